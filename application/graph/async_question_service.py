@@ -0,0 +1,151 @@
+from typing import AsyncIterator, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+from domain.graph.repositories import AsyncQuestionRepository
+from utils.errors import BadRequestError
+
+
+class AsyncQuestionService:
+    """Asynchronous counterpart of QuestionService, with the same business rules"""
+
+    def __init__(self, question_repository: AsyncQuestionRepository):
+        self.question_repository = question_repository
+
+    async def get_all_questions(self) -> List[Question]:
+        """
+        Gets all questions
+        :return: a list of all questions
+        """
+        return await self.question_repository.get_all_questions()
+
+    def iter_all_questions(self) -> AsyncIterator[Question]:
+        """
+        Lazily gets all questions, in creation order
+        :return: an asynchronous iterator over all questions
+        """
+        return self.question_repository.iter_all_questions()
+
+    async def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        """
+        Gets a page of the questions matching a filter, in creation order
+        :param page_request: the page size, the previous page cursor and the fields to read
+        :param question_filter: the criteria the questions must match
+        :return: the serialized questions and the cursor of the next page if any
+        :raises BadRequestError: if a field does not exist or the cursor is malformed
+        """
+        unknown_fields: FrozenSet[str] = page_request.get_unknown_fields(Question)
+        if unknown_fields:
+            raise BadRequestError(
+                f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+            )
+        return await self.question_repository.get_questions_page(
+            page_request, question_filter
+        )
+
+    async def get_version(self) -> int:
+        """
+        Gets the version of the stored questions, which changes with every write
+        :return: the version
+        """
+        return await self.question_repository.get_version()
+
+    async def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        """
+        Gets a question along with its revision, which changes with every write of it
+        :param question_id: the question id
+        :return: the question and its revision, None if the question does not exist
+        """
+        return await self.question_repository.get_question_with_revision(question_id)
+
+    async def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        """
+        Gets a question by its id
+        :param question_id: the question id
+        :return: the question or None if it does not exist
+        """
+        return await self.question_repository.get_question_by_id(question_id)
+
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> Tuple[List[Question], List[QuestionId]]:
+        """
+        Gets questions by their ids, in a single read
+        :param question_ids: the question ids
+        :return: the questions found, in the order of their ids, and the ids of the
+        missing questions, each id once
+        """
+        questions: List[Question] = await self.question_repository.get_questions_by_ids(
+            question_ids
+        )
+        found: Set[str] = {question.id.code for question in questions}
+        missing: Dict[str, QuestionId] = {
+            question_id.code: question_id
+            for question_id in question_ids
+            if question_id.code not in found
+        }
+        return questions, list(missing.values())
+
+    async def add_question(self, question: Question) -> QuestionId:
+        """
+        Inserts a question
+        :param question: the question to insert
+        :return: the id of the inserted question
+        :raises ConflictError: if the question already exists
+        """
+        return await self.question_repository.insert_question(question)
+
+    async def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Updates an existing question
+        :param question_id: the id of the question to update
+        :param question: the updated question
+        :param revisions: the revisions the question is expected to be at, None to
+        update it whatever its revision
+        :raises BadRequestError: if the question id does not match the existing question id
+        :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions
+        """
+        if question_id != question.id:
+            raise BadRequestError("Updated question id does not match")
+        await self.question_repository.update_question(question_id, question, revisions)
+
+    async def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        """
+        Deletes a question
+        :param question_id: the id of the question to delete
+        :param revisions: the revisions the question is expected to be at, None to
+        delete it whatever its revision
+        :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions
+        """
+        await self.question_repository.delete_question(question_id, revisions)
+
+    async def get_new_candidate_id(self) -> QuestionId:
+        """
+        Gets a new candidate id for a question, drawn from the id sequence of the
+        repository, so that no two calls get the same id, even from two processes
+        :return: the new candidate id
+        """
+        reserved: List[QuestionId] = []
+        while len(reserved) == 0:
+            reserved = await self.question_repository.reserve_question_ids(1)
+        return reserved[0]
+
+    async def get_last_inserted_question(self) -> Optional[Question]:
+        """
+        Gets the last inserted question
+        :return: the last inserted question
+        """
+        return await self.question_repository.get_last_inserted_question()
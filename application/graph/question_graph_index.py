@@ -0,0 +1,268 @@
+import threading
+import time
+from bisect import insort
+from datetime import datetime
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from domain.graph.core import AnswerId, Question, QuestionId, QuestionTransitions
+from domain.graph.repositories import QuestionRepository
+
+# Stands for no question in the arrays of interned question numbers
+_NONE: int = -1
+
+
+class QuestionGraphIndex:
+    """Compiled, in-memory view of the question graph, so that working out the
+    question following a selection walks no edge.
+    Question and answer ids are interned into numbers indexing arrays: for each
+    question its previous question, the answers enabling it and its followers in
+    creation order; for each answer the question owning it and, as an inverted index,
+    the questions it enables. The transitions of a question are compiled from its
+    followers on first use and kept until one of them changes.
+    The index is built from the whole catalogue on first use, tagged with the version
+    of the stored questions, then updated in place by the writes reported to it, which
+    mirror what the storage does to the links of the written question. A write made
+    elsewhere changes the version, which is checked at most once every
+    `check_interval` seconds, on every read if 0, and leads to a rebuild."""
+
+    def __init__(
+        self,
+        question_repository: QuestionRepository,
+        check_interval: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.question_repository = question_repository
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._checked_at: float = float("-inf")
+        self._clear()
+
+    def first_question_id(self) -> Optional[QuestionId]:
+        """
+        Gets the first question of a questionnaire, the earliest created question
+        without a previous one
+        :return: the id of the first question or None if there are no questions
+        """
+        self._ensure_current()
+        with self._lock:
+            return self._question_ids[self._roots[0]] if self._roots else None
+
+    def get_transitions(self, question_id: QuestionId) -> QuestionTransitions:
+        """
+        Gets the questions that may follow a question
+        :param question_id: the question id
+        :return: the transitions, empty if the question does not exist
+        """
+        self._ensure_current()
+        with self._lock:
+            number: Optional[int] = self._question_numbers.get(question_id.code)
+            if number is None or not self._alive[number]:
+                return QuestionTransitions()
+            transitions: Optional[QuestionTransitions] = self._transitions.get(number)
+            if transitions is None:
+                transitions = self._compile(number)
+                self._transitions[number] = transitions
+            return transitions
+
+    def next_question_id(
+        self, question_id: QuestionId, selected_answer_ids: Iterable[AnswerId]
+    ) -> Optional[QuestionId]:
+        """
+        Gets the question following a question given the answers selected for it
+        :param question_id: the question id
+        :param selected_answer_ids: the ids of the answers selected
+        :return: the id of the following question or None if there is none
+        """
+        return self.get_transitions(question_id).next_question_id(selected_answer_ids)
+
+    def questions_written(self, questions: List[Question]) -> None:
+        """
+        Reports the questions inserted or updated by a single write
+        :param questions: the written questions
+        """
+
+        def put_all() -> None:
+            for question in questions:
+                self._put(question, resolve_links=True)
+
+        self._apply_write(put_all)
+
+    def question_deleted(self, question_id: QuestionId) -> None:
+        """
+        Reports the deletion of a question
+        :param question_id: the id of the deleted question
+        """
+        self._apply_write(lambda: self._remove(question_id))
+
+    def invalidate(self) -> None:
+        """Drops the index, which is rebuilt on next use"""
+        with self._lock:
+            self._version = None
+
+    def _apply_write(self, apply: Callable[[], object]) -> None:
+        if self._version is None:
+            return
+        # Applied in place only if no other write happened since the index version
+        version: int = self.question_repository.get_version()
+        with self._lock:
+            if self._version is None:
+                return
+            if version != self._version + 1:
+                self._version = None
+                return
+            apply()
+            self._version = version
+
+    def _ensure_current(self) -> None:
+        now: float = self.clock()
+        with self._lock:
+            if (
+                self._version is not None
+                and now - self._checked_at < self.check_interval
+            ):
+                return
+        version: int = self.question_repository.get_version()
+        with self._lock:
+            if version == self._version:
+                self._checked_at = now
+                return
+        # Read after the version, so the questions are at least as recent as the tag
+        questions: List[Question] = self.question_repository.get_all_questions()
+        with self._lock:
+            if version != self._version:
+                self._clear()
+                for question in questions:
+                    self._put(question, resolve_links=False)
+                self._version = version
+            self._checked_at = now
+
+    def _clear(self) -> None:
+        self._question_numbers: Dict[str, int] = {}
+        self._question_ids: List[QuestionId] = []
+        self._alive: List[bool] = []
+        self._keys: List[Tuple[datetime, str]] = []
+        self._previous: List[int] = []
+        self._enabled_by: List[Set[int]] = []
+        self._answers: List[Tuple[int, ...]] = []
+        self._followers: List[List[int]] = []
+        self._roots: List[int] = []
+        self._answer_numbers: Dict[str, int] = {}
+        self._answer_codes: List[str] = []
+        self._answer_owners: List[int] = []
+        self._enabling: List[Set[int]] = []
+        self._transitions: Dict[int, QuestionTransitions] = {}
+
+    def _intern_question(self, question_id: QuestionId) -> int:
+        number: Optional[int] = self._question_numbers.get(question_id.code)
+        if number is None:
+            number = len(self._question_ids)
+            self._question_numbers[question_id.code] = number
+            self._question_ids.append(question_id)
+            self._alive.append(False)
+            self._keys.append((datetime.min, question_id.code))
+            self._previous.append(_NONE)
+            self._enabled_by.append(set())
+            self._answers.append(())
+            self._followers.append([])
+        return number
+
+    def _intern_answer(self, code: str) -> int:
+        number: Optional[int] = self._answer_numbers.get(code)
+        if number is None:
+            number = len(self._answer_codes)
+            self._answer_numbers[code] = number
+            self._answer_codes.append(code)
+            self._answer_owners.append(_NONE)
+            self._enabling.append(set())
+        return number
+
+    def _siblings(self, previous: int) -> List[int]:
+        return self._roots if previous == _NONE else self._followers[previous]
+
+    def _put(self, question: Question, resolve_links: bool) -> None:
+        """Stores a question. Links to questions and answers not stored are kept when
+        they come from the storage, and dropped otherwise as the storage drops them
+        on write"""
+        number: int = self._intern_question(question.id)
+        if self._alive[number]:
+            # Answers keeping their id keep the links other questions have to them
+            self._detach(
+                number,
+                frozenset(
+                    self._answer_numbers.get(answer.id.code, _NONE)
+                    for answer in question.available_answers
+                ),
+            )
+        self._alive[number] = True
+        self._keys[number] = (question.created_at, question.id.code)
+        self._answers[number] = tuple(
+            self._intern_answer(answer.id.code) for answer in question.available_answers
+        )
+        for answer in self._answers[number]:
+            self._answer_owners[answer] = number
+        previous: int = _NONE
+        if question.previous_question_id is not None:
+            previous = self._intern_question(question.previous_question_id)
+            if resolve_links and not self._alive[previous]:
+                previous = _NONE
+        self._previous[number] = previous
+        for answer_id in question.enabled_by:
+            answer: int = self._intern_answer(answer_id.code)
+            if not resolve_links or self._answer_owners[answer] != _NONE:
+                self._enabled_by[number].add(answer)
+                self._enabling[answer].add(number)
+        insort(self._siblings(previous), number, key=self._keys.__getitem__)
+        self._transitions.pop(previous, None)
+
+    def _detach(self, number: int, kept_answers: FrozenSet[int] = frozenset()) -> None:
+        """Drops the answers and the outgoing links of a question, along with the
+        links from other questions to its answers but the kept ones"""
+        previous: int = self._previous[number]
+        self._siblings(previous).remove(number)
+        self._transitions.pop(previous, None)
+        for answer in self._enabled_by[number]:
+            self._enabling[answer].discard(number)
+        self._enabled_by[number] = set()
+        for answer in self._answers[number]:
+            if self._answer_owners[answer] != number or answer in kept_answers:
+                continue
+            self._answer_owners[answer] = _NONE
+            for enabled in self._enabling[answer]:
+                self._enabled_by[enabled].discard(answer)
+                self._transitions.pop(self._previous[enabled], None)
+            self._enabling[answer] = set()
+        self._answers[number] = ()
+        self._previous[number] = _NONE
+        self._alive[number] = False
+
+    def _remove(self, question_id: QuestionId) -> None:
+        number: Optional[int] = self._question_numbers.get(question_id.code)
+        if number is None or not self._alive[number]:
+            return
+        self._detach(number)
+        # Its followers lose their link to it
+        for follower in self._followers[number]:
+            self._previous[follower] = _NONE
+            insort(self._roots, follower, key=self._keys.__getitem__)
+        self._followers[number] = []
+        self._transitions.pop(number, None)
+
+    def _compile(self, number: int) -> QuestionTransitions:
+        followers: List[int] = self._followers[number]
+        unconditional: Optional[int] = None
+        by_answer: Dict[str, int] = {}
+        for position, follower in enumerate(followers):
+            if not self._enabled_by[follower]:
+                # No later follower can come before this one
+                unconditional = position
+                followers = followers[: position + 1]
+                break
+            for answer in self._enabled_by[follower]:
+                by_answer.setdefault(self._answer_codes[answer], position)
+        return QuestionTransitions(
+            followers=tuple(self._question_ids[follower] for follower in followers),
+            unconditional=unconditional,
+            by_answer=by_answer,
+        )
@@ -0,0 +1,349 @@
+import heapq
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+from pydantic import BaseModel, ValidationError
+
+from domain.graph.core import AnswerId, Question, QuestionId
+from domain.graph.repositories import QuestionRepository
+from presentation.presentation import deserialize
+from utils.errors import ConflictError
+
+DEFAULT_CHUNK_SIZE: int = 500
+
+
+class ImportMode(Enum):
+    ATOMIC = "atomic"
+    CHUNKED = "chunked"
+
+
+class ImportStatus(Enum):
+    CREATED = "created"
+    INVALID = "invalid"
+    CONFLICT = "conflict"
+    SKIPPED = "skipped"
+
+
+class QuestionImportResult(BaseModel):
+    index: int
+    id: Optional[QuestionId]
+    status: ImportStatus
+    errors: List[str] = []
+
+
+class ImportReport(BaseModel):
+    mode: ImportMode
+    results: List[QuestionImportResult]
+
+    def count(self, status: ImportStatus) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+
+class QuestionImporter:
+    """Imports a batch of questions in three steps: every item is parsed into a question,
+    the whole batch is validated (duplicated ids, dangling or conflicting references),
+    and the valid questions are written with chunked UNWIND statements.
+    In ATOMIC mode nothing is written unless the whole batch is valid, and all chunks
+    share a single transaction. In CHUNKED mode each chunk is committed on its own,
+    and questions depending on a question that could not be imported are skipped.
+    The whole batch is held in memory until it is written, since any question may
+    link to a later one, so memory grows with the size of the batch, whatever the
+    chunk size."""
+
+    def __init__(self, question_repository: QuestionRepository):
+        self.question_repository = question_repository
+
+    def import_questions(
+        self,
+        items: Iterable[object],
+        mode: ImportMode = ImportMode.ATOMIC,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """Imports questions
+        :param items: the serialized questions, consumed lazily
+        :param mode: whether to commit all the questions at once or chunk by chunk
+        :param chunk_size: the number of questions written by each statement
+        :return: the outcome for each item, in the same order as the items
+        :raises BadRequestError: if the items cannot be parsed"""
+        results: List[QuestionImportResult] = []
+        questions: Dict[int, Question] = {}
+        for index, item in enumerate(items):
+            try:
+                questions[index] = deserialize(item, Question)
+                results.append(
+                    QuestionImportResult(
+                        index=index, id=questions[index].id, status=ImportStatus.CREATED
+                    )
+                )
+            except (ValidationError, TypeError) as e:
+                results.append(
+                    QuestionImportResult(
+                        index=index,
+                        id=self._get_item_id(item),
+                        status=ImportStatus.INVALID,
+                        errors=self._get_validation_errors(e),
+                    )
+                )
+
+        self._validate_batch(results, questions)
+        self._skip_dependents(results, questions)
+        valid: List[int] = [
+            index
+            for index in questions
+            if results[index].status == ImportStatus.CREATED
+        ]
+        if mode == ImportMode.ATOMIC:
+            self._write_atomically(results, questions, valid, chunk_size)
+        else:
+            self._write_in_chunks(results, questions, valid, chunk_size)
+        return ImportReport(mode=mode, results=results)
+
+    def _validate_batch(
+        self, results: List[QuestionImportResult], questions: Dict[int, Question]
+    ) -> None:
+        question_owners: Dict[QuestionId, int] = {}
+        answer_owners: Dict[AnswerId, int] = {}
+        for index, question in questions.items():
+            if question.id in question_owners:
+                self._fail(
+                    results[index], ImportStatus.INVALID, "Duplicate question id"
+                )
+            question_owners.setdefault(question.id, index)
+            for answer in question.available_answers:
+                if answer.id in answer_owners:
+                    self._fail(
+                        results[index],
+                        ImportStatus.INVALID,
+                        f"Duplicate answer id {answer.id.code}",
+                    )
+                answer_owners.setdefault(answer.id, index)
+
+        referenced_question_ids: Set[QuestionId] = {
+            question.previous_question_id
+            for question in questions.values()
+            if question.previous_question_id
+        }
+        referenced_answer_ids: Set[AnswerId] = {
+            answer_id
+            for question in questions.values()
+            for answer_id in question.enabled_by
+        }
+        existing_question_ids, existing_answer_ids = (
+            self.question_repository.get_existing_ids(
+                frozenset(question_owners) | frozenset(referenced_question_ids),
+                frozenset(answer_owners) | frozenset(referenced_answer_ids),
+            )
+        )
+
+        unparsed_ids: Set[QuestionId] = {
+            result.id
+            for result in results
+            if result.index not in questions and result.id is not None
+        }
+        for index, question in questions.items():
+            result: QuestionImportResult = results[index]
+            if question.id in existing_question_ids:
+                self._fail(result, ImportStatus.CONFLICT, "Question already exists")
+            for answer in question.available_answers:
+                if answer.id in existing_answer_ids:
+                    self._fail(
+                        result,
+                        ImportStatus.CONFLICT,
+                        f"Answer {answer.id.code} already exists",
+                    )
+            previous_question_id = question.previous_question_id
+            if previous_question_id in unparsed_ids:
+                self._fail(
+                    result,
+                    ImportStatus.SKIPPED,
+                    f"Depends on question {previous_question_id.code} which was not imported",
+                )
+            elif (
+                previous_question_id
+                and previous_question_id not in question_owners
+                and previous_question_id not in existing_question_ids
+            ):
+                self._fail(
+                    result,
+                    ImportStatus.INVALID,
+                    f"Unknown previous question {previous_question_id.code}",
+                )
+            for answer_id in question.enabled_by:
+                if (
+                    answer_id not in answer_owners
+                    and answer_id not in existing_answer_ids
+                ):
+                    self._fail(
+                        result,
+                        ImportStatus.INVALID,
+                        f"Unknown enabling answer {answer_id.code}",
+                    )
+
+    def _skip_dependents(
+        self, results: List[QuestionImportResult], questions: Dict[int, Question]
+    ) -> None:
+        dependents: Dict[QuestionId, List[int]] = self._get_dependents(questions)
+        failed: List[QuestionId] = [
+            question.id
+            for index, question in questions.items()
+            if results[index].status != ImportStatus.CREATED
+        ]
+        while failed:
+            dependency: QuestionId = failed.pop()
+            for index in dependents.get(dependency, []):
+                result: QuestionImportResult = results[index]
+                if result.status != ImportStatus.CREATED:
+                    continue
+                self._fail(
+                    result,
+                    ImportStatus.SKIPPED,
+                    f"Depends on question {dependency.code} which was not imported",
+                )
+                failed.append(questions[index].id)
+
+    def _write_atomically(
+        self,
+        results: List[QuestionImportResult],
+        questions: Dict[int, Question],
+        valid: List[int],
+        chunk_size: int,
+    ) -> None:
+        if len(valid) < len(results):
+            for index in valid:
+                self._fail(
+                    results[index],
+                    ImportStatus.SKIPPED,
+                    "Import aborted because of invalid questions",
+                )
+            return
+        try:
+            self.question_repository.insert_questions(
+                [questions[index] for index in valid], chunk_size
+            )
+        except ConflictError as e:
+            for index in valid:
+                self._fail(results[index], ImportStatus.CONFLICT, e.message)
+
+    def _write_in_chunks(
+        self,
+        results: List[QuestionImportResult],
+        questions: Dict[int, Question],
+        valid: List[int],
+        chunk_size: int,
+    ) -> None:
+        dependencies: Dict[int, FrozenSet[QuestionId]] = self._get_dependencies(
+            questions
+        )
+        ordered: List[int] = self._sort_dependencies_first(valid, questions)
+        failed: Set[QuestionId] = set()
+        for start in range(0, len(ordered), chunk_size):
+            chunk: List[int] = []
+            for index in ordered[start : start + chunk_size]:
+                for dependency in dependencies[index] & failed:
+                    self._fail(
+                        results[index],
+                        ImportStatus.SKIPPED,
+                        f"Depends on question {dependency.code} which was not imported",
+                    )
+                if results[index].status == ImportStatus.CREATED:
+                    chunk.append(index)
+                else:
+                    failed.add(questions[index].id)
+            try:
+                self.question_repository.insert_questions(
+                    [questions[index] for index in chunk]
+                )
+            except ConflictError as e:
+                for index in chunk:
+                    self._fail(results[index], ImportStatus.CONFLICT, e.message)
+                    failed.add(questions[index].id)
+
+    @staticmethod
+    def _get_dependencies(
+        questions: Dict[int, Question]
+    ) -> Dict[int, FrozenSet[QuestionId]]:
+        """Gets, for each question, the questions of the batch it links to"""
+        answer_owners: Dict[AnswerId, QuestionId] = {
+            answer.id: question.id
+            for question in questions.values()
+            for answer in question.available_answers
+        }
+        question_ids: Set[QuestionId] = {q.id for q in questions.values()}
+        dependencies: Dict[int, FrozenSet[QuestionId]] = {}
+        for index, question in questions.items():
+            linked: Set[QuestionId] = {
+                answer_owners[answer_id]
+                for answer_id in question.enabled_by
+                if answer_id in answer_owners
+            }
+            if question.previous_question_id in question_ids:
+                linked.add(question.previous_question_id)
+            linked.discard(question.id)
+            dependencies[index] = frozenset(linked)
+        return dependencies
+
+    @staticmethod
+    def _get_dependents(questions: Dict[int, Question]) -> Dict[QuestionId, List[int]]:
+        """Gets, for each question of the batch, the questions linking to it"""
+        dependents: Dict[QuestionId, List[int]] = {}
+        for index, dependencies in QuestionImporter._get_dependencies(
+            questions
+        ).items():
+            for dependency in dependencies:
+                dependents.setdefault(dependency, []).append(index)
+        return dependents
+
+    @staticmethod
+    def _sort_dependencies_first(
+        indexes: List[int], questions: Dict[int, Question]
+    ) -> List[int]:
+        """Orders the questions so that each one comes after the questions it links to,
+        keeping the original order otherwise. Questions in a cycle are put last."""
+        included: Set[int] = set(indexes)
+        pending_ids: Set[QuestionId] = {questions[index].id for index in indexes}
+        dependencies: Dict[int, FrozenSet[QuestionId]] = (
+            QuestionImporter._get_dependencies(questions)
+        )
+        dependents: Dict[QuestionId, List[int]] = QuestionImporter._get_dependents(
+            questions
+        )
+        missing: Dict[int, int] = {
+            index: len(dependencies[index] & pending_ids) for index in indexes
+        }
+        ready: List[int] = [index for index in indexes if missing[index] == 0]
+        heapq.heapify(ready)
+        ordered: List[int] = []
+        while ready:
+            index: int = heapq.heappop(ready)
+            ordered.append(index)
+            for dependent in dependents.get(questions[index].id, []):
+                if dependent not in included:
+                    continue
+                missing[dependent] -= 1
+                if missing[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+        sorted_indexes: Set[int] = set(ordered)
+        ordered.extend(index for index in indexes if index not in sorted_indexes)
+        return ordered
+
+    @staticmethod
+    def _fail(result: QuestionImportResult, status: ImportStatus, error: str) -> None:
+        if result.status in (ImportStatus.CREATED, ImportStatus.SKIPPED):
+            result.status = status
+        result.errors.append(error)
+
+    @staticmethod
+    def _get_item_id(item: object) -> Optional[QuestionId]:
+        try:
+            return QuestionId(code=item["id"]["code"])
+        except (TypeError, KeyError, ValidationError):
+            return None
+
+    @staticmethod
+    def _get_validation_errors(error: Exception) -> List[str]:
+        if isinstance(error, ValidationError):
+            return [
+                f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}"
+                for e in error.errors()
+            ]
+        return ["Question must be a mapping"]
@@ -1,14 +1,49 @@
-from typing import Optional, List
+import threading
+from collections import deque
+from typing import (
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    Optional,
+    List,
+    Set,
+    Tuple,
+)
 
-from domain.graph.core import Question, QuestionId
+from application.graph.question_graph_index import QuestionGraphIndex
+from application.graph.question_importer import (
+    DEFAULT_CHUNK_SIZE,
+    ImportMode,
+    ImportReport,
+    QuestionImporter,
+)
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
 from domain.graph.repositories import QuestionRepository
 from utils.errors import BadRequestError
 
 
 class QuestionService:
 
-    def __init__(self, question_repository: QuestionRepository):
+    def __init__(
+        self,
+        question_repository: QuestionRepository,
+        question_graph_index: Optional[QuestionGraphIndex] = None,
+        id_block_size: int = 1,
+    ):
+        """:param question_repository: the repository of the questions
+        :param question_graph_index: the index of the question graph, if any, kept up
+        to date with the writes
+        :param id_block_size: the number of candidate ids reserved at once"""
+        if id_block_size < 1:
+            raise ValueError("The id block size must be at least 1")
         self.question_repository = question_repository
+        self.question_graph_index = question_graph_index
+        self.id_block_size = id_block_size
+        self._reserved_ids: Deque[QuestionId] = deque()
+        self._reserved_ids_lock = threading.Lock()
 
     def get_all_questions(self) -> List[Question]:
         """
@@ -17,6 +52,49 @@ class QuestionService:
         """
         return self.question_repository.get_all_questions()
 
+    def iter_all_questions(self) -> Iterator[Question]:
+        """
+        Lazily gets all questions, in creation order
+        :return: an iterator over all questions
+        """
+        return self.question_repository.iter_all_questions()
+
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        """
+        Gets a page of the questions matching a filter, in creation order
+        :param page_request: the page size, the previous page cursor and the fields to read
+        :param question_filter: the criteria the questions must match
+        :return: the serialized questions and the cursor of the next page if any
+        :raises BadRequestError: if a field does not exist or the cursor is malformed
+        """
+        unknown_fields: FrozenSet[str] = page_request.get_unknown_fields(Question)
+        if unknown_fields:
+            raise BadRequestError(
+                f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+            )
+        return self.question_repository.get_questions_page(
+            page_request, question_filter
+        )
+
+    def get_version(self) -> int:
+        """
+        Gets the version of the stored questions, which changes with every write
+        :return: the version
+        """
+        return self.question_repository.get_version()
+
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        """
+        Gets a question along with its revision, which changes with every write of it
+        :param question_id: the question id
+        :return: the question and its revision, None if the question does not exist
+        """
+        return self.question_repository.get_question_with_revision(question_id)
+
     def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
         """
         Gets a question by its id
@@ -25,6 +103,26 @@ class QuestionService:
         """
         return self.question_repository.get_question_by_id(question_id)
 
+    def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> Tuple[List[Question], List[QuestionId]]:
+        """
+        Gets questions by their ids, in a single read
+        :param question_ids: the question ids
+        :return: the questions found, in the order of their ids, and the ids of the
+        missing questions, each id once
+        """
+        questions: List[Question] = self.question_repository.get_questions_by_ids(
+            question_ids
+        )
+        found: Set[str] = {question.id.code for question in questions}
+        missing: Dict[str, QuestionId] = {
+            question_id.code: question_id
+            for question_id in question_ids
+            if question_id.code not in found
+        }
+        return questions, list(missing.values())
+
     def add_question(self, question: Question) -> QuestionId:
         """
         Inserts a question
@@ -32,42 +130,98 @@ class QuestionService:
         :return: the id of the inserted question
         :raises ConflictError: if the question already exists
         """
-        return self.question_repository.insert_question(question)
+        question_id: QuestionId = self.question_repository.insert_question(question)
+        if self.question_graph_index is not None:
+            self.question_graph_index.questions_written([question])
+        return question_id
+
+    def add_questions(self, questions: List[Question]) -> List[QuestionId]:
+        """
+        Inserts many questions in a single transaction
+        :param questions: the questions to insert
+        :return: the ids of the inserted questions
+        :raises ConflictError: if any of the questions already exists
+        """
+        question_ids: List[QuestionId] = self.question_repository.insert_questions(
+            questions
+        )
+        if self.question_graph_index is not None:
+            self.question_graph_index.questions_written(questions)
+        return question_ids
+
+    def load_questions(
+        self,
+        items: Iterable[object],
+        mode: ImportMode = ImportMode.ATOMIC,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> ImportReport:
+        """
+        Validates and imports a batch of serialized questions
+        :param items: the serialized questions, consumed lazily
+        :param mode: whether to commit all the questions at once or chunk by chunk
+        :param chunk_size: the number of questions written by each statement
+        :return: the outcome for each question
+        :raises BadRequestError: if the items cannot be parsed
+        """
+        try:
+            return QuestionImporter(self.question_repository).import_questions(
+                items, mode, chunk_size
+            )
+        finally:
+            # An import may span many transactions, so the index is built anew
+            if self.question_graph_index is not None:
+                self.question_graph_index.invalidate()
 
-    def update_question(self, question_id: QuestionId, question: Question) -> None:
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
         """
         Updates an existing question
         :param question_id: the id of the question to update
         :param question: the updated question
+        :param revisions: the revisions the question is expected to be at, None to
+        update it whatever its revision
         :raises BadRequestError: if the question id does not match the existing question id
         :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions
         """
         if question_id != question.id:
             raise BadRequestError("Updated question id does not match")
-        self.question_repository.update_question(question_id, question)
+        self.question_repository.update_question(question_id, question, revisions)
+        if self.question_graph_index is not None:
+            self.question_graph_index.questions_written([question])
 
-    def delete_question(self, question_id: QuestionId) -> None:
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
         """
         Deletes a question
         :param question_id: the id of the question to delete
+        :param revisions: the revisions the question is expected to be at, None to
+        delete it whatever its revision
         :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions
         """
-        self.question_repository.delete_question(question_id)
+        self.question_repository.delete_question(question_id, revisions)
+        if self.question_graph_index is not None:
+            self.question_graph_index.question_deleted(question_id)
 
     def get_new_candidate_id(self) -> QuestionId:
         """
-        Gets a new candidate id for a question
+        Gets a new candidate id for a question, drawn from the id sequence of the
+        repository, so that no two calls get the same id, even from two processes.
+        Ids are reserved by blocks, the ones left being handed out by the next calls
         :return: the new candidate id
         """
-        increment = 1
-        questions_number = len(self.get_all_questions())
-        candidate_id: QuestionId = QuestionId(code=f"q-{questions_number + increment}")
-        check = self.question_repository.get_question_by_id(candidate_id)
-        while check is not None:
-            increment += 1
-            candidate_id = QuestionId(code=f"q-{questions_number + increment}")
-            check = self.question_repository.get_question_by_id(candidate_id)
-        return candidate_id
+        with self._reserved_ids_lock:
+            while len(self._reserved_ids) == 0:
+                self._reserved_ids.extend(
+                    self.question_repository.reserve_question_ids(self.id_block_size)
+                )
+            return self._reserved_ids.popleft()
 
     def get_last_inserted_question(self) -> Optional[Question]:
         """
@@ -0,0 +1,127 @@
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import shortuuid
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from domain.project.factories import ProjectFactory
+from domain.project.repositories import AsyncProjectRepository
+from utils.errors import BadRequestError
+
+
+class AsyncProjectService:
+    """Asynchronous counterpart of ProjectService, with the same business rules"""
+
+    def __init__(self, project_repository: AsyncProjectRepository):
+        self.project_repository = project_repository
+
+    async def get_all_projects(self) -> List[Project]:
+        """
+        Gets all projects
+        :return: a list of all projects
+        """
+        return await self.project_repository.get_all_projects()
+
+    async def get_projects_page(self, page_request: PageRequest) -> Page:
+        """
+        Gets a page of projects, ordered by id
+        :param page_request: the page size, the previous page cursor and the fields to read
+        :return: the serialized projects and the cursor of the next page if any
+        :raises BadRequestError: if a field does not exist or the cursor is malformed
+        """
+        unknown_fields: FrozenSet[str] = page_request.get_unknown_fields(Project)
+        if unknown_fields:
+            raise BadRequestError(
+                f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+            )
+        return await self.project_repository.get_projects_page(page_request)
+
+    async def get_version(self) -> int:
+        """
+        Gets the version of the stored projects, which changes with every write
+        :return: the version
+        """
+        return await self.project_repository.get_version()
+
+    async def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        """
+        Gets a project along with its revision, which changes with every write of it
+        :param project_id: the project id
+        :return: the project and its revision, None if the project does not exist
+        """
+        return await self.project_repository.get_project_with_revision(project_id)
+
+    async def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        """
+        Gets a project by its id
+        :param project_id: the project id
+        :return: the project or None if it does not exist
+        """
+        return await self.project_repository.get_project_by_id(project_id)
+
+    async def get_projects_by_ids(
+        self, project_ids: List[ProjectId]
+    ) -> Tuple[List[Project], List[ProjectId]]:
+        """
+        Gets projects by their ids, in a single read
+        :param project_ids: the project ids
+        :return: the projects found, in the order of their ids, and the ids of the
+        missing projects, each id once
+        """
+        projects: List[Project] = await self.project_repository.get_projects_by_ids(
+            project_ids
+        )
+        found: Set[str] = {project.id.code for project in projects}
+        missing: Dict[str, ProjectId] = {
+            project_id.code: project_id
+            for project_id in project_ids
+            if project_id.code not in found
+        }
+        return projects, list(missing.values())
+
+    async def add_project(self, name: str) -> ProjectId:
+        """
+        Inserts a project
+        :param name: the project name
+        :return: the id of the inserted project
+        :raises ConflictError: if the project already exists
+        """
+        project: Project = ProjectFactory.create_project(
+            ProjectId(code=shortuuid.uuid()), name
+        )
+        return await self.project_repository.insert_project(project)
+
+    async def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Updates an existing project
+        :param project_id: the id of the project to update
+        :param project: the updated project
+        :param revisions: the revisions the project is expected to be at, None to
+        update it whatever its revision
+        :raises BadRequestError: if the project id does not match the existing project id
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions
+        """
+        if project_id != project.id:
+            raise BadRequestError("Updated project id does not match")
+        await self.project_repository.update_project(project_id, project, revisions)
+
+    async def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        """
+        Deletes a project
+        :param project_id: the id of the project to delete
+        :param revisions: the revisions the project is expected to be at, None to
+        delete it whatever its revision
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions
+        """
+        await self.project_repository.delete_project(project_id, revisions)
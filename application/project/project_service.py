@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Dict, FrozenSet, Optional, List, Set, Tuple
 
 import shortuuid
 
+from domain.common.core import Page, PageRequest
 from domain.project.core import Project, ProjectId
 from domain.project.factories import ProjectFactory
 from domain.project.repositories import ProjectRepository
@@ -20,6 +21,37 @@ class ProjectService:
         """
         return self.project_repository.get_all_projects()
 
+    def get_projects_page(self, page_request: PageRequest) -> Page:
+        """
+        Gets a page of projects, ordered by id
+        :param page_request: the page size, the previous page cursor and the fields to read
+        :return: the serialized projects and the cursor of the next page if any
+        :raises BadRequestError: if a field does not exist or the cursor is malformed
+        """
+        unknown_fields: FrozenSet[str] = page_request.get_unknown_fields(Project)
+        if unknown_fields:
+            raise BadRequestError(
+                f"Unknown fields: {', '.join(sorted(unknown_fields))}"
+            )
+        return self.project_repository.get_projects_page(page_request)
+
+    def get_version(self) -> int:
+        """
+        Gets the version of the stored projects, which changes with every write
+        :return: the version
+        """
+        return self.project_repository.get_version()
+
+    def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        """
+        Gets a project along with its revision, which changes with every write of it
+        :param project_id: the project id
+        :return: the project and its revision, None if the project does not exist
+        """
+        return self.project_repository.get_project_with_revision(project_id)
+
     def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
         """
         Gets a project by its id
@@ -28,6 +60,26 @@ class ProjectService:
         """
         return self.project_repository.get_project_by_id(project_id)
 
+    def get_projects_by_ids(
+        self, project_ids: List[ProjectId]
+    ) -> Tuple[List[Project], List[ProjectId]]:
+        """
+        Gets projects by their ids, in a single read
+        :param project_ids: the project ids
+        :return: the projects found, in the order of their ids, and the ids of the
+        missing projects, each id once
+        """
+        projects: List[Project] = self.project_repository.get_projects_by_ids(
+            project_ids
+        )
+        found: Set[str] = {project.id.code for project in projects}
+        missing: Dict[str, ProjectId] = {
+            project_id.code: project_id
+            for project_id in project_ids
+            if project_id.code not in found
+        }
+        return projects, list(missing.values())
+
     def add_project(self, name: str) -> ProjectId:
         """
         Inserts a project
@@ -40,22 +92,35 @@ class ProjectService:
         )
         return self.project_repository.insert_project(project)
 
-    def update_project(self, project_id: ProjectId, project: Project) -> None:
+    def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
         """
         Updates an existing project
         :param project_id: the id of the project to update
         :param project: the updated project
+        :param revisions: the revisions the project is expected to be at, None to
+        update it whatever its revision
         :raises BadRequestError: if the project id does not match the existing project id
         :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions
         """
         if project_id != project.id:
             raise BadRequestError("Updated project id does not match")
-        self.project_repository.update_project(project_id, project)
+        self.project_repository.update_project(project_id, project, revisions)
 
-    def delete_project(self, project_id: ProjectId) -> None:
+    def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
         """
         Deletes a project
         :param project_id: the id of the project to delete
+        :param revisions: the revisions the project is expected to be at, None to
+        delete it whatever its revision
         :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions
         """
-        self.project_repository.delete_project(project_id)
+        self.project_repository.delete_project(project_id, revisions)
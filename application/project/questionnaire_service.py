@@ -1,26 +1,120 @@
-from domain.graph.core import QuestionId, Answer
-from domain.graph.repositories import QuestionRepository
+from typing import List, Optional
+
+from application.graph.question_graph_index import QuestionGraphIndex
+from domain.graph.core import Answer, AnswerId, QuestionId
 from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.repositories import QuestionnaireRepository
+from utils.errors import BadRequestError
 
 
 class QuestionnaireService:
 
-    def __init__(self, question_repository: QuestionRepository):
-        self.question_repository = question_repository
+    def __init__(
+        self,
+        questionnaire_repository: QuestionnaireRepository,
+        question_graph_index: QuestionGraphIndex,
+    ):
+        self.questionnaire_repository = questionnaire_repository
+        self.question_graph_index = question_graph_index
+
+    def get_questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        """
+        Gets the questions asked so far, with their selected answers
+        :param project_id: the project id
+        :return: the questions, in the order they were asked
+        :raises NotFoundError: if the project does not exist
+        """
+        return self.questionnaire_repository.get_questionnaire(project_id)
 
-    def get_first_question(self, project_id: ProjectId):
-        pass
+    def get_first_question(self, project_id: ProjectId) -> Optional[SelectableQuestion]:
+        """
+        Starts the questionnaire, unless it is already started
+        :param project_id: the project id
+        :return: the first question or None if there are no questions
+        :raises NotFoundError: if the project does not exist
+        """
+        first_question_id: Optional[QuestionId] = (
+            self.question_graph_index.first_question_id()
+        )
+        if first_question_id is None:
+            questionnaire: List[SelectableQuestion] = (
+                self.questionnaire_repository.get_questionnaire(project_id)
+            )
+            return questionnaire[0] if questionnaire else None
+        return self.questionnaire_repository.start_questionnaire(
+            project_id, first_question_id
+        )
 
     def insert_answer(
-        self, project_id: ProjectId, question_id: QuestionId, answer: Answer
-    ):
-        pass
+        self, project_id: ProjectId, question_id: QuestionId, answer_id: AnswerId
+    ) -> SelectableQuestion:
+        """
+        Selects an answer of an asked question. When the selection changes, the
+        questions asked after it are discarded, as the answer may lead elsewhere
+        :param project_id: the project id
+        :param question_id: the question id
+        :param answer_id: the id of the selected answer
+        :return: the question with the updated selection
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked
+        :raises BadRequestError: if the answer is not available for the question
+        :raises ConflictError: if the questionnaire changed concurrently
+        """
+
+        def select(question: SelectableQuestion) -> SelectableQuestion:
+            answer: Optional[Answer] = next(
+                (a for a in question.available_answers if a.id == answer_id), None
+            )
+            if answer is None:
+                raise BadRequestError(
+                    f"Answer with id {answer_id} is not available for question"
+                    f" {question_id}"
+                )
+            return question.select_answer(answer)
+
+        return self.questionnaire_repository.update_selectable_question(
+            project_id, question_id, select
+        )
 
-    def get_next_question(self, project_id: ProjectId, question: SelectableQuestion):
-        pass
+    def get_next_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        """
+        Moves on from an asked question, working out the following one from the
+        answers selected for it and the transitions compiled by the question graph
+        index
+        :param project_id: the project id
+        :param question_id: the id of the question answered
+        :return: the following question or None if the questionnaire is over
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked
+        """
+        return self.questionnaire_repository.append_next_question(
+            project_id,
+            question_id,
+            self.question_graph_index.get_transitions(question_id),
+        )
 
-    def go_back_to_question(self, project_id: ProjectId, question: QuestionId):
-        pass
+    def go_back_to_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        """
+        Goes back to an asked question, discarding the questions asked after it
+        :param project_id: the project id
+        :param question_id: the question id
+        :return: the question, with its selected answers
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked
+        :raises ConflictError: if the questionnaire changed concurrently
+        """
+        return self.questionnaire_repository.truncate_questionnaire(
+            project_id, question_id
+        )
 
-    def reset_questionnaire(self, project_id: ProjectId):
-        pass
+    def reset_questionnaire(self, project_id: ProjectId) -> None:
+        """
+        Discards all the questions asked
+        :param project_id: the project id
+        :raises NotFoundError: if the project does not exist
+        """
+        self.questionnaire_repository.delete_questionnaire(project_id)
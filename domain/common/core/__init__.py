@@ -0,0 +1,2 @@
+from domain.common.core.page_request import PageRequest
+from domain.common.core.page import Page
@@ -0,0 +1,11 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class Page(BaseModel):
+    items: List[dict]
+    next_cursor: Optional[str] = None
+
+    def __str__(self):
+        return f"Page(items={len(self.items)}, next_cursor={self.next_cursor})"
@@ -0,0 +1,20 @@
+from typing import FrozenSet, Optional, Type
+
+from pydantic import BaseModel, Field
+
+
+class PageRequest(BaseModel):
+    limit: Optional[int] = Field(default=None, gt=0)
+    cursor: Optional[str] = None
+    fields: Optional[FrozenSet[str]] = None
+
+    def get_unknown_fields(self, klass: Type[BaseModel]) -> FrozenSet[str]:
+        """Gets the requested fields that the given model does not have
+        :param klass: the model the page is made of
+        :return: the unknown fields, empty if all fields are requested"""
+        if self.fields is None:
+            return frozenset()
+        return self.fields - frozenset(klass.model_fields)
+
+    def __str__(self):
+        return f"PageRequest(limit={self.limit}, cursor={self.cursor}, fields={self.fields})"
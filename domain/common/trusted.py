@@ -0,0 +1,37 @@
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=BaseModel)
+
+# Debug switch: when set, trusted data is validated like any other input
+_validate: bool = False
+
+
+def validate_trusted_data(enabled: bool) -> None:
+    """Enables or disables the validation of trusted data, which is skipped by default
+    :param enabled: whether trusted data should be validated"""
+    global _validate
+    _validate = enabled
+
+
+def construct_trusted(klass: Type[T], **fields) -> T:
+    """Builds a model out of data known to be valid, e.g. read back from the database,
+    without validating it. Nested models must be already built, enums and datetimes
+    already parsed
+    :param klass: the model to build
+    :param fields: the value of every field of the model
+    :return: the model"""
+    if _validate:
+        return klass(**fields)
+    return klass.model_construct(**fields)
+
+
+def update_trusted(model: T, **changes) -> T:
+    """Copies a model changing some of its fields, without validating the changes
+    :param model: the model to copy
+    :param changes: the new values of the changed fields
+    :return: the updated copy"""
+    if _validate:
+        return type(model)(**{**dict(model), **changes})
+    return model.model_copy(update=changes)
@@ -2,3 +2,5 @@ from domain.graph.core.answer_id import AnswerId
 from domain.graph.core.answer import Answer
 from domain.graph.core.question_id import QuestionId
 from domain.graph.core.question import Question
+from domain.graph.core.question_filter import QuestionFilter
+from domain.graph.core.question_transitions import QuestionTransitions
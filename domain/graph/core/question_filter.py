@@ -0,0 +1,18 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from domain.graph.core import QuestionId
+from domain.graph.core.enum import Action, QuestionType
+
+
+class QuestionFilter(BaseModel):
+    type: Optional[QuestionType] = None
+    action_needed: Optional[Action] = None
+    previous_question_id: Optional[QuestionId] = None
+
+    def __str__(self):
+        return (
+            f"QuestionFilter(type={self.type}, action_needed={self.action_needed},"
+            f" previous_question_id={self.previous_question_id})"
+        )
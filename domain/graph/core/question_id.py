@@ -9,4 +9,4 @@ class QuestionId(BaseModel):
         return f"QuestionId(code='{self.code}')"
 
     def __hash__(self):
-        hash(self.code)
+        return hash(self.code)
@@ -0,0 +1,37 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from pydantic import BaseModel
+
+from domain.graph.core.answer_id import AnswerId
+from domain.graph.core.question_id import QuestionId
+
+
+class QuestionTransitions(BaseModel):
+    """The questions that may follow a question, earliest created first, along with
+    the position of the first of them enabled by no answer and, by answer code, the
+    position of the first of them enabled by each answer"""
+
+    followers: Tuple[QuestionId, ...] = ()
+    unconditional: Optional[int] = None
+    by_answer: Dict[str, int] = {}
+
+    def next_question_id(
+        self, selected_answer_ids: Iterable[AnswerId]
+    ) -> Optional[QuestionId]:
+        """
+        Gets the question following the selection, in a lookup per selected answer
+        :param selected_answer_ids: the ids of the answers selected
+        :return: the id of the following question or None if there is none
+        """
+        best: Optional[int] = self.unconditional
+        for answer_id in selected_answer_ids:
+            position: Optional[int] = self.by_answer.get(answer_id.code)
+            if position is not None and (best is None or position < best):
+                best = position
+        return None if best is None else self.followers[best]
+
+    def __str__(self):
+        return (
+            f"QuestionTransitions(followers={self.followers},"
+            f" unconditional={self.unconditional}, by_answer={self.by_answer})"
+        )
@@ -1,3 +1,4 @@
+from domain.common.trusted import construct_trusted
 from domain.graph.core.answer import Answer, AnswerId
 
 
@@ -10,3 +11,8 @@ class AnswerFactory:
     @staticmethod
     def create_boolean_answer(answer_id: AnswerId, value: bool):
         return Answer(id=answer_id, text="Yes" if value else "No", value=str(value))
+
+    @staticmethod
+    def create_trusted_answer(answer_id: AnswerId, text: str, value: str) -> Answer:
+        """Creates an answer out of trusted data, skipping validation"""
+        return construct_trusted(Answer, id=answer_id, text=text, value=value)
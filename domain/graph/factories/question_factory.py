@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import FrozenSet, Optional
 
+from domain.common.trusted import construct_trusted
 from domain.graph.core import Answer, AnswerId, QuestionId, Question
 from domain.graph.core.enum import Action, QuestionType
 from domain.graph.factories import AnswerFactory
@@ -30,6 +31,32 @@ class QuestionFactory:
             created_at=created_at,
         )
 
+    @staticmethod
+    def create_trusted_question(
+        question_id: QuestionId,
+        text: str,
+        question_type: QuestionType,
+        available_answers: FrozenSet[Answer],
+        previous_question_id: Optional[QuestionId],
+        enabled_by: FrozenSet[AnswerId],
+        action_needed: Optional[Action],
+        created_at: datetime,
+    ) -> Question:
+        """Creates a question out of trusted data, e.g. read back from the database,
+        skipping validation. Answers and ids must be already built
+        :return: the question"""
+        return construct_trusted(
+            Question,
+            id=question_id,
+            text=text,
+            type=question_type,
+            available_answers=available_answers,
+            previous_question_id=previous_question_id,
+            enabled_by=enabled_by,
+            action_needed=action_needed,
+            created_at=created_at,
+        )
+
     @staticmethod
     def create_boolean_question(
         question_id: QuestionId,
@@ -1 +1,4 @@
 from domain.graph.repositories.question_repository import QuestionRepository
+from domain.graph.repositories.async_question_repository import (
+    AsyncQuestionRepository,
+)
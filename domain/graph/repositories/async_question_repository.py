@@ -0,0 +1,78 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+
+
+class AsyncQuestionRepository(ABC):
+    """Asynchronous counterpart of QuestionRepository, for code running on an event
+    loop. Each method has the contract of the QuestionRepository method of the same
+    name."""
+
+    @abstractmethod
+    async def get_all_questions(self) -> List[Question]:
+        pass
+
+    @abstractmethod
+    def iter_all_questions(self) -> AsyncIterator[Question]:
+        pass
+
+    @abstractmethod
+    async def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        pass
+
+    @abstractmethod
+    async def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        pass
+
+    @abstractmethod
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> List[Question]:
+        pass
+
+    @abstractmethod
+    async def insert_question(self, question: Question) -> QuestionId:
+        pass
+
+    @abstractmethod
+    async def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        pass
+
+    @abstractmethod
+    async def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def get_last_inserted_question(self) -> Optional[Question]:
+        pass
+
+    @abstractmethod
+    async def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        pass
+
+    @abstractmethod
+    async def get_version(self) -> int:
+        pass
+
+    @abstractmethod
+    async def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        pass
@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import FrozenSet, Iterator, List, Optional, Tuple
 
-from domain.graph.core import QuestionId, Question
+from domain.common.core import Page, PageRequest
+from domain.graph.core import AnswerId, QuestionId, Question, QuestionFilter
+
+# Prefix of the candidate ids handed out by reserve_question_ids, followed by the
+# number drawn from the sequence
+CANDIDATE_ID_PREFIX: str = "q-"
 
 
 class QuestionRepository(ABC):
@@ -12,6 +17,26 @@ class QuestionRepository(ABC):
         :return: a list of all questions"""
         pass
 
+    @abstractmethod
+    def iter_all_questions(self) -> Iterator[Question]:
+        """Lazily gets all questions, in creation order,
+        without holding the whole catalogue in memory
+        :return: an iterator over all questions"""
+        pass
+
+    @abstractmethod
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        """Gets a page of the questions matching a filter, in creation order
+        :param page_request: the page size, the cursor of the previous page and the
+        fields to read
+        :param question_filter: the criteria the questions must match
+        :return: the serialized questions, holding only the requested fields,
+        and the cursor of the next page if any
+        :raises BadRequestError: if the cursor is malformed"""
+        pass
+
     @abstractmethod
     def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
         """Gets a question by its id
@@ -19,6 +44,13 @@ class QuestionRepository(ABC):
         :return: the question or None if it does not exist"""
         pass
 
+    @abstractmethod
+    def get_questions_by_ids(self, question_ids: List[QuestionId]) -> List[Question]:
+        """Gets questions by their ids, in a single read
+        :param question_ids: the question ids, duplicates being read once
+        :return: the questions which exist, in the order of their ids"""
+        pass
+
     @abstractmethod
     def insert_question(self, question) -> QuestionId:
         """Inserts a question
@@ -28,18 +60,43 @@ class QuestionRepository(ABC):
         pass
 
     @abstractmethod
-    def update_question(self, question_id: QuestionId, question) -> None:
-        """Updates an existing question
+    def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        """Inserts many questions at once, either all of them or none
+        :param questions: the questions to insert, they may refer to each other
+        :param chunk_size: the maximum number of questions written by each statement,
+        all of them in the same batch if None
+        :return: the ids of the inserted questions
+        :raises ConflictError: if any of the questions already exists"""
+        pass
+
+    @abstractmethod
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        """Updates an existing question, checking its revision in the same write
         :param question_id: the id of the question to update
         :param question: the updated question
-        :raises NotFound: if the question does not exist"""
+        :param revisions: the revisions the question is expected to be at, None to
+        update it whatever its revision
+        :raises NotFound: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions"""
         pass
 
     @abstractmethod
-    def delete_question(self, question_id: QuestionId) -> None:
-        """Deletes a question
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        """Deletes a question, checking its revision in the same write
         :param question_id: the id of the question to delete
-        :raises NotFound: if the question does not exist"""
+        :param revisions: the revisions the question is expected to be at, None to
+        delete it whatever its revision
+        :raises NotFound: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the revisions"""
         pass
 
     @abstractmethod
@@ -47,3 +104,47 @@ class QuestionRepository(ABC):
         """Gets the last inserted question
         :return: the last inserted question"""
         pass
+
+    @abstractmethod
+    def get_existing_ids(
+        self, question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        """Checks which of the given ids are already stored
+        :param question_ids: the question ids to look for
+        :param answer_ids: the answer ids to look for
+        :return: the subsets of the question ids and of the answer ids that exist"""
+        pass
+
+    @abstractmethod
+    def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        """Reserves candidate question ids, drawing the next numbers of a persistent
+        sequence in a single atomic write, so that no number is ever handed out
+        twice, even to concurrent callers or after the question is deleted.
+        Numbers whose id a stored question already has are skipped
+        :param count: the number of numbers to draw
+        :return: the free ids among the drawn numbers, in order, possibly none"""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> int:
+        """Gets the version of the stored questions, which changes with every write,
+        including writes made by other processes
+        :return: the version"""
+        pass
+
+    @abstractmethod
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        """Gets a question along with its revision, read together. The revision
+        changes with every write of the question and whenever it loses a link to a
+        deleted question or answer
+        :param question_id: the question id
+        :return: the question and its revision, None if the question does not exist"""
+        pass
+
+    @abstractmethod
+    def get_all_questions_with_revisions(self) -> List[Tuple[Question, int]]:
+        """Gets all questions, each along with its revision
+        :return: the questions and their revisions"""
+        pass
@@ -3,6 +3,7 @@ from typing import FrozenSet
 from pydantic import field_serializer
 from typing_extensions import Self
 
+from domain.common.trusted import update_trusted
 from domain.graph.core import Answer, Question
 from domain.project.core.selection import SelectionStrategy
 
@@ -20,35 +21,13 @@ class SelectableQuestion(Question):
         selected_answers = self.selection_strategy.select_answer(
             answer, self.selected_answers
         )
-        return SelectableQuestion(
-            id=self.id,
-            text=self.text,
-            type=self.type,
-            available_answers=self.available_answers,
-            previous_question_id=self.previous_question_id,
-            enabled_by=self.enabled_by,
-            action_needed=self.action_needed,
-            created_at=self.created_at,
-            selection_strategy=self.selection_strategy,
-            selected_answers=selected_answers,
-        )
+        return update_trusted(self, selected_answers=selected_answers)
 
     def deselect_answer(self, answer: Answer) -> Self:
         selected_answers = self.selection_strategy.deselect_answer(
             answer, self.selected_answers
         )
-        return SelectableQuestion(
-            id=self.id,
-            text=self.text,
-            type=self.type,
-            available_answers=self.available_answers,
-            previous_question_id=self.previous_question_id,
-            enabled_by=self.enabled_by,
-            action_needed=self.action_needed,
-            created_at=self.created_at,
-            selection_strategy=self.selection_strategy,
-            selected_answers=selected_answers,
-        )
+        return update_trusted(self, selected_answers=selected_answers)
 
     @field_serializer("selected_answers", when_used="json")
     def serialize_available_answers_in_order(self, answer_ids: FrozenSet[Answer]):
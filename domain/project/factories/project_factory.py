@@ -1,3 +1,4 @@
+from domain.common.trusted import construct_trusted
 from domain.project.core import Project, ProjectId
 
 
@@ -9,3 +10,8 @@ class ProjectFactory:
             id=project_id,
             name=name,
         )
+
+    @staticmethod
+    def create_trusted_project(project_id: ProjectId, name: str) -> Project:
+        """Creates a project out of trusted data, skipping validation"""
+        return construct_trusted(Project, id=project_id, name=name)
@@ -1,12 +1,14 @@
 from datetime import datetime
 from typing import FrozenSet, Optional
 
+from domain.common.trusted import construct_trusted
 from domain.graph.core import Answer, AnswerId, QuestionId
 from domain.graph.core.enum import Action, QuestionType
 from domain.graph.factories import AnswerFactory
 from domain.project.core import SelectableQuestion
 from domain.project.core.selection import (
     MultipleSelectionStrategy,
+    SelectionStrategy,
     SingleSelectionStrategy,
 )
 
@@ -25,18 +27,6 @@ class SelectableQuestionFactory:
         created_at: datetime = datetime.now(),
         selected_answers: FrozenSet[Answer] = frozenset(),
     ) -> SelectableQuestion:
-        match question_type:
-            case QuestionType.BOOLEAN:
-                selection_strategy = SingleSelectionStrategy()
-            case QuestionType.SINGLE_CHOICE:
-                selection_strategy = SingleSelectionStrategy()
-            case QuestionType.MULTIPLE_CHOICE:
-                selection_strategy = MultipleSelectionStrategy()
-            case QuestionType.RATING:
-                selection_strategy = SingleSelectionStrategy()
-            case _:
-                raise ValueError(f"Unsupported question type {question_type}")
-
         return SelectableQuestion(
             id=question_id,
             text=text,
@@ -46,7 +36,40 @@ class SelectableQuestionFactory:
             enabled_by=enabled_by,
             action_needed=action_needed,
             created_at=created_at,
-            selection_strategy=selection_strategy,
+            selection_strategy=SelectableQuestionFactory._selection_strategy(
+                question_type
+            ),
+            selected_answers=selected_answers,
+        )
+
+    @staticmethod
+    def create_trusted_selectable_question(
+        question_id: QuestionId,
+        text: str,
+        question_type: QuestionType,
+        available_answers: FrozenSet[Answer],
+        previous_question_id: Optional[QuestionId],
+        enabled_by: FrozenSet[AnswerId],
+        action_needed: Optional[Action],
+        created_at: datetime,
+        selected_answers: FrozenSet[Answer] = frozenset(),
+    ) -> SelectableQuestion:
+        """Creates a selectable question out of trusted data, e.g. read back from the
+        database, skipping validation. Answers and ids must be already built
+        :return: the selectable question"""
+        return construct_trusted(
+            SelectableQuestion,
+            id=question_id,
+            text=text,
+            type=question_type,
+            available_answers=available_answers,
+            previous_question_id=previous_question_id,
+            enabled_by=enabled_by,
+            action_needed=action_needed,
+            created_at=created_at,
+            selection_strategy=SelectableQuestionFactory._selection_strategy(
+                question_type
+            ),
             selected_answers=selected_answers,
         )
 
@@ -79,3 +102,17 @@ class SelectableQuestionFactory:
             action_needed,
             created_at,
         )
+
+    @staticmethod
+    def _selection_strategy(question_type: QuestionType) -> SelectionStrategy:
+        match question_type:
+            case QuestionType.BOOLEAN:
+                return SingleSelectionStrategy()
+            case QuestionType.SINGLE_CHOICE:
+                return SingleSelectionStrategy()
+            case QuestionType.MULTIPLE_CHOICE:
+                return MultipleSelectionStrategy()
+            case QuestionType.RATING:
+                return SingleSelectionStrategy()
+            case _:
+                raise ValueError(f"Unsupported question type {question_type}")
@@ -1 +1,10 @@
 from domain.project.repositories.project_repository import ProjectRepository
+from domain.project.repositories.async_project_repository import (
+    AsyncProjectRepository,
+)
+from domain.project.repositories.questionnaire_repository import (
+    QuestionnaireRepository,
+)
+from domain.project.repositories.async_questionnaire_repository import (
+    AsyncQuestionnaireRepository,
+)
@@ -0,0 +1,56 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+
+
+class AsyncProjectRepository(ABC):
+    """Asynchronous counterpart of ProjectRepository, for code running on an event
+    loop. Each method has the contract of the ProjectRepository method of the same
+    name."""
+
+    @abstractmethod
+    async def get_all_projects(self) -> List[Project]:
+        pass
+
+    @abstractmethod
+    async def get_projects_page(self, page_request: PageRequest) -> Page:
+        pass
+
+    @abstractmethod
+    async def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        pass
+
+    @abstractmethod
+    async def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        pass
+
+    @abstractmethod
+    async def insert_project(self, project: Project) -> ProjectId:
+        pass
+
+    @abstractmethod
+    async def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def get_version(self) -> int:
+        pass
+
+    @abstractmethod
+    async def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        pass
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
+
+from domain.graph.core import QuestionId, QuestionTransitions
+from domain.project.core import ProjectId, SelectableQuestion
+
+
+class AsyncQuestionnaireRepository(ABC):
+    """Asynchronous counterpart of QuestionnaireRepository, for code running on an
+    event loop. Each method has the contract of the QuestionnaireRepository method of
+    the same name."""
+
+    @abstractmethod
+    async def get_questionnaire(
+        self, project_id: ProjectId
+    ) -> List[SelectableQuestion]:
+        pass
+
+    @abstractmethod
+    async def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        pass
+
+    @abstractmethod
+    async def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        pass
+
+    @abstractmethod
+    async def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        pass
+
+    @abstractmethod
+    async def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        pass
+
+    @abstractmethod
+    async def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        pass
+
+    @abstractmethod
+    async def delete_questionnaire(self, project_id: ProjectId) -> None:
+        pass
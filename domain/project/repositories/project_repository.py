@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from domain.common.core import Page, PageRequest
 from domain.project.core import ProjectId, Project
 
 
@@ -12,6 +13,16 @@ class ProjectRepository(ABC):
         :return: a list of all projects"""
         pass
 
+    @abstractmethod
+    def get_projects_page(self, page_request: PageRequest) -> Page:
+        """Gets a page of projects, ordered by id
+        :param page_request: the page size, the cursor of the previous page and the
+        fields to read
+        :return: the serialized projects, holding only the requested fields,
+        and the cursor of the next page if any
+        :raises BadRequestError: if the cursor is malformed"""
+        pass
+
     @abstractmethod
     def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
         """Gets a project by its id
@@ -19,6 +30,13 @@ class ProjectRepository(ABC):
         :return: the project or None if it does not exist"""
         pass
 
+    @abstractmethod
+    def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        """Gets projects by their ids, in a single read
+        :param project_ids: the project ids, duplicates being read once
+        :return: the projects which exist, in the order of their ids"""
+        pass
+
     @abstractmethod
     def insert_project(self, project) -> ProjectId:
         """Inserts a project
@@ -28,16 +46,46 @@ class ProjectRepository(ABC):
         pass
 
     @abstractmethod
-    def update_project(self, project_id: ProjectId, project) -> None:
-        """Updates an existing project
+    def update_project(
+        self,
+        project_id: ProjectId,
+        project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        """Updates an existing project, checking its revision in the same write
         :param project_id: the id of the project to update
         :param project: the updated project
-        :raises NotFoundError: if the project does not exist"""
+        :param revisions: the revisions the project is expected to be at, None to
+        update it whatever its revision
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions"""
         pass
 
     @abstractmethod
-    def delete_project(self, project_id: ProjectId) -> None:
-        """Deletes a project
+    def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        """Deletes a project, checking its revision in the same write
         :param project_id: the id of the project to delete
-        :raises NotFoundError: if the project does not exist"""
+        :param revisions: the revisions the project is expected to be at, None to
+        delete it whatever its revision
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the revisions"""
+        pass
+
+    @abstractmethod
+    def get_version(self) -> int:
+        """Gets the version of the stored projects, which changes with every write,
+        including writes made by other processes
+        :return: the version"""
+        pass
+
+    @abstractmethod
+    def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        """Gets a project along with its revision, read together. The revision
+        changes with every write of the project
+        :param project_id: the project id
+        :return: the project and its revision, None if the project does not exist"""
         pass
@@ -1,10 +1,97 @@
 from abc import ABC, abstractmethod
+from typing import Callable, List, Optional
 
-from domain.project.core import SelectableQuestion
+from domain.graph.core import QuestionId, QuestionTransitions
+from domain.project.core import ProjectId, SelectableQuestion
 
 
 class QuestionnaireRepository(ABC):
+    """Stores the questionnaire of each project: the questions asked so far, in order,
+    with the answers selected for each of them"""
 
     @abstractmethod
-    def insert_selectable_question(self, question: SelectableQuestion) -> None:
+    def get_questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        """Gets the questions asked so far
+        :param project_id: the project id
+        :return: the questions, in the order they were asked
+        :raises NotFoundError: if the project does not exist"""
+        pass
+
+    @abstractmethod
+    def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        """Gets a question of the questionnaire, with its selected answers
+        :param project_id: the project id
+        :param question_id: the question id
+        :return: the question or None if it was not asked
+        :raises NotFoundError: if the project does not exist"""
+        pass
+
+    @abstractmethod
+    def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        """Asks the first question, unless the questionnaire is already started
+        :param project_id: the project id
+        :param question_id: the id of the first question
+        :return: the first question of the questionnaire or None if the question does
+        not exist
+        :raises NotFoundError: if the project does not exist"""
+        pass
+
+    @abstractmethod
+    def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        """Updates the answers selected for a question, out of the question as read
+        along with the questionnaire, so that the questionnaire is read once. When
+        they change, the questions asked after it are discarded, as they may lead
+        elsewhere
+        :param project_id: the project id
+        :param question_id: the question id
+        :param update: builds the question with its new selected answers out of the
+        question with its current ones, raising if they cannot be selected
+        :return: the question with its new selected answers
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked"""
+        pass
+
+    @abstractmethod
+    def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        """Asks the question following a question, unless it is already asked: the
+        one the transitions lead to from the answers selected for the given question
+        :param project_id: the project id
+        :param question_id: the id of the question answered
+        :param transitions: the questions that may follow the question answered
+        :return: the following question or None if the questionnaire is over
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked"""
+        pass
+
+    @abstractmethod
+    def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        """Discards the questions asked after a question, which becomes the last one
+        :param project_id: the project id
+        :param question_id: the question id
+        :return: the question, with its selected answers
+        :raises NotFoundError: if the project does not exist or the question was not
+        asked"""
+        pass
+
+    @abstractmethod
+    def delete_questionnaire(self, project_id: ProjectId) -> None:
+        """Discards all the questions asked
+        :param project_id: the project id
+        :raises NotFoundError: if the project does not exist"""
         pass
@@ -0,0 +1,28 @@
+import base64
+import binascii
+import json
+from typing import List
+
+from utils.errors import BadRequestError
+
+
+def encode_cursor(keys: List) -> str:
+    """Encodes the sort keys of the last item of a page into an opaque cursor
+    :param keys: the sort keys, JSON serializable
+    :return: the cursor"""
+    return base64.urlsafe_b64encode(json.dumps(keys).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List:
+    """Decodes a cursor created by encode_cursor
+    :param cursor: the cursor
+    :param size: the expected number of sort keys
+    :return: the sort keys
+    :raises BadRequestError: if the cursor is malformed"""
+    try:
+        keys = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise BadRequestError("Invalid cursor")
+    if not isinstance(keys, list) or len(keys) != size:
+        raise BadRequestError("Invalid cursor")
+    return keys
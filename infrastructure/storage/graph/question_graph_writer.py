@@ -0,0 +1,126 @@
+from typing import Callable, List, Optional
+
+from domain.graph.core import Answer, Question
+from presentation.presentation import serialize
+from utils.neo4j_driver import Neo4jQuery
+
+
+class QuestionGraphWriter:
+    """Builds the statements writing a batch of questions, together with their answers
+    and their HAS_ANSWER, PREVIOUS and ENABLED_BY relationships.
+    There is one UNWIND statement per node or relationship type and per chunk of
+    questions, and links are created after all the nodes, so questions of the same batch
+    may refer to each other in any order."""
+
+    @staticmethod
+    def queries(
+        questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[Neo4jQuery]:
+        """Gets the statements to be run in a single transaction to write the questions
+        :param questions: the questions to write
+        :param chunk_size: the maximum number of questions written by each statement,
+        all of them in a single statement per type if None
+        :return: the list of statements, statements with nothing to write are omitted"""
+        size: int = chunk_size or max(len(questions), 1)
+        chunks: List[List[Question]] = [
+            questions[i : i + size] for i in range(0, len(questions), size)
+        ]
+        # All the nodes of all the chunks are created before any link
+        statements: List[Callable[[List[Question]], Optional[Neo4jQuery]]] = [
+            QuestionGraphWriter._questions_query,
+            QuestionGraphWriter._answers_query,
+            QuestionGraphWriter._previous_links_query,
+            QuestionGraphWriter._enabling_links_query,
+        ]
+        queries: List[Neo4jQuery] = []
+        for statement in statements:
+            for chunk in chunks:
+                query: Optional[Neo4jQuery] = statement(chunk)
+                if query is not None:
+                    queries.append(query)
+        return queries
+
+    @staticmethod
+    def _questions_query(questions: List[Question]) -> Optional[Neo4jQuery]:
+        return Neo4jQuery(
+            "UNWIND $questions AS question"
+            " CREATE (q:Question) SET q = question, q.revision = 1",
+            {
+                "questions": [
+                    QuestionGraphWriter.convert_question_in_node(question)
+                    for question in questions
+                ]
+            },
+        )
+
+    @staticmethod
+    def _answers_query(questions: List[Question]) -> Optional[Neo4jQuery]:
+        answers: List[dict] = [
+            {
+                "question_id": question.id.code,
+                "answer": QuestionGraphWriter.convert_answer_in_node(answer),
+            }
+            for question in questions
+            for answer in question.available_answers
+        ]
+        if not answers:
+            return None
+        return Neo4jQuery(
+            "UNWIND $answers AS row"
+            " MATCH (q:Question {id: row.question_id})"
+            " CREATE (q)-[:HAS_ANSWER]->(a:Answer) SET a = row.answer",
+            {"answers": answers},
+        )
+
+    @staticmethod
+    def _previous_links_query(questions: List[Question]) -> Optional[Neo4jQuery]:
+        links: List[dict] = [
+            {
+                "question_id": question.id.code,
+                "previous_question_id": question.previous_question_id.code,
+            }
+            for question in questions
+            if question.previous_question_id
+        ]
+        if not links:
+            return None
+        return Neo4jQuery(
+            "UNWIND $links AS row"
+            " MATCH (q:Question {id: row.question_id})"
+            " MATCH (prev:Question {id: row.previous_question_id})"
+            " CREATE (q)-[:PREVIOUS]->(prev)",
+            {"links": links},
+        )
+
+    @staticmethod
+    def _enabling_links_query(questions: List[Question]) -> Optional[Neo4jQuery]:
+        links: List[dict] = [
+            {"question_id": question.id.code, "answer_id": answer_id.code}
+            for question in questions
+            for answer_id in question.enabled_by
+        ]
+        if not links:
+            return None
+        return Neo4jQuery(
+            "UNWIND $links AS row"
+            " MATCH (q:Question {id: row.question_id})"
+            " MATCH (a:Answer {id: row.answer_id})"
+            " CREATE (q)-[:ENABLED_BY]->(a)",
+            {"links": links},
+        )
+
+    @staticmethod
+    def convert_question_in_node(question: Question) -> dict:
+        q: dict = serialize(question)
+        q["id"] = question.id.code
+        q["created_at"] = question.created_at.isoformat()
+        del q["available_answers"]
+        del q["previous_question_id"]
+        del q["enabled_by"]
+        return q
+
+    @staticmethod
+    def convert_answer_in_node(answer: Answer) -> dict:
+        a: dict = serialize(answer)
+        a["id"] = answer.id.code
+        return a
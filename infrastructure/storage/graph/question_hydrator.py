@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+from domain.common.trusted import construct_trusted
+from domain.graph.core import AnswerId, Question, QuestionId
+from domain.graph.core.enum import Action, QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+
+# Enum members by stored value, cheaper to look up than calling the enums
+_QUESTION_TYPES: Dict[str, QuestionType] = {t.value: t for t in QuestionType}
+_ACTIONS: Dict[int, Action] = {a.value: a for a in Action}
+
+
+class QuestionHydrator:
+    """Builds questions out of the rows returned by a question read query.
+    Every read query matches the question as `q` and then returns
+    `QuestionHydrator.RETURN_CLAUSE`, so that answers, previous question and enabling
+    answers of all the matched questions are fetched in a single round trip."""
+
+    RETURN_CLAUSE: str = (
+        " RETURN q,"
+        " [(q)-[:HAS_ANSWER]->(a:Answer) | a] AS answers,"
+        " head([(q)-[:PREVIOUS]->(prev:Question) | prev.id]) AS previous_question_id,"
+        " [(q)-[:ENABLED_BY]->(e:Answer) | e.id] AS enabled_by"
+    )
+
+    # The same items as RETURN_CLAUSE in a map, for queries collecting many questions
+    # in a single row
+    ROW_MAP: str = (
+        "{q: q,"
+        " answers: [(q)-[:HAS_ANSWER]->(a:Answer) | a],"
+        " previous_question_id: head([(q)-[:PREVIOUS]->(prev:Question) | prev.id]),"
+        " enabled_by: [(q)-[:ENABLED_BY]->(e:Answer) | e.id]}"
+    )
+
+    # Cypher expressions of each field, as returned by projection queries
+    _PROJECTIONS: Dict[str, str] = {
+        "id": "q.id",
+        "text": "q.text",
+        "type": "q.type",
+        "available_answers": "[(q)-[:HAS_ANSWER]->(a:Answer) | a {.id, .text, .value}]",
+        "previous_question_id": "head([(q)-[:PREVIOUS]->(prev:Question) | prev.id])",
+        "enabled_by": "[(q)-[:ENABLED_BY]->(e:Answer) | e.id]",
+        "action_needed": "q.action_needed",
+        "created_at": "q.created_at",
+    }
+
+    @staticmethod
+    def projection_clause(fields: Iterable[str]) -> str:
+        """Gets the RETURN items reading only the given fields of the question `q`,
+        so that unrequested answers and links are not even traversed
+        :param fields: the names of the fields of Question to read
+        :return: the comma separated items, each aliased as the field name"""
+        return ", ".join(
+            f"{QuestionHydrator._PROJECTIONS[field]} AS {field}" for field in fields
+        )
+
+    @staticmethod
+    def hydrate_projection(record: dict, fields: Iterable[str]) -> dict:
+        """Converts a row returned by a projection query into a serialized question
+        holding only the given fields
+        :param record: a row whose items come from projection_clause
+        :param fields: the names of the projected fields
+        :return: the serialized question, in the same shape as `serialize` produces"""
+        question: dict = {}
+        for field in fields:
+            value = record[field]
+            match field:
+                case "id":
+                    value = {"code": value}
+                case "available_answers":
+                    value = [
+                        {
+                            "id": {"code": a["id"]},
+                            "text": a["text"],
+                            "value": a["value"],
+                        }
+                        for a in sorted(value, key=lambda a: a["text"])
+                    ]
+                case "previous_question_id":
+                    value = {"code": value} if value else None
+                case "enabled_by":
+                    value = [{"code": code} for code in sorted(value)]
+            question[field] = value
+        return question
+
+    @staticmethod
+    def hydrate(record: dict) -> Question:
+        """Converts a single row into a question. Rows hold what the service itself
+        wrote, so the question is built without validation
+        :param record: a row returned by a query ending with RETURN_CLAUSE
+        :return: the question"""
+        q = record["q"]
+        previous_question_id = record["previous_question_id"]
+        action_needed = q.get("action_needed")
+        return QuestionFactory.create_trusted_question(
+            construct_trusted(QuestionId, code=q["id"]),
+            q["text"],
+            _QUESTION_TYPES[q["type"]],
+            frozenset(
+                AnswerFactory.create_trusted_answer(
+                    construct_trusted(AnswerId, code=a["id"]), a["text"], a["value"]
+                )
+                for a in record["answers"]
+            ),
+            (
+                construct_trusted(QuestionId, code=previous_question_id)
+                if previous_question_id
+                else None
+            ),
+            frozenset(
+                construct_trusted(AnswerId, code=code) for code in record["enabled_by"]
+            ),
+            _ACTIONS[action_needed] if action_needed is not None else None,
+            datetime.fromisoformat(q["created_at"]),
+        )
+
+    @staticmethod
+    def hydrate_with_revision(record: dict) -> Tuple[Question, int]:
+        """Converts a single row into a question along with its revision, which the
+        node returned by RETURN_CLAUSE holds
+        :param record: a row returned by a query ending with RETURN_CLAUSE
+        :return: the question and its revision"""
+        return QuestionHydrator.hydrate(record), record["q"]["revision"]
+
+    @staticmethod
+    def hydrate_all(records: List[dict]) -> List[Question]:
+        """Converts all the rows of a result set into questions
+        :param records: the rows returned by a query ending with RETURN_CLAUSE
+        :return: the list of questions"""
+        return [QuestionHydrator.hydrate(record) for record in records]
@@ -0,0 +1,330 @@
+from typing import FrozenSet, List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import AnswerId, Question, QuestionFilter, QuestionId
+from domain.graph.repositories.question_repository import CANDIDATE_ID_PREFIX
+from infrastructure.storage.cursor import decode_cursor, encode_cursor
+from infrastructure.storage.graph.question_graph_writer import QuestionGraphWriter
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.graph_version import GraphVersion
+from utils.errors import NotFoundError, PreconditionFailedError
+from utils.neo4j_driver import Neo4jQuery
+
+
+class QuestionQueries:
+    """Builds the statements of the question repositories and reads their records,
+    so that the blocking and the asynchronous repositories run the same Cypher"""
+
+    # Moves the questions enabled by the answer bound to `a` to their next revision,
+    # as they lose the link to it when it is deleted
+    _REVISE_ENABLED_QUESTIONS: str = (
+        " CALL { WITH a MATCH (enabled:Question)-[:ENABLED_BY]->(a)"
+        " SET enabled.revision = enabled.revision + 1 }"
+    )
+
+    # Brings the answers and the outgoing links of the question bound to `q` in line
+    # with the parameters, writing only what differs: answers keeping their id are
+    # updated in place, keeping the links other questions have to them, and links
+    # already there are left alone. The question moves to its next revision
+    _WRITE_QUESTION_CHANGES: str = (
+        " WITH q, q.revision + 1 AS revision"
+        " SET q = $question, q.revision = revision"
+        " WITH q"
+        " CALL { WITH q MATCH (q)-[:HAS_ANSWER]->(a:Answer)"
+        " WHERE NOT a.id IN $answer_ids"
+        + _REVISE_ENABLED_QUESTIONS
+        + " DETACH DELETE a }"
+        " CALL { WITH q UNWIND $answers AS answer"
+        " OPTIONAL MATCH (q)-[:HAS_ANSWER]->(a:Answer {id: answer.id})"
+        " FOREACH (_ IN CASE WHEN a IS NULL THEN [1] ELSE [] END |"
+        " CREATE (q)-[:HAS_ANSWER]->(created:Answer) SET created = answer)"
+        " FOREACH (_ IN CASE WHEN properties(a) <> answer THEN [1] ELSE [] END |"
+        " SET a = answer)"
+        " RETURN count(*) AS answers }"
+        " CALL { WITH q MATCH (q)-[link:PREVIOUS]->(prev:Question)"
+        " WHERE $previous_question_id IS NULL OR prev.id <> $previous_question_id"
+        " DELETE link }"
+        " CALL { WITH q MATCH (prev:Question {id: $previous_question_id})"
+        " WHERE NOT (q)-[:PREVIOUS]->(prev)"
+        " CREATE (q)-[:PREVIOUS]->(prev) RETURN count(prev) AS previous_links }"
+        " CALL { WITH q MATCH (q)-[link:ENABLED_BY]->(e:Answer)"
+        " WHERE NOT e.id IN $enabled_by DELETE link }"
+        " CALL { WITH q MATCH (e:Answer) WHERE e.id IN $enabled_by"
+        " AND NOT (q)-[:ENABLED_BY]->(e)"
+        " CREATE (q)-[:ENABLED_BY]->(e) RETURN count(e) AS enabling_links }"
+    )
+
+    # Binds `current` to whether the question bound to `q` is at one of the expected
+    # revisions, all of them matching if none is expected
+    _CHECK_REVISION: str = (
+        " WITH q, $revisions IS NULL OR q.revision IN $revisions AS current"
+    )
+
+    @staticmethod
+    def all_questions() -> Neo4jQuery:
+        return Neo4jQuery("MATCH (q:Question)" + QuestionHydrator.RETURN_CLAUSE, {})
+
+    @staticmethod
+    def all_questions_in_creation_order() -> Neo4jQuery:
+        return Neo4jQuery(
+            "MATCH (q:Question)"
+            " WITH q ORDER BY q.created_at, q.id" + QuestionHydrator.RETURN_CLAUSE,
+            {},
+        )
+
+    @staticmethod
+    def page_fields(page_request: PageRequest) -> List[str]:
+        """Gets the fields a page holds
+        :param page_request: the page request
+        :return: the requested fields, all of them if none is requested"""
+        return [
+            field
+            for field in Question.model_fields
+            if page_request.fields is None or field in page_request.fields
+        ]
+
+    @staticmethod
+    def questions_page(
+        page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Neo4jQuery:
+        """Builds the query of a page, keyed on creation time and id
+        :raises BadRequestError: if the cursor is malformed"""
+        fields: List[str] = QuestionQueries.page_fields(page_request)
+        params: dict = {}
+        conditions: List[str] = []
+        query_string = "MATCH (q:Question)"
+        if question_filter.previous_question_id:
+            query_string += "-[:PREVIOUS]->(:Question {id: $previous_question_id})"
+            params["previous_question_id"] = question_filter.previous_question_id.code
+        if question_filter.type is not None:
+            conditions.append("q.type = $type")
+            params["type"] = question_filter.type.value
+        if question_filter.action_needed is not None:
+            conditions.append("q.action_needed = $action_needed")
+            params["action_needed"] = question_filter.action_needed.value
+        if page_request.cursor:
+            after_created_at, after_id = decode_cursor(page_request.cursor, 2)
+            conditions.append(
+                "(q.created_at > $after_created_at"
+                " OR (q.created_at = $after_created_at AND q.id > $after_id))"
+            )
+            params["after_created_at"] = after_created_at
+            params["after_id"] = after_id
+        if conditions:
+            query_string += " WHERE " + " AND ".join(conditions)
+        query_string += " WITH q ORDER BY q.created_at, q.id"
+        if page_request.limit:
+            # One more row tells whether there is a next page
+            query_string += " LIMIT $limit"
+            params["limit"] = page_request.limit + 1
+        query_string += " RETURN q.created_at AS cursor_created_at, q.id AS cursor_id"
+        if fields:
+            query_string += ", " + QuestionHydrator.projection_clause(fields)
+        return Neo4jQuery(query_string, params)
+
+    @staticmethod
+    def read_page(records: List[dict], page_request: PageRequest) -> Page:
+        """Reads the records of a page query into a page"""
+        fields: List[str] = QuestionQueries.page_fields(page_request)
+        next_cursor: Optional[str] = None
+        if page_request.limit and len(records) > page_request.limit:
+            records = records[: page_request.limit]
+            next_cursor = encode_cursor(
+                [records[-1]["cursor_created_at"], records[-1]["cursor_id"]]
+            )
+        return Page(
+            items=[
+                QuestionHydrator.hydrate_projection(record, fields)
+                for record in records
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def question_by_id(question_id: QuestionId) -> Neo4jQuery:
+        return Neo4jQuery(
+            "MATCH (q:Question {id: $question_id})" + QuestionHydrator.RETURN_CLAUSE,
+            {"question_id": question_id.code},
+        )
+
+    @staticmethod
+    def questions_by_ids(question_ids: List[QuestionId]) -> Neo4jQuery:
+        """Builds the statement reading questions by their ids, which returns them
+        in the order of their ids"""
+        return Neo4jQuery(
+            "UNWIND $question_ids AS id MATCH (q:Question {id: id})"
+            + QuestionHydrator.RETURN_CLAUSE,
+            {
+                "question_ids": list(
+                    dict.fromkeys(question_id.code for question_id in question_ids)
+                )
+            },
+        )
+
+    @staticmethod
+    def insert_questions(
+        questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[Neo4jQuery]:
+        """Builds the statements of the transaction inserting questions"""
+        return QuestionGraphWriter.queries(questions, chunk_size) + [
+            GraphVersion.bump_query(GraphVersion.QUESTIONS)
+        ]
+
+    @staticmethod
+    def update_question(
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> Neo4jQuery:
+        """Builds the statement updating a question in place, unless it is at none of
+        the expected revisions. The statement returns whether the revision was one
+        of them, and no record if the question does not exist. Its cost grows with
+        the size of the change rather than with the size of the question
+        :param revisions: the expected revisions, None to update the question
+        whatever its revision"""
+        query_string = (
+            "MATCH (q:Question {id: $question_id})"
+            + QuestionQueries._CHECK_REVISION
+            + " CALL { WITH q, current WITH q WHERE current"
+            + QuestionQueries._WRITE_QUESTION_CHANGES
+            + GraphVersion.bump_clause(GraphVersion.QUESTIONS)
+            + " } RETURN current"
+        )
+        params: dict = QuestionQueries._question_params(question)
+        params["question_id"] = question_id.code
+        params["revisions"] = revisions
+        return Neo4jQuery(query_string, params)
+
+    @staticmethod
+    def delete_question(
+        question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> Neo4jQuery:
+        """Builds the statement deleting a question, unless it is at none of the
+        expected revisions. The questions that followed it or were enabled by its
+        answers move to their next revision, as they lose their links. The statement
+        returns whether the revision was one of the expected ones, and no record if
+        the question does not exist
+        :param revisions: the expected revisions, None to delete the question
+        whatever its revision"""
+        return Neo4jQuery(
+            "MATCH (q:Question {id: $question_id})"
+            + QuestionQueries._CHECK_REVISION
+            + " CALL { WITH q, current WITH q WHERE current"
+            " CALL { WITH q MATCH (follower:Question)-[:PREVIOUS]->(q)"
+            " SET follower.revision = follower.revision + 1 }"
+            " CALL { WITH q MATCH (q)-[:HAS_ANSWER]->(a:Answer)"
+            + QuestionQueries._REVISE_ENABLED_QUESTIONS
+            + " DETACH DELETE a }"
+            + GraphVersion.bump_clause(GraphVersion.QUESTIONS)
+            + " DETACH DELETE q } RETURN current",
+            {"question_id": question_id.code, "revisions": revisions},
+        )
+
+    @staticmethod
+    def check_current(records: List[dict], question_id: QuestionId) -> None:
+        """Checks the result of the update_question or delete_question statement
+        :param records: the rows returned
+        :param question_id: the question id
+        :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if the question is at none of the expected
+        revisions"""
+        if len(records) == 0:
+            raise NotFoundError(f"Question with id {question_id} does not exist")
+        if not records[0]["current"]:
+            raise QuestionQueries.modified(question_id)
+
+    @staticmethod
+    def modified(question_id: QuestionId) -> PreconditionFailedError:
+        """Builds the error of a write expecting another revision of a question
+        :param question_id: the question id
+        :return: the error"""
+        return PreconditionFailedError(f"Question with id {question_id} was modified")
+
+    @staticmethod
+    def last_inserted_question() -> Neo4jQuery:
+        return Neo4jQuery(
+            "MATCH (q:Question)"
+            " WITH q ORDER BY q.created_at DESC LIMIT 1"
+            + QuestionHydrator.RETURN_CLAUSE,
+            {},
+        )
+
+    @staticmethod
+    def existing_ids(
+        question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Neo4jQuery:
+        return Neo4jQuery(
+            "CALL { UNWIND $question_ids AS id MATCH (q:Question {id: id})"
+            " RETURN collect(q.id) AS question_ids }"
+            " CALL { UNWIND $answer_ids AS id MATCH (a:Answer {id: id})"
+            " RETURN collect(a.id) AS answer_ids }"
+            " RETURN question_ids, answer_ids",
+            {
+                "question_ids": [question_id.code for question_id in question_ids],
+                "answer_ids": [answer_id.code for answer_id in answer_ids],
+            },
+        )
+
+    @staticmethod
+    def read_existing_ids(
+        records: List[dict],
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        return (
+            frozenset(QuestionId(code=code) for code in records[0]["question_ids"]),
+            frozenset(AnswerId(code=code) for code in records[0]["answer_ids"]),
+        )
+
+    @staticmethod
+    def reserve_question_ids(count: int) -> Neo4jQuery:
+        """Builds the statement drawing the next numbers of the question id sequence,
+        which returns the free ids among them. The lock taken on the sequence node
+        serializes concurrent reservations until their transaction commits"""
+        return Neo4jQuery(
+            "MERGE (sequence:IdSequence {name: 'question'})"
+            " ON CREATE SET sequence.last = 0"
+            " SET sequence._lock = true REMOVE sequence._lock"
+            " WITH sequence, sequence.last + 1 AS first"
+            " SET sequence.last = sequence.last + $count"
+            " WITH first UNWIND range(first, first + $count - 1) AS number"
+            " WITH $prefix + toString(number) AS id"
+            " WHERE NOT EXISTS { MATCH (:Question {id: id}) }"
+            " RETURN id",
+            {"count": count, "prefix": CANDIDATE_ID_PREFIX},
+        )
+
+    @staticmethod
+    def read_reserved_ids(records: List[dict]) -> List[QuestionId]:
+        return [QuestionId(code=record["id"]) for record in records]
+
+    @staticmethod
+    def delete_all_questions() -> List[Neo4jQuery]:
+        return [
+            Neo4jQuery("MATCH (n:Question) DETACH DELETE n", {}),
+            Neo4jQuery("MATCH (n:Answer) DETACH DELETE n", {}),
+            GraphVersion.bump_query(GraphVersion.QUESTIONS),
+        ]
+
+    @staticmethod
+    def _question_params(question: Question) -> dict:
+        """Gets the parameters of an update. Null properties are left out, as they
+        are not stored, so that answer nodes compare equal to their unchanged maps"""
+        return {
+            "question": _stored_properties(
+                QuestionGraphWriter.convert_question_in_node(question)
+            ),
+            "answers": [
+                _stored_properties(QuestionGraphWriter.convert_answer_in_node(answer))
+                for answer in question.available_answers
+            ],
+            "answer_ids": [answer.id.code for answer in question.available_answers],
+            "previous_question_id": (
+                question.previous_question_id.code
+                if question.previous_question_id
+                else None
+            ),
+            "enabled_by": [answer_id.code for answer_id in question.enabled_by],
+        }
+
+
+def _stored_properties(node: dict) -> dict:
+    return {key: value for key, value in node.items() if value is not None}
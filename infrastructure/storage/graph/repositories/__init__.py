@@ -1,3 +1,15 @@
 from infrastructure.storage.graph.repositories.neo4j_question_repository import (
     Neo4jQuestionRepository,
 )
+from infrastructure.storage.graph.repositories.cached_question_repository import (
+    CachedQuestionRepository,
+)
+from infrastructure.storage.graph.repositories.async_neo4j_question_repository import (
+    AsyncNeo4jQuestionRepository,
+)
+from infrastructure.storage.graph.repositories.in_memory_question_repository import (
+    InMemoryQuestionRepository,
+)
+from infrastructure.storage.graph.repositories.async_in_memory_question_repository import (
+    AsyncInMemoryQuestionRepository,
+)
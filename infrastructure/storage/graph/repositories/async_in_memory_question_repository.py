@@ -0,0 +1,73 @@
+from typing import AsyncIterator, List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+from domain.graph.repositories import AsyncQuestionRepository
+from infrastructure.storage.graph.repositories.in_memory_question_repository import (
+    InMemoryQuestionRepository,
+)
+from infrastructure.storage.in_memory_store import InMemoryStore
+
+
+class AsyncInMemoryQuestionRepository(AsyncQuestionRepository):
+    """Serves an InMemoryQuestionRepository through the async interface, for test
+    and development runs of the ASGI application. The store is only locked for as
+    long as it is read or written, so its calls are made right on the event loop"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.repository: InMemoryQuestionRepository = InMemoryQuestionRepository(store)
+
+    async def get_all_questions(self) -> List[Question]:
+        return self.repository.get_all_questions()
+
+    async def iter_all_questions(self) -> AsyncIterator[Question]:
+        for question in self.repository.iter_all_questions():
+            yield question
+
+    async def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        return self.repository.get_questions_page(page_request, question_filter)
+
+    async def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        return self.repository.get_question_by_id(question_id)
+
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> List[Question]:
+        return self.repository.get_questions_by_ids(question_ids)
+
+    async def insert_question(self, question: Question) -> QuestionId:
+        return self.repository.insert_question(question)
+
+    async def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        return self.repository.insert_questions(questions, chunk_size)
+
+    async def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        self.repository.update_question(question_id, question, revisions)
+
+    async def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        self.repository.delete_question(question_id, revisions)
+
+    async def get_last_inserted_question(self) -> Optional[Question]:
+        return self.repository.get_last_inserted_question()
+
+    async def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        return self.repository.reserve_question_ids(count)
+
+    async def get_version(self) -> int:
+        return self.repository.get_version()
+
+    async def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        return self.repository.get_question_with_revision(question_id)
@@ -0,0 +1,125 @@
+from typing import AsyncIterator, List, Optional, Tuple
+
+from neo4j.exceptions import ConstraintError
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+from domain.graph.repositories import AsyncQuestionRepository
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.graph.question_queries import QuestionQueries
+from infrastructure.storage.graph_version import GraphVersion
+from utils.errors import ConflictError
+from utils.neo4j_async_driver import AsyncNeo4jDriver
+
+
+class AsyncNeo4jQuestionRepository(AsyncQuestionRepository):
+
+    def __init__(self, driver: AsyncNeo4jDriver):
+        self.driver: AsyncNeo4jDriver = driver
+
+    async def get_all_questions(self) -> List[Question]:
+        r: List[dict] = await self.driver.execute_read(QuestionQueries.all_questions())
+        return QuestionHydrator.hydrate_all(r)
+
+    async def iter_all_questions(self) -> AsyncIterator[Question]:
+        query = QuestionQueries.all_questions_in_creation_order()
+        async for record in self.driver.stream(query):
+            yield QuestionHydrator.hydrate(record)
+
+    async def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        r: List[dict] = await self.driver.execute_read(
+            QuestionQueries.questions_page(page_request, question_filter)
+        )
+        return QuestionQueries.read_page(r, page_request)
+
+    async def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        r: List[dict] = await self.driver.execute_read(
+            QuestionQueries.question_by_id(question_id)
+        )
+        if len(r) == 0:
+            return None
+        return QuestionHydrator.hydrate(r[0])
+
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> List[Question]:
+        r: List[dict] = await self.driver.execute_read(
+            QuestionQueries.questions_by_ids(question_ids)
+        )
+        return QuestionHydrator.hydrate_all(r)
+
+    async def insert_question(self, question: Question) -> QuestionId:
+        try:
+            return (await self.insert_questions([question]))[0]
+        except ConflictError:
+            raise ConflictError(f"Question with id {question.id} already exists")
+
+    async def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        if len(questions) == 0:
+            return []
+        try:
+            await self.driver.execute_write_all(
+                QuestionQueries.insert_questions(questions, chunk_size)
+            )
+        except ConstraintError:
+            ids: str = ", ".join(question.id.code for question in questions)
+            raise ConflictError(f"Some of the questions [{ids}] already exist")
+        return [question.id for question in questions]
+
+    async def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        try:
+            r: List[dict] = await self.driver.execute_write(
+                QuestionQueries.update_question(question_id, question, revisions)
+            )
+        except ConstraintError:
+            raise ConflictError(
+                f"Answers of question {question.id} conflict with existing answers"
+            )
+        QuestionQueries.check_current(r, question_id)
+
+    async def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        r: List[dict] = await self.driver.execute_write(
+            QuestionQueries.delete_question(question_id, revisions)
+        )
+        QuestionQueries.check_current(r, question_id)
+
+    async def get_last_inserted_question(self) -> Optional[Question]:
+        r: List[dict] = await self.driver.execute_read(
+            QuestionQueries.last_inserted_question()
+        )
+        if len(r) == 0:
+            return None
+        return QuestionHydrator.hydrate(r[0])
+
+    async def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        r: List[dict] = await self.driver.execute_write(
+            QuestionQueries.reserve_question_ids(count)
+        )
+        return QuestionQueries.read_reserved_ids(r)
+
+    async def get_version(self) -> int:
+        r: List[dict] = await self.driver.execute_read(
+            GraphVersion.read_query(GraphVersion.QUESTIONS)
+        )
+        return GraphVersion.read_version(r)
+
+    async def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        r: List[dict] = await self.driver.execute_read(
+            QuestionQueries.question_by_id(question_id)
+        )
+        if len(r) == 0:
+            return None
+        return QuestionHydrator.hydrate_with_revision(r[0])
@@ -0,0 +1,296 @@
+import threading
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import AnswerId, Question, QuestionFilter, QuestionId
+from domain.graph.repositories import QuestionRepository
+
+
+class CacheStats:
+    def __init__(self, hits: int, misses: int, evictions: int):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+
+    def __str__(self):
+        return f"CacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions})"
+
+
+class _Snapshot:
+    """Immutable view of the whole catalogue, indexed by question id, along with the
+    revision of each question, the version and the time it was loaded at"""
+
+    def __init__(
+        self, revised: List[Tuple[Question, int]], version: int, loaded_at: float
+    ):
+        questions: List[Question] = [question for question, _ in revised]
+        self.questions: Tuple[Question, ...] = tuple(questions)
+        self.by_id: Mapping[str, Question] = MappingProxyType(
+            {question.id.code: question for question in questions}
+        )
+        self.revisions: Mapping[str, int] = MappingProxyType(
+            {question.id.code: revision for question, revision in revised}
+        )
+        self.last_inserted: Optional[Question] = max(
+            questions, key=lambda question: question.created_at, default=None
+        )
+        self.version = version
+        self.loaded_at = loaded_at
+
+
+class CachedQuestionRepository(QuestionRepository):
+    """Read-through cache in front of another question repository.
+    The whole catalogue is kept as an immutable snapshot, tagged with the version of
+    the stored questions it was loaded at. The snapshot is reloaded once its time to
+    live expires, after any write made through this repository, or when the stored
+    version changed because another process wrote. The version is checked at most
+    once every `check_interval` seconds, on every read if 0, and never while holding
+    the lock of the cache, so that readers only wait for each other on a load.
+    Catalogues bigger than `max_size` are not snapshotted: once a load found the
+    catalogue oversized, questions are cached one by one in a LRU of `max_size`
+    entries, subject to the same expiry rules, for the lifetime of the repository.
+    Questions are cached along with their revision, read together with them.
+    Cached questions are shared between callers, who must not mutate them."""
+
+    def __init__(
+        self,
+        delegate: QuestionRepository,
+        ttl: float,
+        max_size: int,
+        check_interval: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.delegate = delegate
+        self.ttl = ttl
+        self.max_size = max_size
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        # Held by the thread loading the snapshot, which others wait for
+        self._load_lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._snapshot_checked_at: float = float("-inf")
+        self._oversized: bool = False
+        self._entries: OrderedDict[str, Tuple[Question, int, float]] = OrderedDict()
+        self._entries_version: Optional[int] = None
+        self._entries_checked_at: float = float("-inf")
+        # Bumped by every write, so that loads started before a write are discarded
+        self._generation: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get_stats(self) -> CacheStats:
+        """Gets the hit, miss and eviction counters since the repository was created
+        :return: the counters"""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions)
+
+    def invalidate(self) -> None:
+        """Drops every cached question"""
+        with self._lock:
+            self._generation += 1
+            self._snapshot = None
+            self._clear_entries()
+
+    def get_all_questions(self) -> List[Question]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is None:
+            return self.delegate.get_all_questions()
+        return list(snapshot.questions)
+
+    def iter_all_questions(self) -> Iterator[Question]:
+        return self.delegate.iter_all_questions()
+
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        return self.delegate.get_questions_page(page_request, question_filter)
+
+    def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is not None:
+            return snapshot.by_id.get(question_id.code)
+        entry: Optional[Tuple[Question, int]] = self._get_entry(question_id)
+        return entry[0] if entry is not None else None
+
+    def get_questions_by_ids(self, question_ids: List[QuestionId]) -> List[Question]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is None:
+            return self.delegate.get_questions_by_ids(question_ids)
+        questions: Iterator[Optional[Question]] = (
+            snapshot.by_id.get(code)
+            for code in dict.fromkeys(question_id.code for question_id in question_ids)
+        )
+        return [question for question in questions if question is not None]
+
+    def insert_question(self, question: Question) -> QuestionId:
+        try:
+            return self.delegate.insert_question(question)
+        finally:
+            self.invalidate()
+
+    def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        try:
+            return self.delegate.insert_questions(questions, chunk_size)
+        finally:
+            self.invalidate()
+
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        try:
+            self.delegate.update_question(question_id, question, revisions)
+        finally:
+            self.invalidate()
+
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        try:
+            self.delegate.delete_question(question_id, revisions)
+        finally:
+            self.invalidate()
+
+    def get_last_inserted_question(self) -> Optional[Question]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is None:
+            return self.delegate.get_last_inserted_question()
+        return snapshot.last_inserted
+
+    def get_existing_ids(
+        self, question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        return self.delegate.get_existing_ids(question_ids, answer_ids)
+
+    def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        return self.delegate.reserve_question_ids(count)
+
+    def get_version(self) -> int:
+        return self.delegate.get_version()
+
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is None:
+            return self._get_entry(question_id)
+        question: Optional[Question] = snapshot.by_id.get(question_id.code)
+        if question is None:
+            return None
+        return question, snapshot.revisions[question_id.code]
+
+    def get_all_questions_with_revisions(self) -> List[Tuple[Question, int]]:
+        snapshot: Optional[_Snapshot] = self._get_snapshot()
+        if snapshot is None:
+            return self.delegate.get_all_questions_with_revisions()
+        return [
+            (question, snapshot.revisions[question.id.code])
+            for question in snapshot.questions
+        ]
+
+    def _get_snapshot(self) -> Optional[_Snapshot]:
+        """Gets the snapshot of the catalogue, loading it if missing or outdated
+        :return: the snapshot, None if the catalogue is too big to be snapshotted"""
+        now: float = self.clock()
+        with self._lock:
+            if self._oversized:
+                return None
+            snapshot: Optional[_Snapshot] = self._snapshot
+            fresh: bool = snapshot is not None and now - snapshot.loaded_at < self.ttl
+            if fresh and now - self._snapshot_checked_at < self.check_interval:
+                self._hits += 1
+                return snapshot
+        if fresh:
+            version: int = self.delegate.get_version()
+            with self._lock:
+                if snapshot is self._snapshot and version == snapshot.version:
+                    self._snapshot_checked_at = now
+                    self._hits += 1
+                    return snapshot
+        # Concurrent readers wait for a single load
+        with self._load_lock:
+            with self._lock:
+                loaded: Optional[_Snapshot] = self._snapshot
+                if loaded is not None and loaded is not snapshot:
+                    self._hits += 1
+                    return loaded
+                if self._oversized:
+                    return None
+                self._misses += 1
+                if loaded is not None:
+                    self._evictions += 1
+                    self._snapshot = None
+                generation: int = self._generation
+            # The version is read first: a write landing in between makes the
+            # snapshot look outdated, never current
+            version = self.delegate.get_version()
+            revised: List[Tuple[Question, int]] = (
+                self.delegate.get_all_questions_with_revisions()
+            )
+            with self._lock:
+                if len(revised) > self.max_size:
+                    self._oversized = True
+                    return None
+                loaded = _Snapshot(revised, version, now)
+                if generation == self._generation:
+                    self._snapshot = loaded
+                    self._snapshot_checked_at = now
+                return loaded
+
+    def _get_entry(self, question_id: QuestionId) -> Optional[Tuple[Question, int]]:
+        now: float = self.clock()
+        with self._lock:
+            checked: bool = (
+                self._entries_version is not None
+                and now - self._entries_checked_at < self.check_interval
+            )
+        if not checked:
+            version: int = self.delegate.get_version()
+            with self._lock:
+                if version != self._entries_version:
+                    self._clear_entries()
+                    self._entries_version = version
+                self._entries_checked_at = now
+        with self._lock:
+            entry: Optional[Tuple[Question, int, float]] = self._entries.get(
+                question_id.code
+            )
+            if entry is not None and now - entry[2] < self.ttl:
+                self._entries.move_to_end(question_id.code)
+                self._hits += 1
+                return entry[0], entry[1]
+            self._misses += 1
+            generation: int = self._generation
+        revised: Optional[Tuple[Question, int]] = (
+            self.delegate.get_question_with_revision(question_id)
+        )
+        with self._lock:
+            if revised is not None and generation == self._generation:
+                self._entries[question_id.code] = (*revised, now)
+                self._entries.move_to_end(question_id.code)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return revised
+
+    def _clear_entries(self) -> None:
+        self._evictions += len(self._entries)
+        self._entries.clear()
+        self._entries_version = None
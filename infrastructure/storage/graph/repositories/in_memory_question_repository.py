@@ -0,0 +1,359 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import FrozenSet, Iterator, List, Optional, Sequence, Set, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import AnswerId, Question, QuestionFilter, QuestionId
+from domain.graph.repositories import QuestionRepository
+from domain.graph.repositories.question_repository import CANDIDATE_ID_PREFIX
+from infrastructure.storage.cursor import decode_cursor
+from infrastructure.storage.graph.question_graph_writer import QuestionGraphWriter
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.graph.question_queries import QuestionQueries
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.in_memory_store import InMemoryStore
+from utils.errors import BadRequestError, ConflictError, NotFoundError
+
+
+class InMemoryQuestionRepository(QuestionRepository):
+    """Keeps the questions in an InMemoryStore, for test and development runs.
+    It follows Neo4jQuestionRepository to the letter: links to questions or answers
+    that do not exist when a question is written are dropped, deleting a question
+    drops the links to it and to its answers, and updating a question keeps the
+    answers whose id it keeps, dropping the links other questions had to the others.
+    Questions written or losing a link move to their next revision, as nodes do.
+    Questions are stored as the same nodes and read back through the same hydrator
+    and page reader, so that both repositories return the very same results"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.store: InMemoryStore = store or InMemoryStore()
+
+    def get_all_questions(self) -> List[Question]:
+        return QuestionHydrator.hydrate_all(self._rows())
+
+    def iter_all_questions(self) -> Iterator[Question]:
+        for row in self._rows():
+            yield QuestionHydrator.hydrate(row)
+
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        fields: List[str] = QuestionQueries.page_fields(page_request)
+        after: Optional[Tuple[str, str]] = None
+        if page_request.cursor:
+            cursor_keys: list = decode_cursor(page_request.cursor, 2)
+            if not all(isinstance(key, str) for key in cursor_keys):
+                raise BadRequestError("Invalid cursor")
+            after = (cursor_keys[0], cursor_keys[1])
+        store: InMemoryStore = self.store
+        records: List[dict] = []
+        with store.lock:
+            keys: Sequence[Tuple[str, str]] = store.question_order
+            if question_filter.previous_question_id is not None:
+                keys = sorted(
+                    (store.questions[code]["created_at"], code)
+                    for code in store.followers.get(
+                        question_filter.previous_question_id.code, ()
+                    )
+                )
+            start: int = 0 if after is None else bisect_right(keys, after)
+            for index in range(start, len(keys)):
+                code: str = keys[index][1]
+                q: dict = store.questions[code]
+                if (
+                    question_filter.type is not None
+                    and q["type"] != question_filter.type.value
+                ) or (
+                    question_filter.action_needed is not None
+                    and q.get("action_needed") != question_filter.action_needed.value
+                ):
+                    continue
+                records.append(self._page_record(code, fields))
+                # One more record tells whether there is a next page
+                if page_request.limit and len(records) > page_request.limit:
+                    break
+        return QuestionQueries.read_page(records, page_request)
+
+    def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        with self.store.lock:
+            row: Optional[dict] = self.store.question_row(question_id.code)
+        if row is None:
+            return None
+        return QuestionHydrator.hydrate(row)
+
+    def get_questions_by_ids(self, question_ids: List[QuestionId]) -> List[Question]:
+        with self.store.lock:
+            rows: List[dict] = [
+                self.store.question_row(code)
+                for code in dict.fromkeys(
+                    question_id.code for question_id in question_ids
+                )
+                if code in self.store.questions
+            ]
+        return QuestionHydrator.hydrate_all(rows)
+
+    def insert_question(self, question: Question) -> QuestionId:
+        try:
+            return self.insert_questions([question])[0]
+        except ConflictError:
+            raise ConflictError(f"Question with id {question.id} already exists")
+
+    def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        if len(questions) == 0:
+            return []
+        store: InMemoryStore = self.store
+        with store.lock:
+            question_codes: List[str] = [question.id.code for question in questions]
+            answer_codes: List[str] = [
+                answer.id.code
+                for question in questions
+                for answer in question.available_answers
+            ]
+            if (
+                _has_duplicates(question_codes)
+                or _has_duplicates(answer_codes)
+                or any(code in store.questions for code in question_codes)
+                or any(code in store.answer_owners for code in answer_codes)
+            ):
+                ids: str = ", ".join(question_codes)
+                raise ConflictError(f"Some of the questions [{ids}] already exist")
+            # All the nodes are created before any link, so that the questions may
+            # refer to each other
+            for question in questions:
+                self._create_nodes(question)
+            for question in questions:
+                self._create_links(question)
+            store.bump(GraphVersion.QUESTIONS)
+        return [question.id for question in questions]
+
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            code: str = question_id.code
+            self._check_revision(question_id, revisions)
+            answer_codes: List[str] = [
+                answer.id.code for answer in question.available_answers
+            ]
+            if _has_duplicates(answer_codes) or any(
+                store.answer_owners.get(answer, code) != code for answer in answer_codes
+            ):
+                raise ConflictError(
+                    f"Answers of question {question.id} conflict with existing answers"
+                )
+            revision: int = store.questions[code]["revision"] + 1
+            self._delete_answers(code, frozenset(answer_codes))
+            self._delete_links(code)
+            self._delete_order_key(code)
+            self._create_nodes(question, revision)
+            self._create_links(question)
+            store.bump(GraphVersion.QUESTIONS)
+
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            code: str = question_id.code
+            self._check_revision(question_id, revisions)
+            self._delete_answers(code)
+            self._delete_links(code)
+            for follower in store.followers.pop(code, ()):
+                del store.previous[follower]
+                self._revise(follower)
+            self._delete_order_key(code)
+            del store.questions[code]
+            store.bump(GraphVersion.QUESTIONS)
+
+    def get_last_inserted_question(self) -> Optional[Question]:
+        with self.store.lock:
+            if not self.store.question_order:
+                return None
+            row: dict = self.store.question_row(self.store.question_order[-1][1])
+        return QuestionHydrator.hydrate(row)
+
+    def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        with self.store.lock:
+            first: int = self.store.question_id_sequence + 1
+            self.store.question_id_sequence += count
+            return [
+                QuestionId(code=code)
+                for code in (
+                    f"{CANDIDATE_ID_PREFIX}{number}"
+                    for number in range(first, first + count)
+                )
+                if code not in self.store.questions
+            ]
+
+    def get_version(self) -> int:
+        with self.store.lock:
+            return self.store.versions[GraphVersion.QUESTIONS]
+
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        with self.store.lock:
+            row: Optional[dict] = self.store.question_row(question_id.code)
+        if row is None:
+            return None
+        return QuestionHydrator.hydrate_with_revision(row)
+
+    def get_all_questions_with_revisions(self) -> List[Tuple[Question, int]]:
+        return [QuestionHydrator.hydrate_with_revision(row) for row in self._rows()]
+
+    def get_existing_ids(
+        self, question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        with self.store.lock:
+            return (
+                frozenset(
+                    question_id
+                    for question_id in question_ids
+                    if question_id.code in self.store.questions
+                ),
+                frozenset(
+                    answer_id
+                    for answer_id in answer_ids
+                    if answer_id.code in self.store.answer_owners
+                ),
+            )
+
+    def delete_all_questions(self) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            for index in (
+                store.questions,
+                store.question_order,
+                store.answers,
+                store.answer_owners,
+                store.previous,
+                store.followers,
+                store.enabled_by,
+                store.enabling,
+            ):
+                index.clear()
+            store.bump(GraphVersion.QUESTIONS)
+
+    def _rows(self) -> List[dict]:
+        """Gets the rows of all the questions, in creation order. Nodes are replaced
+        rather than changed by writes, so the rows may be hydrated once the lock is
+        released"""
+        with self.store.lock:
+            return [
+                self.store.question_row(code) for _, code in self.store.question_order
+            ]
+
+    def _page_record(self, code: str, fields: List[str]) -> dict:
+        """Builds the record a page query returns for a question"""
+        store: InMemoryStore = self.store
+        q: dict = store.questions[code]
+        record: dict = {"cursor_created_at": q["created_at"], "cursor_id": code}
+        for field in fields:
+            match field:
+                case "available_answers":
+                    value = [
+                        {"id": a["id"], "text": a["text"], "value": a["value"]}
+                        for a in store.answers[code]
+                    ]
+                case "previous_question_id":
+                    value = store.previous.get(code)
+                case "enabled_by":
+                    value = list(store.enabled_by.get(code, ()))
+                case _:
+                    value = q.get(field)
+            record[field] = value
+        return record
+
+    def _check_revision(
+        self, question_id: QuestionId, revisions: Optional[List[int]]
+    ) -> None:
+        """Checks that a question exists and is at one of the expected revisions
+        :raises NotFoundError: if the question does not exist
+        :raises PreconditionFailedError: if it is at none of the revisions"""
+        q: Optional[dict] = self.store.questions.get(question_id.code)
+        if q is None:
+            raise NotFoundError(f"Question with id {question_id} does not exist")
+        if revisions is not None and q["revision"] not in revisions:
+            raise QuestionQueries.modified(question_id)
+
+    def _revise(self, code: str) -> None:
+        """Moves a question to its next revision, replacing its node"""
+        q: dict = self.store.questions[code]
+        self.store.questions[code] = {**q, "revision": q["revision"] + 1}
+
+    def _create_nodes(self, question: Question, revision: int = 1) -> None:
+        store: InMemoryStore = self.store
+        code: str = question.id.code
+        q: dict = QuestionGraphWriter.convert_question_in_node(question)
+        q["revision"] = revision
+        store.questions[code] = q
+        insort(store.question_order, (q["created_at"], code))
+        store.answers[code] = [
+            QuestionGraphWriter.convert_answer_in_node(answer)
+            for answer in question.available_answers
+        ]
+        for answer in question.available_answers:
+            store.answer_owners[answer.id.code] = code
+
+    def _create_links(self, question: Question) -> None:
+        """Links a question to its previous question and enabling answers, those
+        which exist"""
+        store: InMemoryStore = self.store
+        code: str = question.id.code
+        previous: Optional[QuestionId] = question.previous_question_id
+        if previous is not None and previous.code in store.questions:
+            store.previous[code] = previous.code
+            store.followers.setdefault(previous.code, set()).add(code)
+        enabled_by: Set[str] = {
+            answer.code
+            for answer in question.enabled_by
+            if answer.code in store.answer_owners
+        }
+        if enabled_by:
+            store.enabled_by[code] = enabled_by
+            for answer in enabled_by:
+                store.enabling.setdefault(answer, set()).add(code)
+
+    def _delete_answers(self, code: str, kept: FrozenSet[str] = frozenset()) -> None:
+        """Deletes the answers of a question, and the links other questions had to
+        them, except for the links to the kept answers. The questions losing a link
+        move to their next revision"""
+        store: InMemoryStore = self.store
+        for a in store.answers.pop(code, ()):
+            if a["id"] in kept:
+                continue
+            del store.answer_owners[a["id"]]
+            for enabled in store.enabling.pop(a["id"], ()):
+                _discard(store.enabled_by, enabled, a["id"])
+                self._revise(enabled)
+
+    def _delete_links(self, code: str) -> None:
+        """Deletes the links of a question to its previous question and enabling
+        answers"""
+        store: InMemoryStore = self.store
+        previous: Optional[str] = store.previous.pop(code, None)
+        if previous is not None:
+            _discard(store.followers, previous, code)
+        for answer in store.enabled_by.pop(code, ()):
+            _discard(store.enabling, answer, code)
+
+    def _delete_order_key(self, code: str) -> None:
+        order: List[Tuple[str, str]] = self.store.question_order
+        del order[bisect_left(order, (self.store.questions[code]["created_at"], code))]
+
+
+def _has_duplicates(codes: List[str]) -> bool:
+    return len(set(codes)) != len(codes)
+
+
+def _discard(index: dict, key: str, value: str) -> None:
+    """Removes a value from the set of a key, and the key along with its last value"""
+    values: Set[str] = index[key]
+    values.discard(value)
+    if not values:
+        del index[key]
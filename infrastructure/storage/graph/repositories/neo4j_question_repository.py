@@ -1,187 +1,143 @@
-from typing import List, Optional
+from typing import FrozenSet, Iterator, List, Optional, Tuple
 
-from domain.graph.core import QuestionId, Question, AnswerId, Answer
+from neo4j.exceptions import ConstraintError
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import QuestionId, Question, AnswerId, QuestionFilter
 from domain.graph.core.enum import QuestionType
 from domain.graph.factories import AnswerFactory, QuestionFactory
 from domain.graph.repositories import QuestionRepository
-from presentation.presentation import serialize, deserialize
-from utils.env import DB_HOST, DB_USER, DB_PASSWORD
-from utils.errors import NotFoundError, ConflictError
-from utils.neo4j_driver import Neo4jDriver, Credentials, Neo4jQuery
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.graph.question_queries import QuestionQueries
+from infrastructure.storage.graph_version import GraphVersion
+from utils import env
+from utils.errors import ConflictError
+from utils.neo4j_driver import Neo4jDriver, Credentials
 
 
 class Neo4jQuestionRepository(QuestionRepository):
 
-    def __init__(self):
-        self.driver: Neo4jDriver = Neo4jDriver(
-            DB_HOST, Credentials(DB_USER, DB_PASSWORD)
+    def __init__(self, driver: Optional[Neo4jDriver] = None):
+        self.driver: Neo4jDriver = driver or Neo4jDriver(
+            env.DB_HOST, Credentials(env.DB_USER, env.DB_PASSWORD)
         )
 
     def get_all_questions(self) -> List[Question]:
-        query_string = (
-            "MATCH (q:Question)-[:HAS_ANSWER]->(a:Answer)"
-            "OPTIONAL MATCH (q)-[:PREVIOUS]->(prev:Question)"
-            "RETURN q, COLLECT(a) AS answers, prev.id AS previous_question_id"
+        res: List[dict] = self.driver.execute_read(QuestionQueries.all_questions())
+        return QuestionHydrator.hydrate_all(res)
+
+    def iter_all_questions(self) -> Iterator[Question]:
+        query = QuestionQueries.all_questions_in_creation_order()
+        for record in self.driver.stream(query):
+            yield QuestionHydrator.hydrate(record)
+
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.questions_page(page_request, question_filter)
         )
-        query: Neo4jQuery = Neo4jQuery(query_string, {})
-        res: List[dict] = self.driver.query(query)
-        questions: List[Question] = []
-        for r in res:
-            question: Question = self._convert_node_in_question(
-                r["q"], r["answers"], r["previous_question_id"]
-            )
-            questions.append(question)
-        return questions
+        return QuestionQueries.read_page(r, page_request)
 
     def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
-        query_string = (
-            "MATCH (q:Question {id: $question_id})-[:HAS_ANSWER]->(a:Answer)"
-            "OPTIONAL MATCH (q)-[:PREVIOUS]->(prev:Question)"
-            "RETURN q, COLLECT(a) AS answers, prev.id AS previous_question_id"
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.question_by_id(question_id)
         )
-        query: Neo4jQuery = Neo4jQuery(query_string, {"question_id": question_id.code})
-        r: List[dict] = self.driver.query(query)
         if len(r) == 0:
             return None
-        question: Question = self._convert_node_in_question(
-            r[0]["q"], r[0]["answers"], r[0]["previous_question_id"]
+        return QuestionHydrator.hydrate(r[0])
+
+    def get_questions_by_ids(self, question_ids: List[QuestionId]) -> List[Question]:
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.questions_by_ids(question_ids)
         )
-        return question
+        return QuestionHydrator.hydrate_all(r)
 
-    def insert_question(self, question: Question) -> None:
-        if self._check_question_exists(question.id):
+    def insert_question(self, question: Question) -> QuestionId:
+        try:
+            return self.insert_questions([question])[0]
+        except ConflictError:
             raise ConflictError(f"Question with id {question.id} already exists")
 
-        q: dict = self._convert_question_in_node(question)
-        prev_question_id: Optional[str] = None
-        if question.previous_question_id:
-            prev_question_id = question.previous_question_id.code
-
-        queries: List[Neo4jQuery] = [
-            Neo4jQuery(
-                "CREATE (:Question $question)",
-                {"question": q},
+    def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        if len(questions) == 0:
+            return []
+        try:
+            self.driver.execute_write_all(
+                QuestionQueries.insert_questions(questions, chunk_size)
             )
-        ]
-        for answer in question.available_answers:
-            a: dict = self._convert_answer_in_node(answer)
-            queries.append(Neo4jQuery("CREATE (:Answer $answer)", {"answer": a}))
-            queries.append(
-                Neo4jQuery(
-                    "MATCH (q:Question {id: $question_id}) MATCH (a:Answer {id: $answer_id}) CREATE (q)-[:HAS_ANSWER]->(a)",
-                    {"question_id": question.id.code, "answer_id": answer.id.code},
-                )
+        except ConstraintError:
+            ids: str = ", ".join(question.id.code for question in questions)
+            raise ConflictError(f"Some of the questions [{ids}] already exist")
+        return [question.id for question in questions]
+
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        try:
+            r: List[dict] = self.driver.execute_write(
+                QuestionQueries.update_question(question_id, question, revisions)
             )
-        if prev_question_id:
-            queries.append(
-                Neo4jQuery(
-                    "MATCH (q1:Question {id: $question_id}) MATCH (q2:Question {id: $prev_question_id}) CREATE (q1)-[:PREVIOUS]->(q2)",
-                    {
-                        "question_id": question.id.code,
-                        "prev_question_id": prev_question_id,
-                    },
-                )
-            )
-        for answer_id in question.enabled_by:
-            queries.append(
-                Neo4jQuery(
-                    "MATCH (q1:Question {id: $question_id}) MATCH (a:Answer {id: $answer_id}) CREATE (q1)-[:ENABLED_BY]->(a)",
-                    {"question_id": question.id.code, "answer_id": answer_id.code},
-                )
+        except ConstraintError:
+            raise ConflictError(
+                f"Answers of question {question.id} conflict with existing answers"
             )
+        QuestionQueries.check_current(r, question_id)
 
-        self.driver.transaction(queries)
-
-    def update_question(self, question_id: QuestionId, question: Question) -> None:
-        if not self._check_question_exists(question_id):
-            raise NotFoundError(f"Question with id {question_id} does not exist")
-        self.delete_question(question_id)
-        self.insert_question(question)
-
-    def delete_question(self, question_id: QuestionId) -> None:
-        if not self._check_question_exists(question_id):
-            raise NotFoundError(f"Question with id {question_id} does not exist")
-        self.driver.query(
-            Neo4jQuery(
-                "MATCH (q:Question {id: $question_id})-[:HAS_ANSWER]->(a:Answer) DETACH DELETE q, a",
-                {"question_id": question_id.code},
-            )
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        r: List[dict] = self.driver.execute_write(
+            QuestionQueries.delete_question(question_id, revisions)
         )
+        QuestionQueries.check_current(r, question_id)
 
     def get_last_inserted_question(self) -> Optional[Question]:
-        query_string = (
-            "MATCH (q:Question)-[:HAS_ANSWER]->(a:Answer)"
-            "OPTIONAL MATCH (q)-[:PREVIOUS]->(prev:Question)"
-            "RETURN q, COLLECT(a) AS answers, prev.id AS previous_question_id"
-            " ORDER BY q.created_at DESC LIMIT 1"
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.last_inserted_question()
         )
-        query: Neo4jQuery = Neo4jQuery(query_string, {})
-        r: List[dict] = self.driver.query(query)
         if len(r) == 0:
             return None
-        question: Question = self._convert_node_in_question(
-            r[0]["q"], r[0]["answers"], r[0]["previous_question_id"]
+        return QuestionHydrator.hydrate(r[0])
+
+    def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        r: List[dict] = self.driver.execute_write(
+            QuestionQueries.reserve_question_ids(count)
         )
-        return question
+        return QuestionQueries.read_reserved_ids(r)
 
-    def _check_question_exists(self, question_id: QuestionId) -> bool:
-        q: Question = self.get_question_by_id(question_id)
-        return q is not None
+    def get_version(self) -> int:
+        return GraphVersion.read(self.driver, GraphVersion.QUESTIONS)
 
-    def _get_enabled_by(self, question_id: QuestionId) -> List[dict]:
-        query_string = (
-            "MATCH (q:Question {id: $question_id}) "
-            "OPTIONAL MATCH (q)-[:ENABLED_BY]->(a:Answer) "
-            "RETURN COLLECT(a.id) AS enabled_by"
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.question_by_id(question_id)
         )
-        query: Neo4jQuery = Neo4jQuery(query_string, {"question_id": question_id.code})
-        r: List[dict] = self.driver.query(query)
-        return [{"code": code} for code in r[0]["enabled_by"]]
-
-    def _convert_question_in_node(self, question: Question) -> dict:
-        q: dict = serialize(question)
-        q["id"] = question.id.code
-        q["created_at"] = question.created_at.isoformat()
-        del q["available_answers"]
-        del q["previous_question_id"]
-        del q["enabled_by"]
-        return q
-
-    def _convert_node_in_question(
-        self, q: dict, answers: List, previous_question_id: QuestionId
-    ) -> Question:
-        question: dict = q
-        question["id"] = {"code": question["id"]}
-        question["created_at"] = question["created_at"]
-        question["available_answers"] = [
-            {"id": {"code": a["id"]}, "text": a["text"], "value": a["value"]}
-            for a in answers
-        ]
-        question["previous_question_id"] = (
-            {"code": previous_question_id} if previous_question_id else None
-        )
-        enabled_by: List[dict] = self._get_enabled_by(
-            QuestionId(code=question["id"]["code"])
+        if len(r) == 0:
+            return None
+        return QuestionHydrator.hydrate_with_revision(r[0])
+
+    def get_all_questions_with_revisions(self) -> List[Tuple[Question, int]]:
+        res: List[dict] = self.driver.execute_read(QuestionQueries.all_questions())
+        return [QuestionHydrator.hydrate_with_revision(record) for record in res]
+
+    def get_existing_ids(
+        self, question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        r: List[dict] = self.driver.execute_read(
+            QuestionQueries.existing_ids(question_ids, answer_ids)
         )
-        question["enabled_by"] = enabled_by
-        if "action_needed" in question:
-            question["action_needed"] = question["action_needed"]
-        else:
-            question["action_needed"] = None
-        return deserialize(question, Question)
-
-    def _convert_answer_in_node(self, answer: Answer) -> dict:
-        a: dict = serialize(answer)
-        a["id"] = answer.id.code
-        return a
+        return QuestionQueries.read_existing_ids(r)
 
     def delete_all_questions(self) -> None:
-        self.driver.transaction(
-            [
-                Neo4jQuery("MATCH (n:Question) DETACH DELETE n", {}),
-                Neo4jQuery("MATCH (n:Answer) DETACH DELETE n", {}),
-            ]
-        )
+        self.driver.execute_write_all(QuestionQueries.delete_all_questions())
 
 
 if __name__ == "__main__":
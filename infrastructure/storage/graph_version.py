@@ -0,0 +1,66 @@
+from typing import List
+
+from utils.neo4j_driver import Neo4jDriver, Neo4jQuery
+
+
+class GraphVersion:
+    """Version counters of the stored graph, one per scope. Every write transaction
+    of a scope increments its counter, so that processes caching the scope can
+    tell whether their copy is still current by reading a single node."""
+
+    QUESTIONS: str = "questions"
+    PROJECTS: str = "projects"
+
+    @staticmethod
+    def bump_clause(scope: str) -> str:
+        """Gets a unit subquery incrementing the counter of a scope, to be embedded
+        in a write statement. It runs once per incoming row, hence it must follow
+        a clause yielding one row per written entity
+        :param scope: the scope of the counter
+        :return: the Cypher clause"""
+        return (
+            f" CALL {{ MERGE (version:GraphVersion {{scope: '{scope}'}})"
+            " SET version.version = coalesce(version.version, 0) + 1 }"
+        )
+
+    @staticmethod
+    def bump_query(scope: str) -> Neo4jQuery:
+        """Gets a statement incrementing the counter of a scope, to be run in the
+        transaction that writes the scope
+        :param scope: the scope of the counter
+        :return: the query"""
+        return Neo4jQuery(
+            "MERGE (version:GraphVersion {scope: $scope})"
+            " SET version.version = coalesce(version.version, 0) + 1",
+            {"scope": scope},
+        )
+
+    @staticmethod
+    def read_query(scope: str) -> Neo4jQuery:
+        """Gets the query reading the counter of a scope
+        :param scope: the scope of the counter
+        :return: the query"""
+        return Neo4jQuery(
+            "MATCH (version:GraphVersion {scope: $scope})"
+            " RETURN version.version AS version",
+            {"scope": scope},
+        )
+
+    @staticmethod
+    def read_version(records: List[dict]) -> int:
+        """Reads the counter out of the records of read_query
+        :param records: the records
+        :return: the counter, 0 if the scope was never written"""
+        if len(records) == 0:
+            return 0
+        return records[0]["version"]
+
+    @staticmethod
+    def read(driver: Neo4jDriver, scope: str) -> int:
+        """Reads the counter of a scope
+        :param driver: the driver to use
+        :param scope: the scope of the counter
+        :return: the counter, 0 if the scope was never written"""
+        return GraphVersion.read_version(
+            driver.execute_read(GraphVersion.read_query(scope))
+        )
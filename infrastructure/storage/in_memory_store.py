@@ -0,0 +1,61 @@
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.project.questionnaire_state import QuestionnaireEntry
+
+
+class InMemoryStore:
+    """Holds the data of the in-memory repositories in the shape the database holds
+    it: question, answer and project nodes as property maps, and the links between
+    them indexed both ways. Repositories sharing a store see each other's writes, as
+    they would through a shared database.
+    Every repository operation runs under the lock of the store, hence is atomic and
+    isolated from the others, as a transaction would be."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.versions: Dict[str, int] = {
+            GraphVersion.QUESTIONS: 0,
+            GraphVersion.PROJECTS: 0,
+        }
+        # Question nodes by id, and their (created_at, id) keys in creation order
+        self.questions: Dict[str, dict] = {}
+        self.question_order: List[Tuple[str, str]] = []
+        # Answer nodes by question id, and the question id of each answer
+        self.answers: Dict[str, List[dict]] = {}
+        self.answer_owners: Dict[str, str] = {}
+        # PREVIOUS links by question id and the other way round
+        self.previous: Dict[str, str] = {}
+        self.followers: Dict[str, Set[str]] = {}
+        # ENABLED_BY links by question id and the other way round, by answer id
+        self.enabled_by: Dict[str, Set[str]] = {}
+        self.enabling: Dict[str, Set[str]] = {}
+        # Last number drawn from the question id sequence
+        self.question_id_sequence: int = 0
+        # Project nodes by id, and their ids in order
+        self.projects: Dict[str, dict] = {}
+        self.project_order: List[str] = []
+        # Questionnaires by project id, and the number of writes made to each
+        self.questionnaires: Dict[str, List[QuestionnaireEntry]] = {}
+        self.questionnaire_versions: Dict[str, int] = {}
+
+    def bump(self, scope: str) -> None:
+        """Increments the version counter of a scope, as every write does
+        :param scope: the scope of the counter, one of the GraphVersion scopes"""
+        self.versions[scope] += 1
+
+    def question_row(self, question_id: str) -> Optional[dict]:
+        """Gets a stored question in the shape of the rows of the question read
+        queries, so that it is hydrated the same way
+        :param question_id: the question id
+        :return: the row or None if the question does not exist"""
+        q: Optional[dict] = self.questions.get(question_id)
+        if q is None:
+            return None
+        return {
+            "q": q,
+            "answers": self.answers[question_id],
+            "previous_question_id": self.previous.get(question_id),
+            "enabled_by": sorted(self.enabled_by.get(question_id, ())),
+        }
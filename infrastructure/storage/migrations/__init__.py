@@ -0,0 +1,2 @@
+from infrastructure.storage.migrations.schema_migration import SchemaMigration
+from infrastructure.storage.migrations.schema_migrator import SchemaMigrator
@@ -0,0 +1,13 @@
+from infrastructure.storage.migrations import SchemaMigrator
+from utils import env
+from utils.neo4j_driver import Neo4jDriver, Credentials
+
+if __name__ == "__main__":
+    driver: Neo4jDriver = Neo4jDriver(
+        env.DB_HOST, Credentials(env.DB_USER, env.DB_PASSWORD)
+    )
+    try:
+        version: int = SchemaMigrator(driver).migrate()
+        print(f"Schema is at version {version}")
+    finally:
+        driver.close()
@@ -0,0 +1,62 @@
+from typing import List
+
+from infrastructure.storage.migrations.schema_migration import SchemaMigration
+
+MIGRATIONS: List[SchemaMigration] = [
+    SchemaMigration(
+        1,
+        "Uniqueness constraints on ids and range index on question creation time",
+        [
+            "CREATE CONSTRAINT schema_version_name IF NOT EXISTS "
+            "FOR (v:SchemaVersion) REQUIRE v.name IS UNIQUE",
+            "CREATE CONSTRAINT question_id IF NOT EXISTS "
+            "FOR (q:Question) REQUIRE q.id IS UNIQUE",
+            "CREATE CONSTRAINT answer_id IF NOT EXISTS "
+            "FOR (a:Answer) REQUIRE a.id IS UNIQUE",
+            "CREATE CONSTRAINT project_id IF NOT EXISTS "
+            "FOR (p:Project) REQUIRE p.id IS UNIQUE",
+            "CREATE RANGE INDEX question_created_at IF NOT EXISTS "
+            "FOR (q:Question) ON (q.created_at)",
+        ],
+    ),
+    SchemaMigration(
+        2,
+        "Uniqueness constraint on the scope of graph version counters",
+        [
+            "CREATE CONSTRAINT graph_version_scope IF NOT EXISTS "
+            "FOR (v:GraphVersion) REQUIRE v.scope IS UNIQUE",
+        ],
+    ),
+    # Version 3 was withdrawn. Versions are never reused or renumbered, as stored
+    # schema versions refer to them
+    SchemaMigration(
+        4,
+        "Questionnaires kept as event logs",
+        [
+            "CREATE CONSTRAINT questionnaire_project_id IF NOT EXISTS "
+            "FOR (q:Questionnaire) REQUIRE q.project_id IS UNIQUE",
+            "CREATE CONSTRAINT questionnaire_event_seq IF NOT EXISTS "
+            "FOR (e:QuestionnaireEvent) REQUIRE (e.project_id, e.seq) IS UNIQUE",
+        ],
+    ),
+    SchemaMigration(
+        5,
+        "Sequence of candidate question ids, starting after the ids in use",
+        [
+            "CREATE CONSTRAINT id_sequence_name IF NOT EXISTS "
+            "FOR (s:IdSequence) REQUIRE s.name IS UNIQUE",
+            "OPTIONAL MATCH (q:Question) WHERE q.id =~ 'q-[0-9]{1,18}' "
+            "WITH max(toInteger(substring(q.id, 2))) AS last "
+            "MERGE (sequence:IdSequence {name: 'question'}) "
+            "ON CREATE SET sequence.last = coalesce(last, 0)",
+        ],
+    ),
+    SchemaMigration(
+        6,
+        "Revision of each question and project",
+        [
+            "MATCH (q:Question) WHERE q.revision IS NULL SET q.revision = 1",
+            "MATCH (p:Project) WHERE p.revision IS NULL SET p.revision = 1",
+        ],
+    ),
+]
@@ -0,0 +1,15 @@
+from typing import List
+
+
+class SchemaMigration:
+    """A versioned set of idempotent schema statements (constraints, indexes)"""
+
+    def __init__(self, version: int, description: str, statements: List[str]):
+        self.version = version
+        self.description = description
+        self.statements = statements
+
+    def __str__(self):
+        return (
+            f"SchemaMigration(version={self.version}, description='{self.description}')"
+        )
@@ -0,0 +1,53 @@
+from typing import List
+
+from infrastructure.storage.migrations.migrations import MIGRATIONS
+from infrastructure.storage.migrations.schema_migration import SchemaMigration
+from utils.neo4j_driver import Neo4jDriver, Neo4jQuery
+from ws.utils.logger import logger
+
+SCHEMA_NAME: str = "reasoner"
+
+
+class SchemaMigrator:
+    """Applies the schema migrations that have not been applied yet.
+    The version of the last applied migration is stored in a (:SchemaVersion) node,
+    and every migration statement is idempotent, so concurrent or repeated runs are safe.
+    """
+
+    def __init__(
+        self, driver: Neo4jDriver, migrations: List[SchemaMigration] = MIGRATIONS
+    ):
+        self.driver = driver
+        self.migrations = sorted(migrations, key=lambda m: m.version)
+
+    def get_current_version(self) -> int:
+        """Gets the version of the last applied migration
+        :return: the applied version, 0 if no migration has been applied yet"""
+        r: List[dict] = self.driver.execute_read(
+            Neo4jQuery(
+                "MATCH (v:SchemaVersion {name: $name}) RETURN v.version AS version",
+                {"name": SCHEMA_NAME},
+            )
+        )
+        return r[0]["version"] if len(r) > 0 else 0
+
+    def migrate(self) -> int:
+        """Applies all the pending migrations in version order
+        :return: the schema version after the migration"""
+        current_version: int = self.get_current_version()
+        for migration in self.migrations:
+            if migration.version <= current_version:
+                continue
+            logger.info(f"Applying {migration}")
+            # Schema statements cannot share a transaction with data writes
+            for statement in migration.statements:
+                self.driver.execute_write(Neo4jQuery(statement, {}))
+            self.driver.execute_write(
+                Neo4jQuery(
+                    "MERGE (v:SchemaVersion {name: $name}) "
+                    "SET v.version = $version, v.applied_at = datetime()",
+                    {"name": SCHEMA_NAME, "version": migration.version},
+                )
+            )
+            current_version = migration.version
+        return current_version
@@ -0,0 +1,192 @@
+from typing import List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.common.trusted import construct_trusted
+from domain.project.core import Project, ProjectId
+from domain.project.factories import ProjectFactory
+from infrastructure.storage.cursor import decode_cursor, encode_cursor
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.project.questionnaire_queries import QuestionnaireQueries
+from presentation.presentation import serialize
+from utils.errors import NotFoundError, PreconditionFailedError
+from utils.neo4j_driver import Neo4jQuery
+
+
+class ProjectQueries:
+    """Builds the statements of the project repositories and reads their records,
+    so that the blocking and the asynchronous repositories run the same Cypher"""
+
+    # Binds `current` to whether the project bound to `p` is at one of the expected
+    # revisions, all of them matching if none is expected
+    _CHECK_REVISION: str = (
+        " WITH p, $revisions IS NULL OR p.revision IN $revisions AS current"
+    )
+
+    @staticmethod
+    def all_projects() -> Neo4jQuery:
+        return Neo4jQuery("MATCH (p:Project) RETURN p", {})
+
+    @staticmethod
+    def page_fields(page_request: PageRequest) -> List[str]:
+        """Gets the fields a page holds
+        :param page_request: the page request
+        :return: the requested fields, all of them if none is requested"""
+        return [
+            field
+            for field in Project.model_fields
+            if page_request.fields is None or field in page_request.fields
+        ]
+
+    @staticmethod
+    def projects_page(page_request: PageRequest) -> Neo4jQuery:
+        """Builds the query of a page, keyed on id
+        :raises BadRequestError: if the cursor is malformed"""
+        params: dict = {}
+        query_string: str = "MATCH (p:Project)"
+        if page_request.cursor:
+            (after_id,) = decode_cursor(page_request.cursor, 1)
+            query_string += " WHERE p.id > $after_id"
+            params["after_id"] = after_id
+        query_string += " WITH p ORDER BY p.id"
+        if page_request.limit:
+            # One more row tells whether there is a next page
+            query_string += " LIMIT $limit"
+            params["limit"] = page_request.limit + 1
+        query_string += " RETURN p.id AS cursor_id"
+        for field in ProjectQueries.page_fields(page_request):
+            query_string += f", p.{field} AS {field}"
+        return Neo4jQuery(query_string, params)
+
+    @staticmethod
+    def read_page(records: List[dict], page_request: PageRequest) -> Page:
+        """Reads the records of a page query into a page"""
+        fields: List[str] = ProjectQueries.page_fields(page_request)
+        next_cursor: Optional[str] = None
+        if page_request.limit and len(records) > page_request.limit:
+            records = records[: page_request.limit]
+            next_cursor = encode_cursor([records[-1]["cursor_id"]])
+        items: List[dict] = []
+        for record in records:
+            project: dict = {field: record[field] for field in fields}
+            if "id" in project:
+                project["id"] = {"code": project["id"]}
+            items.append(project)
+        return Page(items=items, next_cursor=next_cursor)
+
+    @staticmethod
+    def project_by_id(project_id: ProjectId) -> Neo4jQuery:
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id}) RETURN p",
+            {"project_id": project_id.code},
+        )
+
+    @staticmethod
+    def projects_by_ids(project_ids: List[ProjectId]) -> Neo4jQuery:
+        """Builds the statement reading projects by their ids, which returns them
+        in the order of their ids"""
+        return Neo4jQuery(
+            "UNWIND $project_ids AS id MATCH (p:Project {id: id}) RETURN p",
+            {
+                "project_ids": list(
+                    dict.fromkeys(project_id.code for project_id in project_ids)
+                )
+            },
+        )
+
+    @staticmethod
+    def insert_project(project: Project) -> Neo4jQuery:
+        return Neo4jQuery(
+            "CREATE (p:Project $project) SET p.revision = 1 WITH p"
+            + GraphVersion.bump_clause(GraphVersion.PROJECTS),
+            {"project": ProjectQueries.convert_project_in_node(project)},
+        )
+
+    @staticmethod
+    def update_project(
+        project_id: ProjectId, project: Project, revisions: Optional[List[int]] = None
+    ) -> Neo4jQuery:
+        """Builds the statement updating a project, which moves to its next revision,
+        unless it is at none of the expected revisions. The statement returns whether
+        the revision was one of them, and no record if the project does not exist
+        :param revisions: the expected revisions, None to update the project
+        whatever its revision"""
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id})"
+            + ProjectQueries._CHECK_REVISION
+            + " CALL { WITH p, current WITH p WHERE current"
+            " WITH p, p.revision + 1 AS revision"
+            " SET p = $project, p.revision = revision WITH p"
+            + GraphVersion.bump_clause(GraphVersion.PROJECTS)
+            + " } RETURN current",
+            {
+                "project_id": project_id.code,
+                "project": ProjectQueries.convert_project_in_node(project),
+                "revisions": revisions,
+            },
+        )
+
+    @staticmethod
+    def delete_project(
+        project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> Neo4jQuery:
+        """Builds the statement deleting a project along with its questionnaire,
+        unless it is at none of the expected revisions. The statement returns whether
+        the revision was one of them, and no record if the project does not exist
+        :param revisions: the expected revisions, None to delete the project
+        whatever its revision"""
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id})"
+            + ProjectQueries._CHECK_REVISION
+            + " CALL { WITH p, current WITH p WHERE current"
+            + QuestionnaireQueries.delete_clause()
+            + GraphVersion.bump_clause(GraphVersion.PROJECTS)
+            + " DETACH DELETE p } RETURN current",
+            {"project_id": project_id.code, "revisions": revisions},
+        )
+
+    @staticmethod
+    def check_current(records: List[dict], project_id: ProjectId) -> None:
+        """Checks the result of the update_project or delete_project statement
+        :param records: the rows returned
+        :param project_id: the project id
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if the project is at none of the expected
+        revisions"""
+        if len(records) == 0:
+            raise NotFoundError(f"Project with id {project_id} does not exist")
+        if not records[0]["current"]:
+            raise ProjectQueries.modified(project_id)
+
+    @staticmethod
+    def modified(project_id: ProjectId) -> PreconditionFailedError:
+        """Builds the error of a write expecting another revision of a project
+        :param project_id: the project id
+        :return: the error"""
+        return PreconditionFailedError(f"Project with id {project_id} was modified")
+
+    @staticmethod
+    def delete_all_projects() -> List[Neo4jQuery]:
+        return [
+            QuestionnaireQueries.delete_all(),
+            Neo4jQuery("MATCH (n:Project) DETACH DELETE n", {}),
+            GraphVersion.bump_query(GraphVersion.PROJECTS),
+        ]
+
+    @staticmethod
+    def convert_project_in_node(project: Project) -> dict:
+        p: dict = serialize(project)
+        p["id"] = project.id.code
+        return p
+
+    @staticmethod
+    def convert_node_in_project(p: dict) -> Project:
+        return ProjectFactory.create_trusted_project(
+            construct_trusted(ProjectId, code=p["id"]), p["name"]
+        )
+
+    @staticmethod
+    def convert_node_with_revision(p: dict) -> Tuple[Project, int]:
+        """Converts a project node into the project along with its revision
+        :param p: the properties of the node
+        :return: the project and its revision"""
+        return ProjectQueries.convert_node_in_project(p), p["revision"]
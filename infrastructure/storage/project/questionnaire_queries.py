@@ -0,0 +1,219 @@
+from typing import List, Optional
+
+from domain.graph.core import Question, QuestionId
+from domain.project.core import ProjectId, SelectableQuestion
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.project.questionnaire_state import (
+    QuestionnaireState,
+    selectable,
+)
+from utils.errors import ConflictError, NotFoundError
+from utils.neo4j_driver import Neo4jQuery
+
+# Events between two snapshots of a questionnaire
+DEFAULT_SNAPSHOT_INTERVAL: int = 16
+
+
+class QuestionnaireQueries:
+    """Builds the statements of the questionnaire repository.
+    The questionnaire of a project is an append-only chain of events, each setting
+    the question asked at a position along with its selected answers and discarding
+    the later positions: (:Project)-[:HAS_QUESTIONNAIRE]->(:Questionnaire)-[:HEAD]->
+    (:QuestionnaireEvent)-[:FOLLOWS]->(:QuestionnaireEvent)...
+    Events whose depth in the chain is a multiple of the snapshot interval come with
+    a (:QuestionnaireSnapshot)-[:OF]->(:QuestionnaireEvent) holding the whole
+    questionnaire, so that the state is read as the latest snapshot plus the events
+    following it. Going back or resetting only moves the head, and appending after a
+    move starts a new branch.
+    Every write bumps the version of the questionnaire, and is only applied if the
+    version is still the one read, so that concurrent changes are detected. Every
+    statement matches the project first, so that no row at all means that the
+    project does not exist"""
+
+    # Locks the questionnaire `log` of the project `p`, creating it if needed, and
+    # binds `current` to whether its version is still the expected one. The lock is
+    # taken by a write before reading the version, so that no concurrent write can
+    # slip in between
+    _LOCK_QUESTIONNAIRE: str = (
+        " MERGE (p)-[:HAS_QUESTIONNAIRE]->(log:Questionnaire {project_id: $project_id})"
+        " ON CREATE SET log.version = 0"
+        " SET log._lock = true REMOVE log._lock"
+    )
+
+    @staticmethod
+    def state(project_id: ProjectId, snapshot_interval: int) -> Neo4jQuery:
+        """Builds the statement reading the head of a questionnaire, its latest
+        snapshot, the events following it and the questions they refer to, which
+        returns a single row"""
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id})"
+            " OPTIONAL MATCH (p)-[:HAS_QUESTIONNAIRE]->(log:Questionnaire)"
+            " OPTIONAL MATCH (log)-[:HEAD]->(head:QuestionnaireEvent)"
+            # A snapshotted event or the first one is at most an interval away
+            f" OPTIONAL MATCH tail = (head)-[:FOLLOWS*0..{snapshot_interval - 1}]->"
+            "(base:QuestionnaireEvent)"
+            " WHERE base.depth % $snapshot_interval = 0 OR base.depth = 1"
+            " WITH log, head, tail, base ORDER BY length(tail) LIMIT 1"
+            " OPTIONAL MATCH (snapshot:QuestionnaireSnapshot)-[:OF]->(base)"
+            " WITH log, head, snapshot,"
+            " [event IN CASE WHEN tail IS NULL THEN [] ELSE reverse(nodes(tail)) END"
+            " | event {.seq, .position, .question_id, .selected_answers}] AS events"
+            " CALL { WITH snapshot, events"
+            " UNWIND coalesce(snapshot.question_ids, [])"
+            " + [event IN events | event.question_id] AS question_id"
+            " MATCH (q:Question {id: question_id})"
+            " WITH DISTINCT q"
+            " RETURN collect(" + QuestionHydrator.ROW_MAP + ") AS questions }"
+            " RETURN coalesce(log.version, 0) AS version, head.depth AS depth,"
+            " snapshot {.*} AS snapshot, events, questions",
+            {"project_id": project_id.code, "snapshot_interval": snapshot_interval},
+        )
+
+    @staticmethod
+    def read_state(records: List[dict], project_id: ProjectId) -> QuestionnaireState:
+        """Reads the result of the state statement
+        :param records: the rows returned
+        :param project_id: the project id
+        :return: the state
+        :raises NotFoundError: if the project does not exist"""
+        QuestionnaireQueries._check_project(records, project_id)
+        return QuestionnaireState.read(records[0])
+
+    @staticmethod
+    def append(
+        project_id: ProjectId,
+        version: int,
+        depth: int,
+        position: int,
+        question_id: QuestionId,
+        selected_answers: List[str],
+        snapshot: Optional[dict],
+    ) -> Neo4jQuery:
+        """Builds the statement appending an event after the head, which becomes the
+        new head, unless the questionnaire changed or the question does not exist.
+        The statement returns whether the version was the expected one, along with
+        the question of the event"""
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id})"
+            " OPTIONAL MATCH (q:Question {id: $question_id})"
+            + QuestionnaireQueries._LOCK_QUESTIONNAIRE
+            + " WITH p, q, log, log.version = $version AS current"
+            " CALL { WITH q, log, current"
+            " WITH q, log WHERE current AND q IS NOT NULL"
+            " SET log.version = log.version + 1"
+            " WITH log"
+            " OPTIONAL MATCH (log)-[link:HEAD]->(head:QuestionnaireEvent)"
+            " DELETE link"
+            " CREATE (log)-[:HEAD]->(event:QuestionnaireEvent)"
+            " SET event = $event, event.seq = log.version"
+            " FOREACH (previous IN CASE WHEN head IS NULL THEN [] ELSE [head] END |"
+            " CREATE (event)-[:FOLLOWS]->(previous))"
+            " FOREACH (properties IN $snapshots |"
+            " CREATE (snapshot:QuestionnaireSnapshot)-[:OF]->(event)"
+            " SET snapshot = properties) }"
+            " WITH q, current" + QuestionHydrator.RETURN_CLAUSE + ", current",
+            {
+                "project_id": project_id.code,
+                "question_id": question_id.code,
+                "version": version,
+                "event": {
+                    "project_id": project_id.code,
+                    "depth": depth + 1,
+                    "position": position,
+                    "question_id": question_id.code,
+                    "selected_answers": selected_answers,
+                },
+                "snapshots": (
+                    []
+                    if snapshot is None
+                    else [{"project_id": project_id.code, **snapshot}]
+                ),
+            },
+        )
+
+    @staticmethod
+    def read_appended(
+        records: List[dict], project_id: ProjectId, selected_answers: List[str]
+    ) -> Optional[SelectableQuestion]:
+        """Reads the result of the append statement
+        :param records: the rows returned
+        :param project_id: the project id
+        :param selected_answers: the answers selected by the event
+        :return: the question of the event, None if it does not exist
+        :raises NotFoundError: if the project does not exist
+        :raises ConflictError: if the questionnaire changed since it was read"""
+        QuestionnaireQueries.check_current(records, project_id)
+        if records[0]["q"] is None:
+            return None
+        question: Question = QuestionHydrator.hydrate(records[0])
+        return selectable(question, tuple(selected_answers))
+
+    @staticmethod
+    def move_head(
+        project_id: ProjectId, version: Optional[int], seq: Optional[int]
+    ) -> Neo4jQuery:
+        """Builds the statement moving the head of a questionnaire to one of its
+        events, or removing it to empty the questionnaire, unless the questionnaire
+        changed. The statement returns whether the version was the expected one
+        :param version: the expected version, None to move the head whatever it is
+        :param seq: the sequence number of the event, None to remove the head"""
+        return Neo4jQuery(
+            "MATCH (p:Project {id: $project_id})"
+            + QuestionnaireQueries._LOCK_QUESTIONNAIRE
+            + " WITH log, $version IS NULL OR log.version = $version AS current"
+            " OPTIONAL MATCH (target:QuestionnaireEvent"
+            " {project_id: $project_id, seq: $seq})"
+            " CALL { WITH log, target, current"
+            " WITH log, target WHERE current"
+            " SET log.version = log.version + 1"
+            " WITH log, target"
+            " OPTIONAL MATCH (log)-[link:HEAD]->(:QuestionnaireEvent)"
+            " DELETE link"
+            " FOREACH (event IN CASE WHEN target IS NULL THEN [] ELSE [target] END |"
+            " CREATE (log)-[:HEAD]->(event)) }"
+            " RETURN current",
+            {"project_id": project_id.code, "version": version, "seq": seq},
+        )
+
+    @staticmethod
+    def check_current(records: List[dict], project_id: ProjectId) -> None:
+        """Checks the result of the append or move_head statement
+        :param records: the rows returned
+        :param project_id: the project id
+        :raises NotFoundError: if the project does not exist
+        :raises ConflictError: if the questionnaire changed since it was read"""
+        QuestionnaireQueries._check_project(records, project_id)
+        if not records[0]["current"]:
+            raise QuestionnaireQueries.conflict(project_id)
+
+    @staticmethod
+    def conflict(project_id: ProjectId) -> ConflictError:
+        """Builds the error of a write racing another one on a questionnaire
+        :param project_id: the project id
+        :return: the error"""
+        return ConflictError(
+            f"Questionnaire of project {project_id} was changed concurrently"
+        )
+
+    @staticmethod
+    def _check_project(records: List[dict], project_id: ProjectId) -> None:
+        if len(records) == 0:
+            raise NotFoundError(f"Project with id {project_id} does not exist")
+
+    @staticmethod
+    def delete_clause() -> str:
+        """Gets the clause deleting the questionnaire of the project `p`, history
+        included, to be run before deleting the project"""
+        return (
+            " CALL { WITH p"
+            " MATCH (n:Questionnaire|QuestionnaireEvent|QuestionnaireSnapshot"
+            " {project_id: p.id}) DETACH DELETE n }"
+        )
+
+    @staticmethod
+    def delete_all() -> Neo4jQuery:
+        return Neo4jQuery(
+            "MATCH (n:Questionnaire|QuestionnaireEvent|QuestionnaireSnapshot)"
+            " DETACH DELETE n",
+            {},
+        )
@@ -0,0 +1,156 @@
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from domain.graph.core import Question, QuestionId
+from domain.project.core import SelectableQuestion
+from domain.project.factories import SelectableQuestionFactory
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+
+
+class QuestionnaireEntry(NamedTuple):
+    """A question of the questionnaire, with the answers selected for it and the
+    sequence number of the event which set it"""
+
+    question_id: str
+    selected_answers: Tuple[str, ...]
+    seq: int
+
+
+class QuestionnaireState:
+    """The questionnaire of a project as of its head event, along with what is needed
+    to append the next event: the version of the log and the depth of the head.
+    Each event sets the entry at its position and discards the later ones"""
+
+    def __init__(
+        self,
+        version: int,
+        depth: int,
+        entries: List[QuestionnaireEntry],
+        questions: Dict[str, Question],
+    ):
+        self.version = version
+        self.depth = depth
+        self.entries = entries
+        self.questions = questions
+
+    @staticmethod
+    def read(record: dict) -> "QuestionnaireState":
+        """Replays the events following the latest snapshot
+        :param record: the row returned by QuestionnaireQueries.state
+        :return: the state"""
+        entries: List[QuestionnaireEntry] = []
+        events: List[dict] = record["events"]
+        snapshot: Optional[dict] = record["snapshot"]
+        if snapshot is not None:
+            entries = QuestionnaireState._read_snapshot(snapshot)
+            # The snapshot is taken after its event
+            events = events[1:]
+        for event in events:
+            del entries[event["position"] :]
+            entries.append(
+                QuestionnaireEntry(
+                    event["question_id"],
+                    tuple(event["selected_answers"]),
+                    event["seq"],
+                )
+            )
+        questions: Dict[str, Question] = {}
+        for row in record["questions"]:
+            question: Question = QuestionHydrator.hydrate(row)
+            questions[question.id.code] = question
+        return QuestionnaireState(
+            record["version"], record["depth"] or 0, entries, questions
+        )
+
+    def position(self, question_id: QuestionId) -> Optional[int]:
+        """Gets the position of a question
+        :param question_id: the question id
+        :return: the position or None if the question was not asked"""
+        for position, entry in enumerate(self.entries):
+            if entry.question_id == question_id.code:
+                return position
+        return None
+
+    def selectable_question(self, position: int) -> Optional[SelectableQuestion]:
+        """Gets the question of an entry, with its selected answers
+        :param position: the position of the entry
+        :return: the question or None if it has been deleted since it was asked"""
+        entry: QuestionnaireEntry = self.entries[position]
+        question: Optional[Question] = self.questions.get(entry.question_id)
+        if question is None:
+            return None
+        return selectable(question, entry.selected_answers)
+
+    def selectable_questions(self) -> List[SelectableQuestion]:
+        """Gets the questions asked, skipping those deleted since
+        :return: the questions with their selected answers, in the order they were
+        asked"""
+        questions: List[SelectableQuestion] = []
+        for position in range(len(self.entries)):
+            question: Optional[SelectableQuestion] = self.selectable_question(position)
+            if question is not None:
+                questions.append(question)
+        return questions
+
+    def snapshot_after(
+        self, position: int, question_id: QuestionId, selected_answers: List[str]
+    ) -> dict:
+        """Builds the snapshot of the state following an event, which is given the
+        next sequence number. Selected answers are flattened, since properties cannot
+        hold nested lists
+        :param position: the position set by the event
+        :param question_id: the question of the event
+        :param selected_answers: the answers selected by the event
+        :return: the properties of the snapshot node"""
+        entries: List[QuestionnaireEntry] = self.entries[:position] + [
+            QuestionnaireEntry(
+                question_id.code, tuple(selected_answers), self.version + 1
+            )
+        ]
+        return {
+            "question_ids": [entry.question_id for entry in entries],
+            "event_seqs": [entry.seq for entry in entries],
+            "answers": [
+                answer for entry in entries for answer in entry.selected_answers
+            ],
+            "answer_counts": [len(entry.selected_answers) for entry in entries],
+        }
+
+    @staticmethod
+    def _read_snapshot(snapshot: dict) -> List[QuestionnaireEntry]:
+        entries: List[QuestionnaireEntry] = []
+        answers: List[str] = snapshot["answers"]
+        start: int = 0
+        for question_id, seq, count in zip(
+            snapshot["question_ids"], snapshot["event_seqs"], snapshot["answer_counts"]
+        ):
+            entries.append(
+                QuestionnaireEntry(
+                    question_id, tuple(answers[start : start + count]), seq
+                )
+            )
+            start += count
+        return entries
+
+
+def selectable(
+    question: Question, selected_answers: Tuple[str, ...]
+) -> SelectableQuestion:
+    """Builds a question of a questionnaire out of a stored question
+    :param question: the stored question
+    :param selected_answers: the codes of the answers selected for it
+    :return: the question with its selected answers"""
+    return SelectableQuestionFactory.create_trusted_selectable_question(
+        question.id,
+        question.text,
+        question.type,
+        question.available_answers,
+        question.previous_question_id,
+        question.enabled_by,
+        question.action_needed,
+        question.created_at,
+        frozenset(
+            answer
+            for answer in question.available_answers
+            if answer.id.code in selected_answers
+        ),
+    )
@@ -0,0 +1,53 @@
+from typing import List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from domain.project.repositories import AsyncProjectRepository
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.project.repositories.in_memory_project_repository import (
+    InMemoryProjectRepository,
+)
+
+
+class AsyncInMemoryProjectRepository(AsyncProjectRepository):
+    """Serves an InMemoryProjectRepository through the async interface, for test and
+    development runs of the ASGI application"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.repository: InMemoryProjectRepository = InMemoryProjectRepository(store)
+
+    async def get_all_projects(self) -> List[Project]:
+        return self.repository.get_all_projects()
+
+    async def get_projects_page(self, page_request: PageRequest) -> Page:
+        return self.repository.get_projects_page(page_request)
+
+    async def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        return self.repository.get_project_by_id(project_id)
+
+    async def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        return self.repository.get_projects_by_ids(project_ids)
+
+    async def insert_project(self, project: Project) -> ProjectId:
+        return self.repository.insert_project(project)
+
+    async def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        self.repository.update_project(project_id, project, revisions)
+
+    async def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        self.repository.delete_project(project_id, revisions)
+
+    async def get_version(self) -> int:
+        return self.repository.get_version()
+
+    async def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        return self.repository.get_project_with_revision(project_id)
@@ -0,0 +1,62 @@
+from typing import Callable, List, Optional
+
+from domain.graph.core import QuestionId, QuestionTransitions
+from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.repositories import AsyncQuestionnaireRepository
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.project.repositories.in_memory_questionnaire_repository import (
+    InMemoryQuestionnaireRepository,
+)
+
+
+class AsyncInMemoryQuestionnaireRepository(AsyncQuestionnaireRepository):
+    """Serves an InMemoryQuestionnaireRepository through the async interface, for test
+    and development runs of the ASGI application"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.repository: InMemoryQuestionnaireRepository = (
+            InMemoryQuestionnaireRepository(store)
+        )
+
+    async def get_questionnaire(
+        self, project_id: ProjectId
+    ) -> List[SelectableQuestion]:
+        return self.repository.get_questionnaire(project_id)
+
+    async def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        return self.repository.get_selectable_question(project_id, question_id)
+
+    async def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        return self.repository.start_questionnaire(project_id, question_id)
+
+    async def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        return self.repository.update_selectable_question(
+            project_id, question_id, update
+        )
+
+    async def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        return self.repository.append_next_question(
+            project_id, question_id, transitions
+        )
+
+    async def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        return self.repository.truncate_questionnaire(project_id, question_id)
+
+    async def delete_questionnaire(self, project_id: ProjectId) -> None:
+        self.repository.delete_questionnaire(project_id)
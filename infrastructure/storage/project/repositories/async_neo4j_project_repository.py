@@ -0,0 +1,83 @@
+from typing import List, Optional, Tuple
+
+from neo4j.exceptions import ConstraintError
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from domain.project.repositories import AsyncProjectRepository
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.project.project_queries import ProjectQueries
+from utils.errors import ConflictError
+from utils.neo4j_async_driver import AsyncNeo4jDriver
+
+
+class AsyncNeo4jProjectRepository(AsyncProjectRepository):
+
+    def __init__(self, driver: AsyncNeo4jDriver):
+        self.driver: AsyncNeo4jDriver = driver
+
+    async def get_all_projects(self) -> List[Project]:
+        r: List[dict] = await self.driver.execute_read(ProjectQueries.all_projects())
+        return [ProjectQueries.convert_node_in_project(record["p"]) for record in r]
+
+    async def get_projects_page(self, page_request: PageRequest) -> Page:
+        r: List[dict] = await self.driver.execute_read(
+            ProjectQueries.projects_page(page_request)
+        )
+        return ProjectQueries.read_page(r, page_request)
+
+    async def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        r: List[dict] = await self.driver.execute_read(
+            ProjectQueries.project_by_id(project_id)
+        )
+        if len(r) == 0:
+            return None
+        return ProjectQueries.convert_node_in_project(r[0]["p"])
+
+    async def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        r: List[dict] = await self.driver.execute_read(
+            ProjectQueries.projects_by_ids(project_ids)
+        )
+        return [ProjectQueries.convert_node_in_project(record["p"]) for record in r]
+
+    async def insert_project(self, project: Project) -> ProjectId:
+        try:
+            await self.driver.execute_write(ProjectQueries.insert_project(project))
+        except ConstraintError:
+            raise ConflictError(f"Project with id {project.id} already exists")
+        return project.id
+
+    async def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        r: List[dict] = await self.driver.execute_write(
+            ProjectQueries.update_project(project_id, project, revisions)
+        )
+        ProjectQueries.check_current(r, project_id)
+
+    async def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        r: List[dict] = await self.driver.execute_write(
+            ProjectQueries.delete_project(project_id, revisions)
+        )
+        ProjectQueries.check_current(r, project_id)
+
+    async def get_version(self) -> int:
+        r: List[dict] = await self.driver.execute_read(
+            GraphVersion.read_query(GraphVersion.PROJECTS)
+        )
+        return GraphVersion.read_version(r)
+
+    async def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        r: List[dict] = await self.driver.execute_read(
+            ProjectQueries.project_by_id(project_id)
+        )
+        if len(r) == 0:
+            return None
+        return ProjectQueries.convert_node_with_revision(r[0]["p"])
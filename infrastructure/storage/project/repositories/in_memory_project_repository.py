@@ -0,0 +1,145 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from domain.project.repositories.project_repository import ProjectRepository
+from infrastructure.storage.cursor import decode_cursor
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.project.project_queries import ProjectQueries
+from utils.errors import BadRequestError, ConflictError, NotFoundError
+
+
+class InMemoryProjectRepository(ProjectRepository):
+    """Keeps the projects in an InMemoryStore, for test and development runs, with
+    the semantics of Neo4jProjectRepository. Deleting a project deletes its
+    questionnaire as well"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.store: InMemoryStore = store or InMemoryStore()
+
+    def get_all_projects(self) -> List[Project]:
+        with self.store.lock:
+            nodes: List[dict] = [
+                self.store.projects[code] for code in self.store.project_order
+            ]
+        return [ProjectQueries.convert_node_in_project(p) for p in nodes]
+
+    def get_projects_page(self, page_request: PageRequest) -> Page:
+        fields: List[str] = ProjectQueries.page_fields(page_request)
+        after: Optional[str] = None
+        if page_request.cursor:
+            (after,) = decode_cursor(page_request.cursor, 1)
+            if not isinstance(after, str):
+                raise BadRequestError("Invalid cursor")
+        store: InMemoryStore = self.store
+        with store.lock:
+            start: int = (
+                0 if after is None else bisect_right(store.project_order, after)
+            )
+            # One more record tells whether there is a next page
+            end: Optional[int] = (
+                start + page_request.limit + 1 if page_request.limit else None
+            )
+            records: List[dict] = [
+                {
+                    "cursor_id": code,
+                    **{field: store.projects[code].get(field) for field in fields},
+                }
+                for code in store.project_order[start:end]
+            ]
+        return ProjectQueries.read_page(records, page_request)
+
+    def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
+        with self.store.lock:
+            p: Optional[dict] = self.store.projects.get(project_id.code)
+        if p is None:
+            return None
+        return ProjectQueries.convert_node_in_project(p)
+
+    def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        with self.store.lock:
+            nodes: List[dict] = [
+                self.store.projects[code]
+                for code in dict.fromkeys(project_id.code for project_id in project_ids)
+                if code in self.store.projects
+            ]
+        return [ProjectQueries.convert_node_in_project(p) for p in nodes]
+
+    def insert_project(self, project: Project) -> ProjectId:
+        store: InMemoryStore = self.store
+        with store.lock:
+            if project.id.code in store.projects:
+                raise ConflictError(f"Project with id {project.id} already exists")
+            store.projects[project.id.code] = self._node(project, 1)
+            insort(store.project_order, project.id.code)
+            store.bump(GraphVersion.PROJECTS)
+        return project.id
+
+    def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            revision: int = self._check_revision(project_id, revisions)
+            store.projects[project_id.code] = self._node(project, revision + 1)
+            store.bump(GraphVersion.PROJECTS)
+
+    def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            code: str = project_id.code
+            self._check_revision(project_id, revisions)
+            store.questionnaires.pop(code, None)
+            store.questionnaire_versions.pop(code, None)
+            del store.project_order[bisect_left(store.project_order, code)]
+            del store.projects[code]
+            store.bump(GraphVersion.PROJECTS)
+
+    def get_version(self) -> int:
+        with self.store.lock:
+            return self.store.versions[GraphVersion.PROJECTS]
+
+    def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        with self.store.lock:
+            p: Optional[dict] = self.store.projects.get(project_id.code)
+        if p is None:
+            return None
+        return ProjectQueries.convert_node_with_revision(p)
+
+    def delete_all_projects(self) -> None:
+        store: InMemoryStore = self.store
+        with store.lock:
+            store.questionnaires.clear()
+            store.questionnaire_versions.clear()
+            store.project_order.clear()
+            store.projects.clear()
+            store.bump(GraphVersion.PROJECTS)
+
+    def _check_revision(
+        self, project_id: ProjectId, revisions: Optional[List[int]]
+    ) -> int:
+        """Checks that a project exists and is at one of the expected revisions
+        :return: the revision of the project
+        :raises NotFoundError: if the project does not exist
+        :raises PreconditionFailedError: if it is at none of the revisions"""
+        p: Optional[dict] = self.store.projects.get(project_id.code)
+        if p is None:
+            raise NotFoundError(f"Project with id {project_id} does not exist")
+        if revisions is not None and p["revision"] not in revisions:
+            raise ProjectQueries.modified(project_id)
+        return p["revision"]
+
+    @staticmethod
+    def _node(project: Project, revision: int) -> dict:
+        p: dict = ProjectQueries.convert_project_in_node(project)
+        p["revision"] = revision
+        return p
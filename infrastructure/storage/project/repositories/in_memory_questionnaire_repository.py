@@ -0,0 +1,172 @@
+from typing import Callable, Dict, List, Optional
+
+from domain.graph.core import AnswerId, Question, QuestionId, QuestionTransitions
+from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.repositories import QuestionnaireRepository
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.project.questionnaire_state import (
+    QuestionnaireEntry,
+    QuestionnaireState,
+    selectable,
+)
+from utils.errors import NotFoundError
+
+
+class InMemoryQuestionnaireRepository(QuestionnaireRepository):
+    """Keeps the questionnaires in an InMemoryStore, for test and development runs,
+    with the semantics of Neo4jQuestionnaireRepository. Only the current entries of
+    a questionnaire are kept, not its history. Every operation holds the lock of the
+    store from the read to the write, so that no change is ever concurrent"""
+
+    def __init__(self, store: Optional[InMemoryStore] = None):
+        self.store: InMemoryStore = store or InMemoryStore()
+
+    def get_questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        with self.store.lock:
+            return self._read_state(project_id).selectable_questions()
+
+    def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        with self.store.lock:
+            state: QuestionnaireState = self._read_state(project_id)
+            position: Optional[int] = state.position(question_id)
+            if position is None:
+                return None
+            return state.selectable_question(position)
+
+    def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        with self.store.lock:
+            state: QuestionnaireState = self._read_state(project_id)
+            if state.entries:
+                return state.selectable_question(0)
+            return self._append(project_id, state, 0, question_id, [])
+
+    def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        with self.store.lock:
+            state: QuestionnaireState = self._read_state(project_id)
+            position: int = self._position(state, project_id, question_id)
+            question: SelectableQuestion = self._question(state, position, question_id)
+            updated_question: SelectableQuestion = update(question)
+            if updated_question.selected_answers != question.selected_answers:
+                self._append(
+                    project_id,
+                    state,
+                    position,
+                    question_id,
+                    sorted(
+                        answer.id.code for answer in updated_question.selected_answers
+                    ),
+                )
+            return updated_question
+
+    def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        with self.store.lock:
+            state: QuestionnaireState = self._read_state(project_id)
+            position: int = self._position(state, project_id, question_id)
+            if position + 1 < len(state.entries):
+                return state.selectable_question(position + 1)
+            next_question_id: Optional[QuestionId] = transitions.next_question_id(
+                AnswerId(code=answer)
+                for answer in state.entries[position].selected_answers
+            )
+            if next_question_id is None:
+                return None
+            return self._append(project_id, state, position + 1, next_question_id, [])
+
+    def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        with self.store.lock:
+            state: QuestionnaireState = self._read_state(project_id)
+            position: int = self._position(state, project_id, question_id)
+            if position + 1 < len(state.entries):
+                self._write(project_id, state.entries[: position + 1])
+            return self._question(state, position, question_id)
+
+    def delete_questionnaire(self, project_id: ProjectId) -> None:
+        with self.store.lock:
+            self._read_state(project_id)
+            self._write(project_id, [])
+
+    def _read_state(self, project_id: ProjectId) -> QuestionnaireState:
+        store: InMemoryStore = self.store
+        if project_id.code not in store.projects:
+            raise NotFoundError(f"Project with id {project_id} does not exist")
+        entries: List[QuestionnaireEntry] = store.questionnaires.get(
+            project_id.code, []
+        )
+        questions: Dict[str, Question] = {}
+        for entry in entries:
+            row: Optional[dict] = store.question_row(entry.question_id)
+            if row is not None:
+                questions[entry.question_id] = QuestionHydrator.hydrate(row)
+        return QuestionnaireState(
+            store.questionnaire_versions.get(project_id.code, 0),
+            len(entries),
+            entries,
+            questions,
+        )
+
+    def _append(
+        self,
+        project_id: ProjectId,
+        state: QuestionnaireState,
+        position: int,
+        question_id: QuestionId,
+        selected_answers: List[str],
+    ) -> Optional[SelectableQuestion]:
+        row: Optional[dict] = self.store.question_row(question_id.code)
+        if row is None:
+            return None
+        self._write(
+            project_id,
+            state.entries[:position]
+            + [
+                QuestionnaireEntry(
+                    question_id.code, tuple(selected_answers), state.version + 1
+                )
+            ],
+        )
+        return selectable(QuestionHydrator.hydrate(row), tuple(selected_answers))
+
+    def _write(self, project_id: ProjectId, entries: List[QuestionnaireEntry]) -> None:
+        """Replaces the entries of a questionnaire, bumping its version"""
+        store: InMemoryStore = self.store
+        store.questionnaires[project_id.code] = entries
+        store.questionnaire_versions[project_id.code] = (
+            store.questionnaire_versions.get(project_id.code, 0) + 1
+        )
+
+    @staticmethod
+    def _position(
+        state: QuestionnaireState, project_id: ProjectId, question_id: QuestionId
+    ) -> int:
+        position: Optional[int] = state.position(question_id)
+        if position is None:
+            raise NotFoundError(
+                f"Question with id {question_id} was not asked in project {project_id}"
+            )
+        return position
+
+    @staticmethod
+    def _question(
+        state: QuestionnaireState, position: int, question_id: QuestionId
+    ) -> SelectableQuestion:
+        question: Optional[SelectableQuestion] = state.selectable_question(position)
+        if question is None:
+            raise NotFoundError(f"Question with id {question_id} does not exist")
+        return question
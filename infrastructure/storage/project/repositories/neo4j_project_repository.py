@@ -1,92 +1,90 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from neo4j.exceptions import ConstraintError
+
+from domain.common.core import Page, PageRequest
 from domain.project.core import ProjectId, Project
 from domain.project.factories import ProjectFactory
 from domain.project.repositories.project_repository import ProjectRepository
-from presentation.presentation import deserialize, serialize
-from utils.env import DB_HOST, DB_USER, DB_PASSWORD
-from utils.errors import NotFoundError, ConflictError
-from utils.neo4j_driver import Neo4jDriver, Credentials, Neo4jQuery
+from infrastructure.storage.graph_version import GraphVersion
+from infrastructure.storage.project.project_queries import ProjectQueries
+from utils import env
+from utils.errors import ConflictError
+from utils.neo4j_driver import Neo4jDriver, Credentials
 
 
 class Neo4jProjectRepository(ProjectRepository):
 
-    def __init__(self):
-        self.driver: Neo4jDriver = Neo4jDriver(
-            DB_HOST, Credentials(DB_USER, DB_PASSWORD)
+    def __init__(self, driver: Optional[Neo4jDriver] = None):
+        self.driver: Neo4jDriver = driver or Neo4jDriver(
+            env.DB_HOST, Credentials(env.DB_USER, env.DB_PASSWORD)
         )
 
     def get_all_projects(self) -> List[Project]:
-        query_string: str = "MATCH (p:Project) RETURN p"
-        query: Neo4jQuery = Neo4jQuery(query_string, {})
-        res: List[dict] = self.driver.query(query)
-        projects: List[Project] = []
-        for r in res:
-            project: Project = self._convert_node_in_project(r["p"])
-            projects.append(project)
-        return projects
+        res: List[dict] = self.driver.execute_read(ProjectQueries.all_projects())
+        return [ProjectQueries.convert_node_in_project(r["p"]) for r in res]
+
+    def get_projects_page(self, page_request: PageRequest) -> Page:
+        r: List[dict] = self.driver.execute_read(
+            ProjectQueries.projects_page(page_request)
+        )
+        return ProjectQueries.read_page(r, page_request)
 
     def get_project_by_id(self, project_id: ProjectId) -> Optional[Project]:
-        query_string: str = "MATCH (p:Project {id: $project_id}) RETURN p"
-        query: Neo4jQuery = Neo4jQuery(query_string, {"project_id": project_id.code})
-        r: List[dict] = self.driver.query(query)
+        r: List[dict] = self.driver.execute_read(
+            ProjectQueries.project_by_id(project_id)
+        )
         if len(r) == 0:
             return None
-        project: Project = self._convert_node_in_project(r[0]["p"])
-        return project
+        return ProjectQueries.convert_node_in_project(r[0]["p"])
+
+    def get_projects_by_ids(self, project_ids: List[ProjectId]) -> List[Project]:
+        r: List[dict] = self.driver.execute_read(
+            ProjectQueries.projects_by_ids(project_ids)
+        )
+        return [ProjectQueries.convert_node_in_project(record["p"]) for record in r]
 
     def insert_project(self, project: Project) -> ProjectId:
-        if self._check_project_exists(project.id):
+        try:
+            self.driver.execute_write(ProjectQueries.insert_project(project))
+        except ConstraintError:
             raise ConflictError(f"Project with id {project.id} already exists")
-
-        p: dict = self._convert_project_in_node(project)
-        self.driver.query(
-            Neo4jQuery(
-                "CREATE (:Project $project)",
-                {"project": p},
-            )
-        )
         return project.id
 
-    def update_project(self, project_id: ProjectId, project: Project) -> None:
-        if not self._check_project_exists(project_id):
-            raise NotFoundError(f"Project with id {project_id} does not exist")
-        self.delete_project(project_id)
-        self.insert_project(project)
-
-    def delete_project(self, project_id: ProjectId) -> None:
-        if not self._check_project_exists(project_id):
-            raise NotFoundError(f"Project with id {project_id} does not exist")
-        self.driver.query(
-            Neo4jQuery(
-                "MATCH (p:Project {id: $project_id}) DETACH DELETE p",
-                {"project_id": project_id.code},
-            )
+    def update_project(
+        self,
+        project_id: ProjectId,
+        project: Project,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        r: List[dict] = self.driver.execute_write(
+            ProjectQueries.update_project(project_id, project, revisions)
         )
+        ProjectQueries.check_current(r, project_id)
 
-    def _check_project_exists(self, project_id: ProjectId) -> bool:
-        p: Project = self.get_project_by_id(project_id)
-        return p is not None
+    def delete_project(
+        self, project_id: ProjectId, revisions: Optional[List[int]] = None
+    ) -> None:
+        r: List[dict] = self.driver.execute_write(
+            ProjectQueries.delete_project(project_id, revisions)
+        )
+        ProjectQueries.check_current(r, project_id)
 
-    def _convert_project_in_node(self, project: Project) -> dict:
-        p: dict = serialize(project)
-        p["id"] = project.id.code
-        return p
+    def get_version(self) -> int:
+        return GraphVersion.read(self.driver, GraphVersion.PROJECTS)
 
-    def _convert_node_in_project(self, p: dict) -> Project:
-        project: dict = p
-        project["id"] = {"code": project["id"]}
-        project["name"] = project["name"]
-        return deserialize(project, Project)
+    def get_project_with_revision(
+        self, project_id: ProjectId
+    ) -> Optional[Tuple[Project, int]]:
+        r: List[dict] = self.driver.execute_read(
+            ProjectQueries.project_by_id(project_id)
+        )
+        if len(r) == 0:
+            return None
+        return ProjectQueries.convert_node_with_revision(r[0]["p"])
 
     def delete_all_projects(self) -> None:
-        self.driver.transaction(
-            [
-                Neo4jQuery(
-                    "MATCH (n:Project) DETACH DELETE n", {}
-                ),  # TODO: also SelectableQuestions?
-            ]
-        )
+        self.driver.execute_write_all(ProjectQueries.delete_all_projects())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,163 @@
+from typing import Callable, List, Optional
+
+from neo4j.exceptions import ConstraintError
+
+from domain.graph.core import AnswerId, QuestionId, QuestionTransitions
+from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.repositories import QuestionnaireRepository
+from infrastructure.storage.project.questionnaire_queries import (
+    DEFAULT_SNAPSHOT_INTERVAL,
+    QuestionnaireQueries,
+)
+from infrastructure.storage.project.questionnaire_state import QuestionnaireState
+from utils.errors import NotFoundError
+from utils.neo4j_driver import Neo4jDriver
+
+
+class Neo4jQuestionnaireRepository(QuestionnaireRepository):
+    """Keeps questionnaires as append-only chains of events next to the question
+    graph. Reading a questionnaire is a single statement, and so is each change once
+    the questionnaire is read: answering or asking appends an event, going back or
+    resetting moves the head. A change made concurrently since the read is reported
+    as a conflict"""
+
+    def __init__(
+        self, driver: Neo4jDriver, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL
+    ):
+        if snapshot_interval < 2:
+            raise ValueError("Snapshot interval must be at least 2")
+        self.driver: Neo4jDriver = driver
+        self.snapshot_interval: int = snapshot_interval
+
+    def get_questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        return self._read_state(project_id).selectable_questions()
+
+    def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        state: QuestionnaireState = self._read_state(project_id)
+        position: Optional[int] = state.position(question_id)
+        if position is None:
+            return None
+        return state.selectable_question(position)
+
+    def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        state: QuestionnaireState = self._read_state(project_id)
+        if state.entries:
+            return state.selectable_question(0)
+        return self._append(project_id, state, 0, question_id, [])
+
+    def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        state: QuestionnaireState = self._read_state(project_id)
+        position: int = self._position(state, project_id, question_id)
+        question: SelectableQuestion = self._question(state, position, question_id)
+        updated_question: SelectableQuestion = update(question)
+        if updated_question.selected_answers != question.selected_answers:
+            self._append(
+                project_id,
+                state,
+                position,
+                question_id,
+                sorted(answer.id.code for answer in updated_question.selected_answers),
+            )
+        return updated_question
+
+    def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        state: QuestionnaireState = self._read_state(project_id)
+        position: int = self._position(state, project_id, question_id)
+        if position + 1 < len(state.entries):
+            return state.selectable_question(position + 1)
+        next_question_id: Optional[QuestionId] = transitions.next_question_id(
+            AnswerId(code=answer) for answer in state.entries[position].selected_answers
+        )
+        if next_question_id is None:
+            return None
+        return self._append(project_id, state, position + 1, next_question_id, [])
+
+    def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        state: QuestionnaireState = self._read_state(project_id)
+        position: int = self._position(state, project_id, question_id)
+        if position + 1 < len(state.entries):
+            self._move_head(project_id, state.version, state.entries[position].seq)
+        return self._question(state, position, question_id)
+
+    def delete_questionnaire(self, project_id: ProjectId) -> None:
+        self._move_head(project_id, None, None)
+
+    def _read_state(self, project_id: ProjectId) -> QuestionnaireState:
+        r: List[dict] = self.driver.execute_read(
+            QuestionnaireQueries.state(project_id, self.snapshot_interval)
+        )
+        return QuestionnaireQueries.read_state(r, project_id)
+
+    def _append(
+        self,
+        project_id: ProjectId,
+        state: QuestionnaireState,
+        position: int,
+        question_id: QuestionId,
+        selected_answers: List[str],
+    ) -> Optional[SelectableQuestion]:
+        snapshot: Optional[dict] = None
+        if (state.depth + 1) % self.snapshot_interval == 0:
+            snapshot = state.snapshot_after(position, question_id, selected_answers)
+        try:
+            r: List[dict] = self.driver.execute_write(
+                QuestionnaireQueries.append(
+                    project_id,
+                    state.version,
+                    state.depth,
+                    position,
+                    question_id,
+                    selected_answers,
+                    snapshot,
+                )
+            )
+        except ConstraintError:
+            raise QuestionnaireQueries.conflict(project_id)
+        return QuestionnaireQueries.read_appended(r, project_id, selected_answers)
+
+    def _move_head(
+        self, project_id: ProjectId, version: Optional[int], seq: Optional[int]
+    ) -> None:
+        try:
+            r: List[dict] = self.driver.execute_write(
+                QuestionnaireQueries.move_head(project_id, version, seq)
+            )
+        except ConstraintError:
+            raise QuestionnaireQueries.conflict(project_id)
+        QuestionnaireQueries.check_current(r, project_id)
+
+    @staticmethod
+    def _position(
+        state: QuestionnaireState, project_id: ProjectId, question_id: QuestionId
+    ) -> int:
+        position: Optional[int] = state.position(question_id)
+        if position is None:
+            raise NotFoundError(
+                f"Question with id {question_id} was not asked in project {project_id}"
+            )
+        return position
+
+    @staticmethod
+    def _question(
+        state: QuestionnaireState, position: int, question_id: QuestionId
+    ) -> SelectableQuestion:
+        question: Optional[SelectableQuestion] = state.selectable_question(position)
+        if question is None:
+            raise NotFoundError(f"Question with id {question_id} does not exist")
+        return question
@@ -0,0 +1,40 @@
+import json
+from typing import Iterable, Iterator
+
+import yaml
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - MessagePack cannot be formatted
+    msgpack = None
+
+
+def iter_yaml_chunks(items: Iterable[dict]) -> Iterator[str]:
+    """Lazily formats items as a YAML sequence, one chunk per item,
+    so that the output can be parsed back with iter_yaml_items
+    :param items: the items to format
+    :return: the chunks of the YAML document"""
+    empty: bool = True
+    for item in items:
+        empty = False
+        yield yaml.safe_dump([item], sort_keys=False, allow_unicode=True)
+    if empty:
+        yield "[]\n"
+
+
+def iter_json_lines_chunks(items: Iterable[dict]) -> Iterator[str]:
+    """Lazily formats items as JSON Lines, one chunk per item
+    :param items: the items to format
+    :return: the lines"""
+    for item in items:
+        yield json.dumps(item) + "\n"
+
+
+def iter_msgpack_chunks(items: Iterable[dict]) -> Iterator[bytes]:
+    """Lazily formats items as a stream of MessagePack objects, one chunk per item,
+    so that the output can be parsed back with iter_msgpack_items
+    :param items: the items to format
+    :return: the encoded items"""
+    packer = msgpack.Packer()
+    for item in items:
+        yield packer.pack(item)
@@ -0,0 +1,89 @@
+import json
+from typing import IO, Iterator
+
+import yaml
+
+from utils.errors import BadRequestError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the standard decoder is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - MessagePack cannot be parsed
+    msgpack = None
+
+
+def iter_yaml_items(stream: IO) -> Iterator[object]:
+    """Lazily parses a YAML stream, one item at a time.
+    Each document may be either a single item or a sequence of items, which are
+    yielded one by one rather than after the whole sequence is parsed.
+    :param stream: a text or binary stream
+    :raises BadRequestError: if the stream is not valid YAML"""
+    loader = yaml.SafeLoader(stream)
+    try:
+        loader.get_event()  # StreamStartEvent
+        while not loader.check_event(yaml.StreamEndEvent):
+            loader.get_event()  # DocumentStartEvent
+            if loader.check_event(yaml.SequenceStartEvent):
+                loader.get_event()
+                while not loader.check_event(yaml.SequenceEndEvent):
+                    yield loader.construct_document(loader.compose_node(None, None))
+                loader.get_event()
+            else:
+                item = loader.construct_document(loader.compose_node(None, None))
+                if item is not None:
+                    yield item
+            loader.get_event()  # DocumentEndEvent
+            loader.anchors = {}
+    except yaml.YAMLError:
+        raise BadRequestError("Invalid YAML file")
+    finally:
+        loader.dispose()
+
+
+def iter_json_lines(stream: IO) -> Iterator[object]:
+    """Lazily parses a JSON Lines stream, one item per line, skipping blank lines
+    :param stream: a text or binary stream
+    :raises BadRequestError: if a line is not valid JSON"""
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            raise BadRequestError(f"Invalid JSON at line {number}")
+
+
+def iter_json_items(stream: IO) -> Iterator[object]:
+    """Parses a JSON document, either a single item or an array of items.
+    Unlike the other parsers the whole document is read at once, with orjson when
+    installed
+    :param stream: a binary stream
+    :raises BadRequestError: if the stream is not valid JSON"""
+    try:
+        document = orjson.loads(stream.read()) if orjson else json.load(stream)
+    except ValueError:
+        raise BadRequestError("Invalid JSON document")
+    if isinstance(document, list):
+        yield from document
+    elif document is not None:
+        yield document
+
+
+def iter_msgpack_items(stream: IO) -> Iterator[object]:
+    """Lazily parses a stream of MessagePack objects, each either a single item or
+    an array of items, as iter_msgpack_chunks writes them
+    :param stream: a binary stream
+    :raises BadRequestError: if the stream is not valid MessagePack"""
+    unpacker = msgpack.Unpacker(stream, raw=False)
+    try:
+        for obj in unpacker:
+            if isinstance(obj, list):
+                yield from obj
+            else:
+                yield obj
+    except (ValueError, msgpack.UnpackException):
+        raise BadRequestError("Invalid MessagePack data")
@@ -1,5 +1,5 @@
-import json
-from typing import Type, TypeVar
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
 
@@ -10,19 +10,36 @@ T = TypeVar("T", bound=BaseModel)
 core_modules = [_graph_core_domain, _project_core_domain]
 
 
+def _core_types() -> Tuple[type, ...]:
+    return tuple(
+        symbol
+        for core_module in core_modules
+        for symbol in (getattr(core_module, name) for name in dir(core_module))
+        if isinstance(symbol, type)
+    )
+
+
+# The core modules are scanned once, and the verdict cached per type
+_admissible_types: Tuple[type, ...] = _core_types()
+
+
+@lru_cache(maxsize=None)
 def _is_admissible_type(obj: type) -> bool:
-    for core_module in core_modules:
-        for name in dir(core_module):
-            symbol = getattr(core_module, name)
-            if isinstance(symbol, type) and issubclass(obj, symbol):
-                return True
-    return False
+    return issubclass(obj, _admissible_types)
 
 
 def serialize(obj: BaseModel) -> dict:
     if not _is_admissible_type(type(obj)):
         raise ValueError(f"Type {type(obj)} is not admissible")
-    return json.loads(obj.model_dump_json())
+    return obj.model_dump(mode="json")
+
+
+def serialize_many(objs: Iterable[BaseModel]) -> List[dict]:
+    """Serializes several objects, e.g. the items of a list response
+    :param objs: the objects to serialize
+    :return: the serialized objects, in the same order
+    :raises ValueError: if any of the objects is not of an admissible type"""
+    return [serialize(obj) for obj in objs]
 
 
 def deserialize(obj: dict, klass: Type[T]) -> T:
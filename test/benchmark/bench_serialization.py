@@ -0,0 +1,69 @@
+import json
+import timeit
+from datetime import datetime
+from typing import Callable, List
+
+from pydantic import BaseModel
+
+from domain.graph.core import AnswerId, Question, QuestionId
+from domain.graph.core.enum import Action, QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+from presentation.presentation import core_modules, serialize_many
+
+CATALOGUE_SIZE: int = 1000
+REPEAT: int = 5
+
+
+def _legacy_is_admissible_type(obj: type) -> bool:
+    for core_module in core_modules:
+        for name in dir(core_module):
+            symbol = getattr(core_module, name)
+            if isinstance(symbol, type) and issubclass(obj, symbol):
+                return True
+    return False
+
+
+def _legacy_serialize(obj: BaseModel) -> dict:
+    if not _legacy_is_admissible_type(type(obj)):
+        raise ValueError(f"Type {type(obj)} is not admissible")
+    return json.loads(obj.model_dump_json())
+
+
+def _catalogue(size: int) -> List[Question]:
+    return [
+        QuestionFactory.create_question(
+            QuestionId(code=f"question-{i}"),
+            f"Question {i}?",
+            QuestionType.SINGLE_CHOICE,
+            frozenset(
+                AnswerFactory.create_answer(
+                    AnswerId(code=f"question-{i}-answer-{j}"), f"Answer {j}", f"{j}"
+                )
+                for j in range(4)
+            ),
+            QuestionId(code=f"question-{i - 1}") if i > 0 else None,
+            frozenset({AnswerId(code=f"question-{i - 1}-answer-0")}),
+            Action.METRICS_CHECK,
+            datetime(2024, 6, 1),
+        )
+        for i in range(size)
+    ]
+
+
+def _best_time(fn: Callable[[], object]) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=REPEAT))
+
+
+def main() -> None:
+    questions: List[Question] = _catalogue(CATALOGUE_SIZE)
+    assert [_legacy_serialize(q) for q in questions] == serialize_many(questions)
+    legacy: float = _best_time(lambda: [_legacy_serialize(q) for q in questions])
+    fast: float = _best_time(lambda: serialize_many(questions))
+    print(f"Serializing {CATALOGUE_SIZE} questions, best of {REPEAT}:")
+    print(f"  admissibility scan + JSON round trip: {legacy * 1000:8.2f} ms")
+    print(f"  cached admissibility + model_dump:    {fast * 1000:8.2f} ms")
+    print(f"  speedup: {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+from typing import List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from domain.project.factories import ProjectFactory
+from domain.project.repositories import ProjectRepository
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
+
+
+def _project(code: str, name: str = "Project") -> Project:
+    return ProjectFactory.create_project(ProjectId(code=code), f"{name} {code}")
+
+
+class ProjectRepositoryContract:
+    """The behaviour every ProjectRepository must have, whatever its storage.
+    Test cases mixing it in along with unittest.TestCase provide a repository over
+    an empty store"""
+
+    repository: ProjectRepository
+
+    def create_repository(self) -> ProjectRepository:
+        raise NotImplementedError
+
+    def setUp(self):
+        self.repository = self.create_repository()
+
+    def _revision(self, project_id: ProjectId) -> Optional[int]:
+        revised: Optional[Tuple[Project, int]] = (
+            self.repository.get_project_with_revision(project_id)
+        )
+        return None if revised is None else revised[1]
+
+    def test_inserted_project_is_read_back(self):
+        self.assertEqual(
+            ProjectId(code="p1"), self.repository.insert_project(_project("p1"))
+        )
+        self.assertEqual(
+            _project("p1"), self.repository.get_project_by_id(ProjectId(code="p1"))
+        )
+        self.assertIsNone(self.repository.get_project_by_id(ProjectId(code="p2")))
+        self.assertEqual([_project("p1")], self.repository.get_all_projects())
+
+    def test_projects_by_ids(self):
+        self.repository.insert_project(_project("p1"))
+        self.repository.insert_project(_project("p2"))
+        self.assertEqual(
+            [_project("p2"), _project("p1")],
+            self.repository.get_projects_by_ids(
+                [ProjectId(code=code) for code in ("p2", "p3", "p1", "p2")]
+            ),
+        )
+        self.assertEqual([], self.repository.get_projects_by_ids([]))
+
+    def test_conflicting_insertion(self):
+        self.repository.insert_project(_project("p1"))
+        self.assertRaises(
+            ConflictError,
+            lambda: self.repository.insert_project(_project("p1", "Other")),
+        )
+        self.assertEqual(
+            _project("p1"), self.repository.get_project_by_id(ProjectId(code="p1"))
+        )
+
+    def test_update(self):
+        self.repository.insert_project(_project("p1"))
+        self.repository.update_project(ProjectId(code="p1"), _project("p1", "Renamed"))
+        self.assertEqual(
+            _project("p1", "Renamed"),
+            self.repository.get_project_by_id(ProjectId(code="p1")),
+        )
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.repository.update_project(
+                ProjectId(code="p2"), _project("p2")
+            ),
+        )
+
+    def test_delete(self):
+        self.repository.insert_project(_project("p1"))
+        self.repository.delete_project(ProjectId(code="p1"))
+        self.assertIsNone(self.repository.get_project_by_id(ProjectId(code="p1")))
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.repository.delete_project(ProjectId(code="p1")),
+        )
+        # The id may be used again
+        self.repository.insert_project(_project("p1"))
+
+    def test_writes_check_the_revision(self):
+        p1: ProjectId = ProjectId(code="p1")
+        self.repository.insert_project(_project("p1"))
+        self.repository.insert_project(_project("p2"))
+        revision: int = self._revision(p1)
+        # Writes to other projects leave the revision alone
+        self.repository.update_project(ProjectId(code="p2"), _project("p2", "New"))
+        self.assertEqual(revision, self._revision(p1))
+        self.repository.update_project(p1, _project("p1", "New"), [revision])
+        self.assertNotEqual(revision, self._revision(p1))
+        self.assertRaises(
+            PreconditionFailedError,
+            lambda: self.repository.update_project(p1, _project("p1"), [revision]),
+        )
+        self.assertRaises(
+            PreconditionFailedError,
+            lambda: self.repository.delete_project(p1, [revision]),
+        )
+        self.assertEqual(
+            (_project("p1", "New"), self._revision(p1)),
+            self.repository.get_project_with_revision(p1),
+        )
+        self.repository.delete_project(p1, [self._revision(p1)])
+        self.assertIsNone(self._revision(p1))
+        self.assertRaises(
+            NotFoundError, lambda: self.repository.delete_project(p1, [revision])
+        )
+
+    def test_pages_follow_each_other(self):
+        for code in ("p3", "p1", "p5", "p2", "p4"):
+            self.repository.insert_project(_project(code))
+        codes: List[str] = []
+        cursor: Optional[str] = None
+        while True:
+            page: Page = self.repository.get_projects_page(
+                PageRequest(limit=2, cursor=cursor, fields=frozenset({"id"}))
+            )
+            self.assertTrue(all(item.keys() == {"id"} for item in page.items))
+            codes += [item["id"]["code"] for item in page.items]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(["p1", "p2", "p3", "p4", "p5"], codes)
+        self.assertEqual(
+            {"id": {"code": "p1"}, "name": "Project p1"},
+            self.repository.get_projects_page(PageRequest(limit=1)).items[0],
+        )
+        self.assertRaises(
+            BadRequestError,
+            lambda: self.repository.get_projects_page(PageRequest(cursor="???")),
+        )
+
+    def test_every_write_changes_version(self):
+        versions: List[int] = [self.repository.get_version()]
+        self.repository.insert_project(_project("p1"))
+        versions.append(self.repository.get_version())
+        self.repository.update_project(ProjectId(code="p1"), _project("p1", "New"))
+        versions.append(self.repository.get_version())
+        self.repository.delete_project(ProjectId(code="p1"))
+        versions.append(self.repository.get_version())
+        self.assertEqual(4, len(set(versions)))
@@ -0,0 +1,372 @@
+from datetime import datetime
+from typing import FrozenSet, List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import AnswerId, Question, QuestionFilter, QuestionId
+from domain.graph.core.enum import Action, QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+from domain.graph.repositories import QuestionRepository
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
+
+
+def make_question(
+    code: str,
+    day: int,
+    previous: Optional[str] = None,
+    enabled_by: FrozenSet[str] = frozenset(),
+    answers: FrozenSet[str] = frozenset({"yes", "no"}),
+    action_needed: Optional[Action] = None,
+) -> Question:
+    return QuestionFactory.create_question(
+        QuestionId(code=code),
+        f"Question {code}",
+        QuestionType.SINGLE_CHOICE,
+        frozenset(
+            AnswerFactory.create_answer(AnswerId(code=f"{code}-{value}"), value, value)
+            for value in answers
+        ),
+        QuestionId(code=previous) if previous else None,
+        frozenset(AnswerId(code=answer) for answer in enabled_by),
+        action_needed,
+        created_at=datetime(2024, 6, day),
+    )
+
+
+class QuestionRepositoryContract:
+    """The behaviour every QuestionRepository must have, whatever its storage.
+    Test cases mixing it in along with unittest.TestCase provide a repository over
+    an empty store"""
+
+    repository: QuestionRepository
+
+    def create_repository(self) -> QuestionRepository:
+        raise NotImplementedError
+
+    def setUp(self):
+        self.repository = self.create_repository()
+
+    def _get(self, code: str) -> Optional[Question]:
+        return self.repository.get_question_by_id(QuestionId(code=code))
+
+    def _revision(self, question_id: QuestionId) -> Optional[int]:
+        revised: Optional[Tuple[Question, int]] = (
+            self.repository.get_question_with_revision(question_id)
+        )
+        return None if revised is None else revised[1]
+
+    def _codes(self, page: Page) -> List[str]:
+        return [item["id"]["code"] for item in page.items]
+
+    def test_inserted_question_is_read_back(self):
+        q1: Question = make_question("q1", 1, action_needed=Action.METRICS_CHECK)
+        q2: Question = make_question("q2", 2, "q1", frozenset({"q1-yes"}))
+        self.assertEqual(QuestionId(code="q1"), self.repository.insert_question(q1))
+        self.repository.insert_question(q2)
+        self.assertEqual(q1, self._get("q1"))
+        self.assertEqual(q2, self._get("q2"))
+        self.assertIsNone(self._get("q3"))
+
+    def test_questions_by_ids(self):
+        q1: Question = make_question("q1", 1)
+        q2: Question = make_question("q2", 2, "q1", frozenset({"q1-yes"}))
+        self.repository.insert_questions([q1, q2])
+        self.assertEqual(
+            [q2, q1],
+            self.repository.get_questions_by_ids(
+                [QuestionId(code=code) for code in ("q2", "q3", "q1", "q2")]
+            ),
+        )
+        self.assertEqual([], self.repository.get_questions_by_ids([]))
+
+    def test_links_to_missing_questions_and_answers_are_dropped(self):
+        self.repository.insert_question(
+            make_question("q2", 2, "q1", frozenset({"q1-yes"}))
+        )
+        q2: Question = self._get("q2")
+        self.assertIsNone(q2.previous_question_id)
+        self.assertEqual(frozenset(), q2.enabled_by)
+
+    def test_batch_questions_may_refer_to_each_other(self):
+        questions: List[Question] = [
+            make_question("q2", 2, "q1", frozenset({"q1-yes"})),
+            make_question("q1", 1),
+        ]
+        self.assertEqual(
+            [QuestionId(code="q2"), QuestionId(code="q1")],
+            self.repository.insert_questions(questions, chunk_size=1),
+        )
+        self.assertEqual(questions[0], self._get("q2"))
+        self.assertEqual([], self.repository.insert_questions([]))
+
+    def test_conflicting_insertions_write_nothing(self):
+        self.repository.insert_question(make_question("q1", 1))
+        version: int = self.repository.get_version()
+        self.assertRaises(
+            ConflictError,
+            lambda: self.repository.insert_question(make_question("q1", 2)),
+        )
+        self.assertRaises(
+            ConflictError,
+            lambda: self.repository.insert_questions(
+                [make_question("q2", 2), make_question("q1", 3)]
+            ),
+        )
+        # Answer ids are unique across questions
+        self.assertRaises(
+            ConflictError,
+            lambda: self.repository.insert_questions(
+                [
+                    make_question("q3", 3),
+                    make_question("q4", 4, answers=frozenset({"yes"})).model_copy(
+                        update={"available_answers": self._get("q1").available_answers}
+                    ),
+                ]
+            ),
+        )
+        self.assertIsNone(self._get("q2"))
+        self.assertIsNone(self._get("q3"))
+        self.assertEqual(version, self.repository.get_version())
+
+    def test_update_keeps_links_to_kept_answers(self):
+        self.repository.insert_questions(
+            [
+                make_question("q1", 1),
+                make_question("q2", 2, "q1", frozenset({"q1-yes", "q1-no"})),
+                make_question("q3", 3),
+            ]
+        )
+        updated: Question = make_question(
+            "q1",
+            1,
+            answers=frozenset({"yes", "maybe"}),
+            action_needed=Action.METRICS_CHECK,
+        )
+        self.repository.update_question(QuestionId(code="q1"), updated)
+        self.assertEqual(updated, self._get("q1"))
+        q2: Question = self._get("q2")
+        self.assertEqual(QuestionId(code="q1"), q2.previous_question_id)
+        # Links to the removed answers are gone, those to the kept answers remain
+        self.assertEqual(frozenset({AnswerId(code="q1-yes")}), q2.enabled_by)
+        # Outgoing links follow the update
+        moved: Question = make_question("q2", 2, "q3", frozenset({"q3-no", "q1-yes"}))
+        self.repository.update_question(QuestionId(code="q2"), moved)
+        self.assertEqual(moved, self._get("q2"))
+        self.repository.update_question(QuestionId(code="q2"), make_question("q2", 2))
+        self.assertEqual(make_question("q2", 2), self._get("q2"))
+        self.assertRaises(
+            ConflictError,
+            lambda: self.repository.update_question(
+                QuestionId(code="q1"),
+                make_question("q1", 1).model_copy(
+                    update={"available_answers": self._get("q3").available_answers}
+                ),
+            ),
+        )
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.repository.update_question(
+                QuestionId(code="q9"), make_question("q9", 9)
+            ),
+        )
+
+    def test_delete_drops_links_to_question_and_answers(self):
+        self.repository.insert_questions(
+            [
+                make_question("q1", 1),
+                make_question("q2", 2, "q1", frozenset({"q1-yes"})),
+            ]
+        )
+        self.repository.delete_question(QuestionId(code="q1"))
+        self.assertIsNone(self._get("q1"))
+        self.assertEqual(make_question("q2", 2), self._get("q2"))
+        self.assertEqual(
+            (frozenset(), frozenset()),
+            self.repository.get_existing_ids(
+                frozenset({QuestionId(code="q1")}), frozenset({AnswerId(code="q1-no")})
+            ),
+        )
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.repository.delete_question(QuestionId(code="q1")),
+        )
+
+    def test_writes_check_the_revision(self):
+        q1: QuestionId = QuestionId(code="q1")
+        self.repository.insert_questions(
+            [make_question("q1", 1), make_question("q2", 2)]
+        )
+        revision: int = self._revision(q1)
+        # Writes to other questions leave the revision alone
+        self.repository.update_question(QuestionId(code="q2"), make_question("q2", 3))
+        self.assertEqual(revision, self._revision(q1))
+        updated: Question = make_question("q1", 1, action_needed=Action.METRICS_CHECK)
+        self.repository.update_question(q1, updated, [revision])
+        self.assertNotEqual(revision, self._revision(q1))
+        self.assertRaises(
+            PreconditionFailedError,
+            lambda: self.repository.update_question(
+                q1, make_question("q1", 1), [revision]
+            ),
+        )
+        self.assertRaises(
+            PreconditionFailedError,
+            lambda: self.repository.delete_question(q1, [revision]),
+        )
+        self.assertEqual(
+            (updated, self._revision(q1)),
+            self.repository.get_question_with_revision(q1),
+        )
+        self.repository.delete_question(q1, [self._revision(q1)])
+        self.assertIsNone(self._revision(q1))
+        self.assertRaises(
+            NotFoundError, lambda: self.repository.delete_question(q1, [revision])
+        )
+
+    def test_losing_a_link_changes_revision(self):
+        self.repository.insert_questions(
+            [
+                make_question("q1", 1),
+                make_question("q2", 2, "q1", frozenset({"q1-yes"})),
+                make_question("q3", 3, enabled_by=frozenset({"q1-no"})),
+            ]
+        )
+        q2: QuestionId = QuestionId(code="q2")
+        q3: QuestionId = QuestionId(code="q3")
+        revisions: List[int] = [
+            self._revision(q2),
+            self._revision(q3),
+        ]
+        self.repository.update_question(
+            QuestionId(code="q1"), make_question("q1", 1, answers=frozenset({"yes"}))
+        )
+        # Only the question enabled by the removed answer changed
+        self.assertEqual(revisions[0], self._revision(q2))
+        self.assertNotEqual(revisions[1], self._revision(q3))
+        self.repository.delete_question(QuestionId(code="q1"))
+        self.assertNotEqual(revisions[0], self._revision(q2))
+
+    def test_questions_in_creation_order(self):
+        questions: List[Question] = [
+            make_question("q3", 2),
+            make_question("q1", 3),
+            make_question("q2", 2),
+        ]
+        self.repository.insert_questions(questions)
+        self.assertEqual(
+            ["q2", "q3", "q1"],
+            [q.id.code for q in self.repository.iter_all_questions()],
+        )
+        self.assertEqual(
+            sorted(q.id.code for q in questions),
+            sorted(q.id.code for q in self.repository.get_all_questions()),
+        )
+        self.assertEqual(
+            QuestionId(code="q1"), self.repository.get_last_inserted_question().id
+        )
+
+    def test_no_question(self):
+        self.assertEqual([], self.repository.get_all_questions())
+        self.assertIsNone(self.repository.get_last_inserted_question())
+        self.assertEqual(
+            [],
+            self.repository.get_questions_page(PageRequest(), QuestionFilter()).items,
+        )
+
+    def test_pages_follow_each_other(self):
+        self.repository.insert_questions(
+            [make_question(f"q{i}", 1 + i % 3) for i in range(1, 8)]
+        )
+        codes: List[str] = []
+        cursor: Optional[str] = None
+        while True:
+            page: Page = self.repository.get_questions_page(
+                PageRequest(limit=3, cursor=cursor), QuestionFilter()
+            )
+            codes += self._codes(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(["q3", "q6", "q1", "q4", "q7", "q2", "q5"], codes)
+        self.assertRaises(
+            BadRequestError,
+            lambda: self.repository.get_questions_page(
+                PageRequest(cursor="not-a-cursor"), QuestionFilter()
+            ),
+        )
+
+    def test_page_filters_and_fields(self):
+        self.repository.insert_questions(
+            [
+                make_question("q1", 1),
+                make_question("q2", 2, "q1", frozenset({"q1-yes"})),
+                make_question("q3", 3, "q1", action_needed=Action.METRICS_CHECK),
+                make_question("q4", 4, "q2", action_needed=Action.METRICS_CHECK),
+            ]
+        )
+        page: Page = self.repository.get_questions_page(
+            PageRequest(fields=frozenset({"id", "enabled_by", "available_answers"})),
+            QuestionFilter(previous_question_id=QuestionId(code="q1")),
+        )
+        self.assertEqual(
+            [
+                {
+                    "id": {"code": "q2"},
+                    "available_answers": [
+                        {"id": {"code": "q2-no"}, "text": "no", "value": "no"},
+                        {"id": {"code": "q2-yes"}, "text": "yes", "value": "yes"},
+                    ],
+                    "enabled_by": [{"code": "q1-yes"}],
+                },
+                {
+                    "id": {"code": "q3"},
+                    "available_answers": [
+                        {"id": {"code": "q3-no"}, "text": "no", "value": "no"},
+                        {"id": {"code": "q3-yes"}, "text": "yes", "value": "yes"},
+                    ],
+                    "enabled_by": [],
+                },
+            ],
+            page.items,
+        )
+        page = self.repository.get_questions_page(
+            PageRequest(),
+            QuestionFilter(
+                type=QuestionType.SINGLE_CHOICE, action_needed=Action.METRICS_CHECK
+            ),
+        )
+        self.assertEqual(["q3", "q4"], self._codes(page))
+        page = self.repository.get_questions_page(
+            PageRequest(), QuestionFilter(type=QuestionType.BOOLEAN)
+        )
+        self.assertEqual([], page.items)
+
+    def test_reserved_ids_are_not_handed_out_again(self):
+        first: List[QuestionId] = self.repository.reserve_question_ids(2)
+        self.assertEqual(2, len(first))
+        number: int = int(first[-1].code[2:])
+        self.assertEqual(f"q-{number - 1}", first[0].code)
+        # Ids of stored questions are skipped, the sequence moving past them
+        self.repository.insert_question(make_question(f"q-{number + 2}", 1))
+        self.assertEqual(
+            [QuestionId(code=f"q-{number + 1}"), QuestionId(code=f"q-{number + 3}")],
+            self.repository.reserve_question_ids(3),
+        )
+        self.assertEqual(
+            [QuestionId(code=f"q-{number + 4}")],
+            self.repository.reserve_question_ids(1),
+        )
+
+    def test_every_write_changes_version(self):
+        versions: List[int] = [self.repository.get_version()]
+        self.repository.insert_question(make_question("q1", 1))
+        versions.append(self.repository.get_version())
+        self.repository.update_question(QuestionId(code="q1"), make_question("q1", 2))
+        versions.append(self.repository.get_version())
+        self.repository.delete_question(QuestionId(code="q1"))
+        versions.append(self.repository.get_version())
+        self.assertEqual(4, len(set(versions)))
@@ -5,12 +5,12 @@ from pathlib import Path
 from typing import Set
 
 import yaml
-from python_on_whales import DockerClient
 
 from domain.graph.core import Question, QuestionId, AnswerId
 from domain.graph.core.enum import QuestionType
 from domain.graph.factories import AnswerFactory, QuestionFactory
 from presentation.presentation import serialize, deserialize
+from test.utils.database import start_database, stop_database
 from test.utils.utils import get_file_path
 from ws.main import create_app
 
@@ -19,9 +19,7 @@ class TestQuestionsAPI(unittest.TestCase):
 
     @classmethod
     def startDocker(cls):
-        cls.docker = DockerClient()
-        cls.docker.compose.down(volumes=True)
-        cls.docker.compose.up(detach=True, wait=True)
+        cls.docker = start_database()
 
     @classmethod
     def setUpClass(cls):
@@ -54,7 +52,7 @@ class TestQuestionsAPI(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.docker.compose.down(volumes=True)
+        stop_database(cls.docker)
 
     def tearDown(self):
         self._delete_all_questions()
@@ -85,6 +83,26 @@ class TestQuestionsAPI(unittest.TestCase):
             self.question, deserialize(json.loads(response.data), Question)
         )
 
+    def test_get_questions_by_ids(self):
+        self.app.post("/questions", json=serialize(self.question))
+        expected: dict = {
+            "found": [serialize(self.question)],
+            "missing": [serialize(QuestionId(code="does-not-exist"))],
+        }
+        response = self.app.get(
+            f"/questions?ids={self.question.id.code},does-not-exist"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(expected, json.loads(response.data))
+        response = self.app.post(
+            "/questions/batch-get",
+            json={"ids": ["does-not-exist", self.question.id.code]},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(expected, json.loads(response.data))
+        response = self.app.post("/questions/batch-get", json={"ids": []})
+        self.assertEqual(response.status_code, 400)
+
     def test_get_non_existent_question(self):
         response = self.app.get("/questions/does-not-exist")
         self.assertEqual(response.status_code, 404)
@@ -133,24 +151,34 @@ class TestQuestionsAPI(unittest.TestCase):
         response = self.app.delete("/questions/does-not-exist")
         self.assertEqual(response.status_code, 404)
 
-    def test_get_new_candidate_id(self):
+    def _new_candidate_number(self) -> int:
         response = self.app.get("/questions/new-candidate-id")
         self.assertEqual(response.status_code, 200)
-        expected_question_id = serialize(QuestionId(code="q-1"))
-        self.assertEqual(expected_question_id, json.loads(response.data))
+        code: str = deserialize(json.loads(response.data), QuestionId).code
+        self.assertTrue(code.startswith("q-"))
+        return int(code[2:])
+
+    def test_get_new_candidate_id(self):
+        first: int = self._new_candidate_number()
         self.app.post("/questions", json=serialize(self.question))
-        response = self.app.get("/questions/new-candidate-id")
-        self.assertEqual(response.status_code, 200)
-        expected_question_id = serialize(QuestionId(code="q-2"))
-        self.assertEqual(expected_question_id, json.loads(response.data))
+        self.assertEqual(first + 1, self._new_candidate_number())
+        # The ids of stored questions are skipped
+        taken: Question = self.question2.model_copy(
+            update={"id": QuestionId(code=f"q-{first + 2}")}
+        )
+        self.app.post("/questions", json=serialize(taken))
+        self.assertEqual(first + 3, self._new_candidate_number())
+        self.app.delete(f"/questions/{taken.id.code}")
 
     def test_get_new_candidate_id_after_deletion(self):
         self.app.post("/questions", json=serialize(self.question))
-        self.app.delete(f"/questions/{self.question.id.code}")
-        response = self.app.get("/questions/new-candidate-id")
-        self.assertEqual(response.status_code, 200)
-        expected_question_id = serialize(QuestionId(code="q-1"))
-        self.assertEqual(expected_question_id, json.loads(response.data))
+        candidate: Question = self.question2.model_copy(
+            update={"id": QuestionId(code=f"q-{self._new_candidate_number()}")}
+        )
+        self.app.post("/questions", json=serialize(candidate))
+        self.app.delete(f"/questions/{candidate.id.code}")
+        # The id of a deleted question is not handed out again
+        self.assertEqual(int(candidate.id.code[2:]) + 1, self._new_candidate_number())
 
     def test_last_inserted_question(self):
         self.app.post("/questions", json=serialize(self.question))
@@ -176,3 +204,141 @@ class TestQuestionsAPI(unittest.TestCase):
             self.assertEqual(response.status_code, 200)
             expected_questions: dict = yaml.safe_load(questions_yaml)
             self.assertEqual(expected_questions, json.loads(response.data))
+
+    def test_questions_load_json_lines(self):
+        questions_jsonl: str = "\n".join(
+            json.dumps(serialize(question))
+            for question in [self.question, self.question2]
+        )
+        response = self.app.post(
+            "/questions/load?mode=chunked&chunk_size=1",
+            content_type="application/jsonl",
+            data=questions_jsonl,
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(2, json.loads(response.data)["created"])
+        response = self.app.get(f"/questions/{self.question2.id.code}")
+        self.assertEqual(response.status_code, 200)
+
+    def test_questions_load_invalid_batch(self):
+        invalid_question: dict = serialize(self.question2)
+        invalid_question["previous_question_id"] = {"code": "does-not-exist"}
+        response = self.app.post(
+            "/questions/load",
+            content_type="application/jsonl",
+            data="\n".join(
+                [json.dumps(serialize(self.question)), json.dumps(invalid_question)]
+            ),
+        )
+        self.assertEqual(response.status_code, 400)
+        statuses = [r["status"] for r in json.loads(response.data)["results"]]
+        self.assertEqual(["skipped", "invalid"], statuses)
+        response = self.app.get("/questions")
+        self.assertEqual([], json.loads(response.data))
+
+    def test_questions_export_round_trip(self):
+        yaml_file_path: Path = get_file_path(
+            "test/resources/questions-load-example.yml"
+        )
+        with yaml_file_path.open("r") as file:
+            self.app.post("/questions/load", content_type="text/yaml", data=file.read())
+        response = self.app.get("/questions")
+        expected_questions: list = json.loads(response.data)
+        for export_format, content_type in [
+            ("yaml", "text/yaml"),
+            ("jsonl", "application/jsonl"),
+        ]:
+            response = self.app.get(f"/questions/export?format={export_format}")
+            self.assertEqual(response.status_code, 200)
+            exported: bytes = response.data
+            self._delete_all_questions()
+            response = self.app.post(
+                "/questions/load", content_type=content_type, data=exported
+            )
+            self.assertEqual(response.status_code, 201)
+            response = self.app.get("/questions")
+            self.assertEqual(expected_questions, json.loads(response.data))
+
+    def test_get_questions_page(self):
+        self.app.post("/questions", json=serialize(self.question))
+        self.app.post("/questions", json=serialize(self.question2))
+        response = self.app.get("/questions?limit=1&fields=id,text")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [{"id": {"code": "test-question"}, "text": "Test question"}],
+            json.loads(response.data),
+        )
+        cursor: str = response.headers["X-Next-Cursor"]
+        response = self.app.get(f"/questions?limit=1&fields=id&cursor={cursor}")
+        self.assertEqual(
+            [{"id": {"code": "test-question-2"}}], json.loads(response.data)
+        )
+        self.assertNotIn("X-Next-Cursor", response.headers)
+        response = self.app.get("/questions?type=boolean&fields=id")
+        self.assertEqual(
+            [{"id": {"code": "test-question-2"}}], json.loads(response.data)
+        )
+
+    def test_representations_have_their_own_tags(self):
+        self.app.post("/questions", json=serialize(self.question))
+        response = self.app.get("/questions/test-question")
+        self.assertIn("Accept", response.headers["Vary"])
+        json_etag: str = response.headers["ETag"]
+        response = self.app.get(
+            "/questions/test-question", headers={"Accept": "application/msgpack"}
+        )
+        msgpack_etag: str = response.headers["ETag"]
+        self.assertNotEqual(json_etag, msgpack_etag)
+        response = self.app.get(
+            "/questions/test-question", headers={"If-None-Match": msgpack_etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.app.get(
+            "/questions/test-question",
+            headers={"Accept": "application/msgpack", "If-None-Match": msgpack_etag},
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertIn("Accept", response.headers["Vary"])
+        response = self.app.delete(
+            "/questions/test-question", headers={"If-Match": msgpack_etag}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_conditional_requests(self):
+        self.app.post("/questions", json=serialize(self.question))
+        response = self.app.get("/questions/test-question")
+        etag: str = response.headers["ETag"]
+        response = self.app.get(
+            "/questions/test-question", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        # Writing another question leaves the tag alone
+        self.app.post("/questions", json=serialize(self.question2))
+        response = self.app.get(
+            "/questions/test-question", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        response = self.app.put(
+            "/questions/test-question",
+            json=serialize(self.question),
+            headers={"If-Match": etag},
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.app.put(
+            "/questions/test-question",
+            json=serialize(self.question),
+            headers={"If-Match": etag},
+        )
+        self.assertEqual(response.status_code, 412)
+        response = self.app.delete(
+            "/questions/test-question", headers={"If-Match": etag}
+        )
+        self.assertEqual(response.status_code, 412)
+        response = self.app.get(
+            "/questions/test-question", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 200)
+        response = self.app.delete(
+            "/questions/test-question", headers={"If-Match": response.headers["ETag"]}
+        )
+        self.assertEqual(response.status_code, 200)
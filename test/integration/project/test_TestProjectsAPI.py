@@ -2,10 +2,9 @@ import json
 import unittest
 from typing import Set
 
-from python_on_whales import DockerClient
-
 from domain.project.core import Project, ProjectId
 from presentation.presentation import deserialize
+from test.utils.database import start_database, stop_database
 from ws.main import create_app
 
 
@@ -13,9 +12,7 @@ class TestProjectsAPI(unittest.TestCase):
 
     @classmethod
     def startDocker(cls):
-        cls.docker = DockerClient()
-        cls.docker.compose.down(volumes=True)
-        cls.docker.compose.up(detach=True, wait=True)
+        cls.docker = start_database()
 
     @classmethod
     def setUpClass(cls):
@@ -26,7 +23,7 @@ class TestProjectsAPI(unittest.TestCase):
 
     @classmethod
     def tearDownClass(cls):
-        cls.docker.compose.down(volumes=True)
+        stop_database(cls.docker)
 
     def tearDown(self):
         self._delete_all_projects()
@@ -59,6 +56,26 @@ class TestProjectsAPI(unittest.TestCase):
         project: Project = deserialize(json.loads(response.data), Project)
         self.assertEqual(self.project_name_1, project.name)
 
+    def test_get_projects_by_ids(self):
+        response = self.app.post("/projects", json={"name": self.project_name_1})
+        project_id: ProjectId = deserialize(json.loads(response.data), ProjectId)
+        response = self.app.get(f"/projects?ids=does-not-exist,{project_id.code}")
+        self.assertEqual(response.status_code, 200)
+        body: dict = json.loads(response.data)
+        self.assertEqual(
+            [self.project_name_1], [project["name"] for project in body["found"]]
+        )
+        self.assertEqual([{"code": "does-not-exist"}], body["missing"])
+        response = self.app.post(
+            "/projects/batch-get", json={"ids": [project_id.code, project_id.code]}
+        )
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.data)
+        self.assertEqual(1, len(body["found"]))
+        self.assertEqual([], body["missing"])
+        response = self.app.post("/projects/batch-get", data="not json")
+        self.assertEqual(response.status_code, 400)
+
     def test_get_non_existent_project(self):
         response = self.app.get("/projects/does-not-exist")
         self.assertEqual(response.status_code, 404)
@@ -86,3 +103,32 @@ class TestProjectsAPI(unittest.TestCase):
     def test_delete_non_existent_project(self):
         response = self.app.delete("/projects/does-not-exist")
         self.assertEqual(response.status_code, 404)
+
+    def test_get_projects_page(self):
+        self.app.post("/projects", json={"name": self.project_name_1})
+        self.app.post("/projects", json={"name": self.project_name_2})
+        response = self.app.get("/projects?limit=1&fields=name")
+        self.assertEqual(response.status_code, 200)
+        first_page: list = json.loads(response.data)
+        cursor: str = response.headers["X-Next-Cursor"]
+        response = self.app.get(f"/projects?limit=1&fields=name&cursor={cursor}")
+        second_page: list = json.loads(response.data)
+        self.assertEqual(
+            {self.project_name_1, self.project_name_2},
+            {project["name"] for project in first_page + second_page},
+        )
+
+    def test_conditional_requests(self):
+        self.app.post("/projects", json={"name": self.project_name_1})
+        response = self.app.get("/projects")
+        etag: str = response.headers["ETag"]
+        response = self.app.get("/projects", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        response = self.app.post("/projects", json={"name": self.project_name_2})
+        project_id: ProjectId = deserialize(json.loads(response.data), ProjectId)
+        response = self.app.get("/projects", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        response = self.app.delete(
+            f"/projects/{project_id.code}", headers={"If-Match": '"outdated"'}
+        )
+        self.assertEqual(response.status_code, 412)
@@ -0,0 +1,99 @@
+import json
+import unittest
+from typing import List
+
+from test.utils.database import start_database, stop_database
+from test.utils.utils import get_file_path
+from ws.main import create_app
+
+
+class TestQuestionnaireAPI(unittest.TestCase):
+
+    @classmethod
+    def startDocker(cls):
+        cls.docker = start_database()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.startDocker()
+        cls.app = create_app().test_client()
+        with get_file_path("test/resources/question-graph-example.yml").open(
+            "r"
+        ) as file:
+            cls.app.post("/questions/load", content_type="text/yaml", data=file.read())
+
+    @classmethod
+    def tearDownClass(cls):
+        stop_database(cls.docker)
+
+    def setUp(self):
+        response = self.app.post("/projects", json={"name": "Project"})
+        self.project_id: str = json.loads(response.data)["code"]
+        self.questionnaire: str = f"/projects/{self.project_id}/questionnaire"
+
+    def tearDown(self):
+        self.app.delete(f"/projects/{self.project_id}")
+
+    def _asked(self) -> List[str]:
+        response = self.app.get(self.questionnaire)
+        self.assertEqual(response.status_code, 200)
+        return [question["id"]["code"] for question in json.loads(response.data)]
+
+    def test_first_question(self):
+        self.assertEqual([], self._asked())
+        response = self.app.post(self.questionnaire)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual("q1", json.loads(response.data)["id"]["code"])
+        self.app.post(self.questionnaire)
+        self.assertEqual(["q1"], self._asked())
+
+    def test_answer_and_move_on(self):
+        self.app.post(self.questionnaire)
+        response = self.app.post(
+            f"{self.questionnaire}/q1/answers", json={"code": "q1-a1"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            ["q1-a1"],
+            [a["id"]["code"] for a in json.loads(response.data)["selected_answers"]],
+        )
+        response = self.app.post(f"{self.questionnaire}/q1/next")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual("q2", json.loads(response.data)["id"]["code"])
+        self.assertEqual(["q1", "q2"], self._asked())
+
+    def test_unanswered_question_has_no_next(self):
+        self.app.post(self.questionnaire)
+        response = self.app.post(f"{self.questionnaire}/q1/next")
+        self.assertEqual(response.status_code, 404)
+
+    def test_malformed_answer(self):
+        self.app.post(self.questionnaire)
+        for body in ([], {"code": 1}, {}):
+            response = self.app.post(f"{self.questionnaire}/q1/answers", json=body)
+            self.assertEqual(response.status_code, 400)
+        response = self.app.post(
+            f"{self.questionnaire}/q1/answers",
+            data="{",
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_go_back_and_reset(self):
+        self.app.post(self.questionnaire)
+        self.app.post(f"{self.questionnaire}/q1/answers", json={"code": "q1-a1"})
+        self.app.post(f"{self.questionnaire}/q1/next")
+        response = self.app.post(f"{self.questionnaire}/q1/back")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(["q1"], self._asked())
+        response = self.app.delete(self.questionnaire)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([], self._asked())
+
+    def test_unknown_project(self):
+        response = self.app.post("/projects/does-not-exist/questionnaire")
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from infrastructure.storage.graph.repositories import Neo4jQuestionRepository
+from infrastructure.storage.migrations import SchemaMigrator
+from infrastructure.storage.project.repositories.neo4j_project_repository import (
+    Neo4jProjectRepository,
+)
+from test.contract.project_repository_contract import ProjectRepositoryContract
+from test.contract.question_repository_contract import QuestionRepositoryContract
+from test.utils.database import start_database, stop_database
+from utils.env import STORAGE_BACKEND, DB_HOST, DB_USER, DB_PASSWORD
+from utils.neo4j_driver import Credentials, Neo4jDriver
+from ws.settings import startup_retry_policy
+
+
+@unittest.skipIf(STORAGE_BACKEND != "neo4j", "Neo4j is not the storage backend")
+class Neo4jTestCase(unittest.TestCase):
+    """Runs the repository contracts against a fresh database"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.docker = start_database()
+        cls.driver = Neo4jDriver(DB_HOST, Credentials(DB_USER, DB_PASSWORD))
+        SchemaMigrator(cls.driver.with_retry_policy(startup_retry_policy())).migrate()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.driver.close()
+        stop_database(cls.docker)
+
+
+class TestNeo4jQuestionRepository(QuestionRepositoryContract, Neo4jTestCase):
+
+    def create_repository(self) -> Neo4jQuestionRepository:
+        repository: Neo4jQuestionRepository = Neo4jQuestionRepository(self.driver)
+        repository.delete_all_questions()
+        return repository
+
+
+class TestNeo4jProjectRepository(ProjectRepositoryContract, Neo4jTestCase):
+
+    def create_repository(self) -> Neo4jProjectRepository:
+        repository: Neo4jProjectRepository = Neo4jProjectRepository(self.driver)
+        repository.delete_all_projects()
+        return repository
+
+
+if __name__ == "__main__":
+    unittest.main()
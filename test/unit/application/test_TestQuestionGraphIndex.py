@@ -0,0 +1,128 @@
+import unittest
+from datetime import datetime
+from typing import FrozenSet, Optional
+
+from application.graph.question_graph_index import QuestionGraphIndex
+from application.graph.question_service import QuestionService
+from domain.graph.core import Answer, AnswerId, Question, QuestionId
+from domain.graph.core.enum import QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+from test.utils.repositories import RecordingQuestionRepository
+
+
+def _answers(code: str) -> FrozenSet[Answer]:
+    return frozenset(
+        AnswerFactory.create_answer(AnswerId(code=f"{code}-a{i}"), f"A{i}", f"{i}")
+        for i in (1, 2)
+    )
+
+
+def _question(
+    code: str,
+    previous: Optional[str] = None,
+    enabled_by: FrozenSet[str] = frozenset(),
+    day: int = 1,
+) -> Question:
+    return QuestionFactory.create_question(
+        QuestionId(code=code),
+        f"Question {code}",
+        QuestionType.SINGLE_CHOICE,
+        _answers(code),
+        QuestionId(code=previous) if previous else None,
+        frozenset(AnswerId(code=answer) for answer in enabled_by),
+        created_at=datetime(2024, 6, day),
+    )
+
+
+class TestQuestionGraphIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = RecordingQuestionRepository(
+            [
+                _question("q1"),
+                _question("q2", "q1", {"q1-a1"}, 2),
+                _question("q3", "q1", {"q1-a2"}, 3),
+                _question("q4", "q1", day=4),
+                _question("q5", "q1", {"q1-a1"}, 5),
+            ]
+        )
+        self.index = QuestionGraphIndex(self.repository, check_interval=60)
+        self.service = QuestionService(self.repository, self.index)
+
+    def _next(self, question: str, *answers: str) -> Optional[str]:
+        next_question_id: Optional[QuestionId] = self.index.next_question_id(
+            QuestionId(code=question), [AnswerId(code=answer) for answer in answers]
+        )
+        return None if next_question_id is None else next_question_id.code
+
+    def test_next_question_follows_selection(self):
+        self.assertEqual("q1", self.index.first_question_id().code)
+        self.assertEqual("q2", self._next("q1", "q1-a1"))
+        self.assertEqual("q3", self._next("q1", "q1-a2"))
+        self.assertEqual("q2", self._next("q1", "q1-a2", "q1-a1"))
+        self.assertEqual("q4", self._next("q1"))
+        self.assertIsNone(self._next("q4"))
+        self.assertIsNone(self._next("q9"))
+
+    def test_transitions_stop_at_first_unconditional_follower(self):
+        transitions = self.index.get_transitions(QuestionId(code="q1"))
+        self.assertEqual(
+            ["q2", "q3", "q4"], [follower.code for follower in transitions.followers]
+        )
+        self.assertEqual(2, transitions.unconditional)
+        self.assertEqual({"q1-a1": 0, "q1-a2": 1}, transitions.by_answer)
+
+    def test_built_once(self):
+        self._next("q1", "q1-a1")
+        self._next("q1", "q1-a2")
+        self.index.first_question_id()
+        self.assertEqual(1, self.repository.reads)
+
+    def test_writes_are_applied_in_place(self):
+        self._next("q1")
+        self.service.add_question(_question("q6", "q4", {"q4-a1"}, 6))
+        self.assertEqual("q6", self._next("q4", "q4-a1"))
+        self.service.delete_question(QuestionId(code="q4"))
+        self.assertEqual("q2", self._next("q1", "q1-a1"))
+        self.assertIsNone(self._next("q1"))
+        self.assertEqual(1, self.repository.reads)
+
+    def test_update_keeps_links_to_kept_answers_only(self):
+        self._next("q1")
+        self.service.update_question(QuestionId(code="q1"), _question("q1"))
+        self.assertEqual("q2", self._next("q1", "q1-a1"))
+        self.assertEqual("q4", self._next("q1"))
+        q1: Question = _question("q1")
+        self.service.update_question(
+            QuestionId(code="q1"),
+            q1.model_copy(
+                update={
+                    "available_answers": frozenset(
+                        answer
+                        for answer in q1.available_answers
+                        if answer.id == AnswerId(code="q1-a1")
+                    )
+                }
+            ),
+        )
+        # As in storage, removing an answer drops the links enabling followers
+        self.assertEqual("q2", self._next("q1", "q1-a1"))
+        self.assertEqual("q3", self._next("q1"))
+        self.assertEqual(1, self.repository.reads)
+
+    def test_deleted_question_followers_become_first(self):
+        self._next("q1")
+        self.service.delete_question(QuestionId(code="q1"))
+        self.assertEqual("q2", self.index.first_question_id().code)
+
+    def test_write_made_elsewhere_leads_to_rebuild(self):
+        self._next("q1")
+        self.repository.questions[QuestionId(code="q7")] = _question("q7", "q4", day=7)
+        self.repository.version += 1
+        self.service.add_question(_question("q6", "q4", day=6))
+        self.assertEqual("q6", self._next("q4"))
+        self.assertEqual(2, self.repository.reads)
+
+
+if __name__ == "__main__":
+    unittest.main()
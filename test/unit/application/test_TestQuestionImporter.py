@@ -0,0 +1,110 @@
+import unittest
+from datetime import datetime
+from typing import List, Optional
+
+from application.graph.question_importer import (
+    ImportMode,
+    ImportReport,
+    ImportStatus,
+    QuestionImporter,
+)
+from domain.graph.core import AnswerId, Question, QuestionId
+from domain.graph.factories import QuestionFactory
+from presentation.presentation import serialize
+from test.utils.repositories import RecordingQuestionRepository
+
+
+def _question(code: str, previous: Optional[str] = None) -> Question:
+    return QuestionFactory.create_boolean_question(
+        QuestionId(code=code),
+        f"Question {code}",
+        QuestionId(code=previous) if previous else None,
+        frozenset({AnswerId(code=f"{previous}-true")}) if previous else frozenset(),
+        created_at=datetime(2024, 5, 31),
+    )
+
+
+class TestQuestionImporter(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = RecordingQuestionRepository()
+        self.importer = QuestionImporter(self.repository)
+
+    def _statuses(self, report: ImportReport) -> List[ImportStatus]:
+        return [result.status for result in report.results]
+
+    def test_import_atomically(self):
+        items = [serialize(_question("q2", "q1")), serialize(_question("q1"))]
+        report: ImportReport = self.importer.import_questions(items)
+        self.assertEqual([ImportStatus.CREATED] * 2, self._statuses(report))
+        self.assertEqual(
+            [[QuestionId(code="q2"), QuestionId(code="q1")]], self.repository.batches
+        )
+
+    def test_invalid_question_aborts_atomic_import(self):
+        items = [serialize(_question("q1")), {"id": {"code": "broken"}}]
+        report: ImportReport = self.importer.import_questions(items)
+        self.assertEqual(
+            [ImportStatus.SKIPPED, ImportStatus.INVALID], self._statuses(report)
+        )
+        self.assertEqual(QuestionId(code="broken"), report.results[1].id)
+        self.assertEqual([], self.repository.batches)
+
+    def test_duplicate_and_dangling_references(self):
+        items = [
+            serialize(_question("q1")),
+            serialize(_question("q1")),
+            serialize(_question("q3", "missing")),
+        ]
+        report: ImportReport = self.importer.import_questions(items, ImportMode.CHUNKED)
+        self.assertEqual(
+            [ImportStatus.CREATED, ImportStatus.INVALID, ImportStatus.INVALID],
+            self._statuses(report),
+        )
+        self.assertEqual([[QuestionId(code="q1")]], self.repository.batches)
+
+    def test_reference_to_stored_question(self):
+        self.repository.questions[QuestionId(code="q1")] = _question("q1")
+        report: ImportReport = self.importer.import_questions(
+            [serialize(_question("q2", "q1"))]
+        )
+        self.assertEqual([ImportStatus.CREATED], self._statuses(report))
+
+    def test_conflict_with_stored_question(self):
+        self.repository.questions[QuestionId(code="q1")] = _question("q1")
+        report: ImportReport = self.importer.import_questions(
+            [serialize(_question("q1"))]
+        )
+        self.assertEqual([ImportStatus.CONFLICT], self._statuses(report))
+
+    def test_import_in_chunks(self):
+        items = [serialize(_question("q3", "q2")), serialize(_question("q2", "q1"))]
+        items.append(serialize(_question("q1")))
+        items.append({"id": {"code": "q4"}})
+        items.append(
+            serialize(
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code="q5"), "Question q5", QuestionId(code="q4")
+                )
+            )
+        )
+        report: ImportReport = self.importer.import_questions(
+            items, ImportMode.CHUNKED, chunk_size=2
+        )
+        self.assertEqual(
+            [
+                ImportStatus.CREATED,
+                ImportStatus.CREATED,
+                ImportStatus.CREATED,
+                ImportStatus.INVALID,
+                ImportStatus.SKIPPED,
+            ],
+            self._statuses(report),
+        )
+        self.assertEqual(
+            [
+                [QuestionId(code="q1"), QuestionId(code="q2")],
+                [QuestionId(code="q3")],
+            ],
+            self.repository.batches,
+        )
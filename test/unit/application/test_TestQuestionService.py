@@ -0,0 +1,90 @@
+import threading
+import unittest
+from datetime import datetime
+from typing import List, Set
+
+from application import QuestionService
+from domain.common.core import Page, PageRequest
+from domain.graph.core import QuestionFilter, QuestionId
+from domain.graph.core.enum import QuestionType
+from domain.graph.factories import QuestionFactory
+from test.utils.repositories import RecordingQuestionRepository
+
+
+class TestQuestionService(unittest.TestCase):
+
+    def setUp(self):
+        self.repository = RecordingQuestionRepository(
+            [
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code="q-2"), "Question", created_at=datetime(2024, 6, 1)
+                )
+            ]
+        )
+
+    def test_questions_page(self):
+        for code, day in (("q-4", 3), ("q-3", 2)):
+            self.repository.insert_question(
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code=code), "Question", created_at=datetime(2024, 6, day)
+                )
+            )
+        service: QuestionService = QuestionService(self.repository)
+        page: Page = service.get_questions_page(
+            PageRequest(limit=2, fields=frozenset({"id"})), QuestionFilter()
+        )
+        self.assertEqual(["q-2", "q-3"], [item["id"]["code"] for item in page.items])
+        page = service.get_questions_page(
+            PageRequest(limit=2, cursor=page.next_cursor, fields=frozenset({"id"})),
+            QuestionFilter(type=QuestionType.BOOLEAN),
+        )
+        self.assertEqual(["q-4"], [item["id"]["code"] for item in page.items])
+        self.assertIsNone(page.next_cursor)
+        page = service.get_questions_page(
+            PageRequest(), QuestionFilter(type=QuestionType.SINGLE_CHOICE)
+        )
+        self.assertEqual([], page.items)
+
+    def test_candidate_ids_skip_stored_questions(self):
+        service: QuestionService = QuestionService(self.repository)
+        self.assertEqual(
+            ["q-1", "q-3"],
+            [service.get_new_candidate_id().code for _ in range(2)],
+        )
+
+    def test_candidate_ids_are_reserved_by_blocks(self):
+        service: QuestionService = QuestionService(self.repository, id_block_size=4)
+        self.assertEqual(QuestionId(code="q-1"), service.get_new_candidate_id())
+        self.assertEqual(4, self.repository.sequence)
+        self.assertEqual(
+            ["q-3", "q-4", "q-5"],
+            [service.get_new_candidate_id().code for _ in range(3)],
+        )
+        self.assertEqual(8, self.repository.sequence)
+        # Another process reserves its own block
+        other: QuestionService = QuestionService(self.repository, id_block_size=4)
+        self.assertEqual(QuestionId(code="q-9"), other.get_new_candidate_id())
+        self.assertRaises(ValueError, lambda: QuestionService(self.repository, None, 0))
+
+    def test_concurrent_calls_get_distinct_ids(self):
+        service: QuestionService = QuestionService(self.repository, id_block_size=3)
+        ids: List[QuestionId] = []
+
+        def draw():
+            for _ in range(25):
+                ids.append(service.get_new_candidate_id())
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=draw) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        codes: Set[str] = {question_id.code for question_id in ids}
+        self.assertEqual(100, len(codes))
+        self.assertNotIn("q-2", codes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+from datetime import datetime
+from typing import FrozenSet, List, Optional
+
+from application.graph.question_graph_index import QuestionGraphIndex
+from application.project.questionnaire_service import QuestionnaireService
+from domain.graph.core import Answer, AnswerId, Question, QuestionId
+from domain.graph.core.enum import QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+from domain.project.core import ProjectId, SelectableQuestion
+from test.utils.repositories import (
+    RecordingQuestionnaireRepository,
+    RecordingQuestionRepository,
+)
+from utils.errors import BadRequestError, NotFoundError
+
+
+def _answers(code: str) -> FrozenSet[Answer]:
+    return frozenset(
+        AnswerFactory.create_answer(AnswerId(code=f"{code}-a{i}"), f"A{i}", f"{i}")
+        for i in (1, 2)
+    )
+
+
+def _question(
+    code: str,
+    question_type: QuestionType,
+    previous: Optional[str] = None,
+    enabled_by: FrozenSet[str] = frozenset(),
+    day: int = 1,
+) -> Question:
+    return QuestionFactory.create_question(
+        QuestionId(code=code),
+        f"Question {code}",
+        question_type,
+        _answers(code),
+        QuestionId(code=previous) if previous else None,
+        frozenset(AnswerId(code=answer) for answer in enabled_by),
+        created_at=datetime(2024, 6, day),
+    )
+
+
+class TestQuestionnaireService(unittest.TestCase):
+
+    def setUp(self):
+        self.project_id = ProjectId(code="p1")
+        questions: List[Question] = [
+            _question("q1", QuestionType.SINGLE_CHOICE),
+            _question("q2", QuestionType.MULTIPLE_CHOICE, "q1", {"q1-a1"}, 2),
+            _question("q3", QuestionType.SINGLE_CHOICE, "q1", {"q1-a2"}, 3),
+        ]
+        self.repository = RecordingQuestionnaireRepository(questions, [self.project_id])
+        self.service = QuestionnaireService(
+            self.repository,
+            QuestionGraphIndex(RecordingQuestionRepository(questions)),
+        )
+
+    def _answer(self, question: str, answer: str) -> SelectableQuestion:
+        return self.service.insert_answer(
+            self.project_id, QuestionId(code=question), AnswerId(code=answer)
+        )
+
+    def _selected(self, question: SelectableQuestion) -> List[str]:
+        return sorted(answer.id.code for answer in question.selected_answers)
+
+    def test_first_question(self):
+        question = self.service.get_first_question(self.project_id)
+        self.assertEqual("q1", question.id.code)
+        self.assertEqual(frozenset(), question.selected_answers)
+
+    def test_single_choice_replaces_selection(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self.assertEqual(["q1-a2"], self._selected(self._answer("q1", "q1-a2")))
+
+    def test_multiple_choice_adds_to_selection(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self.service.get_next_question(self.project_id, QuestionId(code="q1"))
+        self._answer("q2", "q2-a1")
+        self.assertEqual(
+            ["q2-a1", "q2-a2"], self._selected(self._answer("q2", "q2-a2"))
+        )
+
+    def test_unchanged_selection_is_not_written(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        writes: int = self.repository.writes
+        self._answer("q1", "q1-a1")
+        self.assertEqual(writes, self.repository.writes)
+
+    def test_next_question_follows_selected_answer(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a2")
+        question = self.service.get_next_question(
+            self.project_id, QuestionId(code="q1")
+        )
+        self.assertEqual("q3", question.id.code)
+        self.assertIsNone(
+            self.service.get_next_question(self.project_id, QuestionId(code="q3"))
+        )
+
+    def test_go_back_discards_later_questions(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self.service.get_next_question(self.project_id, QuestionId(code="q1"))
+        question = self.service.go_back_to_question(
+            self.project_id, QuestionId(code="q1")
+        )
+        self.assertEqual(["q1-a1"], self._selected(question))
+        self.assertEqual(
+            ["q1"],
+            [q.id.code for q in self.service.get_questionnaire(self.project_id)],
+        )
+
+    def test_reset(self):
+        self.service.get_first_question(self.project_id)
+        self.service.reset_questionnaire(self.project_id)
+        self.assertEqual([], self.service.get_questionnaire(self.project_id))
+
+    def test_unavailable_answer(self):
+        self.service.get_first_question(self.project_id)
+        self.assertRaises(BadRequestError, lambda: self._answer("q1", "q2-a1"))
+
+    def test_question_not_asked(self):
+        self.service.get_first_question(self.project_id)
+        self.assertRaises(NotFoundError, lambda: self._answer("q2", "q2-a1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
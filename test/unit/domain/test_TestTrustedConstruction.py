@@ -0,0 +1,102 @@
+import unittest
+from datetime import datetime
+
+from pydantic import ValidationError
+
+from domain.common.trusted import validate_trusted_data
+from domain.graph.core import Answer, AnswerId, Question, QuestionId
+from domain.graph.core.enum import QuestionType
+from domain.graph.factories import AnswerFactory, QuestionFactory
+from domain.project.core import SelectableQuestion
+from domain.project.factories import SelectableQuestionFactory
+
+
+class TestTrustedConstruction(unittest.TestCase):
+
+    def setUp(self):
+        self.timestamp = datetime.now()
+        self.answers = frozenset(
+            {
+                AnswerFactory.create_answer(AnswerId(code="yes"), "Yes", "yes"),
+                AnswerFactory.create_answer(AnswerId(code="no"), "No", "no"),
+            }
+        )
+
+    def tearDown(self):
+        validate_trusted_data(False)
+
+    def _trusted_question(self, text) -> Question:
+        return QuestionFactory.create_trusted_question(
+            QuestionId(code="question"),
+            text,
+            QuestionType.SINGLE_CHOICE,
+            self.answers,
+            None,
+            frozenset(),
+            None,
+            self.timestamp,
+        )
+
+    def test_trusted_question_equals_validated_one(self):
+        expected: Question = QuestionFactory.create_question(
+            QuestionId(code="question"),
+            "Question?",
+            QuestionType.SINGLE_CHOICE,
+            self.answers,
+            created_at=self.timestamp,
+        )
+        self.assertEqual(expected, self._trusted_question("Question?"))
+
+    def test_trusted_data_is_not_validated(self):
+        question: Question = self._trusted_question(42)
+        self.assertEqual(42, question.text)
+
+    def test_trusted_question_is_a_complete_model(self):
+        question: Question = self._trusted_question("Question?")
+        self.assertEqual(set(Question.model_fields), question.model_fields_set)
+        self.assertEqual(question, question.model_copy())
+
+    def test_trusted_data_is_validated_in_debug_mode(self):
+        validate_trusted_data(True)
+        with self.assertRaises(ValidationError):
+            self._trusted_question(42)
+
+    def test_selection_keeps_other_fields(self):
+        question: SelectableQuestion = (
+            SelectableQuestionFactory.create_trusted_selectable_question(
+                QuestionId(code="question"),
+                "Question?",
+                QuestionType.MULTIPLE_CHOICE,
+                self.answers,
+                None,
+                frozenset(),
+                None,
+                self.timestamp,
+            )
+        )
+        answer: Answer = AnswerFactory.create_answer(AnswerId(code="yes"), "Yes", "yes")
+        selected: SelectableQuestion = question.select_answer(answer)
+        self.assertEqual(frozenset({answer}), selected.selected_answers)
+        self.assertEqual(frozenset(), question.selected_answers)
+        self.assertEqual(question.available_answers, selected.available_answers)
+        self.assertEqual(question.selection_strategy, selected.selection_strategy)
+
+    def test_selection_in_debug_mode(self):
+        validate_trusted_data(True)
+        question: SelectableQuestion = (
+            SelectableQuestionFactory.create_selectable_question(
+                QuestionId(code="question"),
+                "Question?",
+                QuestionType.SINGLE_CHOICE,
+                self.answers,
+                created_at=self.timestamp,
+            )
+        )
+        answer, _ = question.available_answers
+        self.assertEqual(
+            frozenset({answer}), question.select_answer(answer).selected_answers
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
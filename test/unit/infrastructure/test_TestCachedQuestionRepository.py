@@ -0,0 +1,149 @@
+import unittest
+from datetime import datetime
+
+from domain.graph.core import Question, QuestionId
+from domain.graph.factories import QuestionFactory
+from infrastructure.storage.graph.repositories import CachedQuestionRepository
+from test.utils.repositories import RecordingQuestionRepository
+
+
+def _question(code: str, day: int) -> Question:
+    return QuestionFactory.create_boolean_question(
+        QuestionId(code=code), f"Question {code}", created_at=datetime(2024, 6, day)
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedQuestionRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.delegate = RecordingQuestionRepository(
+            [_question("q1", 1), _question("q2", 2)]
+        )
+        self.clock = FakeClock()
+        self.repository = CachedQuestionRepository(
+            self.delegate, ttl=10, max_size=100, clock=self.clock
+        )
+
+    def test_reads_are_served_from_snapshot(self):
+        self.assertEqual(2, len(self.repository.get_all_questions()))
+        self.assertEqual(
+            "q1", self.repository.get_question_by_id(QuestionId(code="q1")).id.code
+        )
+        self.assertIsNone(self.repository.get_question_by_id(QuestionId(code="q3")))
+        self.assertEqual("q2", self.repository.get_last_inserted_question().id.code)
+        self.assertEqual(1, self.delegate.reads)
+        stats = self.repository.get_stats()
+        self.assertEqual((3, 1), (stats.hits, stats.misses))
+
+    def test_revisions_are_served_along_with_questions(self):
+        q1: QuestionId = QuestionId(code="q1")
+        self.repository.get_all_questions()
+        self.assertEqual(
+            (_question("q1", 1), 1), self.repository.get_question_with_revision(q1)
+        )
+        self.assertIsNone(
+            self.repository.get_question_with_revision(QuestionId(code="q3"))
+        )
+        self.assertEqual(1, self.delegate.reads)
+        self.repository.update_question(q1, _question("q1", 3))
+        self.assertEqual(
+            (_question("q1", 3), 2), self.repository.get_question_with_revision(q1)
+        )
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_oversized_catalogue_caches_revisions_per_question(self):
+        repository = CachedQuestionRepository(
+            self.delegate, ttl=10, max_size=1, clock=self.clock
+        )
+        q1: QuestionId = QuestionId(code="q1")
+        repository.get_question_by_id(q1)
+        self.assertEqual(
+            (_question("q1", 1), 1), repository.get_question_with_revision(q1)
+        )
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_snapshot_expires(self):
+        self.repository.get_all_questions()
+        self.clock.now = 10
+        self.repository.get_all_questions()
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_writes_invalidate_snapshot(self):
+        self.repository.get_all_questions()
+        self.repository.insert_question(_question("q3", 3))
+        self.assertEqual("q3", self.repository.get_last_inserted_question().id.code)
+        self.repository.delete_question(QuestionId(code="q1"))
+        self.assertIsNone(self.repository.get_question_by_id(QuestionId(code="q1")))
+        self.assertEqual(3, self.delegate.reads)
+
+    def test_failed_write_invalidates_snapshot(self):
+        self.repository.get_all_questions()
+        with self.assertRaises(Exception):
+            self.repository.insert_question(_question("q1", 1))
+        self.repository.get_all_questions()
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_snapshot_is_reloaded_after_writes_of_other_processes(self):
+        self.repository.get_all_questions()
+        self.delegate.version += 1
+        self.repository.get_all_questions()
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_version_is_checked_once_per_interval(self):
+        repository = CachedQuestionRepository(
+            self.delegate, ttl=10, max_size=100, check_interval=2, clock=self.clock
+        )
+        repository.get_all_questions()
+        self.delegate.version += 1
+        self.clock.now = 1
+        repository.get_all_questions()
+        self.assertEqual(1, self.delegate.reads)
+        self.clock.now = 2
+        repository.get_all_questions()
+        self.assertEqual(2, self.delegate.reads)
+
+    def test_oversized_catalogue_is_cached_per_question(self):
+        repository = CachedQuestionRepository(
+            self.delegate, ttl=10, max_size=1, clock=self.clock
+        )
+        q1, q2 = QuestionId(code="q1"), QuestionId(code="q2")
+        self.assertEqual("q1", repository.get_question_by_id(q1).id.code)
+        self.assertEqual("q1", repository.get_question_by_id(q1).id.code)
+        self.assertEqual(2, self.delegate.reads)
+        repository.get_question_by_id(q2)
+        repository.get_question_by_id(q1)
+        self.assertEqual(4, self.delegate.reads)
+        self.assertEqual(2, repository.get_stats().evictions)
+        self.delegate.version += 1
+        repository.get_question_by_id(q1)
+        self.assertEqual(5, self.delegate.reads)
+        # The catalogue is not loaded again to learn that it is still oversized
+        self.clock.now = 10
+        repository.get_all_questions()
+        repository.get_question_by_id(q1)
+        self.assertEqual(7, self.delegate.reads)
+
+    def test_version_is_read_outside_the_lock(self):
+        held: list = []
+        get_version = self.delegate.get_version
+
+        def checked_get_version() -> int:
+            held.append(self.repository._lock.locked())
+            return get_version()
+
+        self.delegate.get_version = checked_get_version
+        self.repository.get_all_questions()
+        self.repository.get_question_by_id(QuestionId(code="q1"))
+        self.assertEqual([False, False], held)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+from domain.graph.core import AnswerId, QuestionId, QuestionTransitions
+from domain.project.core import ProjectId
+from domain.project.factories import ProjectFactory
+from infrastructure.storage.graph.repositories import InMemoryQuestionRepository
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.project.repositories.in_memory_project_repository import (
+    InMemoryProjectRepository,
+)
+from infrastructure.storage.project.repositories.in_memory_questionnaire_repository import (
+    InMemoryQuestionnaireRepository,
+)
+from test.contract.project_repository_contract import ProjectRepositoryContract
+from test.contract.question_repository_contract import (
+    QuestionRepositoryContract,
+    make_question,
+)
+from utils.errors import NotFoundError
+
+
+class TestInMemoryQuestionRepository(QuestionRepositoryContract, unittest.TestCase):
+
+    def create_repository(self) -> InMemoryQuestionRepository:
+        return InMemoryQuestionRepository(InMemoryStore())
+
+
+class TestInMemoryProjectRepository(ProjectRepositoryContract, unittest.TestCase):
+
+    def create_repository(self) -> InMemoryProjectRepository:
+        return InMemoryProjectRepository(InMemoryStore())
+
+
+class TestInMemoryQuestionnaireRepository(unittest.TestCase):
+
+    def setUp(self):
+        store: InMemoryStore = InMemoryStore()
+        self.questions = InMemoryQuestionRepository(store)
+        self.projects = InMemoryProjectRepository(store)
+        self.repository = InMemoryQuestionnaireRepository(store)
+        self.questions.insert_questions(
+            [
+                make_question("q1", 1),
+                make_question("q2", 2, "q1", frozenset({"q1-yes"})),
+            ]
+        )
+        self.project_id = ProjectId(code="p1")
+        self.projects.insert_project(
+            ProjectFactory.create_project(self.project_id, "Project")
+        )
+
+    def test_questionnaire_goes_with_project(self):
+        self.repository.start_questionnaire(self.project_id, QuestionId(code="q1"))
+        self.repository.append_next_question(
+            self.project_id,
+            QuestionId(code="q1"),
+            QuestionTransitions(
+                followers=(QuestionId(code="q2"),), unconditional=0, by_answer={}
+            ),
+        )
+        self.assertEqual(
+            ["q1", "q2"],
+            [q.id.code for q in self.repository.get_questionnaire(self.project_id)],
+        )
+        # Deleted questions are skipped
+        self.questions.delete_question(QuestionId(code="q2"))
+        self.assertEqual(
+            ["q1"],
+            [q.id.code for q in self.repository.get_questionnaire(self.project_id)],
+        )
+        self.projects.delete_project(self.project_id)
+        self.assertRaises(
+            NotFoundError, lambda: self.repository.get_questionnaire(self.project_id)
+        )
+        self.projects.insert_project(
+            ProjectFactory.create_project(self.project_id, "Project")
+        )
+        self.assertEqual([], self.repository.get_questionnaire(self.project_id))
+
+    def test_answers_are_kept(self):
+        question = self.repository.start_questionnaire(
+            self.project_id, QuestionId(code="q1")
+        )
+        selected = question.model_copy(
+            update={
+                "selected_answers": frozenset(
+                    answer
+                    for answer in question.available_answers
+                    if answer.id == AnswerId(code="q1-yes")
+                )
+            }
+        )
+        self.assertEqual(
+            selected,
+            self.repository.update_selectable_question(
+                self.project_id, QuestionId(code="q1"), lambda _: selected
+            ),
+        )
+        self.assertEqual(
+            selected,
+            self.repository.get_selectable_question(
+                self.project_id, QuestionId(code="q1")
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
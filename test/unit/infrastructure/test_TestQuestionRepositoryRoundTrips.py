@@ -0,0 +1,178 @@
+import unittest
+from datetime import datetime
+from typing import List
+
+from domain.graph.core import AnswerId, Question, QuestionId
+from domain.graph.core.enum import Action
+from domain.graph.factories import QuestionFactory
+from infrastructure.storage.graph.repositories import Neo4jQuestionRepository
+from utils.errors import NotFoundError, PreconditionFailedError
+from utils.neo4j_driver import Neo4jQuery
+
+
+class CountingDriver:
+    """Stands in for Neo4jDriver, replaying the same rows for every query and
+    counting how many round trips the repository makes."""
+
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self.round_trips = 0
+        self.statements = 0
+        self.executed: List[str] = []
+        self.writes = 0
+
+    def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        self.round_trips += 1
+        self.statements += 1
+        self.executed.append(query.query)
+        return self.rows
+
+    def execute_write(self, query: Neo4jQuery) -> List[dict]:
+        self.writes += 1
+        return self.execute_read(query)
+
+    def execute_write_all(self, queries: List[Neo4jQuery]) -> None:
+        self.writes += 1
+        self.round_trips += 1
+        self.statements += len(queries)
+        self.executed.extend(query.query for query in queries)
+
+
+def _question_row(index: int, timestamp: datetime) -> dict:
+    return {
+        "q": {
+            "id": f"q-{index}",
+            "text": f"Question {index}",
+            "type": "boolean",
+            "action_needed": 0,
+            "created_at": timestamp.isoformat(),
+        },
+        "answers": [
+            {"id": f"q-{index}-true", "text": "Yes", "value": "True"},
+            {"id": f"q-{index}-false", "text": "No", "value": "False"},
+        ],
+        "previous_question_id": f"q-{index - 1}" if index > 1 else None,
+        "enabled_by": [f"q-{index - 1}-true"] if index > 1 else [],
+    }
+
+
+class TestQuestionRepositoryRoundTrips(unittest.TestCase):
+
+    def setUp(self):
+        self.timestamp = datetime.now()
+        self.catalogue_size = 2000
+        self.driver = CountingDriver(
+            [
+                _question_row(i, self.timestamp)
+                for i in range(1, self.catalogue_size + 1)
+            ]
+        )
+        self.repository = Neo4jQuestionRepository(self.driver)
+
+    def test_get_all_questions_round_trips(self):
+        questions: List[Question] = self.repository.get_all_questions()
+        self.assertEqual(self.catalogue_size, len(questions))
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_get_question_by_id_round_trips(self):
+        self.repository.get_question_by_id(QuestionId(code="q-2"))
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_get_last_inserted_question_round_trips(self):
+        self.repository.get_last_inserted_question()
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_hydration(self):
+        self.driver.rows = [_question_row(2, self.timestamp)]
+        expected: Question = QuestionFactory.create_boolean_question(
+            QuestionId(code="q-2"),
+            "Question 2",
+            QuestionId(code="q-1"),
+            frozenset({AnswerId(code="q-1-true")}),
+            Action.METRICS_CHECK,
+            self.timestamp,
+        )
+        actual: Question = self.repository.get_question_by_id(QuestionId(code="q-2"))
+        self.assertEqual(expected, actual)
+
+    def test_insert_question_round_trips(self):
+        question: Question = QuestionFactory.create_boolean_question(
+            QuestionId(code="new-question"), "New question"
+        )
+        self.repository.insert_question(question)
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_insert_questions_statements(self):
+        questions: List[Question] = [
+            QuestionFactory.create_boolean_question(
+                QuestionId(code=f"new-{i}"),
+                f"New question {i}",
+                QuestionId(code=f"new-{i - 1}"),
+                frozenset({AnswerId(code=f"new-{i - 1}-true")}),
+            )
+            for i in range(1, 501)
+        ]
+        ids: List[QuestionId] = self.repository.insert_questions(questions)
+        self.assertEqual([question.id for question in questions], ids)
+        self.assertEqual(1, self.driver.round_trips)
+        # Questions, answers, previous links, enabling links and version bump
+        self.assertEqual(5, self.driver.statements)
+
+    def test_update_question_round_trips(self):
+        question: Question = QuestionFactory.create_boolean_question(
+            QuestionId(code="q-1"), "Updated question"
+        )
+        self.driver.rows = [{"current": True}]
+        self.repository.update_question(question.id, question)
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_update_non_existent_question(self):
+        question: Question = QuestionFactory.create_boolean_question(
+            QuestionId(code="does-not-exist"), "Updated question"
+        )
+        self.driver.rows = []
+        self.assertRaises(
+            NotFoundError, self.repository.update_question, question.id, question
+        )
+
+    def test_delete_question_round_trips(self):
+        self.driver.rows = [{"current": True}]
+        self.repository.delete_question(QuestionId(code="q-1"))
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_delete_non_existent_question(self):
+        self.driver.rows = []
+        self.assertRaises(
+            NotFoundError,
+            self.repository.delete_question,
+            QuestionId(code="does-not-exist"),
+        )
+
+    def test_revision_is_checked_by_the_write(self):
+        self.driver.rows = [{"current": False}]
+        self.assertRaises(
+            PreconditionFailedError,
+            self.repository.delete_question,
+            QuestionId(code="q-1"),
+            [1],
+        )
+        self.assertEqual(1, self.driver.round_trips)
+
+    def test_writes_bump_version(self):
+        question: Question = QuestionFactory.create_boolean_question(
+            QuestionId(code="q-1"), "Question"
+        )
+        self.repository.insert_question(question)
+        self.driver.rows = [{"current": True}]
+        self.repository.update_question(question.id, question)
+        self.driver.rows = [{"current": True}]
+        self.repository.delete_question(question.id)
+        bumps = [s for s in self.driver.executed if "GraphVersion" in s]
+        self.assertEqual(3, len(bumps))
+        self.assertEqual(3, self.driver.writes)
+
+    def test_reads_are_tagged_as_reads(self):
+        self.repository.get_all_questions()
+        self.repository.get_question_by_id(QuestionId(code="q-1"))
+        self.repository.get_last_inserted_question()
+        self.assertEqual(0, self.driver.writes)
@@ -0,0 +1,279 @@
+import unittest
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from application.graph.question_graph_index import QuestionGraphIndex
+from application.project.questionnaire_service import QuestionnaireService
+from domain.graph.core import AnswerId, QuestionId
+from domain.project.core import ProjectId, SelectableQuestion
+from infrastructure.storage.graph.question_hydrator import QuestionHydrator
+from infrastructure.storage.project.repositories.neo4j_questionnaire_repository import (
+    Neo4jQuestionnaireRepository,
+)
+from test.utils.repositories import RecordingQuestionRepository
+from utils.errors import ConflictError, NotFoundError
+from utils.neo4j_driver import Neo4jQuery
+
+
+def _question_row(
+    code: str, day: int, previous: Optional[str] = None, enabled_by: List[str] = ()
+) -> dict:
+    return {
+        "q": {
+            "id": code,
+            "text": f"Question {code}",
+            "type": "single",
+            "action_needed": None,
+            "created_at": datetime(2024, 6, day).isoformat(),
+        },
+        "answers": [
+            {"id": f"{code}-a1", "text": "Yes", "value": "yes"},
+            {"id": f"{code}-a2", "text": "No", "value": "no"},
+        ],
+        "previous_question_id": previous,
+        "enabled_by": list(enabled_by),
+    }
+
+
+class EventLogDriver:
+    """Stands in for Neo4jDriver, keeping the event log of the questionnaire of a
+    single project the way the questionnaire statements do, and recording the
+    statements run"""
+
+    def __init__(self, project_code: str, questions: List[dict]):
+        self.project_code = project_code
+        self.questions: Dict[str, dict] = {row["q"]["id"]: row for row in questions}
+        self.version: int = 0
+        self.head: Optional[int] = None
+        self.events: Dict[int, dict] = {}
+        self.snapshots: Dict[int, dict] = {}
+        # Writes made by someone else right after the next read
+        self.concurrent_writes: int = 0
+        self.executed: List[Neo4jQuery] = []
+        self.writes: int = 0
+
+    def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        self.executed.append(query)
+        params: dict = query.params
+        if params["project_id"] != self.project_code:
+            return []
+        if "snapshot_interval" in params:
+            row: dict = self._state(params["snapshot_interval"])
+            self.version += self.concurrent_writes
+            self.concurrent_writes = 0
+            return [row]
+        if "event" in params:
+            return [self._append(params)]
+        return [self._move_head(params)]
+
+    def execute_write(self, query: Neo4jQuery) -> List[dict]:
+        self.writes += 1
+        return self.execute_read(query)
+
+    def _state(self, snapshot_interval: int) -> dict:
+        tail: List[dict] = []
+        event: Optional[dict] = self.events.get(self.head)
+        while event is not None:
+            tail.append(event)
+            if event["depth"] % snapshot_interval == 0 or event["depth"] == 1:
+                break
+            event = self.events.get(event["follows"])
+        snapshot: Optional[dict] = self.snapshots.get(tail[-1]["seq"]) if tail else None
+        events: List[dict] = [
+            {
+                key: e[key]
+                for key in ("seq", "position", "question_id", "selected_answers")
+            }
+            for e in reversed(tail)
+        ]
+        question_ids: List[str] = (snapshot["question_ids"] if snapshot else []) + [
+            e["question_id"] for e in events
+        ]
+        return {
+            "version": self.version,
+            "depth": tail[0]["depth"] if tail else None,
+            "snapshot": snapshot,
+            "events": events,
+            "questions": [
+                self.questions[code]
+                for code in dict.fromkeys(question_ids)
+                if code in self.questions
+            ],
+        }
+
+    def _append(self, params: dict) -> dict:
+        current: bool = params["version"] == self.version
+        question: Optional[dict] = self.questions.get(params["question_id"])
+        if current and question is not None:
+            self.version += 1
+            self.events[self.version] = {
+                **params["event"],
+                "seq": self.version,
+                "follows": self.head,
+            }
+            for snapshot in params["snapshots"]:
+                self.snapshots[self.version] = snapshot
+            self.head = self.version
+        return {**(question or {"q": None}), "current": current}
+
+    def _move_head(self, params: dict) -> dict:
+        current: bool = params["version"] is None or params["version"] == self.version
+        if current:
+            self.version += 1
+            self.head = params["seq"] if params["seq"] in self.events else None
+        return {"current": current}
+
+
+class TestQuestionnaireRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.project_id = ProjectId(code="p1")
+        rows: List[dict] = [
+            _question_row("q1", 1),
+            _question_row("q2", 2, "q1", ["q1-a1"]),
+            _question_row("q3", 3, "q1", ["q1-a2"]),
+            _question_row("q4", 4, "q2"),
+            _question_row("q5", 5, "q4"),
+        ]
+        self.driver = EventLogDriver("p1", rows)
+        self.repository = Neo4jQuestionnaireRepository(self.driver, snapshot_interval=2)
+        self.service = QuestionnaireService(
+            self.repository,
+            QuestionGraphIndex(
+                RecordingQuestionRepository([QuestionHydrator.hydrate(r) for r in rows])
+            ),
+        )
+
+    def _answer(self, question: str, answer: str) -> SelectableQuestion:
+        return self.service.insert_answer(
+            self.project_id, QuestionId(code=question), AnswerId(code=answer)
+        )
+
+    def _next(self, question: str) -> Optional[SelectableQuestion]:
+        return self.service.get_next_question(
+            self.project_id, QuestionId(code=question)
+        )
+
+    def _questionnaire(self) -> List[str]:
+        return [
+            question.id.code
+            + "".join(f" {a.id.code}" for a in question.selected_answers)
+            for question in self.service.get_questionnaire(self.project_id)
+        ]
+
+    def _walk_to_q5(self) -> None:
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self._next("q1")
+        self._answer("q2", "q2-a2")
+        self._next("q2")
+        self._next("q4")
+
+    def test_state_is_latest_snapshot_and_tail(self):
+        self._walk_to_q5()
+        self.assertEqual(["q1 q1-a1", "q2 q2-a2", "q4", "q5"], self._questionnaire())
+        self.assertEqual(6, len(self.driver.events))
+        self.assertEqual([2, 4, 6], sorted(self.driver.snapshots))
+        self.assertEqual([1, 1, 0, 0], self.driver.snapshots[6]["answer_counts"])
+        # The history before the latest snapshot is not replayed
+        for seq in range(1, 6):
+            del self.driver.events[seq]
+        self.assertEqual(["q1 q1-a1", "q2 q2-a2", "q4", "q5"], self._questionnaire())
+
+    def test_each_step_reads_once_and_writes_at_most_once(self):
+        def back_to_q1() -> SelectableQuestion:
+            return self.service.go_back_to_question(
+                self.project_id, QuestionId(code="q1")
+            )
+
+        # Each step with the statements it runs, and how many of them are writes
+        steps: list = [
+            (lambda: self.service.get_first_question(self.project_id), 2, 1),
+            (lambda: self.service.get_first_question(self.project_id), 1, 0),
+            (lambda: self._answer("q1", "q1-a1"), 2, 1),
+            (lambda: self._answer("q1", "q1-a1"), 1, 0),
+            (lambda: self._next("q1"), 2, 1),
+            (lambda: self._next("q1"), 1, 0),
+            (back_to_q1, 2, 1),
+            (back_to_q1, 1, 0),
+            (lambda: self.service.reset_questionnaire(self.project_id), 1, 1),
+        ]
+        for step, statements, writes in steps:
+            executed: int = len(self.driver.executed)
+            self.driver.writes = 0
+            step()
+            self.assertEqual(statements, len(self.driver.executed) - executed)
+            self.assertEqual(writes, self.driver.writes)
+
+    def test_go_back_moves_head_only(self):
+        self._walk_to_q5()
+        question = self.service.go_back_to_question(
+            self.project_id, QuestionId(code="q2")
+        )
+        self.assertEqual("q2", question.id.code)
+        self.assertEqual(["q1 q1-a1", "q2 q2-a2"], self._questionnaire())
+        self.assertEqual(6, len(self.driver.events))
+        self.assertEqual(4, self.driver.head)
+
+    def test_new_answer_after_going_back_branches(self):
+        self._walk_to_q5()
+        self.service.go_back_to_question(self.project_id, QuestionId(code="q1"))
+        self._answer("q1", "q1-a2")
+        self.assertEqual("q3", self._next("q1").id.code)
+        self.assertEqual(["q1 q1-a2", "q3"], self._questionnaire())
+        self.assertEqual(8, len(self.driver.events))
+
+    def test_reset_keeps_history(self):
+        self._walk_to_q5()
+        self.service.reset_questionnaire(self.project_id)
+        self.assertEqual([], self._questionnaire())
+        self.assertEqual(6, len(self.driver.events))
+        self.assertEqual("q1", self.service.get_first_question(self.project_id).id.code)
+        self.assertEqual(["q1"], self._questionnaire())
+
+    def test_asked_question_is_not_asked_again(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self._next("q1")
+        events: int = len(self.driver.events)
+        self.assertEqual("q2", self._next("q1").id.code)
+        self.assertEqual("q1", self.service.get_first_question(self.project_id).id.code)
+        self.assertEqual(events, len(self.driver.events))
+
+    def test_concurrent_change(self):
+        self.service.get_first_question(self.project_id)
+        self._answer("q1", "q1-a1")
+        self._next("q1")
+        self.driver.concurrent_writes = 1
+        self.assertRaises(
+            ConflictError,
+            lambda: self.service.go_back_to_question(
+                self.project_id, QuestionId(code="q1")
+            ),
+        )
+        self.driver.concurrent_writes = 1
+        self.assertRaises(ConflictError, lambda: self._next("q2"))
+        self.assertEqual(["q1 q1-a1", "q2"], self._questionnaire())
+
+    def test_missing_project(self):
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.repository.get_questionnaire(ProjectId(code="p2")),
+        )
+        self.assertRaises(
+            NotFoundError,
+            lambda: self.service.reset_questionnaire(ProjectId(code="p2")),
+        )
+
+    def test_question_not_asked(self):
+        self.service.get_first_question(self.project_id)
+        self.assertRaises(NotFoundError, lambda: self._next("q2"))
+        self.assertIsNone(
+            self.repository.get_selectable_question(
+                self.project_id, QuestionId(code="q2")
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
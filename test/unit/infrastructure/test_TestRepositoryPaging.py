@@ -0,0 +1,127 @@
+import unittest
+from typing import List
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import QuestionFilter, QuestionId
+from domain.graph.core.enum import Action, QuestionType
+from infrastructure.storage.graph.repositories import Neo4jQuestionRepository
+from infrastructure.storage.project.repositories.neo4j_project_repository import (
+    Neo4jProjectRepository,
+)
+from utils.errors import BadRequestError
+from utils.neo4j_driver import Neo4jQuery
+
+
+class CapturingDriver:
+    """Stands in for Neo4jDriver, capturing the last query and replaying rows"""
+
+    def __init__(self, rows: List[dict]):
+        self.rows = rows
+        self.queries: List[Neo4jQuery] = []
+
+    def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        self.queries.append(query)
+        return self.rows
+
+
+def _question_row(index: int) -> dict:
+    return {
+        "cursor_created_at": f"2024-05-31T18:20:{index:02d}",
+        "cursor_id": f"q-{index}",
+        "id": f"q-{index}",
+        "available_answers": [
+            {"id": f"q-{index}-b", "text": "B", "value": "b"},
+            {"id": f"q-{index}-a", "text": "A", "value": "a"},
+        ],
+    }
+
+
+class TestQuestionRepositoryPaging(unittest.TestCase):
+
+    def setUp(self):
+        self.driver = CapturingDriver([_question_row(i) for i in range(1, 4)])
+        self.repository = Neo4jQuestionRepository(self.driver)
+
+    def test_filters_are_pushed_down(self):
+        self.repository.get_questions_page(
+            PageRequest(fields=frozenset({"id"})),
+            QuestionFilter(
+                type=QuestionType.BOOLEAN,
+                action_needed=Action.METRICS_CHECK,
+                previous_question_id=QuestionId(code="q-0"),
+            ),
+        )
+        query: Neo4jQuery = self.driver.queries[0]
+        self.assertIn(
+            "-[:PREVIOUS]->(:Question {id: $previous_question_id})", query.query
+        )
+        self.assertIn("q.type = $type", query.query)
+        self.assertIn("q.action_needed = $action_needed", query.query)
+        self.assertEqual(
+            {"previous_question_id": "q-0", "type": "boolean", "action_needed": 0},
+            query.params,
+        )
+
+    def test_only_requested_fields_are_read(self):
+        page: Page = self.repository.get_questions_page(
+            PageRequest(fields=frozenset({"id", "available_answers"})),
+            QuestionFilter(),
+        )
+        query: Neo4jQuery = self.driver.queries[0]
+        self.assertNotIn("ENABLED_BY", query.query)
+        self.assertNotIn("PREVIOUS", query.query)
+        self.assertEqual(
+            {
+                "id": {"code": "q-1"},
+                "available_answers": [
+                    {"id": {"code": "q-1-a"}, "text": "A", "value": "a"},
+                    {"id": {"code": "q-1-b"}, "text": "B", "value": "b"},
+                ],
+            },
+            page.items[0],
+        )
+
+    def test_next_cursor(self):
+        page: Page = self.repository.get_questions_page(
+            PageRequest(limit=2, fields=frozenset({"id"})), QuestionFilter()
+        )
+        self.assertEqual(3, self.driver.queries[0].params["limit"])
+        self.assertEqual([{"id": {"code": "q-1"}}, {"id": {"code": "q-2"}}], page.items)
+        self.assertIsNotNone(page.next_cursor)
+
+        self.driver.rows = [_question_row(3)]
+        page = self.repository.get_questions_page(
+            PageRequest(limit=2, cursor=page.next_cursor, fields=frozenset({"id"})),
+            QuestionFilter(),
+        )
+        params: dict = self.driver.queries[1].params
+        self.assertEqual("2024-05-31T18:20:02", params["after_created_at"])
+        self.assertEqual("q-2", params["after_id"])
+        self.assertIsNone(page.next_cursor)
+
+    def test_invalid_cursor(self):
+        self.assertRaises(
+            BadRequestError,
+            self.repository.get_questions_page,
+            PageRequest(cursor="not-a-cursor"),
+            QuestionFilter(),
+        )
+
+
+class TestProjectRepositoryPaging(unittest.TestCase):
+
+    def test_next_cursor(self):
+        driver = CapturingDriver(
+            [
+                {"cursor_id": f"p-{i}", "id": f"p-{i}", "name": f"Project {i}"}
+                for i in range(1, 4)
+            ]
+        )
+        repository = Neo4jProjectRepository(driver)
+        page: Page = repository.get_projects_page(
+            PageRequest(limit=2, fields=frozenset({"name"}))
+        )
+        self.assertEqual([{"name": "Project 1"}, {"name": "Project 2"}], page.items)
+        self.assertNotIn("p.id AS id", driver.queries[0].query)
+        repository.get_projects_page(PageRequest(limit=2, cursor=page.next_cursor))
+        self.assertEqual("p-2", driver.queries[1].params["after_id"])
@@ -0,0 +1,64 @@
+import unittest
+from typing import List, Optional
+
+from infrastructure.storage.migrations import SchemaMigration, SchemaMigrator
+from infrastructure.storage.migrations.migrations import MIGRATIONS
+from utils.neo4j_driver import Neo4jQuery
+
+
+class InMemorySchemaDriver:
+    """Stands in for Neo4jDriver, recording the executed statements and keeping
+    the schema version marker."""
+
+    def __init__(self, version: Optional[int] = None):
+        self.version = version
+        self.statements: List[str] = []
+
+    def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        return self.execute_write(query)
+
+    def execute_write(self, query: Neo4jQuery) -> List[dict]:
+        self.statements.append(query.query)
+        if query.query.startswith("MATCH (v:SchemaVersion"):
+            return [] if self.version is None else [{"version": self.version}]
+        if query.query.startswith("MERGE (v:SchemaVersion"):
+            self.version = query.params["version"]
+        return []
+
+
+class TestSchemaMigrator(unittest.TestCase):
+
+    def setUp(self):
+        self.migrations: List[SchemaMigration] = [
+            SchemaMigration(2, "second", ["CREATE INDEX second"]),
+            SchemaMigration(1, "first", ["CREATE CONSTRAINT first"]),
+        ]
+
+    def test_migrate_empty_database(self):
+        driver = InMemorySchemaDriver()
+        version: int = SchemaMigrator(driver, self.migrations).migrate()
+        self.assertEqual(2, version)
+        self.assertEqual(2, driver.version)
+        schema_statements = [s for s in driver.statements if "SchemaVersion" not in s]
+        self.assertEqual(
+            ["CREATE CONSTRAINT first", "CREATE INDEX second"], schema_statements
+        )
+
+    def test_migrate_partially_migrated_database(self):
+        driver = InMemorySchemaDriver(version=1)
+        SchemaMigrator(driver, self.migrations).migrate()
+        self.assertNotIn("CREATE CONSTRAINT first", driver.statements)
+        self.assertIn("CREATE INDEX second", driver.statements)
+
+    def test_migrate_up_to_date_database(self):
+        driver = InMemorySchemaDriver(version=2)
+        version: int = SchemaMigrator(driver, self.migrations).migrate()
+        self.assertEqual(2, version)
+        self.assertEqual(1, len(driver.statements))
+
+    def test_migration_versions_are_distinct_and_ordered(self):
+        versions: List[int] = [migration.version for migration in MIGRATIONS]
+        self.assertEqual(sorted(set(versions)), versions)
+        # Versions handed out keep their number, the withdrawn one is not reused
+        self.assertNotIn(3, versions)
+        self.assertIn("Sequence", MIGRATIONS[versions.index(5)].description)
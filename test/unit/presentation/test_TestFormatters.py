@@ -0,0 +1,53 @@
+import io
+import unittest
+from datetime import datetime
+from typing import List
+
+from domain.graph.core import AnswerId, QuestionId
+from domain.graph.factories import QuestionFactory
+from presentation.formatters import (
+    iter_json_lines_chunks,
+    iter_msgpack_chunks,
+    iter_yaml_chunks,
+    msgpack,
+)
+from presentation.parsers import iter_json_lines, iter_msgpack_items, iter_yaml_items
+from presentation.presentation import serialize
+
+
+class TestFormatters(unittest.TestCase):
+
+    def setUp(self):
+        self.items: List[dict] = [
+            serialize(
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code="q1"), "First question", created_at=datetime.now()
+                )
+            ),
+            serialize(
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code="q2"),
+                    "Second question",
+                    QuestionId(code="q1"),
+                    frozenset({AnswerId(code="q1-true")}),
+                    created_at=datetime.now(),
+                )
+            ),
+        ]
+
+    def test_yaml_round_trip(self):
+        document: str = "".join(iter_yaml_chunks(self.items))
+        self.assertEqual(self.items, list(iter_yaml_items(io.StringIO(document))))
+
+    def test_empty_yaml(self):
+        document: str = "".join(iter_yaml_chunks([]))
+        self.assertEqual([], list(iter_yaml_items(io.StringIO(document))))
+
+    def test_json_lines_round_trip(self):
+        document: str = "".join(iter_json_lines_chunks(self.items))
+        self.assertEqual(self.items, list(iter_json_lines(io.StringIO(document))))
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_msgpack_round_trip(self):
+        document: bytes = b"".join(iter_msgpack_chunks(self.items))
+        self.assertEqual(self.items, list(iter_msgpack_items(io.BytesIO(document))))
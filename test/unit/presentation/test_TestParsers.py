@@ -0,0 +1,82 @@
+import io
+import unittest
+
+from presentation.parsers import (
+    iter_json_items,
+    iter_json_lines,
+    iter_msgpack_items,
+    iter_yaml_items,
+    msgpack,
+)
+from test.utils.utils import get_file_path
+from utils.errors import BadRequestError
+
+
+class TestYamlParser(unittest.TestCase):
+
+    def test_parse_sequence(self):
+        with get_file_path("test/resources/questions-load-example.yml").open(
+            "rb"
+        ) as file:
+            items = list(iter_yaml_items(file))
+        self.assertEqual(["q1", "q2"], [item["id"]["code"] for item in items])
+
+    def test_parse_multiple_documents(self):
+        stream = io.StringIO(
+            "id: {code: q1}\n---\n- id: {code: q2}\n- id: {code: q3}\n"
+        )
+        items = list(iter_yaml_items(stream))
+        self.assertEqual(["q1", "q2", "q3"], [item["id"]["code"] for item in items])
+
+    def test_parse_lazily(self):
+        stream = io.StringIO("- id: {code: q1}\n- id: [unterminated\n")
+        items = iter_yaml_items(stream)
+        self.assertEqual("q1", next(items)["id"]["code"])
+        self.assertRaises(BadRequestError, lambda: next(items))
+
+    def test_parse_empty_stream(self):
+        self.assertEqual([], list(iter_yaml_items(io.StringIO(""))))
+
+
+class TestJsonLinesParser(unittest.TestCase):
+
+    def test_parse_lines(self):
+        stream = io.BytesIO(b'{"id": {"code": "q1"}}\n\n{"id": {"code": "q2"}}\n')
+        items = list(iter_json_lines(stream))
+        self.assertEqual(["q1", "q2"], [item["id"]["code"] for item in items])
+
+    def test_parse_invalid_line(self):
+        stream = io.BytesIO(b'{"id": {"code": "q1"}}\n{"id": \n')
+        self.assertRaises(BadRequestError, lambda: list(iter_json_lines(stream)))
+
+
+class TestJsonParser(unittest.TestCase):
+
+    def test_parse_array(self):
+        stream = io.BytesIO(b'[{"id": {"code": "q1"}}, {"id": {"code": "q2"}}]')
+        items = list(iter_json_items(stream))
+        self.assertEqual(["q1", "q2"], [item["id"]["code"] for item in items])
+
+    def test_parse_single_item(self):
+        stream = io.BytesIO(b'{"id": {"code": "q1"}}')
+        self.assertEqual([{"id": {"code": "q1"}}], list(iter_json_items(stream)))
+
+    def test_parse_invalid_document(self):
+        stream = io.BytesIO(b'[{"id": ')
+        self.assertRaises(BadRequestError, lambda: list(iter_json_items(stream)))
+
+
+@unittest.skipIf(msgpack is None, "msgpack is not installed")
+class TestMsgpackParser(unittest.TestCase):
+
+    def test_parse_objects_and_arrays(self):
+        stream = io.BytesIO(
+            msgpack.packb({"id": {"code": "q1"}})
+            + msgpack.packb([{"id": {"code": "q2"}}, {"id": {"code": "q3"}}])
+        )
+        items = list(iter_msgpack_items(stream))
+        self.assertEqual(["q1", "q2", "q3"], [item["id"]["code"] for item in items])
+
+    def test_parse_invalid_data(self):
+        stream = io.BytesIO(b"\xc1")
+        self.assertRaises(BadRequestError, lambda: list(iter_msgpack_items(stream)))
@@ -2,11 +2,13 @@ import unittest
 from datetime import datetime
 from typing import FrozenSet
 
+from pydantic import BaseModel
+
 from domain.graph.core import AnswerId, Answer, QuestionId, Question
 from domain.graph.core.enum import Action, QuestionType
 from domain.graph.factories import AnswerFactory
 from domain.graph.factories import QuestionFactory
-from presentation.presentation import serialize
+from presentation.presentation import serialize, serialize_many
 
 
 class TestQuestionSerialization(unittest.TestCase):
@@ -88,3 +90,16 @@ class TestQuestionSerialization(unittest.TestCase):
             expected,
             actual,
         )
+
+    def test_serialize_many(self):
+        actual: list = serialize_many([self.question, self.answer])
+        self.assertEqual([serialize(self.question), serialize(self.answer)], actual)
+
+    def test_serialize_inadmissible_type(self):
+        class Foreign(BaseModel):
+            code: str
+
+        with self.assertRaises(ValueError):
+            serialize(Foreign(code="foreign"))
+        with self.assertRaises(ValueError):
+            serialize_many([self.answer, Foreign(code="foreign")])
@@ -0,0 +1,64 @@
+import unittest
+
+from utils.neo4j_driver import Credentials, DriverSettings, Neo4jDriver, PoolMetrics
+
+
+class FakeConnection:
+    def __init__(self, in_use: bool):
+        self.in_use = in_use
+
+
+class TestNeo4jDriver(unittest.TestCase):
+
+    def setUp(self):
+        # The driver connects lazily, no database is needed
+        self.driver = Neo4jDriver(
+            "localhost",
+            Credentials("neo4j", "password"),
+            DriverSettings(max_connection_pool_size=5, fetch_size=50),
+        )
+
+    def tearDown(self):
+        self.driver.close()
+
+    def test_settings_are_applied(self):
+        self.assertEqual(
+            5, self.driver.driver._pool.pool_config.max_connection_pool_size
+        )
+        self.assertEqual(50, self.driver.driver._default_workspace_config.fetch_size)
+
+    def test_session_config_fits_timeout(self):
+        settings = DriverSettings(connection_acquisition_timeout=60.0)
+        self.assertEqual({}, settings.session_config(None))
+        self.assertEqual(
+            {"connection_acquisition_timeout": 2.5}, settings.session_config(2.5)
+        )
+        self.assertEqual(
+            {"connection_acquisition_timeout": 60.0}, settings.session_config(90.0)
+        )
+
+    def test_pool_metrics(self):
+        metrics: PoolMetrics = self.driver.get_pool_metrics()
+        self.assertEqual(
+            (5, 0, 0, 0),
+            (metrics.max_size, metrics.in_use, metrics.idle, metrics.acquisitions),
+        )
+        self.driver.driver._pool.connections["localhost"].extend(
+            [FakeConnection(True), FakeConnection(False), FakeConnection(False)]
+        )
+        metrics = self.driver.get_pool_metrics()
+        self.assertEqual((1, 2), (metrics.in_use, metrics.idle))
+        self.driver.driver._pool.connections.clear()
+
+    def test_no_pool_metrics_without_the_pool_internals(self):
+        pool = self.driver.driver._pool
+        connections = pool.connections
+        del pool.connections
+        try:
+            self.assertIsNone(self.driver.get_pool_metrics())
+        finally:
+            pool.connections = connections
+
+
+if __name__ == "__main__":
+    unittest.main()
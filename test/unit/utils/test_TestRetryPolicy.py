@@ -0,0 +1,135 @@
+import time
+import unittest
+from typing import List
+
+from utils.errors import ServiceUnavailableError
+from utils.retry import CircuitBreaker, RetryPolicy, deadline, remaining_time
+
+
+class TransientError(Exception):
+    pass
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyFunction:
+    """Fails with a transient error the given number of times, then succeeds"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise TransientError()
+        return "result"
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.delays: List[float] = []
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(3, 10.0, clock=self.clock)
+        self.policy = RetryPolicy(
+            (TransientError,),
+            max_attempts=3,
+            base_delay=0.1,
+            max_delay=1.0,
+            circuit_breaker=self.breaker,
+            sleep=self.delays.append,
+        )
+
+    def test_retries_transient_errors(self):
+        function = FlakyFunction(2)
+        self.assertEqual("result", self.policy.call("query", function))
+        self.assertEqual(3, function.calls)
+        self.assertEqual(2, len(self.delays))
+        self.assertTrue(all(0 <= d <= 0.1 * 2**i for i, d in enumerate(self.delays)))
+        stats = self.policy.get_stats()["query"]
+        self.assertEqual((1, 2, 0), (stats.calls, stats.retries, stats.failures))
+
+    def test_gives_up_after_max_attempts(self):
+        function = FlakyFunction(5)
+        self.assertRaises(ServiceUnavailableError, self.policy.call, "query", function)
+        self.assertEqual(3, function.calls)
+        self.assertEqual(1, self.policy.get_stats()["query"].failures)
+
+    def test_retries_fit_in_deadline(self):
+        function = FlakyFunction(1)
+
+        def slow_function() -> str:
+            time.sleep(0.02)
+            return function()
+
+        with deadline(0.01):
+            self.assertRaises(
+                ServiceUnavailableError, self.policy.call, "query", slow_function
+            )
+        self.assertEqual(1, function.calls)
+        self.assertIsNone(remaining_time())
+
+    def test_no_attempt_after_deadline(self):
+        function = FlakyFunction(0)
+        with deadline(0):
+            self.assertRaises(
+                ServiceUnavailableError, self.policy.call, "query", function
+            )
+        self.assertEqual(0, function.calls)
+        self.assertEqual(1, self.policy.get_stats()["query"].failures)
+
+    def test_other_errors_are_not_retried(self):
+        def failing():
+            raise ValueError()
+
+        self.assertRaises(ValueError, self.policy.call, "query", failing)
+        self.assertEqual([], self.delays)
+
+    def test_circuit_opens_and_closes(self):
+        self.assertRaises(
+            ServiceUnavailableError, self.policy.call, "query", FlakyFunction(3)
+        )
+        self.assertTrue(self.breaker.is_open())
+        function = FlakyFunction(0)
+        self.assertRaises(ServiceUnavailableError, self.policy.call, "query", function)
+        self.assertEqual(0, function.calls)
+        self.assertEqual(1, self.policy.get_stats()["query"].rejections)
+        self.clock.now = 10
+        self.assertEqual("result", self.policy.call("query", function))
+        self.assertFalse(self.breaker.is_open())
+
+    def test_other_errors_leave_circuit_as_is(self):
+        def failing():
+            raise ValueError()
+
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.assertRaises(ValueError, self.policy.call, "query", failing)
+        self.breaker.record_failure()
+        self.assertTrue(self.breaker.is_open())
+        self.clock.now = 10
+        self.assertRaises(ValueError, self.policy.call, "query", failing)
+        self.assertTrue(self.breaker.is_open())
+        self.assertTrue(self.breaker.allow())
+
+    def test_failed_trial_reopens_circuit(self):
+        for _ in range(3):
+            self.breaker.record_failure()
+        self.clock.now = 10
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())
+        self.breaker.record_failure()
+        self.assertFalse(self.breaker.allow())
+        self.clock.now = 20
+        self.assertTrue(self.breaker.allow())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,412 @@
+import asyncio
+import gzip
+import json
+import unittest
+from datetime import datetime
+from typing import AsyncIterator, Callable, List, Optional, Tuple
+
+from application.graph.question_graph_index import QuestionGraphIndex
+from domain.common.core import Page, PageRequest
+from domain.graph.core import (
+    Question,
+    QuestionFilter,
+    QuestionId,
+    QuestionTransitions,
+)
+from domain.graph.factories import QuestionFactory
+from domain.graph.repositories import AsyncQuestionRepository
+from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.repositories import AsyncQuestionnaireRepository
+from test.utils.repositories import (
+    RecordingQuestionnaireRepository,
+    RecordingQuestionRepository,
+)
+from utils.errors import ServiceUnavailableError
+from ws.asgi import create_app
+from ws.setup import Container
+from ws.utils.representations import msgpack
+
+
+def _question(code: str, day: int) -> Question:
+    return QuestionFactory.create_boolean_question(
+        QuestionId(code=code), f"Question {code}", created_at=datetime(2024, 6, day)
+    )
+
+
+class AsyncRecordingQuestionRepository(AsyncQuestionRepository):
+    """Serves a recording repository through the async interface"""
+
+    def __init__(self, delegate: RecordingQuestionRepository):
+        self.delegate = delegate
+        self.unavailable: bool = False
+
+    async def get_all_questions(self) -> List[Question]:
+        if self.unavailable:
+            raise ServiceUnavailableError("Database unavailable")
+        return self.delegate.get_all_questions()
+
+    async def iter_all_questions(self) -> AsyncIterator[Question]:
+        for question in await self.get_all_questions():
+            yield question
+
+    async def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        return self.delegate.get_questions_page(page_request, question_filter)
+
+    async def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        return self.delegate.get_question_by_id(question_id)
+
+    async def get_questions_by_ids(
+        self, question_ids: List[QuestionId]
+    ) -> List[Question]:
+        return self.delegate.get_questions_by_ids(question_ids)
+
+    async def insert_question(self, question: Question) -> QuestionId:
+        return self.delegate.insert_question(question)
+
+    async def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        return self.delegate.insert_questions(questions, chunk_size)
+
+    async def update_question(
+        self,
+        question_id: QuestionId,
+        question: Question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        self.delegate.update_question(question_id, question, revisions)
+
+    async def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        self.delegate.delete_question(question_id, revisions)
+
+    async def get_last_inserted_question(self) -> Optional[Question]:
+        return self.delegate.get_last_inserted_question()
+
+    async def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        return self.delegate.reserve_question_ids(count)
+
+    async def get_version(self) -> int:
+        return self.delegate.get_version()
+
+    async def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        return self.delegate.get_question_with_revision(question_id)
+
+
+class AsyncRecordingQuestionnaireRepository(AsyncQuestionnaireRepository):
+    """Serves a recording questionnaire repository through the async interface"""
+
+    def __init__(self, delegate: RecordingQuestionnaireRepository):
+        self.delegate = delegate
+
+    async def get_questionnaire(
+        self, project_id: ProjectId
+    ) -> List[SelectableQuestion]:
+        return self.delegate.get_questionnaire(project_id)
+
+    async def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        return self.delegate.get_selectable_question(project_id, question_id)
+
+    async def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        return self.delegate.start_questionnaire(project_id, question_id)
+
+    async def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        return self.delegate.update_selectable_question(project_id, question_id, update)
+
+    async def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        return self.delegate.append_next_question(project_id, question_id, transitions)
+
+    async def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        return self.delegate.truncate_questionnaire(project_id, question_id)
+
+    async def delete_questionnaire(self, project_id: ProjectId) -> None:
+        self.delegate.delete_questionnaire(project_id)
+
+
+class TestAsgiApp(unittest.TestCase):
+
+    def setUp(self):
+        questions: List[Question] = [_question("q1", 1), _question("q2", 2)]
+        self.delegate = RecordingQuestionRepository(questions)
+        self.repository = AsyncRecordingQuestionRepository(self.delegate)
+        self.questionnaire_repository = RecordingQuestionnaireRepository(
+            questions, [ProjectId(code="p1")]
+        )
+        self.container = Container("memory").override(
+            async_question_repository=self.repository,
+            async_questionnaire_repository=AsyncRecordingQuestionnaireRepository(
+                self.questionnaire_repository
+            ),
+            question_graph_index=QuestionGraphIndex(self.delegate),
+        )
+        self.app = create_app(self.container)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes = b"",
+        headers: dict = None,
+        app=None,
+    ) -> Tuple[int, dict, bytes]:
+        path, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "query_string": query.encode(),
+            "headers": [
+                (name.encode(), value.encode())
+                for name, value in (headers or {}).items()
+            ],
+        }
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        sent: List[dict] = []
+
+        async def receive() -> dict:
+            return messages.pop(0)
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        asyncio.run((app or self.app)(scope, receive, send))
+        response_headers = {
+            name.decode(): value.decode() for name, value in sent[0]["headers"]
+        }
+        return (
+            sent[0]["status"],
+            response_headers,
+            b"".join(message.get("body", b"") for message in sent[1:]),
+        )
+
+    def test_get_all_questions(self):
+        status, headers, body = self.request("GET", "/questions")
+        self.assertEqual(200, status)
+        self.assertEqual("application/json", headers["content-type"])
+        self.assertEqual(["q1", "q2"], [q["id"]["code"] for q in json.loads(body)])
+
+    def test_get_question_and_not_modified(self):
+        status, headers, body = self.request("GET", "/questions/q1")
+        self.assertEqual(200, status)
+        self.assertEqual("q1", json.loads(body)["id"]["code"])
+        # The question and its revision are read together
+        self.assertEqual(1, self.delegate.reads)
+        status, _, _ = self.request(
+            "GET", "/questions/q1", headers={"If-None-Match": headers["etag"]}
+        )
+        self.assertEqual(304, status)
+        self.assertEqual(404, self.request("GET", "/questions/q3")[0])
+
+    def test_get_questions_by_ids(self):
+        status, _, body = self.request("GET", "/questions?ids=q2,q3,q1")
+        self.assertEqual(200, status)
+        self.assertEqual(
+            (["q2", "q1"], [{"code": "q3"}]),
+            (
+                [q["id"]["code"] for q in json.loads(body)["found"]],
+                json.loads(body)["missing"],
+            ),
+        )
+        status, _, body = self.request(
+            "POST", "/questions/batch-get", json.dumps({"ids": ["q3", "q1"]}).encode()
+        )
+        self.assertEqual(200, status)
+        self.assertEqual([{"code": "q3"}], json.loads(body)["missing"])
+        self.assertEqual(400, self.request("POST", "/questions/batch-get", b"[")[0])
+        self.assertEqual(400, self.request("GET", "/questions?ids=q1&limit=1")[0])
+
+    def test_delete_with_stale_tag_fails(self):
+        _, headers, _ = self.request("GET", "/questions/q1")
+        self.delegate.revisions[QuestionId(code="q1")] += 1
+        status, _, _ = self.request(
+            "DELETE", "/questions/q1", headers={"If-Match": headers["etag"]}
+        )
+        self.assertEqual(412, status)
+        self.assertIn(QuestionId(code="q1"), self.delegate.questions)
+
+    def test_writes_to_other_questions_keep_tag(self):
+        _, headers, _ = self.request("GET", "/questions/q1")
+        self.request("DELETE", "/questions/q2")
+        status, _, _ = self.request(
+            "DELETE", "/questions/q1", headers={"If-Match": headers["etag"]}
+        )
+        self.assertEqual(200, status)
+        self.assertNotIn(QuestionId(code="q1"), self.delegate.questions)
+
+    def test_malformed_bodies_are_bad_requests(self):
+        self.assertEqual(400, self.request("POST", "/questions", b"{")[0])
+        self.assertEqual(400, self.request("POST", "/questions", b"[]")[0])
+        self.assertEqual(
+            400, self.request("PUT", "/questions/q1", json.dumps({}).encode())[0]
+        )
+        self.assertEqual(
+            400,
+            self.request("POST", "/projects/p1/questionnaire/q1/answers", b"{")[0],
+        )
+
+    def test_questionnaire(self):
+        status, _, body = self.request("POST", "/projects/p1/questionnaire")
+        self.assertEqual(200, status)
+        self.assertEqual("q1", json.loads(body)["id"]["code"])
+        status, _, body = self.request(
+            "POST",
+            "/projects/p1/questionnaire/q1/answers",
+            json.dumps({"code": "q1-true"}).encode(),
+        )
+        self.assertEqual(200, status)
+        self.assertEqual(
+            [{"code": "q1-true"}],
+            [answer["id"] for answer in json.loads(body)["selected_answers"]],
+        )
+        self.assertEqual(
+            400,
+            self.request(
+                "POST",
+                "/projects/p1/questionnaire/q1/answers",
+                json.dumps({"code": "q2-true"}).encode(),
+            )[0],
+        )
+        self.assertEqual(
+            404, self.request("POST", "/projects/p1/questionnaire/q1/next")[0]
+        )
+        status, _, body = self.request("GET", "/projects/p1/questionnaire")
+        self.assertEqual(["q1"], [q["id"]["code"] for q in json.loads(body)])
+        self.assertEqual(200, self.request("DELETE", "/projects/p1/questionnaire")[0])
+        self.assertEqual(404, self.request("GET", "/projects/p2/questionnaire")[0])
+
+    def test_export_is_streamed(self):
+        status, headers, body = self.request("GET", "/questions/export?format=jsonl")
+        self.assertEqual(200, status)
+        self.assertNotIn("content-length", headers)
+        self.assertEqual(2, len(body.decode().splitlines()))
+
+    def test_unknown_routes(self):
+        self.assertEqual(404, self.request("GET", "/unknown")[0])
+        self.assertEqual(405, self.request("PATCH", "/questions")[0])
+
+    def test_unavailable_database(self):
+        self.repository.unavailable = True
+        status, headers, body = self.request("GET", "/questions")
+        self.assertEqual(503, status)
+        self.assertEqual("1", headers["retry-after"])
+        self.assertEqual({"error": "Database unavailable"}, json.loads(body))
+
+    @unittest.skipIf(msgpack is None, "msgpack is not installed")
+    def test_media_type_is_negotiated(self):
+        accept: dict = {"Accept": "application/msgpack"}
+        status, headers, body = self.request("GET", "/questions/q1", headers=accept)
+        self.assertEqual(200, status)
+        self.assertEqual("application/msgpack", headers["content-type"])
+        self.assertEqual("q1", msgpack.unpackb(body)["id"]["code"])
+        _, json_headers, _ = self.request("GET", "/questions/q1")
+        self.assertNotEqual(json_headers["etag"], headers["etag"])
+        status, headers, body = self.request("GET", "/unknown", headers=accept)
+        self.assertEqual(
+            (404, "application/msgpack"), (status, headers["content-type"])
+        )
+        status, _, _ = self.request(
+            "GET",
+            "/questions/q1",
+            headers={**accept, "If-None-Match": json_headers["etag"]},
+        )
+        self.assertEqual(200, status)
+
+    def test_large_bodies_are_compressed(self):
+        app = create_app(self.container)
+        app.app.compression_min_size = 10
+        status, headers, body = self.request(
+            "GET", "/questions/q1", headers={"Accept-Encoding": "gzip"}, app=app
+        )
+        self.assertEqual(200, status)
+        self.assertEqual("gzip", headers["content-encoding"])
+        self.assertEqual("Accept-Encoding", headers["vary"])
+        self.assertTrue(headers["etag"].endswith('-gzip"'))
+        self.assertEqual("q1", json.loads(gzip.decompress(body))["id"]["code"])
+        status, headers, _ = self.request(
+            "GET", "/questions/q1", headers={"If-None-Match": headers["etag"]}, app=app
+        )
+        self.assertEqual(304, status)
+        self.assertEqual("Accept, Accept-Encoding", headers["vary"])
+        _, headers, _ = self.request("GET", "/questions/q1", app=app)
+        self.assertNotIn("content-encoding", headers)
+
+    def test_cors(self):
+        _, headers, _ = self.request("GET", "/questions")
+        self.assertEqual("*", headers["access-control-allow-origin"])
+        _, headers, _ = self.request(
+            "GET", "/questions", headers={"Origin": "http://client"}
+        )
+        self.assertEqual("http://client", headers["access-control-allow-origin"])
+        self.assertEqual("Accept-Encoding, Origin", headers["vary"])
+        status, headers, _ = self.request(
+            "OPTIONS",
+            "/questions/q1",
+            headers={
+                "Origin": "http://client",
+                "Access-Control-Request-Method": "PUT",
+                "Access-Control-Request-Headers": "content-type, if-match",
+            },
+        )
+        self.assertEqual(200, status)
+        self.assertEqual("GET, PUT, DELETE, OPTIONS", headers["allow"])
+        self.assertEqual(
+            "content-type, if-match", headers["access-control-allow-headers"]
+        )
+        self.assertIn("PUT", headers["access-control-allow-methods"])
+
+    def test_memory_backend(self):
+        container: Container = Container("memory")
+        app = create_app(container)
+        status, _, body = self.request(
+            "POST", "/projects", json.dumps({"name": "Project"}).encode(), app=app
+        )
+        self.assertEqual(201, status)
+        project_id: str = json.loads(body)["code"]
+        status, _, body = self.request("GET", f"/projects/{project_id}", app=app)
+        self.assertEqual((200, "Project"), (status, json.loads(body)["name"]))
+        self.assertIsNone(container.async_driver)
+
+    def test_lifespan(self):
+        container: Container = Container("memory")
+        messages: List[dict] = [
+            {"type": "lifespan.startup"},
+            {"type": "lifespan.shutdown"},
+        ]
+        sent: List[dict] = []
+
+        async def receive() -> dict:
+            return messages.pop(0)
+
+        async def send(message: dict) -> None:
+            sent.append(message)
+
+        asyncio.run(create_app(container)({"type": "lifespan"}, receive, send))
+        self.assertEqual(
+            ["lifespan.startup.complete", "lifespan.shutdown.complete"],
+            [message["type"] for message in sent],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
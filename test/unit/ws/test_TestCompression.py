@@ -0,0 +1,67 @@
+import gzip
+import unittest
+
+from flask import Flask, Response, request
+
+from ws.utils.compression import compress_response
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.body: str = "question " * 500
+
+        @self.app.route("/large")
+        def large():
+            return self.body
+
+        @self.app.route("/tagged")
+        def tagged():
+            response = Response(self.body)
+            response.set_etag("v1")
+            return response
+
+        @self.app.route("/small")
+        def small():
+            return "question"
+
+        @self.app.route("/streamed")
+        def streamed():
+            return Response(iter([self.body]))
+
+        @self.app.after_request
+        def compress(response):
+            return compress_response(request, response, 1024)
+
+        self.client = self.app.test_client()
+
+    def test_large_body_is_compressed(self):
+        response = self.client.get("/large", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual("gzip", response.headers["Content-Encoding"])
+        self.assertEqual(self.body, gzip.decompress(response.data).decode())
+        self.assertIn("Accept-Encoding", response.headers["Vary"])
+
+    def test_compressed_body_has_its_own_tag(self):
+        response = self.client.get("/tagged", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual('"v1-gzip"', response.headers["ETag"])
+        response = self.client.get("/tagged")
+        self.assertEqual('"v1"', response.headers["ETag"])
+
+    def test_uncompressed_when_not_accepted(self):
+        response = self.client.get("/large")
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(self.body, response.text)
+
+    def test_small_body_is_not_compressed(self):
+        response = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response.headers)
+
+    def test_streamed_body_is_not_compressed(self):
+        response = self.client.get("/streamed", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", response.headers)
+        self.assertEqual(self.body, response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
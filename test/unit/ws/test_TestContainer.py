@@ -0,0 +1,108 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from domain.graph.core import QuestionId
+from domain.graph.factories import QuestionFactory
+from infrastructure.storage.graph.repositories import InMemoryQuestionRepository
+from test.utils.repositories import RecordingQuestionRepository
+from ws.main import create_app
+from ws.setup import Container, _after_fork_in_child
+
+
+class TestContainer(unittest.TestCase):
+
+    def test_import_reads_no_setting(self):
+        environment: dict = {
+            name: value
+            for name, value in os.environ.items()
+            if name not in ("ENV", "DB_HOST", "DB_USER", "DB_PASSWORD")
+        }
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import ws.main, utils.env; assert utils.env._settings is None",
+            ],
+            cwd=Path(__file__).resolve().parents[3],
+            env=environment,
+            capture_output=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr.decode())
+
+    def test_memory_backend_needs_no_database_setting(self):
+        environment: dict = {
+            name: value
+            for name, value in os.environ.items()
+            if name not in ("ENV", "DB_HOST", "DB_USER", "DB_PASSWORD")
+        }
+        environment["STORAGE_BACKEND"] = "memory"
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from ws.main import create_app\n"
+                "from ws.setup import Container\n"
+                "for container in (Container('memory'), None):\n"
+                "    client = create_app(container).test_client()\n"
+                "    response = client.post('/projects', json={'name': 'Project'})\n"
+                "    assert response.status_code == 201, response.status_code\n",
+            ],
+            cwd=Path(__file__).resolve().parents[3],
+            env=environment,
+            capture_output=True,
+        )
+        self.assertEqual(0, result.returncode, result.stderr.decode())
+
+    def test_services_are_built_once_on_first_use(self):
+        container: Container = Container("memory")
+        service = container.question_service
+        self.assertIs(service, container.question_service)
+        self.assertIsNone(container.driver)
+        self.assertIsNone(container.schema_migrator)
+        self.assertIsInstance(container.question_repository, InMemoryQuestionRepository)
+        # The repositories share the store
+        self.assertIs(container.store, container.project_repository.store)
+        self.assertIs(container.store, container.questionnaire_repository.store)
+
+    def test_services_are_built_around_overrides(self):
+        repository = RecordingQuestionRepository(
+            [
+                QuestionFactory.create_boolean_question(
+                    QuestionId(code="q1"), "Question", created_at=datetime(2024, 6, 1)
+                )
+            ]
+        )
+        container: Container = Container("memory")
+        container.question_service
+        container.override(question_repository=repository)
+        self.assertIs(repository, container.question_service.question_repository)
+        self.assertEqual(
+            QuestionId(code="q1"),
+            container.question_graph_index.first_question_id(),
+        )
+        self.assertRaises(ValueError, lambda: container.override(unknown=None))
+
+    def test_forked_child_builds_its_own_services(self):
+        container: Container = Container("memory")
+        repository = container.question_repository
+        overridden = container.override(project_repository=None).project_repository
+        _after_fork_in_child()
+        self.assertIsNot(repository, container.question_repository)
+        self.assertIs(overridden, container.project_repository)
+
+    def test_app_serves_from_its_container(self):
+        client = create_app(Container("memory"), warm_up=False).test_client()
+        other = create_app(Container("memory")).test_client()
+        response = client.post("/projects", json={"name": "Project"})
+        self.assertEqual(201, response.status_code)
+        self.assertEqual(1, len(json.loads(client.get("/projects").data)))
+        self.assertEqual([], json.loads(other.get("/projects").data))
+
+
+if __name__ == "__main__":
+    unittest.main()
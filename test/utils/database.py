@@ -0,0 +1,25 @@
+from typing import Optional
+
+from utils.env import STORAGE_BACKEND
+
+
+def start_database() -> Optional["DockerClient"]:
+    """Starts a fresh database for the integration tests, unless the service keeps
+    its data in memory, in which case every test process has a store of its own
+    :return: the client of the started containers, None in memory"""
+    if STORAGE_BACKEND == "memory":
+        return None
+    # Imported here so that runs in memory do without Docker and its client
+    from python_on_whales import DockerClient
+
+    docker: DockerClient = DockerClient()
+    docker.compose.down(volumes=True)
+    docker.compose.up(detach=True, wait=True)
+    return docker
+
+
+def stop_database(docker: Optional["DockerClient"]) -> None:
+    """Stops the database started by start_database, dropping its data
+    :param docker: the client returned by start_database"""
+    if docker is not None:
+        docker.compose.down(volumes=True)
@@ -0,0 +1,248 @@
+from typing import Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from domain.common.core import Page, PageRequest
+from domain.graph.core import (
+    AnswerId,
+    Question,
+    QuestionFilter,
+    QuestionId,
+    QuestionTransitions,
+)
+from domain.graph.repositories import QuestionRepository
+from domain.project.core import ProjectId, SelectableQuestion
+from domain.project.factories import SelectableQuestionFactory
+from domain.project.repositories import QuestionnaireRepository
+from infrastructure.storage.graph.repositories import InMemoryQuestionRepository
+from utils.errors import ConflictError, NotFoundError, PreconditionFailedError
+
+
+class RecordingQuestionRepository(QuestionRepository):
+    """Keeps questions in memory, counting reads and recording each insertion batch.
+    The version and the revision of the written question are bumped by every write
+    and can also be bumped by hand, as if another process wrote."""
+
+    def __init__(self, questions: List[Question] = ()):
+        self.questions: Dict[QuestionId, Question] = {q.id: q for q in questions}
+        self.revisions: Dict[QuestionId, int] = {q.id: 1 for q in questions}
+        self.batches: List[List[QuestionId]] = []
+        self.reads: int = 0
+        self.version: int = 0
+        self.sequence: int = 0
+
+    def get_all_questions(self) -> List[Question]:
+        self.reads += 1
+        return list(self.questions.values())
+
+    def iter_all_questions(self) -> Iterator[Question]:
+        return iter(self.get_all_questions())
+
+    def get_questions_page(
+        self, page_request: PageRequest, question_filter: QuestionFilter
+    ) -> Page:
+        self.reads += 1
+        # Paged by the in-memory repository, so that the order, the filters and the
+        # cursors are those of the real repositories
+        repository: InMemoryQuestionRepository = InMemoryQuestionRepository()
+        repository.insert_questions(list(self.questions.values()))
+        return repository.get_questions_page(page_request, question_filter)
+
+    def get_question_by_id(self, question_id: QuestionId) -> Optional[Question]:
+        self.reads += 1
+        return self.questions.get(question_id)
+
+    def get_questions_by_ids(self, question_ids: List[QuestionId]) -> List[Question]:
+        self.reads += 1
+        return [
+            self.questions[question_id]
+            for question_id in dict.fromkeys(question_ids)
+            if question_id in self.questions
+        ]
+
+    def insert_question(self, question) -> QuestionId:
+        return self.insert_questions([question])[0]
+
+    def insert_questions(
+        self, questions: List[Question], chunk_size: Optional[int] = None
+    ) -> List[QuestionId]:
+        if any(question.id in self.questions for question in questions):
+            raise ConflictError("Some of the questions already exist")
+        self.batches.append([question.id for question in questions])
+        self.questions.update({question.id: question for question in questions})
+        self.revisions.update({question.id: 1 for question in questions})
+        self.version += 1
+        return [question.id for question in questions]
+
+    def update_question(
+        self,
+        question_id: QuestionId,
+        question,
+        revisions: Optional[List[int]] = None,
+    ) -> None:
+        self._check_revision(question_id, revisions)
+        self.questions[question_id] = question
+        self.revisions[question_id] += 1
+        self.version += 1
+
+    def delete_question(
+        self, question_id: QuestionId, revisions: Optional[List[int]] = None
+    ) -> None:
+        self._check_revision(question_id, revisions)
+        del self.questions[question_id]
+        del self.revisions[question_id]
+        self.version += 1
+
+    def get_last_inserted_question(self) -> Optional[Question]:
+        self.reads += 1
+        return max(self.questions.values(), key=lambda q: q.created_at, default=None)
+
+    def get_existing_ids(
+        self, question_ids: FrozenSet[QuestionId], answer_ids: FrozenSet[AnswerId]
+    ) -> Tuple[FrozenSet[QuestionId], FrozenSet[AnswerId]]:
+        stored_answer_ids = {
+            answer.id
+            for question in self.questions.values()
+            for answer in question.available_answers
+        }
+        return (
+            frozenset(question_ids & self.questions.keys()),
+            frozenset(answer_ids & stored_answer_ids),
+        )
+
+    def reserve_question_ids(self, count: int) -> List[QuestionId]:
+        first: int = self.sequence + 1
+        self.sequence += count
+        ids = [QuestionId(code=f"q-{number}") for number in range(first, first + count)]
+        return [question_id for question_id in ids if question_id not in self.questions]
+
+    def get_version(self) -> int:
+        return self.version
+
+    def get_question_with_revision(
+        self, question_id: QuestionId
+    ) -> Optional[Tuple[Question, int]]:
+        self.reads += 1
+        if question_id not in self.questions:
+            return None
+        return self.questions[question_id], self.revisions[question_id]
+
+    def get_all_questions_with_revisions(self) -> List[Tuple[Question, int]]:
+        self.reads += 1
+        return [
+            (question, self.revisions[question_id])
+            for question_id, question in self.questions.items()
+        ]
+
+    def _check_revision(
+        self, question_id: QuestionId, revisions: Optional[List[int]]
+    ) -> None:
+        if question_id not in self.questions:
+            raise NotFoundError(f"Question with id {question_id} does not exist")
+        if revisions is not None and self.revisions[question_id] not in revisions:
+            raise PreconditionFailedError(
+                f"Question with id {question_id} was modified"
+            )
+
+
+class RecordingQuestionnaireRepository(QuestionnaireRepository):
+    """Keeps questionnaires in memory, over a fixed catalogue of questions, counting
+    writes"""
+
+    def __init__(self, questions: List[Question], project_ids: List[ProjectId]):
+        # By question code, as the ids used in lookups are built anew
+        self.questions: Dict[str, Question] = {q.id.code: q for q in questions}
+        # By project code, as project ids are not hashable
+        self.questionnaires: Dict[str, List[SelectableQuestion]] = {
+            project_id.code: [] for project_id in project_ids
+        }
+        self.writes: int = 0
+
+    def _questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        if project_id.code not in self.questionnaires:
+            raise NotFoundError(f"Project with id {project_id} does not exist")
+        return self.questionnaires[project_id.code]
+
+    def _position(self, project_id: ProjectId, question_id: QuestionId) -> int:
+        for position, question in enumerate(self._questionnaire(project_id)):
+            if question.id == question_id:
+                return position
+        raise NotFoundError(f"Question with id {question_id} was not asked")
+
+    def _ask(self, project_id: ProjectId, question: Question) -> SelectableQuestion:
+        selectable = SelectableQuestionFactory.create_selectable_question(
+            question.id,
+            question.text,
+            question.type,
+            question.available_answers,
+            question.previous_question_id,
+            question.enabled_by,
+            question.action_needed,
+            question.created_at,
+        )
+        self._questionnaire(project_id).append(selectable)
+        return selectable
+
+    def get_questionnaire(self, project_id: ProjectId) -> List[SelectableQuestion]:
+        return list(self._questionnaire(project_id))
+
+    def get_selectable_question(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        for question in self._questionnaire(project_id):
+            if question.id == question_id:
+                return question
+        return None
+
+    def start_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> Optional[SelectableQuestion]:
+        questionnaire = self._questionnaire(project_id)
+        if questionnaire:
+            return questionnaire[0]
+        self.writes += 1
+        if question_id.code not in self.questions:
+            return None
+        return self._ask(project_id, self.questions[question_id.code])
+
+    def update_selectable_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        update: Callable[[SelectableQuestion], SelectableQuestion],
+    ) -> SelectableQuestion:
+        position = self._position(project_id, question_id)
+        question = self._questionnaire(project_id)[position]
+        updated_question = update(question)
+        if updated_question.selected_answers != question.selected_answers:
+            self.writes += 1
+            self._questionnaire(project_id)[position:] = [updated_question]
+        return updated_question
+
+    def append_next_question(
+        self,
+        project_id: ProjectId,
+        question_id: QuestionId,
+        transitions: QuestionTransitions,
+    ) -> Optional[SelectableQuestion]:
+        position = self._position(project_id, question_id)
+        questionnaire = self._questionnaire(project_id)
+        if position + 1 < len(questionnaire):
+            return questionnaire[position + 1]
+        self.writes += 1
+        next_question_id = transitions.next_question_id(
+            answer.id for answer in questionnaire[position].selected_answers
+        )
+        if next_question_id is None or next_question_id.code not in self.questions:
+            return None
+        return self._ask(project_id, self.questions[next_question_id.code])
+
+    def truncate_questionnaire(
+        self, project_id: ProjectId, question_id: QuestionId
+    ) -> SelectableQuestion:
+        position = self._position(project_id, question_id)
+        self.writes += 1
+        del self._questionnaire(project_id)[position + 1 :]
+        return self._questionnaire(project_id)[position]
+
+    def delete_questionnaire(self, project_id: ProjectId) -> None:
+        self._questionnaire(project_id).clear()
+        self.writes += 1
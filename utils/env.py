@@ -1,5 +1,7 @@
 import os
+import threading
 from pathlib import Path
+from typing import Callable, Dict, Optional
 
 from dotenv import load_dotenv
 
@@ -18,15 +20,154 @@ def _get_env_var_or_fail(var_name: str) -> str:
     return value
 
 
-for path in _descending_priority_env_paths:
-    if path.exists():
-        load_dotenv(path, override=False)
+def _get_env_var_or_default(var_name: str, default: str) -> str:
+    return os.environ.get(var_name, default)
 
-ENV = _get_env_var_or_fail("ENV")
-DB_HOST = _get_env_var_or_fail("DB_HOST")
-DB_USER = _get_env_var_or_fail("DB_USER")
 
-if DB_USER != "neo4j":
-    raise ValueError("Only neo4j is supported as database user")
+def _load_env_files() -> None:
+    """Loads the .env files, the environment taking precedence over them"""
+    for path in _descending_priority_env_paths:
+        if path.exists():
+            load_dotenv(path, override=False)
 
-DB_PASSWORD = _get_env_var_or_fail("DB_PASSWORD")
+
+def _storage_backend() -> str:
+    # Where questions and projects are kept: "neo4j", or "memory" for test and
+    # development runs, whose data lives in the process and is lost when it exits
+    backend: str = _get_env_var_or_default("STORAGE_BACKEND", "neo4j").lower()
+    if backend not in ("neo4j", "memory"):
+        raise ValueError("Only neo4j and memory are supported as storage backends")
+    return backend
+
+
+def _db_var(var_name: str, default: str) -> str:
+    # The database settings are only required by the neo4j backend
+    if _get("STORAGE_BACKEND") == "neo4j":
+        return _get_env_var_or_fail(var_name)
+    return _get_env_var_or_default(var_name, default)
+
+
+def _db_user() -> str:
+    user: str = _db_var("DB_USER", "neo4j")
+    if user != "neo4j":
+        raise ValueError("Only neo4j is supported as database user")
+    return user
+
+
+def _flag(var_name: str, default: str) -> bool:
+    return _get_env_var_or_default(var_name, default).lower() == "true"
+
+
+# The reader of each setting, run on the first access to that setting only, so
+# that a process only needs the variables of the code it runs
+_readers: Dict[str, Callable[[], object]] = {
+    "ENV": lambda: _get_env_var_or_fail("ENV"),
+    "STORAGE_BACKEND": _storage_backend,
+    "DB_HOST": lambda: _db_var("DB_HOST", "localhost"),
+    "DB_USER": _db_user,
+    "DB_PASSWORD": lambda: _db_var("DB_PASSWORD", ""),
+    # Connection pool and session settings of the database driver, durations in
+    # seconds
+    "DB_MAX_CONNECTION_POOL_SIZE": lambda: int(
+        _get_env_var_or_default("DB_MAX_CONNECTION_POOL_SIZE", "100")
+    ),
+    "DB_CONNECTION_ACQUISITION_TIMEOUT": lambda: float(
+        _get_env_var_or_default("DB_CONNECTION_ACQUISITION_TIMEOUT", "60")
+    ),
+    "DB_MAX_CONNECTION_LIFETIME": lambda: float(
+        _get_env_var_or_default("DB_MAX_CONNECTION_LIFETIME", "3600")
+    ),
+    "DB_FETCH_SIZE": lambda: int(_get_env_var_or_default("DB_FETCH_SIZE", "1000")),
+    "DB_KEEP_ALIVE": lambda: _flag("DB_KEEP_ALIVE", "true"),
+    # Retries of database calls failing with transient errors, durations in seconds
+    "DB_RETRY_MAX_ATTEMPTS": lambda: int(
+        _get_env_var_or_default("DB_RETRY_MAX_ATTEMPTS", "5")
+    ),
+    "DB_RETRY_BASE_DELAY": lambda: float(
+        _get_env_var_or_default("DB_RETRY_BASE_DELAY", "0.1")
+    ),
+    "DB_RETRY_MAX_DELAY": lambda: float(
+        _get_env_var_or_default("DB_RETRY_MAX_DELAY", "2")
+    ),
+    # Consecutive failures after which database calls fail fast, and for how long
+    "DB_CIRCUIT_FAILURE_THRESHOLD": lambda: int(
+        _get_env_var_or_default("DB_CIRCUIT_FAILURE_THRESHOLD", "5")
+    ),
+    "DB_CIRCUIT_RESET_TIMEOUT": lambda: float(
+        _get_env_var_or_default("DB_CIRCUIT_RESET_TIMEOUT", "10")
+    ),
+    # Seconds a request may spend on database calls, retries included
+    "REQUEST_TIMEOUT": lambda: float(_get_env_var_or_default("REQUEST_TIMEOUT", "10")),
+    # Seconds a snapshot of the question catalogue is kept, 0 disables the cache
+    "QUESTION_CACHE_TTL": lambda: float(
+        _get_env_var_or_default("QUESTION_CACHE_TTL", "60")
+    ),
+    # Largest catalogue kept as a whole, bigger ones are cached question by question
+    "QUESTION_CACHE_MAX_SIZE": lambda: int(
+        _get_env_var_or_default("QUESTION_CACHE_MAX_SIZE", "10000")
+    ),
+    # Seconds between two checks of the stored questions version by the question
+    # cache, 0 checks on every read at the cost of a statement per read
+    "QUESTION_CACHE_CHECK_INTERVAL": lambda: float(
+        _get_env_var_or_default("QUESTION_CACHE_CHECK_INTERVAL", "1")
+    ),
+    # Seconds between two checks of the stored questions version by the question
+    # graph index. Questions change seldom, and a check costs a statement per
+    # questionnaire step
+    "QUESTION_GRAPH_CHECK_INTERVAL": lambda: float(
+        _get_env_var_or_default("QUESTION_GRAPH_CHECK_INTERVAL", "1")
+    ),
+    # Candidate question ids each process reserves at once. Reserving several saves
+    # a write per id, the ids a process has not handed out being lost when it stops
+    "QUESTION_ID_BLOCK_SIZE": lambda: int(
+        _get_env_var_or_default("QUESTION_ID_BLOCK_SIZE", "1")
+    ),
+    # Events appended to a questionnaire between two snapshots of its whole state
+    "QUESTIONNAIRE_SNAPSHOT_INTERVAL": lambda: int(
+        _get_env_var_or_default("QUESTIONNAIRE_SNAPSHOT_INTERVAL", "16")
+    ),
+    # Smallest response body compressed, in bytes
+    "COMPRESSION_MIN_SIZE": lambda: int(
+        _get_env_var_or_default("COMPRESSION_MIN_SIZE", "1024")
+    ),
+    # Debug switch validating the data read back from the database, which is trusted
+    # otherwise
+    "VALIDATE_TRUSTED_DATA": lambda: _flag("VALIDATE_TRUSTED_DATA", "false"),
+}
+
+
+_settings: Optional[Dict[str, object]] = None
+_settings_lock = threading.RLock()
+
+
+def _get(name: str) -> object:
+    """Gets a setting, reading and validating it on first access
+    :param name: the name of the setting
+    :return: the value of the setting
+    :raises ValueError: if the variable is required and missing, or its value
+    unsupported"""
+    global _settings
+    with _settings_lock:
+        if _settings is None:
+            _load_env_files()
+            _settings = {}
+        if name not in _settings:
+            _settings[name] = _readers[name]()
+        return _settings[name]
+
+
+def __getattr__(name: str) -> object:
+    """Gets a setting, reading it on first access, so that importing this module
+    costs nothing and fails on nothing: a process only needs the variables of the
+    code it runs"""
+    if name not in _readers:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _get(name)
+
+
+def reload() -> None:
+    """Forgets the settings read, so that the next access reads them again, e.g. in
+    tests changing the environment"""
+    global _settings
+    with _settings_lock:
+        _settings = None
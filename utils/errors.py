@@ -26,3 +26,21 @@ class BadRequestError(Exception):
 
     def __str__(self):
         return repr(self.message)
+
+
+class ServiceUnavailableError(Exception):
+    def __init__(self, message):
+        self.message = message
+        self.status_code = StatusCode.SERVICE_UNAVAILABLE
+
+    def __str__(self):
+        return repr(self.message)
+
+
+class PreconditionFailedError(Exception):
+    def __init__(self, message):
+        self.message = message
+        self.status_code = StatusCode.PRECONDITION_FAILED
+
+    def __str__(self):
+        return repr(self.message)
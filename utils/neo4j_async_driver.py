@@ -0,0 +1,122 @@
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, TypeVar
+
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncSession,
+    AsyncTransaction,
+)
+from neo4j.api import AsyncBookmarkManager
+
+from utils.neo4j_driver import (
+    Credentials,
+    DriverSettings,
+    Neo4jQuery,
+    default_retry_policy,
+    transaction_timeout,
+)
+from utils.retry import RetryPolicy
+
+T = TypeVar("T")
+
+
+class AsyncNeo4jDriver:
+    """Asynchronous counterpart of Neo4jDriver, for code running on an event loop:
+    waiting for the database suspends the calling task instead of a thread"""
+
+    def __init__(
+        self,
+        host: str,
+        credentials: Credentials,
+        settings: Optional[DriverSettings] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.settings: DriverSettings = settings or DriverSettings()
+        self.retry_policy: RetryPolicy = retry_policy or default_retry_policy()
+        self.driver: AsyncDriver = AsyncGraphDatabase.driver(
+            f"neo4j://{host}",
+            auth=(credentials.user, credentials.password),
+            **self.settings.to_config(),
+        )
+        self.bookmark_manager: AsyncBookmarkManager = (
+            AsyncGraphDatabase.bookmark_manager()
+        )
+
+    async def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        """Runs a read-only query in a transaction, which a cluster may route
+        to a follower, retried on transient failures
+        :param query: the query
+        :return: the records
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+        return await self._execute(
+            READ_ACCESS, query.query, lambda tx: self._run(tx, query)
+        )
+
+    async def execute_write(self, query: Neo4jQuery) -> List[dict]:
+        """Runs a query in a write transaction, routed to the leader and
+        retried on transient failures
+        :param query: the query
+        :return: the records
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+        return await self._execute(
+            WRITE_ACCESS, query.query, lambda tx: self._run(tx, query)
+        )
+
+    async def execute_write_all(self, queries: List[Neo4jQuery]) -> None:
+        """Runs several queries in the same write transaction
+        :param queries: the queries, run in order
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+
+        async def run_all(tx: AsyncTransaction) -> None:
+            for query in queries:
+                result = await tx.run(query.query, **query.params)
+                await result.consume()
+
+        # Chunks of a batch share their statements, which are counted once
+        key: str = " ; ".join(dict.fromkeys(query.query for query in queries))
+        await self._execute(WRITE_ACCESS, key, run_all)
+
+    async def stream(self, query: Neo4jQuery) -> AsyncIterator[dict]:
+        """Lazily yields the records of a read-only query, fetching them in batches
+        from the result cursor. The session stays open until the iterator is exhausted
+        or closed. Failures are not retried.
+        """
+        async with self._session(READ_ACCESS) as session:
+            result = await session.run(query.query, **query.params)
+            async for record in result:
+                yield record.data()
+
+    async def close(self):
+        await self.driver.close()
+
+    async def _execute(
+        self,
+        access_mode: str,
+        key: str,
+        work: Callable[[AsyncTransaction], Awaitable[T]],
+    ) -> T:
+        async def attempt() -> T:
+            timeout: Optional[float] = transaction_timeout()
+            async with self._session(access_mode, timeout) as session:
+                async with await session.begin_transaction(timeout=timeout) as tx:
+                    result: T = await work(tx)
+                    await tx.commit()
+                    return result
+
+        return await self.retry_policy.call_async(key, attempt)
+
+    def _session(
+        self, access_mode: str, timeout: Optional[float] = None
+    ) -> AsyncSession:
+        return self.driver.session(
+            default_access_mode=access_mode,
+            bookmark_manager=self.bookmark_manager,
+            **self.settings.session_config(timeout),
+        )
+
+    @staticmethod
+    async def _run(tx: AsyncTransaction, query: Neo4jQuery) -> List[dict]:
+        result = await tx.run(query.query, **query.params)
+        return await result.data()
@@ -1,8 +1,29 @@
-from typing import List
+import copy
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
 
-import backoff
-from neo4j import GraphDatabase, Driver
-from neo4j.exceptions import ServiceUnavailable
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    Driver,
+    GraphDatabase,
+    Session,
+    Transaction,
+)
+from neo4j.api import BookmarkManager
+from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
+
+from utils.retry import CircuitBreaker, RetryPolicy, RetryStats, remaining_time
+
+T = TypeVar("T")
+
+# Errors after which a transaction may succeed if run again
+TRANSIENT_ERRORS: Tuple[Type[Exception], ...] = (
+    ServiceUnavailable,
+    SessionExpired,
+    TransientError,
+)
 
 
 class Credentials:
@@ -17,28 +38,248 @@ class Neo4jQuery:
         self.params = params
 
 
+class DriverSettings:
+    """Connection pool and session settings, defaulting to the ones of the neo4j driver.
+    Durations are in seconds"""
+
+    def __init__(
+        self,
+        max_connection_pool_size: int = 100,
+        connection_acquisition_timeout: float = 60.0,
+        max_connection_lifetime: float = 3600.0,
+        fetch_size: int = 1000,
+        keep_alive: bool = True,
+    ):
+        self.max_connection_pool_size = max_connection_pool_size
+        self.connection_acquisition_timeout = connection_acquisition_timeout
+        self.max_connection_lifetime = max_connection_lifetime
+        self.fetch_size = fetch_size
+        self.keep_alive = keep_alive
+
+    def to_config(self) -> dict:
+        """Gets the settings as configuration of the neo4j driver
+        :return: the keyword arguments of GraphDatabase.driver"""
+        return {
+            "max_connection_pool_size": self.max_connection_pool_size,
+            "connection_acquisition_timeout": self.connection_acquisition_timeout,
+            "max_connection_lifetime": self.max_connection_lifetime,
+            "fetch_size": self.fetch_size,
+            "keep_alive": self.keep_alive,
+        }
+
+    def session_config(self, timeout: Optional[float] = None) -> dict:
+        """Gets the settings of a session whose transactions must end in time
+        :param timeout: the seconds the transactions may take, None if unbounded
+        :return: the keyword arguments of Driver.session"""
+        if timeout is None:
+            return {}
+        return {
+            "connection_acquisition_timeout": min(
+                self.connection_acquisition_timeout, timeout
+            )
+        }
+
+
+def transaction_timeout() -> Optional[float]:
+    """Gets the time a transaction may take before the current deadline, for the
+    database to abort it rather than let it run for a request given up on. The
+    driver reads a zero timeout as none, so at least a millisecond is given
+    :return: the timeout in seconds, None if no deadline is set"""
+    remaining: Optional[float] = remaining_time()
+    if remaining is None:
+        return None
+    return max(remaining, 0.001)
+
+
+def default_retry_policy() -> RetryPolicy:
+    """Gets the retry policy of drivers built without one
+    :return: a policy retrying transient errors behind a circuit breaker"""
+    return RetryPolicy(TRANSIENT_ERRORS, circuit_breaker=CircuitBreaker(5, 10.0))
+
+
+class PoolMetrics:
+    """Snapshot of the connection pool usage. Wait times are in seconds and
+    cover every acquisition since the driver was created"""
+
+    def __init__(
+        self,
+        max_size: int,
+        in_use: int,
+        idle: int,
+        acquisitions: int,
+        failed_acquisitions: int,
+        total_wait_time: float,
+        max_wait_time: float,
+    ):
+        self.max_size = max_size
+        self.in_use = in_use
+        self.idle = idle
+        self.acquisitions = acquisitions
+        self.failed_acquisitions = failed_acquisitions
+        self.total_wait_time = total_wait_time
+        self.max_wait_time = max_wait_time
+
+
 class Neo4jDriver:
 
-    def __init__(self, host: str, credentials: Credentials):
-        self.retries = 10
-        self.delay = 1
+    def __init__(
+        self,
+        host: str,
+        credentials: Credentials,
+        settings: Optional[DriverSettings] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ):
+        self.settings: DriverSettings = settings or DriverSettings()
+        self.retry_policy: RetryPolicy = retry_policy or default_retry_policy()
         self.driver: Driver = GraphDatabase.driver(
             f"neo4j://{host}",
             auth=(credentials.user, credentials.password),
+            **self.settings.to_config(),
         )
+        self.bookmark_manager: BookmarkManager = GraphDatabase.bookmark_manager()
+        self._metrics_lock = threading.Lock()
+        self._acquisitions: int = 0
+        self._failed_acquisitions: int = 0
+        self._total_wait_time: float = 0.0
+        self._max_wait_time: float = 0.0
+        self._instrument_pool()
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> "Neo4jDriver":
+        """Gets a driver sharing the connection pool and the bookmarks of this one,
+        but retrying according to another policy
+        :param retry_policy: the retry policy
+        :return: the driver"""
+        driver: Neo4jDriver = copy.copy(self)
+        driver.retry_policy = retry_policy
+        return driver
+
+    def execute_read(self, query: Neo4jQuery) -> List[dict]:
+        """Runs a read-only query in a transaction, which a cluster may route
+        to a follower, retried on transient failures
+        :param query: the query
+        :return: the records
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+        return self._execute(READ_ACCESS, query.query, lambda tx: self._run(tx, query))
+
+    def execute_write(self, query: Neo4jQuery) -> List[dict]:
+        """Runs a query in a write transaction, routed to the leader and
+        retried on transient failures
+        :param query: the query
+        :return: the records
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+        return self._execute(WRITE_ACCESS, query.query, lambda tx: self._run(tx, query))
+
+    def execute_write_all(self, queries: List[Neo4jQuery]) -> None:
+        """Runs several queries in the same write transaction
+        :param queries: the queries, run in order
+        :raises ServiceUnavailableError: if the database cannot be reached in time"""
+
+        def run_all(tx: Transaction) -> None:
+            for query in queries:
+                tx.run(query.query, **query.params).consume()
+
+        # Chunks of a batch share their statements, which are counted once
+        key: str = " ; ".join(dict.fromkeys(query.query for query in queries))
+        self._execute(WRITE_ACCESS, key, run_all)
+
+    def get_retry_stats(self) -> Dict[str, RetryStats]:
+        """Gets the retry counters of every statement run so far
+        :return: the counters by statement"""
+        return self.retry_policy.get_stats()
+
+    def _execute(
+        self, access_mode: str, key: str, work: Callable[[Transaction], T]
+    ) -> T:
+        # Transactions are run by hand rather than through the driver transaction
+        # functions, whose own retries would not respect the request deadline
+        def attempt() -> T:
+            timeout: Optional[float] = transaction_timeout()
+            with self._session(access_mode, timeout) as session:
+                with session.begin_transaction(timeout=timeout) as tx:
+                    result: T = work(tx)
+                    tx.commit()
+                    return result
+
+        return self.retry_policy.call(key, attempt)
+
+    def stream(self, query: Neo4jQuery) -> Iterator[dict]:
+        """Lazily yields the records of a read-only query, fetching them in batches
+        from the result cursor. The session stays open until the iterator is exhausted
+        or closed. As records are handed out while they are fetched, failures are not
+        retried.
+        """
+        with self._session(READ_ACCESS) as session:
+            for record in session.run(query.query, **query.params):
+                yield record.data()
+
+    def _session(self, access_mode: str, timeout: Optional[float] = None) -> Session:
+        # Sessions share the bookmarks of the process, so reads routed to a
+        # follower wait for the writes made by this process. Waiting for a
+        # connection does not outlast the transaction timeout
+        return self.driver.session(
+            default_access_mode=access_mode,
+            bookmark_manager=self.bookmark_manager,
+            **self.settings.session_config(timeout),
+        )
+
+    @staticmethod
+    def _run(tx: Transaction, query: Neo4jQuery) -> List[dict]:
+        return tx.run(query.query, **query.params).data()
+
+    def get_pool_metrics(self) -> Optional[PoolMetrics]:
+        """Gets the current usage of the connection pool. The neo4j driver exposes no
+        pool metrics, which are read from its internals when they look as expected
+        :return: the pool metrics, or None if this version of the driver does not
+        allow reading them"""
+        pool = getattr(self.driver, "_pool", None)
+        lock = getattr(pool, "lock", None)
+        connections_by_address = getattr(pool, "connections", None)
+        if lock is None or not isinstance(connections_by_address, dict):
+            return None
+        in_use: int = 0
+        idle: int = 0
+        with lock:
+            for connections in connections_by_address.values():
+                for connection in connections:
+                    if getattr(connection, "in_use", False):
+                        in_use += 1
+                    else:
+                        idle += 1
+        with self._metrics_lock:
+            return PoolMetrics(
+                self.settings.max_connection_pool_size,
+                in_use,
+                idle,
+                self._acquisitions,
+                self._failed_acquisitions,
+                self._total_wait_time,
+                self._max_wait_time,
+            )
+
+    def _instrument_pool(self) -> None:
+        # The neo4j driver exposes no pool metrics: acquisitions are timed by
+        # wrapping the acquire method of its pool, when it has one
+        pool = getattr(self.driver, "_pool", None)
+        acquire: Optional[Callable] = getattr(pool, "acquire", None)
+        if acquire is None:
+            return
+
+        def timed_acquire(*args, **kwargs):
+            start: float = time.perf_counter()
+            try:
+                connection = acquire(*args, **kwargs)
+            except Exception:
+                with self._metrics_lock:
+                    self._failed_acquisitions += 1
+                raise
+            wait_time: float = time.perf_counter() - start
+            with self._metrics_lock:
+                self._acquisitions += 1
+                self._total_wait_time += wait_time
+                self._max_wait_time = max(self._max_wait_time, wait_time)
+            return connection
 
-    @backoff.on_exception(backoff.expo, ServiceUnavailable, max_tries=10)
-    def query(self, query: Neo4jQuery) -> List[dict]:
-        with self.driver.session() as session:
-            return session.run(query.query, **query.params).data()
-
-    @backoff.on_exception(backoff.expo, ServiceUnavailable, max_tries=10)
-    def transaction(self, queries: List[Neo4jQuery]) -> None:
-        with self.driver.session() as session:
-            with session.begin_transaction() as tx:
-                for query in queries:
-                    tx.run(query.query, **query.params)
-                tx.commit()
+        pool.acquire = timed_acquire
 
     def close(self):
         self.driver.close()
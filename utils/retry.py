@@ -0,0 +1,245 @@
+import asyncio
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from utils.errors import ServiceUnavailableError
+
+T = TypeVar("T")
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+def start_deadline(timeout: float) -> Token:
+    """Bounds the time the retried calls made in the current context may take,
+    including their retries. A deadline cannot extend the one already set
+    :param timeout: the time budget in seconds
+    :return: the token to pass to end_deadline"""
+    expires_at: float = time.monotonic() + timeout
+    current: Optional[float] = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    return _deadline.set(expires_at)
+
+
+def end_deadline(token: Token) -> None:
+    """Restores the deadline set before start_deadline was called
+    :param token: the token returned by start_deadline"""
+    _deadline.reset(token)
+
+
+@contextmanager
+def deadline(timeout: float) -> Iterator[None]:
+    """Bounds the time the retried calls made within the block may take
+    :param timeout: the time budget in seconds"""
+    token: Token = start_deadline(timeout)
+    try:
+        yield
+    finally:
+        end_deadline(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Gets the time left before the current deadline
+    :return: the seconds left, None if no deadline is set"""
+    expires_at: Optional[float] = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+class CircuitBreaker:
+    """Fails fast once a dependency is known to be down. The circuit opens after
+    `failure_threshold` consecutive failures and rejects every call for
+    `reset_timeout` seconds. Then a single trial call is let through: its success
+    closes the circuit, its failure opens it again."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._failures: int = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running: bool = False
+
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Tells whether a call may be made, reserving the trial call when the
+        circuit is ready to close
+        :return: False if the call must be rejected"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running:
+                return False
+            if self.clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_other(self) -> None:
+        """Records a call whose outcome tells nothing about the dependency, e.g. a
+        client error, only letting another trial call through if it was the trial"""
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = self.clock()
+            self._trial_running = False
+
+
+class RetryStats:
+    def __init__(self):
+        self.calls: int = 0
+        self.retries: int = 0
+        self.failures: int = 0
+        self.rejections: int = 0
+
+
+class RetryPolicy:
+    """Retries calls failing with transient errors, waiting a random delay between
+    zero and an exponentially growing cap (full jitter). No attempt is made once the
+    current deadline is over, a retry is only made if its delay fits in the time left,
+    and never when the circuit breaker is open. Only successes close the circuit,
+    errors other than transient ones leaving it as it is. Calls, retries, failures and
+    rejections by the circuit breaker are counted per key."""
+
+    def __init__(
+        self,
+        retry_on: Tuple[Type[Exception], ...],
+        max_attempts: int = 5,
+        base_delay: float = 0.1,
+        max_delay: float = 2.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.retry_on = retry_on
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.circuit_breaker = circuit_breaker
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._stats: Dict[str, RetryStats] = {}
+
+    def call(self, key: str, function: Callable[[], T]) -> T:
+        """Calls a function, retrying it on transient errors
+        :param key: the key the call is counted under
+        :param function: the function to call
+        :return: the result of the function
+        :raises ServiceUnavailableError: if the deadline is over, the circuit is open,
+        or the last attempt failed with a transient error"""
+        self._count(key, "calls")
+        attempt: int = 0
+        while True:
+            self._check_deadline(key)
+            self._check_circuit(key)
+            attempt += 1
+            try:
+                result: T = function()
+            except self.retry_on as e:
+                self.sleep(self._retry_delay(key, attempt, e))
+                continue
+            except Exception:
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_other()
+                raise
+            if self.circuit_breaker:
+                self.circuit_breaker.record_success()
+            return result
+
+    async def call_async(self, key: str, function: Callable[[], Awaitable[T]]) -> T:
+        """Awaits a coroutine function, retrying it on transient errors without
+        blocking the event loop between attempts
+        :param key: the key the call is counted under
+        :param function: the coroutine function to await
+        :return: the result of the coroutine
+        :raises ServiceUnavailableError: if the deadline is over, the circuit is open,
+        or the last attempt failed with a transient error"""
+        self._count(key, "calls")
+        attempt: int = 0
+        while True:
+            self._check_deadline(key)
+            self._check_circuit(key)
+            attempt += 1
+            try:
+                result: T = await function()
+            except self.retry_on as e:
+                await asyncio.sleep(self._retry_delay(key, attempt, e))
+                continue
+            except Exception:
+                if self.circuit_breaker:
+                    self.circuit_breaker.record_other()
+                raise
+            if self.circuit_breaker:
+                self.circuit_breaker.record_success()
+            return result
+
+    def _check_circuit(self, key: str) -> None:
+        if self.circuit_breaker and not self.circuit_breaker.allow():
+            self._count(key, "rejections")
+            raise ServiceUnavailableError("Database unavailable")
+
+    def _check_deadline(self, key: str) -> None:
+        remaining: Optional[float] = remaining_time()
+        if remaining is not None and remaining <= 0:
+            self._count(key, "failures")
+            raise ServiceUnavailableError("Database unavailable")
+
+    def _retry_delay(self, key: str, attempt: int, error: Exception) -> float:
+        """Records a transient failure and gets the delay before the next attempt
+        :raises ServiceUnavailableError: if no attempt is left or fits the deadline"""
+        if self.circuit_breaker:
+            self.circuit_breaker.record_failure()
+        delay: float = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+        remaining: Optional[float] = remaining_time()
+        if attempt >= self.max_attempts or (
+            remaining is not None and delay >= remaining
+        ):
+            self._count(key, "failures")
+            raise ServiceUnavailableError("Database unavailable") from error
+        self._count(key, "retries")
+        return delay
+
+    def get_stats(self) -> Dict[str, RetryStats]:
+        """Gets the counters of every key called so far
+        :return: the counters by key"""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, counter: str) -> None:
+        with self._lock:
+            stats: RetryStats = self._stats.setdefault(key, RetryStats())
+            setattr(stats, counter, getattr(stats, counter) + 1)
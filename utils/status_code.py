@@ -4,8 +4,12 @@ from enum import Enum
 class StatusCode(int, Enum):
     OK = 200
     CREATED = 201
+    MULTI_STATUS = 207
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     NOT_FOUND = 404
     CONFLICT = 409
+    PRECONDITION_FAILED = 412
     INTERNAL_SERVER_ERROR = 500
+    SERVICE_UNAVAILABLE = 503
     UNSUPPORTED_MEDIA_TYPE = 415
@@ -0,0 +1 @@
+from ws.asgi.app import AsgiApp, create_app
@@ -0,0 +1,146 @@
+import asyncio
+from typing import List, Optional
+
+from werkzeug.http import dump_header, quote_etag, unquote_etag
+
+from domain.common.trusted import validate_trusted_data
+from utils import env
+from utils.errors import BadRequestError, ServiceUnavailableError
+from utils.retry import end_deadline, start_deadline
+from utils.status_code import StatusCode
+from ws.asgi.cors import CorsMiddleware
+from ws.asgi.http import DataResponse, Handler, Request, Response, Router
+from ws.asgi.projects import ProjectHandlers
+from ws.asgi.questionnaires import QuestionnaireHandlers
+from ws.asgi.questions import QuestionHandlers
+from ws.setup import Container
+from ws.utils.compression import compress_body
+from ws.utils.conditional import coded_etag
+from ws.utils.logger import logger
+
+
+class AsgiApp:
+    """ASGI application serving the routes of the handlers of the services of a
+    container. Like the Flask application, it negotiates the media type and the
+    content coding of the responses. The handlers, and the drivers under them, are
+    built at startup when the server supports the lifespan protocol, on the first
+    request otherwise, so that each worker process builds its own. The schema is
+    migrated at startup, and the drivers closed at shutdown"""
+
+    def __init__(self, container: Container, compression_min_size: int = 0):
+        """:param container: the container of the services
+        :param compression_min_size: the smallest body to compress, in bytes"""
+        self.container = container
+        self.compression_min_size = compression_min_size
+        self._router: Optional[Router] = None
+
+    @property
+    def router(self) -> Router:
+        """The router of the requests, built on first use"""
+        if self._router is None:
+            router: Router = Router()
+            QuestionHandlers(self.container.async_question_service).add_routes(router)
+            QuestionnaireHandlers(
+                self.container.async_questionnaire_service
+            ).add_routes(router)
+            ProjectHandlers(self.container.async_project_service).add_routes(router)
+            self._router = router
+        return self._router
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            request: Request = Request(scope, receive)
+            # Streamed bodies are sent once the deadline is over, like in Flask
+            token = start_deadline(env.REQUEST_TIMEOUT)
+            try:
+                response: Response = await self._dispatch(request)
+            finally:
+                end_deadline(token)
+            if isinstance(response, DataResponse):
+                response.encode(request.media_type)
+            self._compress(request, response)
+            await response.send(send)
+
+    async def _dispatch(self, request: Request) -> Response:
+        handler: Optional[Handler]
+        handler, params, path_exists = self.router.resolve(request.method, request.path)
+        if handler is None:
+            if path_exists and request.method == "OPTIONS":
+                # Answered for every route, as Flask does, for CORS preflight requests
+                methods: List[str] = self.router.methods(request.path)
+                return Response(headers={"Allow": dump_header(methods + ["OPTIONS"])})
+            if path_exists:
+                return DataResponse(
+                    {"message": "The method is not allowed for the requested URL."},
+                    405,
+                )
+            return DataResponse(
+                {"message": "The requested URL was not found on the server."},
+                StatusCode.NOT_FOUND,
+            )
+        try:
+            return await handler(request, **params)
+        except BadRequestError as e:
+            return DataResponse(e.message, e.status_code)
+        except ServiceUnavailableError as e:
+            return DataResponse(
+                {"error": e.message}, e.status_code, {"Retry-After": "1"}
+            )
+        except Exception:
+            logger.exception(f"Exception on {request.path} [{request.method}]")
+            return DataResponse(
+                {"message": "Internal Server Error"},
+                StatusCode.INTERNAL_SERVER_ERROR,
+            )
+
+    def _compress(self, request: Request, response: Response) -> None:
+        """Compresses the body of a response as ws.utils.compression.compress_response
+        compresses those of Flask"""
+        if (
+            response.chunks is not None
+            or response.status < 200
+            or response.status in (204, 304)
+            or "Content-Encoding" in response.headers
+        ):
+            return
+        response.vary("Accept-Encoding")
+        if len(response.body) < self.compression_min_size:
+            return
+        compressed = compress_body(request.accept_encodings, response.body)
+        if compressed is None:
+            return
+        coding, response.body = compressed
+        response.headers["Content-Encoding"] = coding
+        etag, weak = unquote_etag(response.headers.get("ETag"))
+        if etag:
+            response.headers["ETag"] = quote_etag(coded_etag(etag, coding), weak)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message: dict = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await asyncio.to_thread(self.container.migrate)
+                    self.container.warm_up_async()
+                except Exception as e:
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.container.close_async()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def create_app(container: Optional[Container] = None) -> CorsMiddleware:
+    """Creates the ASGI application, an alternative to ws.main:create_app serving
+    the same routes, except bulk loading and metrics, without holding a thread per
+    request. Serve it with any ASGI server, e.g.
+    `uvicorn --factory ws.asgi:create_app`
+    :param container: the container of the services, a new one reading the
+    environment if None, e.g. a container with overrides in tests
+    :return: the application"""
+    validate_trusted_data(env.VALIDATE_TRUSTED_DATA)
+    return CorsMiddleware(AsgiApp(container or Container(), env.COMPRESSION_MIN_SIZE))
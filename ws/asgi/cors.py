@@ -0,0 +1,76 @@
+from typing import Dict, List, Optional, Tuple
+
+from werkzeug.http import parse_set_header
+
+# Methods allowed to cross-origin requests, as flask-cors allows them by default
+_ALLOWED_METHODS: str = "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class CorsMiddleware:
+    """ASGI middleware adding the CORS headers flask-cors adds, with its default
+    settings, to the responses of the Flask application: every origin is allowed,
+    along with every method and request header, without credentials. Requests
+    telling their origin get it back, varying on it, others get the wildcard.
+    Preflight requests are answered by the application, as any OPTIONS request"""
+
+    def __init__(self, app):
+        """:param app: the ASGI application"""
+        self.app = app
+
+    async def __call__(self, scope: dict, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers: Dict[str, str] = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        cors_headers: List[Tuple[str, str]] = _cors_headers(
+            scope["method"], request_headers
+        )
+
+        async def send_with_cors(message: dict) -> None:
+            if message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": _with_headers(message["headers"], cors_headers),
+                }
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+def _cors_headers(method: str, headers: Dict[str, str]) -> List[Tuple[str, str]]:
+    origin: Optional[str] = headers.get("origin")
+    if origin is None:
+        return [("access-control-allow-origin", "*")]
+    cors_headers: List[Tuple[str, str]] = [
+        ("access-control-allow-origin", origin),
+        ("vary", "Origin"),
+    ]
+    if method == "OPTIONS" and "access-control-request-method" in headers:
+        requested_headers: Optional[str] = headers.get("access-control-request-headers")
+        if requested_headers:
+            cors_headers.append(("access-control-allow-headers", requested_headers))
+        cors_headers.append(("access-control-allow-methods", _ALLOWED_METHODS))
+    return cors_headers
+
+
+def _with_headers(
+    headers: List[Tuple[bytes, bytes]], cors_headers: List[Tuple[str, str]]
+) -> List[Tuple[bytes, bytes]]:
+    """Adds the CORS headers to those of a response, merging the Vary header"""
+    vary = parse_set_header(
+        ", ".join(value.decode("latin-1") for name, value in headers if name == b"vary")
+    )
+    merged: List[Tuple[bytes, bytes]] = [
+        (name, value) for name, value in headers if name != b"vary"
+    ]
+    for name, value in cors_headers:
+        if name == "vary":
+            vary.add(value)
+        else:
+            merged.append((name.encode("latin-1"), value.encode("latin-1")))
+    if vary:
+        merged.append((b"vary", vary.to_header().encode("latin-1")))
+    return merged
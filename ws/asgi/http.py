@@ -0,0 +1,219 @@
+import json
+import re
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from urllib.parse import parse_qsl
+
+from werkzeug.datastructures import Accept, ETags, Headers, MIMEAccept, MultiDict
+from werkzeug.http import (
+    parse_accept_header,
+    parse_etags,
+    parse_options_header,
+    parse_set_header,
+)
+
+from utils.errors import BadRequestError
+from utils.status_code import StatusCode
+from ws.utils.bodies import parse_model_body
+from ws.utils.conditional import etag_headers
+from ws.utils.representations import best_media_type, encode_body
+
+T = TypeVar("T")
+
+
+class Request:
+    """HTTP request received through ASGI. The body is read on demand"""
+
+    def __init__(self, scope: dict, receive: Callable[[], Awaitable[dict]]):
+        self.method: str = scope["method"]
+        self.path: str = scope["path"]
+        self.query_string: str = scope.get("query_string", b"").decode("latin-1")
+        self.args: MultiDict = MultiDict(
+            parse_qsl(self.query_string, keep_blank_values=True)
+        )
+        self.headers: Dict[str, str] = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        self.mimetype: str = parse_options_header(self.headers.get("content-type", ""))[
+            0
+        ]
+        self.accept_mimetypes: MIMEAccept = parse_accept_header(
+            self.headers.get("accept"), MIMEAccept
+        )
+        self.accept_encodings: Accept = parse_accept_header(
+            self.headers.get("accept-encoding")
+        )
+        self._receive = receive
+
+    @property
+    def media_type(self) -> str:
+        """The media type of the response body, negotiated as in Flask"""
+        return best_media_type(self.accept_mimetypes)
+
+    @property
+    def full_path(self) -> str:
+        # Same format as the full path of Flask requests, so that tags match
+        return f"{self.path}?{self.query_string}"
+
+    @property
+    def if_none_match(self) -> ETags:
+        return parse_etags(self.headers.get("if-none-match"))
+
+    @property
+    def if_match(self) -> ETags:
+        return parse_etags(self.headers.get("if-match"))
+
+    async def body(self) -> bytes:
+        chunks: List[bytes] = []
+        async for chunk in self.stream():
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def stream(self) -> AsyncIterator[bytes]:
+        more_body: bool = True
+        while more_body:
+            message: dict = await self._receive()
+            if message["type"] == "http.disconnect":
+                return
+            more_body = message.get("more_body", False)
+            yield message.get("body", b"")
+
+    async def json(self) -> object:
+        """Reads the JSON body
+        :return: the decoded body
+        :raises BadRequestError: if the body is not valid JSON"""
+        try:
+            return json.loads(await self.body())
+        except ValueError:
+            raise BadRequestError("The request body is not valid JSON")
+
+    async def read_model(self, klass: Type[T]) -> T:
+        """Reads a JSON body holding an object of the given class
+        :param klass: the class of the object
+        :return: the object
+        :raises BadRequestError: if the body is not valid JSON or not a valid object
+        of the class"""
+        return parse_model_body(await self.json(), klass)
+
+
+class Response:
+    """HTTP response sent through ASGI, its body either whole or streamed"""
+
+    def __init__(
+        self,
+        body: bytes = b"",
+        status: int = StatusCode.OK,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: Optional[str] = None,
+        chunks: Optional[AsyncIterator[str]] = None,
+    ):
+        self.body = body
+        self.status = status
+        self.headers: Headers = Headers(headers or {})
+        if media_type:
+            self.headers["Content-Type"] = media_type
+        self.chunks = chunks
+
+    def vary(self, *names: str) -> None:
+        """Adds request headers to the Vary header
+        :param names: the names of the request headers"""
+        vary = parse_set_header(self.headers.get("Vary"))
+        vary.update(names)
+        self.headers["Vary"] = vary.to_header()
+
+    async def send(self, send: Callable[[dict], Awaitable[None]]) -> None:
+        headers: List[Tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.headers.items()
+        ]
+        if self.chunks is None:
+            headers.append((b"content-length", str(len(self.body)).encode()))
+        await send(
+            {"type": "http.response.start", "status": self.status, "headers": headers}
+        )
+        if self.chunks is None:
+            await send({"type": "http.response.body", "body": self.body})
+            return
+        async for chunk in self.chunks:
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": chunk.encode(),
+                    "more_body": True,
+                }
+            )
+        await send({"type": "http.response.body", "body": b""})
+
+
+class DataResponse(Response):
+    """Response whose body is data, encoded once the handler returns in the media type
+    negotiated with the client, as flask-restful encodes what resources return"""
+
+    def __init__(
+        self,
+        data: object,
+        status: int = StatusCode.OK,
+        headers: Optional[dict] = None,
+    ):
+        super().__init__(status=status, headers=headers)
+        self.data = data
+
+    def encode(self, media_type: str) -> None:
+        """Encodes the data into the body
+        :param media_type: the media type of the body"""
+        self.body = encode_body(self.data, media_type)
+        self.headers["Content-Type"] = media_type
+
+
+def not_modified_response(etag: str) -> Response:
+    """Builds a bodiless 304 Not Modified response, varying as the full response would
+    :param etag: the current unquoted entity tag of the resource
+    :return: the response"""
+    response: Response = Response(
+        status=StatusCode.NOT_MODIFIED, headers=etag_headers(etag)
+    )
+    response.vary("Accept", "Accept-Encoding")
+    return response
+
+
+Handler = Callable[..., Awaitable[Response]]
+
+
+class Router:
+    """Dispatches requests to handlers by method and path. Path parameters are
+    written `<name>` and passed to handlers as keyword arguments"""
+
+    def __init__(self):
+        self.routes: List[Tuple[Pattern, Dict[str, Handler]]] = []
+
+    def add_route(self, path: str, handlers: Dict[str, Handler]) -> None:
+        pattern: str = re.sub(r"<(\w+)>", r"(?P<\1>[^/]+)", path)
+        self.routes.append((re.compile(f"^{pattern}$"), handlers))
+
+    def resolve(self, method: str, path: str) -> Tuple[Optional[Handler], dict, bool]:
+        """Finds the handler of a request
+        :return: the handler, the path parameters, and whether the path exists"""
+        for pattern, handlers in self.routes:
+            match = pattern.match(path)
+            if match:
+                return handlers.get(method), match.groupdict(), True
+        return None, {}, False
+
+    def methods(self, path: str) -> List[str]:
+        """Gets the methods a path is served with
+        :return: the methods, none if the path does not exist"""
+        for pattern, handlers in self.routes:
+            if pattern.match(path):
+                return list(handlers)
+        return []
@@ -0,0 +1,136 @@
+from typing import List, Optional, Tuple
+
+from application.project.async_project_service import AsyncProjectService
+from domain.common.core import Page, PageRequest
+from domain.project.core import Project, ProjectId
+from presentation.presentation import serialize, serialize_many
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
+from utils.status_code import StatusCode
+from ws.asgi.http import (
+    DataResponse,
+    Request,
+    Response,
+    Router,
+    not_modified_response,
+)
+from ws.utils.batch import batch_body, parse_ids_arg, parse_ids_body
+from ws.utils.conditional import (
+    compute_etag,
+    etag_headers,
+    expected_revisions,
+    matches,
+    revision_etag,
+)
+from ws.utils.pagination import page_headers, parse_page_request
+
+
+class ProjectHandlers:
+    """Serves the /projects routes, with the contract of ws.resources.projects"""
+
+    def __init__(self, project_service: AsyncProjectService):
+        self.project_service = project_service
+
+    def add_routes(self, router: Router) -> None:
+        router.add_route("/projects/batch-get", {"POST": self.batch_get})
+        router.add_route("/projects", {"GET": self.get_all, "POST": self.post})
+        router.add_route(
+            "/projects/<project_id>",
+            {"GET": self.get, "PUT": self.put, "DELETE": self.delete},
+        )
+
+    async def get_all(self, request: Request) -> Response:
+        # The version is read before the projects: a concurrent write makes
+        # the tag outdated, never the body
+        etag: str = compute_etag(
+            await self.project_service.get_version(),
+            request.full_path,
+            request.media_type,
+        )
+        if matches(request.if_none_match, etag, weak=True):
+            return not_modified_response(etag)
+        try:
+            page_request: Optional[PageRequest] = parse_page_request(request.args)
+            ids: Optional[List[str]] = parse_ids_arg(request.args)
+            if ids is not None:
+                if page_request is not None:
+                    raise BadRequestError("Ids go with no paging")
+                return DataResponse(
+                    await self._get_by_ids(ids), StatusCode.OK, etag_headers(etag)
+                )
+            if page_request is None:
+                return DataResponse(
+                    serialize_many(await self.project_service.get_all_projects()),
+                    StatusCode.OK,
+                    etag_headers(etag),
+                )
+            page: Page = await self.project_service.get_projects_page(page_request)
+        except BadRequestError as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(
+            page.items, StatusCode.OK, {**page_headers(page), **etag_headers(etag)}
+        )
+
+    async def get(self, request: Request, project_id: str) -> Response:
+        revised: Optional[Tuple[Project, int]] = (
+            await self.project_service.get_project_with_revision(
+                ProjectId(code=project_id)
+            )
+        )
+        if revised is None:
+            return DataResponse("Project not found", StatusCode.NOT_FOUND)
+        project, revision = revised
+        etag: str = revision_etag(revision, request.path, request.media_type)
+        if matches(request.if_none_match, etag, weak=True):
+            return not_modified_response(etag)
+        return DataResponse(serialize(project), StatusCode.OK, etag_headers(etag))
+
+    async def post(self, request: Request) -> Response:
+        body: object = await request.json()
+        name: object = body.get("name") if isinstance(body, dict) else None
+        if not isinstance(name, str):
+            raise BadRequestError("Body must hold the name of the project")
+        try:
+            project_id: ProjectId = await self.project_service.add_project(name)
+        except ConflictError as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(serialize(project_id), StatusCode.CREATED)
+
+    async def batch_get(self, request: Request) -> Response:
+        ids: List[str] = parse_ids_body(await request.json())
+        return DataResponse(await self._get_by_ids(ids))
+
+    async def _get_by_ids(self, ids: List[str]) -> dict:
+        found, missing = await self.project_service.get_projects_by_ids(
+            [ProjectId(code=code) for code in ids]
+        )
+        return batch_body(found, missing)
+
+    async def put(self, request: Request, project_id: str) -> Response:
+        revisions: Optional[List[int]] = expected_revisions(
+            request.if_match, request.path
+        )
+        updated_project: Project = await request.read_model(Project)
+        try:
+            await self.project_service.update_project(
+                ProjectId(code=project_id), updated_project, revisions
+            )
+        except (BadRequestError, NotFoundError, PreconditionFailedError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse("Project updated successfully")
+
+    async def delete(self, request: Request, project_id: str) -> Response:
+        revisions: Optional[List[int]] = expected_revisions(
+            request.if_match, request.path
+        )
+        try:
+            await self.project_service.delete_project(
+                ProjectId(code=project_id), revisions
+            )
+        except (NotFoundError, PreconditionFailedError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse("Project deleted successfully")
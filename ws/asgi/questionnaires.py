@@ -0,0 +1,111 @@
+from typing import Optional
+
+from application.project.async_questionnaire_service import AsyncQuestionnaireService
+from domain.graph.core import AnswerId, QuestionId
+from domain.project.core import ProjectId, SelectableQuestion
+from presentation.presentation import serialize, serialize_many
+from utils.errors import BadRequestError, ConflictError, NotFoundError
+from utils.status_code import StatusCode
+from ws.asgi.http import DataResponse, Request, Response, Router
+
+
+class QuestionnaireHandlers:
+    """Serves the /projects/<project_id>/questionnaire routes, with the contract of
+    ws.resources.questionnaires"""
+
+    def __init__(self, questionnaire_service: AsyncQuestionnaireService):
+        self.questionnaire_service = questionnaire_service
+
+    def add_routes(self, router: Router) -> None:
+        router.add_route(
+            "/projects/<project_id>/questionnaire",
+            {"GET": self.get, "POST": self.post, "DELETE": self.delete},
+        )
+        router.add_route(
+            "/projects/<project_id>/questionnaire/<question_id>/answers",
+            {"POST": self.answer},
+        )
+        router.add_route(
+            "/projects/<project_id>/questionnaire/<question_id>/next",
+            {"POST": self.next},
+        )
+        router.add_route(
+            "/projects/<project_id>/questionnaire/<question_id>/back",
+            {"POST": self.back},
+        )
+
+    async def get(self, request: Request, project_id: str) -> Response:
+        try:
+            return DataResponse(
+                serialize_many(
+                    await self.questionnaire_service.get_questionnaire(
+                        ProjectId(code=project_id)
+                    )
+                )
+            )
+        except NotFoundError as e:
+            return DataResponse(e.message, e.status_code)
+
+    async def post(self, request: Request, project_id: str) -> Response:
+        try:
+            question: Optional[SelectableQuestion] = (
+                await self.questionnaire_service.get_first_question(
+                    ProjectId(code=project_id)
+                )
+            )
+        except (NotFoundError, ConflictError) as e:
+            return DataResponse(e.message, e.status_code)
+        if question:
+            return DataResponse(serialize(question))
+        return DataResponse("No questions found", StatusCode.NOT_FOUND)
+
+    async def delete(self, request: Request, project_id: str) -> Response:
+        try:
+            await self.questionnaire_service.reset_questionnaire(
+                ProjectId(code=project_id)
+            )
+        except NotFoundError as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse("Questionnaire reset successfully")
+
+    async def answer(
+        self, request: Request, project_id: str, question_id: str
+    ) -> Response:
+        answer_id: AnswerId = await request.read_model(AnswerId)
+        try:
+            question: SelectableQuestion = (
+                await self.questionnaire_service.insert_answer(
+                    ProjectId(code=project_id), QuestionId(code=question_id), answer_id
+                )
+            )
+        except (BadRequestError, NotFoundError, ConflictError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(serialize(question))
+
+    async def next(
+        self, request: Request, project_id: str, question_id: str
+    ) -> Response:
+        try:
+            question: Optional[SelectableQuestion] = (
+                await self.questionnaire_service.get_next_question(
+                    ProjectId(code=project_id), QuestionId(code=question_id)
+                )
+            )
+        except (NotFoundError, ConflictError) as e:
+            return DataResponse(e.message, e.status_code)
+        if question:
+            return DataResponse(serialize(question))
+        return DataResponse("No next question", StatusCode.NOT_FOUND)
+
+    async def back(
+        self, request: Request, project_id: str, question_id: str
+    ) -> Response:
+        try:
+            question: SelectableQuestion = (
+                await self.questionnaire_service.go_back_to_question(
+                    ProjectId(code=project_id), QuestionId(code=question_id)
+                )
+            )
+        except (NotFoundError, ConflictError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(serialize(question))
@@ -0,0 +1,191 @@
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from application.graph.async_question_service import AsyncQuestionService
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+from presentation.formatters import iter_json_lines_chunks, iter_yaml_chunks
+from presentation.presentation import serialize, serialize_many
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
+from utils.status_code import StatusCode
+from ws.asgi.http import (
+    DataResponse,
+    Request,
+    Response,
+    Router,
+    not_modified_response,
+)
+from ws.utils.batch import batch_body, parse_ids_arg, parse_ids_body
+from ws.utils.conditional import (
+    compute_etag,
+    etag_headers,
+    expected_revisions,
+    matches,
+    revision_etag,
+)
+from ws.utils.filters import parse_question_filter
+from ws.utils.pagination import page_headers, parse_page_request
+
+
+class QuestionHandlers:
+    """Serves the /questions routes, with the contract of ws.resources.questions"""
+
+    formatters: Dict[str, Tuple[str, Callable[[Iterable[dict]], Iterator[str]]]] = {
+        "yaml": ("text/yaml", iter_yaml_chunks),
+        "jsonl": ("application/jsonl", iter_json_lines_chunks),
+    }
+
+    def __init__(self, question_service: AsyncQuestionService):
+        self.question_service = question_service
+
+    def add_routes(self, router: Router) -> None:
+        # Fixed paths come first, as they would match the question id too
+        router.add_route("/questions/new-candidate-id", {"GET": self.new_candidate_id})
+        router.add_route("/questions/last-inserted", {"GET": self.last_inserted})
+        router.add_route("/questions/export", {"GET": self.export})
+        router.add_route("/questions/batch-get", {"POST": self.batch_get})
+        router.add_route("/questions", {"GET": self.get_all, "POST": self.post})
+        router.add_route(
+            "/questions/<question_id>",
+            {"GET": self.get, "PUT": self.put, "DELETE": self.delete},
+        )
+
+    async def get_all(self, request: Request) -> Response:
+        # The version is read before the questions: a concurrent write makes
+        # the tag outdated, never the body
+        etag: str = compute_etag(
+            await self.question_service.get_version(),
+            request.full_path,
+            request.media_type,
+        )
+        if matches(request.if_none_match, etag, weak=True):
+            return not_modified_response(etag)
+        try:
+            question_filter: QuestionFilter = parse_question_filter(request.args)
+            page_request: Optional[PageRequest] = parse_page_request(request.args)
+            ids: Optional[List[str]] = parse_ids_arg(request.args)
+            if ids is not None:
+                if page_request is not None or question_filter != QuestionFilter():
+                    raise BadRequestError("Ids go with no paging nor filter")
+                return DataResponse(
+                    await self._get_by_ids(ids), StatusCode.OK, etag_headers(etag)
+                )
+            if page_request is None and question_filter == QuestionFilter():
+                return DataResponse(
+                    serialize_many(await self.question_service.get_all_questions()),
+                    StatusCode.OK,
+                    etag_headers(etag),
+                )
+            page: Page = await self.question_service.get_questions_page(
+                page_request or PageRequest(), question_filter
+            )
+        except BadRequestError as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(
+            page.items, StatusCode.OK, {**page_headers(page), **etag_headers(etag)}
+        )
+
+    async def get(self, request: Request, question_id: str) -> Response:
+        revised: Optional[Tuple[Question, int]] = (
+            await self.question_service.get_question_with_revision(
+                QuestionId(code=question_id)
+            )
+        )
+        if revised is None:
+            return DataResponse("Question not found", StatusCode.NOT_FOUND)
+        question, revision = revised
+        etag: str = revision_etag(revision, request.path, request.media_type)
+        if matches(request.if_none_match, etag, weak=True):
+            return not_modified_response(etag)
+        return DataResponse(serialize(question), StatusCode.OK, etag_headers(etag))
+
+    async def post(self, request: Request) -> Response:
+        new_question: Question = await request.read_model(Question)
+        try:
+            await self.question_service.add_question(new_question)
+        except ConflictError as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse(serialize(new_question.id), StatusCode.CREATED)
+
+    async def put(self, request: Request, question_id: str) -> Response:
+        revisions: Optional[List[int]] = expected_revisions(
+            request.if_match, request.path
+        )
+        updated_question: Question = await request.read_model(Question)
+        try:
+            await self.question_service.update_question(
+                QuestionId(code=question_id), updated_question, revisions
+            )
+        except (BadRequestError, NotFoundError, PreconditionFailedError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse("Question updated successfully")
+
+    async def delete(self, request: Request, question_id: str) -> Response:
+        revisions: Optional[List[int]] = expected_revisions(
+            request.if_match, request.path
+        )
+        try:
+            await self.question_service.delete_question(
+                QuestionId(code=question_id), revisions
+            )
+        except (NotFoundError, PreconditionFailedError) as e:
+            return DataResponse(e.message, e.status_code)
+        return DataResponse("Question deleted successfully")
+
+    async def batch_get(self, request: Request) -> Response:
+        ids: List[str] = parse_ids_body(await request.json())
+        return DataResponse(await self._get_by_ids(ids))
+
+    async def _get_by_ids(self, ids: List[str]) -> dict:
+        found, missing = await self.question_service.get_questions_by_ids(
+            [QuestionId(code=code) for code in ids]
+        )
+        return batch_body(found, missing)
+
+    async def new_candidate_id(self, request: Request) -> Response:
+        return DataResponse(
+            serialize(await self.question_service.get_new_candidate_id())
+        )
+
+    async def last_inserted(self, request: Request) -> Response:
+        question: Optional[Question] = (
+            await self.question_service.get_last_inserted_question()
+        )
+        if question:
+            return DataResponse(serialize(question))
+        return DataResponse("No questions found", StatusCode.NOT_FOUND)
+
+    async def export(self, request: Request) -> Response:
+        export_format: str = request.args.get("format", "yaml")
+        if export_format not in self.formatters:
+            return DataResponse(
+                {"error": "Unsupported export format"}, StatusCode.BAD_REQUEST
+            )
+        mimetype, formatter = self.formatters[export_format]
+        return Response(media_type=mimetype, chunks=self._export_chunks(formatter))
+
+    async def _export_chunks(
+        self, formatter: Callable[[Iterable[dict]], Iterator[str]]
+    ) -> AsyncIterator[str]:
+        # Questions are formatted one at a time, as they are fetched
+        empty: bool = True
+        async for question in self.question_service.iter_all_questions():
+            empty = False
+            for chunk in formatter([serialize(question)]):
+                yield chunk
+        if empty:
+            for chunk in formatter([]):
+                yield chunk
@@ -1,15 +1,55 @@
-from flask import Flask
+from typing import Optional
+
+from flask import Flask, g, request
 from flask_cors import CORS
 
+from domain.common.trusted import validate_trusted_data
+from utils import env
+from utils.retry import end_deadline, start_deadline
+from ws.resources.metrics import metrics_bp
 from ws.resources.projects import projects_bp
 from ws.resources.questionnaires import questionnaires_bp
 from ws.resources.questions import questions_bp
+from ws.setup import Container, install
+from ws.utils.compression import compress_response
 
 
-def create_app():
+def create_app(container: Optional[Container] = None, warm_up: bool = True):
+    """Creates the application, whose services are built by a container.
+    Prefork servers should create it with warm_up=False before forking, and warm
+    up the container of each worker once forked, e.g. from a post-fork hook, so that
+    no driver is created before the fork
+    :param container: the container of the services, a new one reading the
+    environment if None, e.g. a container with overrides in tests
+    :param warm_up: whether to build the services and migrate the database schema
+    right away rather than on first use
+    :return: the application"""
+    validate_trusted_data(env.VALIDATE_TRUSTED_DATA)
+    container = container or Container()
+    if warm_up:
+        container.warm_up()
     app = Flask(__name__)
+    install(app, container)
+    request_timeout: float = env.REQUEST_TIMEOUT
+    compression_min_size: int = env.COMPRESSION_MIN_SIZE
     CORS(app)
     app.register_blueprint(questions_bp)
     app.register_blueprint(projects_bp)
     app.register_blueprint(questionnaires_bp)
+    app.register_blueprint(metrics_bp)
+
+    @app.before_request
+    def start_request_deadline():
+        g.deadline_token = start_deadline(request_timeout)
+
+    @app.teardown_request
+    def end_request_deadline(exception):
+        token = g.pop("deadline_token", None)
+        if token is not None:
+            end_deadline(token)
+
+    @app.after_request
+    def compress(response):
+        return compress_response(request, response, compression_min_size)
+
     return app
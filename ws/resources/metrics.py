@@ -0,0 +1,42 @@
+from typing import Optional
+
+from flask import Blueprint
+from flask_restful import Resource
+
+from domain.graph.repositories import QuestionRepository
+from infrastructure.storage.graph.repositories import CachedQuestionRepository
+from utils.neo4j_driver import Neo4jDriver, PoolMetrics
+from utils.status_code import StatusCode
+from ws.setup import Container, services
+from ws.utils.api import ServiceApi
+
+metrics_bp = Blueprint("metrics", __name__)
+api = ServiceApi(metrics_bp)
+
+
+class Metrics(Resource):
+
+    def get(self):
+        container: Container = services()
+        driver: Optional[Neo4jDriver] = container.driver
+        question_repository: QuestionRepository = container.question_repository
+        metrics: dict = {}
+        # The in-memory backend has no database
+        if driver is not None:
+            pool_metrics: Optional[PoolMetrics] = driver.get_pool_metrics()
+            if pool_metrics is not None:
+                metrics["database_pool"] = vars(pool_metrics)
+            metrics["database_retries"] = {
+                statement: vars(stats)
+                for statement, stats in driver.get_retry_stats().items()
+            }
+            if driver.retry_policy.circuit_breaker:
+                metrics["database_circuit_open"] = (
+                    driver.retry_policy.circuit_breaker.is_open()
+                )
+        if isinstance(question_repository, CachedQuestionRepository):
+            metrics["question_cache"] = vars(question_repository.get_stats())
+        return metrics, StatusCode.OK
+
+
+api.add_resource(Metrics, "/metrics")
@@ -1,16 +1,34 @@
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple
 
 from flask import Blueprint, request
-from flask_restful import Api, Resource
+from flask_restful import Resource
 
+from domain.common.core import Page, PageRequest
 from domain.project.core import Project, ProjectId
-from presentation.presentation import serialize, deserialize
-from utils.errors import ConflictError, NotFoundError, BadRequestError
+from presentation.presentation import deserialize, serialize, serialize_many
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
 from utils.status_code import StatusCode
-from ws.setup import project_service
+from ws.setup import services
+from ws.utils.api import ServiceApi
+from ws.utils.batch import batch_body, parse_ids_arg, parse_ids_body
+from ws.utils.conditional import (
+    compute_etag,
+    etag_headers,
+    expected_revisions,
+    is_not_modified,
+    negotiated_media_type,
+    not_modified_response,
+    revision_etag,
+)
+from ws.utils.pagination import page_headers, parse_page_request
 
 projects_bp = Blueprint("projects", __name__)
-api = Api(projects_bp)
+api = ServiceApi(projects_bp)
 
 projects: Set = set()
 
@@ -19,49 +37,116 @@ class ProjectResource(Resource):
 
     def get(self, project_id=None):
         if project_id:
-            project: Optional[Project] = project_service.get_project_by_id(
+            # A project is tagged by its own revision, read along with it, and its
+            # path alone, so that tags of GET and PUT match and writes to other
+            # projects leave them alone
+            revised: Optional[
+                Tuple[Project, int]
+            ] = services().project_service.get_project_with_revision(
                 ProjectId(code=project_id)
             )
-            if project:
-                return serialize(project), StatusCode.OK
-            else:
+            if revised is None:
                 return "Project not found", StatusCode.NOT_FOUND
+            project, revision = revised
+            etag: str = revision_etag(revision, request.path, negotiated_media_type())
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            return serialize(project), StatusCode.OK, etag_headers(etag)
         else:
-            all_projects: List = project_service.get_all_projects()
-            return [serialize(project) for project in all_projects], StatusCode.OK
+            # The version is read before the projects: a concurrent write makes
+            # the tag outdated, never the body
+            etag = compute_etag(
+                services().project_service.get_version(),
+                request.full_path,
+                negotiated_media_type(),
+            )
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            try:
+                page_request: Optional[PageRequest] = parse_page_request(request.args)
+                ids: Optional[List[str]] = parse_ids_arg(request.args)
+                if ids is not None:
+                    if page_request is not None:
+                        raise BadRequestError("Ids go with no paging")
+                    return (
+                        _get_projects_by_ids(ids),
+                        StatusCode.OK,
+                        etag_headers(etag),
+                    )
+                if page_request is None:
+                    all_projects: List = services().project_service.get_all_projects()
+                    return (
+                        serialize_many(all_projects),
+                        StatusCode.OK,
+                        etag_headers(etag),
+                    )
+                page: Page = services().project_service.get_projects_page(page_request)
+            except BadRequestError as e:
+                return e.message, e.status_code
+            return (
+                page.items,
+                StatusCode.OK,
+                {**page_headers(page), **etag_headers(etag)},
+            )
 
     def post(self):
         body: dict = request.get_json()
         try:
-            project_id: ProjectId = project_service.add_project(body["name"])
+            project_id: ProjectId = services().project_service.add_project(body["name"])
         except ConflictError as e:
             return e.message, e.status_code
         return serialize(project_id), StatusCode.CREATED
 
     def put(self, project_id=None):
         if project_id:
+            revisions: Optional[List[int]] = expected_revisions(
+                request.if_match, request.path
+            )
             updated_project: Project = deserialize(request.get_json(), Project)
             try:
-                project_service.update_project(
-                    ProjectId(code=project_id), updated_project
+                services().project_service.update_project(
+                    ProjectId(code=project_id), updated_project, revisions
                 )
                 return "Project updated successfully", StatusCode.OK
             except BadRequestError as e:
                 return e.message, e.status_code
-            except NotFoundError as e:
+            except (NotFoundError, PreconditionFailedError) as e:
                 return e.message, e.status_code
         else:
             return "Missing project id", StatusCode.BAD_REQUEST
 
     def delete(self, project_id=None):
         if project_id:
+            revisions: Optional[List[int]] = expected_revisions(
+                request.if_match, request.path
+            )
             try:
-                project_service.delete_project(ProjectId(code=project_id))
+                services().project_service.delete_project(
+                    ProjectId(code=project_id), revisions
+                )
                 return "Project deleted successfully", StatusCode.OK
-            except NotFoundError as e:
+            except (NotFoundError, PreconditionFailedError) as e:
                 return e.message, e.status_code
         else:
             return "Missing project id", StatusCode.BAD_REQUEST
 
 
+def _get_projects_by_ids(ids: List[str]) -> dict:
+    found, missing = services().project_service.get_projects_by_ids(
+        [ProjectId(code=code) for code in ids]
+    )
+    return batch_body(found, missing)
+
+
+class BatchGetProjects(Resource):
+
+    def post(self):
+        try:
+            ids: List[str] = parse_ids_body(request.get_json(silent=True))
+        except BadRequestError as e:
+            return e.message, e.status_code
+        return _get_projects_by_ids(ids), StatusCode.OK
+
+
 api.add_resource(ProjectResource, "/projects", "/projects/<string:project_id>")
+api.add_resource(BatchGetProjects, "/projects/batch-get")
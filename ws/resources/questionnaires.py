@@ -1,20 +1,113 @@
-from flask import Blueprint
-from flask_restful import Api, Resource
+from typing import Optional
 
+from flask import Blueprint, request
+from flask_restful import Resource
+
+from domain.graph.core import AnswerId, QuestionId
+from domain.project.core import ProjectId, SelectableQuestion
+from presentation.presentation import serialize, serialize_many
+from utils.errors import BadRequestError, ConflictError, NotFoundError
 from utils.status_code import StatusCode
+from ws.setup import services
+from ws.utils.api import ServiceApi
+from ws.utils.bodies import parse_model_body
 
 questionnaires_bp = Blueprint("questionnaires", __name__)
-api = Api(questionnaires_bp)
+api = ServiceApi(questionnaires_bp)
 
 
 class QuestionnaireResource(Resource):
+
     def get(self, project_id):
-        # Replace this with business logic
-        return "", StatusCode.OK
+        try:
+            return serialize_many(
+                services().questionnaire_service.get_questionnaire(
+                    ProjectId(code=project_id)
+                )
+            )
+        except NotFoundError as e:
+            return e.message, e.status_code
+
+    def post(self, project_id):
+        try:
+            question: Optional[
+                SelectableQuestion
+            ] = services().questionnaire_service.get_first_question(
+                ProjectId(code=project_id)
+            )
+        except (NotFoundError, ConflictError) as e:
+            return e.message, e.status_code
+        if question:
+            return serialize(question), StatusCode.OK
+        return "No questions found", StatusCode.NOT_FOUND
 
     def delete(self, project_id):
-        # Replace this with business logic
-        return "", 404
+        try:
+            services().questionnaire_service.reset_questionnaire(
+                ProjectId(code=project_id)
+            )
+        except NotFoundError as e:
+            return e.message, e.status_code
+        return "Questionnaire reset successfully", StatusCode.OK
+
+
+class QuestionnaireAnswers(Resource):
+
+    def post(self, project_id, question_id):
+        try:
+            answer_id: AnswerId = parse_model_body(
+                request.get_json(silent=True), AnswerId
+            )
+            question: (
+                SelectableQuestion
+            ) = services().questionnaire_service.insert_answer(
+                ProjectId(code=project_id), QuestionId(code=question_id), answer_id
+            )
+        except (BadRequestError, NotFoundError, ConflictError) as e:
+            return e.message, e.status_code
+        return serialize(question), StatusCode.OK
+
+
+class NextQuestion(Resource):
+
+    def post(self, project_id, question_id):
+        try:
+            question: Optional[
+                SelectableQuestion
+            ] = services().questionnaire_service.get_next_question(
+                ProjectId(code=project_id), QuestionId(code=question_id)
+            )
+        except (NotFoundError, ConflictError) as e:
+            return e.message, e.status_code
+        if question:
+            return serialize(question), StatusCode.OK
+        return "No next question", StatusCode.NOT_FOUND
+
+
+class PreviousQuestion(Resource):
+
+    def post(self, project_id, question_id):
+        try:
+            question: (
+                SelectableQuestion
+            ) = services().questionnaire_service.go_back_to_question(
+                ProjectId(code=project_id), QuestionId(code=question_id)
+            )
+        except (NotFoundError, ConflictError) as e:
+            return e.message, e.status_code
+        return serialize(question), StatusCode.OK
 
 
 api.add_resource(QuestionnaireResource, "/projects/<string:project_id>/questionnaire")
+api.add_resource(
+    QuestionnaireAnswers,
+    "/projects/<string:project_id>/questionnaire/<string:question_id>/answers",
+)
+api.add_resource(
+    NextQuestion,
+    "/projects/<string:project_id>/questionnaire/<string:question_id>/next",
+)
+api.add_resource(
+    PreviousQuestion,
+    "/projects/<string:project_id>/questionnaire/<string:question_id>/back",
+)
@@ -1,79 +1,196 @@
-from typing import List, Optional
+from typing import (
+    IO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import yaml
-from flask import Blueprint, request
-from flask_restful import Api, Resource
+from flask import Blueprint, Response, request
+from flask_restful import Resource
 
-from domain.graph.core import Question, QuestionId
-from presentation.presentation import serialize, deserialize
-from utils.errors import BadRequestError, ConflictError, NotFoundError
+from application.graph.question_importer import (
+    DEFAULT_CHUNK_SIZE,
+    ImportMode,
+    ImportReport,
+    ImportStatus,
+)
+from domain.common.core import Page, PageRequest
+from domain.graph.core import Question, QuestionFilter, QuestionId
+from presentation.formatters import (
+    iter_json_lines_chunks,
+    iter_msgpack_chunks,
+    iter_yaml_chunks,
+)
+from presentation.parsers import (
+    iter_json_items,
+    iter_json_lines,
+    iter_msgpack_items,
+    iter_yaml_items,
+)
+from presentation.presentation import deserialize, serialize, serialize_many
+from utils.errors import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    PreconditionFailedError,
+)
 from utils.status_code import StatusCode
-from ws.setup import question_service
+from ws.setup import services
+from ws.utils.api import ServiceApi
+from ws.utils.batch import batch_body, parse_ids_arg, parse_ids_body
+from ws.utils.conditional import (
+    compute_etag,
+    etag_headers,
+    expected_revisions,
+    is_not_modified,
+    negotiated_media_type,
+    not_modified_response,
+    revision_etag,
+)
+from ws.utils.filters import parse_question_filter
+from ws.utils.pagination import page_headers, parse_page_request
+from ws.utils.representations import MSGPACK_AVAILABLE, MSGPACK_MEDIA_TYPE
 
 questions_bp = Blueprint("questions", __name__)
-api = Api(questions_bp)
+api = ServiceApi(questions_bp)
 
 
 class QuestionResource(Resource):
 
     def get(self, question_id=None):
         if question_id:
-            question: Optional[Question] = question_service.get_question_by_id(
+            # A question is tagged by its own revision, read along with it, and its
+            # path alone, so that tags of GET and PUT match and writes to other
+            # questions leave them alone
+            revised: Optional[
+                Tuple[Question, int]
+            ] = services().question_service.get_question_with_revision(
                 QuestionId(code=question_id)
             )
-            if question:
-                return serialize(question), StatusCode.OK
-            else:
+            if revised is None:
                 return "Question not found", StatusCode.NOT_FOUND
+            question, revision = revised
+            etag: str = revision_etag(revision, request.path, negotiated_media_type())
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            return serialize(question), StatusCode.OK, etag_headers(etag)
         else:
-            all_questions: List = question_service.get_all_questions()
-            return [serialize(question) for question in all_questions], StatusCode.OK
+            # The version is read before the questions: a concurrent write makes
+            # the tag outdated, never the body
+            etag = compute_etag(
+                services().question_service.get_version(),
+                request.full_path,
+                negotiated_media_type(),
+            )
+            if is_not_modified(etag):
+                return not_modified_response(etag)
+            try:
+                question_filter: QuestionFilter = parse_question_filter(request.args)
+                page_request: Optional[PageRequest] = parse_page_request(request.args)
+                ids: Optional[List[str]] = parse_ids_arg(request.args)
+                if ids is not None:
+                    if page_request is not None or question_filter != QuestionFilter():
+                        raise BadRequestError("Ids go with no paging nor filter")
+                    return (
+                        _get_questions_by_ids(ids),
+                        StatusCode.OK,
+                        etag_headers(etag),
+                    )
+                if page_request is None and question_filter == QuestionFilter():
+                    all_questions: List = (
+                        services().question_service.get_all_questions()
+                    )
+                    return (
+                        serialize_many(all_questions),
+                        StatusCode.OK,
+                        etag_headers(etag),
+                    )
+                page: Page = services().question_service.get_questions_page(
+                    page_request or PageRequest(), question_filter
+                )
+            except BadRequestError as e:
+                return e.message, e.status_code
+            return (
+                page.items,
+                StatusCode.OK,
+                {**page_headers(page), **etag_headers(etag)},
+            )
 
     def post(self):
         new_question: Question = deserialize(request.get_json(), Question)
         try:
-            question_service.add_question(new_question)
+            services().question_service.add_question(new_question)
         except ConflictError as e:
             return e.message, e.status_code
         return serialize(new_question.id), StatusCode.CREATED
 
     def put(self, question_id=None):
         if question_id:
+            revisions: Optional[List[int]] = expected_revisions(
+                request.if_match, request.path
+            )
             updated_question: Question = deserialize(request.get_json(), Question)
             try:
-                question_service.update_question(
-                    QuestionId(code=question_id), updated_question
+                services().question_service.update_question(
+                    QuestionId(code=question_id), updated_question, revisions
                 )
                 return "Question updated successfully", StatusCode.OK
             except BadRequestError as e:
                 return e.message, e.status_code
-            except NotFoundError as e:
+            except (NotFoundError, PreconditionFailedError) as e:
                 return e.message, e.status_code
         else:
             return "Missing question id", StatusCode.BAD_REQUEST
 
     def delete(self, question_id=None):
         if question_id:
+            revisions: Optional[List[int]] = expected_revisions(
+                request.if_match, request.path
+            )
             try:
-                question_service.delete_question(QuestionId(code=question_id))
+                services().question_service.delete_question(
+                    QuestionId(code=question_id), revisions
+                )
                 return "Question deleted successfully", StatusCode.OK
-            except NotFoundError as e:
+            except (NotFoundError, PreconditionFailedError) as e:
                 return e.message, e.status_code
         else:
             return "Missing question id", StatusCode.BAD_REQUEST
 
 
+def _get_questions_by_ids(ids: List[str]) -> dict:
+    found, missing = services().question_service.get_questions_by_ids(
+        [QuestionId(code=code) for code in ids]
+    )
+    return batch_body(found, missing)
+
+
+class BatchGetQuestions(Resource):
+
+    def post(self):
+        try:
+            ids: List[str] = parse_ids_body(request.get_json(silent=True))
+        except BadRequestError as e:
+            return e.message, e.status_code
+        return _get_questions_by_ids(ids), StatusCode.OK
+
+
 class NewCandidateID(Resource):
 
     def get(self):
-        return serialize(question_service.get_new_candidate_id())
+        return serialize(services().question_service.get_new_candidate_id())
 
 
 class LastInsertedQuestion(Resource):
 
     def get(self):
         last_inserted_question: Optional[Question] = (
-            question_service.get_last_inserted_question()
+            services().question_service.get_last_inserted_question()
         )
         if last_inserted_question:
             return serialize(last_inserted_question), StatusCode.OK
@@ -83,25 +200,86 @@ class LastInsertedQuestion(Resource):
 
 class LoadQuestions(Resource):
 
-    def post(self):
-        if not request.data:
-            return {"error": "No data provided"}, StatusCode.BAD_REQUEST
+    parsers: Dict[str, Callable[[IO], Iterator[object]]] = {
+        "text/yaml": iter_yaml_items,
+        "application/yaml": iter_yaml_items,
+        "application/x-yaml": iter_yaml_items,
+        "application/jsonl": iter_json_lines,
+        "application/x-ndjson": iter_json_lines,
+        "application/json": iter_json_items,
+    }
+    if MSGPACK_AVAILABLE:
+        parsers[MSGPACK_MEDIA_TYPE] = iter_msgpack_items
 
-        if request.content_type != "text/yaml":
+    def post(self):
+        parser = self.parsers.get(request.mimetype)
+        if parser is None:
             return {
                 "error": "Unsupported media type"
             }, StatusCode.UNSUPPORTED_MEDIA_TYPE
 
         try:
-            questions_dict: dict = yaml.safe_load(request.data)
-            for question in questions_dict:
-                question_service.add_question(deserialize(question, Question))
-            return "Questions loaded successfully", StatusCode.CREATED
-        except yaml.YAMLError:
-            return {"error": "Invalid YAML file"}, StatusCode.BAD_REQUEST
+            mode: ImportMode = ImportMode(request.args.get("mode", "atomic"))
+            chunk_size: int = int(request.args.get("chunk_size", DEFAULT_CHUNK_SIZE))
+            if chunk_size < 1:
+                raise ValueError()
+        except ValueError:
+            return {"error": "Invalid mode or chunk size"}, StatusCode.BAD_REQUEST
+
+        try:
+            report: ImportReport = services().question_service.load_questions(
+                parser(request.stream), mode, chunk_size
+            )
+        except BadRequestError as e:
+            return {"error": e.message}, e.status_code
+        if len(report.results) == 0:
+            return {"error": "No data provided"}, StatusCode.BAD_REQUEST
+
+        created: int = report.count(ImportStatus.CREATED)
+        body: dict = {
+            "mode": report.mode.value,
+            "created": created,
+            "failed": len(report.results) - created,
+            "results": [
+                result.model_dump(mode="json", exclude_none=True)
+                for result in report.results
+            ],
+        }
+        if created == len(report.results):
+            return body, StatusCode.CREATED
+        if created > 0:
+            return body, StatusCode.MULTI_STATUS
+        if report.count(ImportStatus.INVALID) > 0:
+            return body, StatusCode.BAD_REQUEST
+        return body, StatusCode.CONFLICT
+
+
+class ExportQuestions(Resource):
+
+    formatters: Dict[
+        str, Tuple[str, Callable[[Iterable[dict]], Iterator[Union[str, bytes]]]]
+    ] = {
+        "yaml": ("text/yaml", iter_yaml_chunks),
+        "jsonl": ("application/jsonl", iter_json_lines_chunks),
+    }
+    if MSGPACK_AVAILABLE:
+        formatters["msgpack"] = (MSGPACK_MEDIA_TYPE, iter_msgpack_chunks)
+
+    def get(self):
+        export_format: str = request.args.get("format", "yaml")
+        if export_format not in self.formatters:
+            return {"error": "Unsupported export format"}, StatusCode.BAD_REQUEST
+        mimetype, formatter = self.formatters[export_format]
+        questions: Iterator[dict] = (
+            serialize(question)
+            for question in services().question_service.iter_all_questions()
+        )
+        return Response(formatter(questions), mimetype=mimetype)
 
 
 api.add_resource(QuestionResource, "/questions", "/questions/<string:question_id>")
 api.add_resource(NewCandidateID, "/questions/new-candidate-id")
+api.add_resource(BatchGetQuestions, "/questions/batch-get")
 api.add_resource(LastInsertedQuestion, "/questions/last-inserted")
 api.add_resource(LoadQuestions, "/questions/load")
+api.add_resource(ExportQuestions, "/questions/export")
@@ -0,0 +1,33 @@
+from utils import env
+from utils.neo4j_driver import TRANSIENT_ERRORS, DriverSettings
+from utils.retry import CircuitBreaker, RetryPolicy
+
+
+def driver_settings() -> DriverSettings:
+    """Gets the database driver settings configured in the environment"""
+    return DriverSettings(
+        env.DB_MAX_CONNECTION_POOL_SIZE,
+        env.DB_CONNECTION_ACQUISITION_TIMEOUT,
+        env.DB_MAX_CONNECTION_LIFETIME,
+        env.DB_FETCH_SIZE,
+        env.DB_KEEP_ALIVE,
+    )
+
+
+def retry_policy() -> RetryPolicy:
+    """Gets the retry policy of database calls configured in the environment"""
+    return RetryPolicy(
+        TRANSIENT_ERRORS,
+        env.DB_RETRY_MAX_ATTEMPTS,
+        env.DB_RETRY_BASE_DELAY,
+        env.DB_RETRY_MAX_DELAY,
+        CircuitBreaker(env.DB_CIRCUIT_FAILURE_THRESHOLD, env.DB_CIRCUIT_RESET_TIMEOUT),
+    )
+
+
+def startup_retry_policy() -> RetryPolicy:
+    """Gets the retry policy of the startup schema migration, which waits for the
+    database to come up"""
+    return RetryPolicy(
+        TRANSIENT_ERRORS, max_attempts=10, base_delay=1.0, max_delay=60.0
+    )
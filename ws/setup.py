@@ -1,14 +1,384 @@
+import asyncio
+import os
+import threading
+import weakref
+from typing import Callable, Dict, Optional
+
+from flask import current_app
+
 from application import QuestionService
+from application.graph.async_question_service import AsyncQuestionService
+from application.graph.question_graph_index import QuestionGraphIndex
+from application.project.async_project_service import AsyncProjectService
+from application.project.async_questionnaire_service import AsyncQuestionnaireService
 from application.project.project_service import ProjectService
-from domain.graph.repositories import QuestionRepository
-from domain.project.repositories import ProjectRepository
-from infrastructure.storage.graph.repositories import Neo4jQuestionRepository
+from application.project.questionnaire_service import QuestionnaireService
+from domain.graph.repositories import AsyncQuestionRepository, QuestionRepository
+from domain.project.repositories import (
+    AsyncProjectRepository,
+    AsyncQuestionnaireRepository,
+    ProjectRepository,
+    QuestionnaireRepository,
+)
+from infrastructure.storage.graph.repositories import (
+    AsyncInMemoryQuestionRepository,
+    AsyncNeo4jQuestionRepository,
+    CachedQuestionRepository,
+    InMemoryQuestionRepository,
+    Neo4jQuestionRepository,
+)
+from infrastructure.storage.in_memory_store import InMemoryStore
+from infrastructure.storage.migrations import SchemaMigrator
+from infrastructure.storage.project.repositories.async_in_memory_project_repository import (
+    AsyncInMemoryProjectRepository,
+)
+from infrastructure.storage.project.repositories.async_in_memory_questionnaire_repository import (
+    AsyncInMemoryQuestionnaireRepository,
+)
+from infrastructure.storage.project.repositories.async_neo4j_project_repository import (
+    AsyncNeo4jProjectRepository,
+)
+from infrastructure.storage.project.repositories.async_neo4j_questionnaire_repository import (
+    AsyncNeo4jQuestionnaireRepository,
+)
+from infrastructure.storage.project.repositories.in_memory_project_repository import (
+    InMemoryProjectRepository,
+)
+from infrastructure.storage.project.repositories.in_memory_questionnaire_repository import (
+    InMemoryQuestionnaireRepository,
+)
 from infrastructure.storage.project.repositories.neo4j_project_repository import (
     Neo4jProjectRepository,
 )
+from infrastructure.storage.project.repositories.neo4j_questionnaire_repository import (
+    Neo4jQuestionnaireRepository,
+)
+from utils import env
+from utils.neo4j_async_driver import AsyncNeo4jDriver
+from utils.neo4j_driver import Credentials, Neo4jDriver
+from ws.settings import driver_settings, retry_policy, startup_retry_policy
+
+# Key of the container in the extensions of the Flask application
+_EXTENSION: str = "aequitas_container"
+
+# The services a warm-up builds, along with everything they depend on
+_SERVICES = (
+    "question_service",
+    "project_service",
+    "questionnaire_service",
+)
+
+# The services of the ASGI application, which only reads the question graph
+# synchronously, through the question graph index
+_ASYNC_SERVICES = (
+    "async_question_service",
+    "async_project_service",
+    "async_questionnaire_service",
+)
+
+# Containers of the process, whose services are dropped in forked children
+_containers: "weakref.WeakSet[Container]" = weakref.WeakSet()
+
+
+class Container:
+    """Builds the services of the application on first use, once per process.
+    Nothing is built, nor any setting read, when the container is created: the
+    database driver is only created when a request first needs it, or when the
+    container is warmed up. A forked child drops whatever its parent had built, so
+    that a driver created before a prefork server forks its workers is never shared
+    with them: each worker creates its own on first use.
+    The ASGI application gets its async services from a container too, the question
+    graph index and the schema migrator being shared with the Flask application.
+    Tests may override any service or repository before use, the others being built
+    around the overrides."""
+
+    def __init__(self, storage_backend: Optional[str] = None):
+        """:param storage_backend: "neo4j" or "memory", the STORAGE_BACKEND setting
+        if None"""
+        self._storage_backend: Optional[str] = storage_backend
+        self._lock = threading.RLock()
+        self._instances: Dict[str, object] = {}
+        self._overrides: Dict[str, object] = {}
+        _containers.add(self)
+
+    def override(self, **instances: object) -> "Container":
+        """Replaces some of the services or repositories, e.g.
+        `Container().override(question_repository=repository)`. What was built
+        already is dropped, so that it is built again around the overrides
+        :param instances: the instances by attribute name
+        :return: the container"""
+        for name in instances:
+            if not hasattr(Container, name):
+                raise ValueError(f"Container has no {name}")
+        with self._lock:
+            self.close()
+            self._overrides.update(instances)
+        return self
+
+    def warm_up(self) -> None:
+        """Builds every service up front, and brings the database schema up to date,
+        waiting for the database if it is still starting. Prefork servers call it in
+        each worker once forked, single process servers before serving"""
+        self.migrate()
+        for name in _SERVICES:
+            getattr(self, name)
+
+    def warm_up_async(self) -> None:
+        """Builds every service of the ASGI application up front. The schema is
+        migrated apart, as the migration blocks"""
+        for name in _ASYNC_SERVICES:
+            getattr(self, name)
+
+    def migrate(self) -> None:
+        """Brings the database schema up to date, waiting for the database if it is
+        still starting. Nothing is done with the memory backend"""
+        migrator: Optional[SchemaMigrator] = self.schema_migrator
+        if migrator is not None:
+            migrator.migrate()
+
+    def close(self) -> None:
+        """Closes the driver if this container created it, and drops every built
+        instance, so that the next use builds them again. The async driver is left
+        to close_async, as closing it needs its event loop"""
+        with self._lock:
+            driver: Optional[Neo4jDriver] = self._instances.get("driver")
+            self._instances.clear()
+        if driver is not None:
+            driver.close()
+
+    async def close_async(self) -> None:
+        """Closes both drivers if this container created them, from the event loop of
+        the async one, and drops every built instance"""
+        with self._lock:
+            driver: Optional[AsyncNeo4jDriver] = self._instances.pop(
+                "async_driver", None
+            )
+        if driver is not None:
+            await driver.close()
+        await asyncio.to_thread(self.close)
+
+    @property
+    def storage_backend(self) -> str:
+        return self._storage_backend or env.STORAGE_BACKEND
+
+    @property
+    def driver(self) -> Optional[Neo4jDriver]:
+        """The driver shared by every repository, hence a single connection pool per
+        process, None with the memory backend"""
+        return self._get("driver", self._build_driver)
+
+    @property
+    def async_driver(self) -> Optional[AsyncNeo4jDriver]:
+        """The driver shared by every async repository, None with the memory
+        backend"""
+        return self._get("async_driver", self._build_async_driver)
+
+    @property
+    def store(self) -> Optional[InMemoryStore]:
+        """The store shared by every repository with the memory backend, as they
+        would share the database"""
+        return self._get(
+            "store",
+            lambda: InMemoryStore() if self.storage_backend == "memory" else None,
+        )
+
+    @property
+    def schema_migrator(self) -> Optional[SchemaMigrator]:
+        """The migrator of the database schema, None with the memory backend"""
+        return self._get("schema_migrator", self._build_schema_migrator)
+
+    @property
+    def question_repository(self) -> QuestionRepository:
+        return self._get("question_repository", self._build_question_repository)
+
+    @property
+    def question_graph_index(self) -> QuestionGraphIndex:
+        return self._get(
+            "question_graph_index",
+            lambda: QuestionGraphIndex(
+                self.question_repository, env.QUESTION_GRAPH_CHECK_INTERVAL
+            ),
+        )
+
+    @property
+    def question_service(self) -> QuestionService:
+        return self._get(
+            "question_service",
+            lambda: QuestionService(
+                self.question_repository,
+                self.question_graph_index,
+                env.QUESTION_ID_BLOCK_SIZE,
+            ),
+        )
+
+    @property
+    def project_repository(self) -> ProjectRepository:
+        return self._get(
+            "project_repository",
+            lambda: (
+                InMemoryProjectRepository(self.store)
+                if self.storage_backend == "memory"
+                else Neo4jProjectRepository(self.driver)
+            ),
+        )
+
+    @property
+    def project_service(self) -> ProjectService:
+        return self._get(
+            "project_service", lambda: ProjectService(self.project_repository)
+        )
+
+    @property
+    def questionnaire_repository(self) -> QuestionnaireRepository:
+        return self._get(
+            "questionnaire_repository",
+            lambda: (
+                InMemoryQuestionnaireRepository(self.store)
+                if self.storage_backend == "memory"
+                else Neo4jQuestionnaireRepository(
+                    self.driver, env.QUESTIONNAIRE_SNAPSHOT_INTERVAL
+                )
+            ),
+        )
+
+    @property
+    def questionnaire_service(self) -> QuestionnaireService:
+        return self._get(
+            "questionnaire_service",
+            lambda: QuestionnaireService(
+                self.questionnaire_repository, self.question_graph_index
+            ),
+        )
+
+    @property
+    def async_question_repository(self) -> AsyncQuestionRepository:
+        return self._get(
+            "async_question_repository",
+            lambda: (
+                AsyncInMemoryQuestionRepository(self.store)
+                if self.storage_backend == "memory"
+                else AsyncNeo4jQuestionRepository(self.async_driver)
+            ),
+        )
+
+    @property
+    def async_question_service(self) -> AsyncQuestionService:
+        return self._get(
+            "async_question_service",
+            lambda: AsyncQuestionService(self.async_question_repository),
+        )
+
+    @property
+    def async_project_repository(self) -> AsyncProjectRepository:
+        return self._get(
+            "async_project_repository",
+            lambda: (
+                AsyncInMemoryProjectRepository(self.store)
+                if self.storage_backend == "memory"
+                else AsyncNeo4jProjectRepository(self.async_driver)
+            ),
+        )
+
+    @property
+    def async_project_service(self) -> AsyncProjectService:
+        return self._get(
+            "async_project_service",
+            lambda: AsyncProjectService(self.async_project_repository),
+        )
+
+    @property
+    def async_questionnaire_repository(self) -> AsyncQuestionnaireRepository:
+        return self._get(
+            "async_questionnaire_repository",
+            lambda: (
+                AsyncInMemoryQuestionnaireRepository(self.store)
+                if self.storage_backend == "memory"
+                else AsyncNeo4jQuestionnaireRepository(
+                    self.async_driver, env.QUESTIONNAIRE_SNAPSHOT_INTERVAL
+                )
+            ),
+        )
+
+    @property
+    def async_questionnaire_service(self) -> AsyncQuestionnaireService:
+        return self._get(
+            "async_questionnaire_service",
+            lambda: AsyncQuestionnaireService(
+                self.async_questionnaire_repository, self.question_graph_index
+            ),
+        )
+
+    def _get(self, name: str, build: Callable[[], object]):
+        with self._lock:
+            if name in self._overrides:
+                return self._overrides[name]
+            if name not in self._instances:
+                self._instances[name] = build()
+            return self._instances[name]
+
+    def _build_driver(self) -> Optional[Neo4jDriver]:
+        if self.storage_backend == "memory":
+            return None
+        return Neo4jDriver(
+            env.DB_HOST,
+            Credentials(env.DB_USER, env.DB_PASSWORD),
+            driver_settings(),
+            retry_policy(),
+        )
+
+    def _build_async_driver(self) -> Optional[AsyncNeo4jDriver]:
+        if self.storage_backend == "memory":
+            return None
+        return AsyncNeo4jDriver(
+            env.DB_HOST,
+            Credentials(env.DB_USER, env.DB_PASSWORD),
+            driver_settings(),
+            retry_policy(),
+        )
+
+    def _build_schema_migrator(self) -> Optional[SchemaMigrator]:
+        if self.driver is None:
+            return None
+        # At startup the database may still be coming up: the migration waits for it
+        return SchemaMigrator(self.driver.with_retry_policy(startup_retry_policy()))
+
+    def _build_question_repository(self) -> QuestionRepository:
+        if self.storage_backend == "memory":
+            return InMemoryQuestionRepository(self.store)
+        repository: QuestionRepository = Neo4jQuestionRepository(self.driver)
+        if env.QUESTION_CACHE_TTL > 0:
+            repository = CachedQuestionRepository(
+                repository,
+                env.QUESTION_CACHE_TTL,
+                env.QUESTION_CACHE_MAX_SIZE,
+                env.QUESTION_CACHE_CHECK_INTERVAL,
+            )
+        return repository
+
+    def _forget(self) -> None:
+        """Drops the instances built by the parent process, without closing them,
+        since they are the parent's to close"""
+        self._lock = threading.RLock()
+        self._instances = {}
+
+
+def _after_fork_in_child() -> None:
+    for container in list(_containers):
+        container._forget()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def install(app, container: Container) -> None:
+    """Makes a container the one serving the requests of a Flask application
+    :param app: the application
+    :param container: the container"""
+    app.extensions[_EXTENSION] = container
 
-question_repository: QuestionRepository = Neo4jQuestionRepository()
-question_service: QuestionService = QuestionService(question_repository)
 
-project_repository: ProjectRepository = Neo4jProjectRepository()
-project_service: ProjectService = ProjectService(project_repository)
+def services() -> Container:
+    """Gets the container of the application handling the current request
+    :return: the container"""
+    return current_app.extensions[_EXTENSION]
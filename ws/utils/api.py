@@ -0,0 +1,27 @@
+from flask_restful import Api
+
+from utils.errors import ServiceUnavailableError
+from ws.utils.representations import representations
+
+
+class ServiceApi(Api):
+    """Api answering 503 Service Unavailable, rather than 500, when the database
+    cannot be reached, so that clients and load balancers know to retry later.
+    Bodies are encoded in the media type the client accepts, see representations,
+    and responses vary accordingly"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.representations = representations()
+
+    def make_response(self, data, *args, **kwargs):
+        response = super().make_response(data, *args, **kwargs)
+        response.vary.add("Accept")
+        return response
+
+    def handle_error(self, e):
+        if isinstance(e, ServiceUnavailableError):
+            return self.make_response(
+                {"error": e.message}, e.status_code, {"Retry-After": "1"}
+            )
+        return super().handle_error(e)
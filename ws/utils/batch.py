@@ -0,0 +1,50 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+from werkzeug.datastructures import MultiDict
+
+from presentation.presentation import serialize, serialize_many
+from utils.errors import BadRequestError
+
+MAX_BATCH_SIZE: int = 1000
+
+
+def parse_ids_arg(args: MultiDict) -> Optional[List[str]]:
+    """Reads the `ids` query parameter, a comma separated list of ids
+    :param args: the query parameters of the request
+    :return: the ids, or None if the parameter is not set
+    :raises BadRequestError: if no id or too many ids are given"""
+    if "ids" not in args:
+        return None
+    return _check_ids([code.strip() for code in args["ids"].split(",") if code.strip()])
+
+
+def parse_ids_body(body: object) -> List[str]:
+    """Reads the ids of a batch-get request, whose body is `{"ids": [...]}`
+    :param body: the JSON body of the request
+    :return: the ids
+    :raises BadRequestError: if the body is malformed, or no id or too many ids are
+    given"""
+    ids: object = body.get("ids") if isinstance(body, dict) else None
+    if not isinstance(ids, list) or not all(
+        isinstance(code, str) and code for code in ids
+    ):
+        raise BadRequestError("Body must hold the list of ids to get")
+    return _check_ids(ids)
+
+
+def batch_body(found: List[BaseModel], missing: List[BaseModel]) -> dict:
+    """Builds the body of a batch-get response
+    :param found: the entities found, in the order of their ids
+    :param missing: the ids with no entity
+    :return: the serialized entities and missing ids"""
+    return {
+        "found": serialize_many(found),
+        "missing": [serialize(entity_id) for entity_id in missing],
+    }
+
+
+def _check_ids(ids: List[str]) -> List[str]:
+    if not 0 < len(ids) <= MAX_BATCH_SIZE:
+        raise BadRequestError(f"Between 1 and {MAX_BATCH_SIZE} ids must be given")
+    return ids
@@ -0,0 +1,23 @@
+from typing import Type, TypeVar
+
+from pydantic import BaseModel
+
+from presentation.presentation import deserialize
+from utils.errors import BadRequestError
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def parse_model_body(body: object, klass: Type[T]) -> T:
+    """Reads the JSON body of a request holding an object of the given class
+    :param body: the JSON body of the request, None if it is not valid JSON
+    :param klass: the class of the object
+    :return: the object
+    :raises BadRequestError: if the body is not a valid object of the class"""
+    if not isinstance(body, dict):
+        raise BadRequestError(f"The request body must be a {klass.__name__}")
+    try:
+        return deserialize(body, klass)
+    except (TypeError, ValueError):
+        # Validation errors of pydantic are value errors
+        raise BadRequestError(f"The request body is not a valid {klass.__name__}")
@@ -0,0 +1,64 @@
+import gzip
+from typing import Callable, Dict, Optional, Tuple
+
+from flask import Request, Response
+from werkzeug.datastructures import Accept
+
+from ws.utils.conditional import coded_etag
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip is used instead
+    brotli = None
+
+# Compressors by content coding, in order of preference
+_compressors: Dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:
+    _compressors["br"] = lambda data: brotli.compress(data, quality=5)
+_compressors["gzip"] = lambda data: gzip.compress(data, compresslevel=6)
+
+
+def compress_response(request: Request, response: Response, min_size: int) -> Response:
+    """Compresses the body of a response with the best coding accepted by the client.
+    Streamed responses, e.g. exports, are left as they are, as are bodies smaller than
+    the threshold, which compression would hardly shrink.
+    A compressed body gets its own ETag, derived from the tag of the uncompressed one,
+    since the bytes sent differ
+    :param request: the request being answered
+    :param response: the response to compress
+    :param min_size: the smallest body to compress, in bytes
+    :return: the same response, compressed if worth it"""
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+        or "Content-Encoding" in response.headers
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if response.content_length is None or response.content_length < min_size:
+        return response
+    compressed: Optional[Tuple[str, bytes]] = compress_body(
+        request.accept_encodings, response.get_data()
+    )
+    if compressed is None:
+        return response
+    coding, data = compressed
+    response.set_data(data)
+    response.headers["Content-Encoding"] = coding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(coded_etag(etag, coding), weak)
+    return response
+
+
+def compress_body(accept_encodings: Accept, data: bytes) -> Optional[Tuple[str, bytes]]:
+    """Compresses a body with the best coding accepted by the client
+    :param accept_encodings: the codings of the Accept-Encoding header of the request
+    :param data: the body
+    :return: the coding and the compressed body, None if the client accepts none"""
+    for coding, compress in _compressors.items():
+        if accept_encodings[coding] > 0:
+            return coding, compress(data)
+    return None
@@ -0,0 +1,123 @@
+import hashlib
+from typing import List, Optional, Set
+
+from flask import Response, request
+from werkzeug.datastructures import ETags
+from werkzeug.http import quote_etag
+
+from utils.status_code import StatusCode
+from ws.utils.representations import best_media_type, representations
+
+# Separates an entity tag from the content coding of the body it was sent with
+_CODING_SEPARATOR: str = "-"
+# Separates the revision of a resource from the rest of its entity tag
+_REVISION_SEPARATOR: str = "."
+
+
+def compute_etag(version: int, key: str, media_type: str) -> str:
+    """Computes a strong entity tag from the version of the stored data a response is
+    built from. The tag changes with every write of that data, even when the
+    response itself would not, which is safe for caches and cheaper than hashing
+    the response, as it needs no query besides reading the version. Each media type
+    gets its own tag, as its bodies differ
+    :param version: the version of the stored data
+    :param key: identifies the resource, e.g. the request path and query
+    :param media_type: the media type of the body
+    :return: the unquoted entity tag"""
+    return hashlib.sha256(f"{version}:{media_type}:{key}".encode()).hexdigest()[:32]
+
+
+def revision_etag(revision: int, key: str, media_type: str) -> str:
+    """Computes a strong entity tag from the revision of a single stored resource,
+    which only changes with the writes of that resource, unlike the version of all
+    the stored data. The tag starts with the revision, so that a conditional write
+    can hand the revision its If-Match header expects to the write itself
+    :param revision: the revision of the resource
+    :param key: identifies the resource, e.g. the request path
+    :param media_type: the media type of the body
+    :return: the unquoted entity tag"""
+    return f"{revision}{_REVISION_SEPARATOR}{_representation_digest(key, media_type)}"
+
+
+def expected_revisions(etags: ETags, key: str) -> Optional[List[int]]:
+    """Reads the revisions an If-Match header expects a resource to be at, out of the
+    strong tags of any of its representations, whatever their content coding. Tags
+    of other resources are left out, so that they never match
+    :param etags: the tags of the If-Match header
+    :param key: identifies the resource, as in revision_etag
+    :return: the revisions, possibly none, None if the header matches any revision"""
+    if not etags or etags.star_tag:
+        return None
+    digests: Set[str] = {
+        _representation_digest(key, media_type) for media_type in representations()
+    }
+    revisions: List[int] = []
+    for tag in etags.as_set():
+        revision, _, digest = tag.split(_CODING_SEPARATOR, 1)[0].partition(
+            _REVISION_SEPARATOR
+        )
+        if digest in digests and revision.isdigit():
+            revisions.append(int(revision))
+    return revisions
+
+
+def _representation_digest(key: str, media_type: str) -> str:
+    return hashlib.sha256(f"{media_type}:{key}".encode()).hexdigest()[:24]
+
+
+def negotiated_media_type() -> str:
+    """Gets the media type the body of the response to the request is encoded in,
+    chosen as flask-restful chooses it
+    :return: the media type"""
+    return best_media_type(request.accept_mimetypes)
+
+
+def coded_etag(etag: str, coding: str) -> str:
+    """Gets the entity tag of a body compressed with a content coding, which differs
+    from the tag of the uncompressed body, as the bytes sent differ
+    :param etag: the unquoted entity tag of the uncompressed body
+    :param coding: the content coding, e.g. gzip
+    :return: the unquoted entity tag"""
+    return f"{etag}{_CODING_SEPARATOR}{coding}"
+
+
+def matches(etags: ETags, etag: str, weak: bool) -> bool:
+    """Tells whether the tags of a conditional request match an entity tag, whatever
+    the content coding they were sent with: compressing changes the bytes sent, not
+    the data they stand for
+    :param etags: the tags of an If-Match or If-None-Match header
+    :param etag: the current unquoted entity tag of the uncompressed body
+    :param weak: whether weak tags match too, as in If-None-Match
+    :return: True if one of the tags matches"""
+    if etags.star_tag:
+        return True
+    return any(
+        tag.split(_CODING_SEPARATOR, 1)[0] == etag
+        for tag in etags.as_set(include_weak=weak)
+    )
+
+
+def etag_headers(etag: str) -> dict:
+    """Gets the response headers carrying an entity tag
+    :param etag: the unquoted entity tag
+    :return: the headers"""
+    return {"ETag": quote_etag(etag)}
+
+
+def is_not_modified(etag: str) -> bool:
+    """Tells whether the If-None-Match header of the request matches an entity tag,
+    so that a GET can be answered with 304 Not Modified
+    :param etag: the current unquoted entity tag of the resource
+    :return: True if the client copy is current"""
+    return matches(request.if_none_match, etag, weak=True)
+
+
+def not_modified_response(etag: str) -> Response:
+    """Builds a bodiless 304 Not Modified response, varying as the full response would
+    :param etag: the current unquoted entity tag of the resource
+    :return: the response"""
+    response: Response = Response(
+        status=StatusCode.NOT_MODIFIED, headers=etag_headers(etag)
+    )
+    response.vary.update(("Accept", "Accept-Encoding"))
+    return response
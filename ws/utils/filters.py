@@ -0,0 +1,27 @@
+from typing import Optional
+
+from werkzeug.datastructures import MultiDict
+
+from domain.graph.core import QuestionFilter, QuestionId
+from domain.graph.core.enum import Action, QuestionType
+from utils.errors import BadRequestError
+
+
+def parse_question_filter(args: MultiDict) -> QuestionFilter:
+    """Reads the `type`, `action_needed` and `previous_question_id` query parameters
+    :param args: the query parameters of the request
+    :return: the question filter, matching every question if no parameter is set
+    :raises BadRequestError: if a parameter is malformed"""
+    try:
+        question_type: Optional[str] = args.get("type")
+        action_needed: Optional[str] = args.get("action_needed")
+        previous_question_id: Optional[str] = args.get("previous_question_id")
+        return QuestionFilter(
+            type=QuestionType(question_type) if question_type else None,
+            action_needed=Action(int(action_needed)) if action_needed else None,
+            previous_question_id=(
+                QuestionId(code=previous_question_id) if previous_question_id else None
+            ),
+        )
+    except ValueError:
+        raise BadRequestError("Invalid question filter")
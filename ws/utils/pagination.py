@@ -0,0 +1,37 @@
+from typing import Optional
+
+from werkzeug.datastructures import MultiDict
+
+from domain.common.core import Page, PageRequest
+from utils.errors import BadRequestError
+
+MAX_PAGE_SIZE: int = 1000
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+
+def parse_page_request(args: MultiDict) -> Optional[PageRequest]:
+    """Reads the `limit`, `cursor` and `fields` query parameters
+    :param args: the query parameters of the request
+    :return: the page request, or None if no paging parameter is set
+    :raises BadRequestError: if a parameter is malformed"""
+    if not any(arg in args for arg in ("limit", "cursor", "fields")):
+        return None
+    limit: Optional[int] = None
+    if "limit" in args:
+        try:
+            limit = int(args["limit"])
+        except ValueError:
+            raise BadRequestError("Limit must be an integer")
+        if not 0 < limit <= MAX_PAGE_SIZE:
+            raise BadRequestError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+    fields = None
+    if "fields" in args:
+        fields = frozenset(f.strip() for f in args["fields"].split(",") if f.strip())
+    return PageRequest(limit=limit, cursor=args.get("cursor"), fields=fields)
+
+
+def page_headers(page: Page) -> dict:
+    """Gets the response headers describing a page
+    :param page: the page
+    :return: the headers, holding the cursor of the next page if any"""
+    return {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else {}
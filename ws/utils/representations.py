@@ -0,0 +1,81 @@
+import json
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from flask import Response, make_response
+from flask_restful.representations.json import output_json as _output_std_json
+from werkzeug.datastructures import MIMEAccept
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - the standard encoder is used instead
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - MessagePack is just not offered
+    msgpack = None
+
+DEFAULT_MEDIA_TYPE: str = "application/json"
+MSGPACK_MEDIA_TYPE: str = "application/msgpack"
+MSGPACK_AVAILABLE: bool = msgpack is not None
+
+
+def output_json(data: object, code: int, headers: Optional[dict] = None) -> Response:
+    """Makes a response with a JSON encoded body, using orjson when installed
+    :param data: the data to encode
+    :param code: the status code
+    :param headers: the additional headers
+    :return: the response"""
+    if orjson is None:
+        return _output_std_json(data, code, headers)
+    response: Response = make_response(encode_body(data, DEFAULT_MEDIA_TYPE), code)
+    response.headers.extend(headers or {})
+    return response
+
+
+def output_msgpack(data: object, code: int, headers: Optional[dict] = None) -> Response:
+    """Makes a response with a MessagePack encoded body
+    :param data: the data to encode
+    :param code: the status code
+    :param headers: the additional headers
+    :return: the response"""
+    response: Response = make_response(encode_body(data, MSGPACK_MEDIA_TYPE), code)
+    response.headers.extend(headers or {})
+    return response
+
+
+def representations() -> Dict[str, Callable[..., Response]]:
+    """Gets the encoders of the response bodies, by media type. JSON comes first,
+    as it is the default when clients accept anything; MessagePack is offered only
+    when msgpack is installed
+    :return: the encoders"""
+    encoders: Dict[str, Callable[..., Response]] = OrderedDict(
+        [(DEFAULT_MEDIA_TYPE, output_json)]
+    )
+    if MSGPACK_AVAILABLE:
+        encoders[MSGPACK_MEDIA_TYPE] = output_msgpack
+    return encoders
+
+
+def best_media_type(accept_mimetypes: MIMEAccept) -> str:
+    """Chooses the media type of a response body among those the client accepts, as
+    flask-restful chooses it: JSON when the client accepts anything, or nothing
+    offered
+    :param accept_mimetypes: the media types of the Accept header of the request
+    :return: the media type"""
+    return accept_mimetypes.best_match(representations(), default=DEFAULT_MEDIA_TYPE)
+
+
+def encode_body(data: object, media_type: str) -> bytes:
+    """Encodes a response body in one of the offered media types, the way the
+    encoders of representations() do, for responses built outside Flask
+    :param data: the data to encode
+    :param media_type: the media type, one of those of representations()
+    :return: the encoded body"""
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return msgpack.packb(data)
+    # Same trailing new line as flask-restful
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data) + "\n").encode()